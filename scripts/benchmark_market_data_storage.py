@@ -0,0 +1,160 @@
+"""
+Benchmark SQLiteStorage market data writes and reads
+
+Compares the bulk upsert path with the previous per-candle ORM path
+(SELECT existing row, then add) on a fresh database, and the raw-cursor
+get_market_data read path with the previous ORM read on a large table.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import logging
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from src.data.storage import SQLiteStorage, MarketDataModel
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+logger = logging.getLogger(__name__)
+
+
+def make_candles(count):
+    """Generate 1m candles"""
+    base_time = datetime(2024, 1, 1)
+    return [{
+        'timestamp': base_time + timedelta(minutes=i),
+        'open': 100.0 + i * 0.01,
+        'high': 101.0 + i * 0.01,
+        'low': 99.0 + i * 0.01,
+        'close': 100.5 + i * 0.01,
+        'volume': 1000.0 + i
+    } for i in range(count)]
+
+
+def save_per_candle(storage, symbol, timeframe, ohlcv_data):
+    """Previous implementation: one SELECT per candle through the ORM"""
+    session = storage.SessionLocal()
+    try:
+        for candle in ohlcv_data:
+            existing = session.query(MarketDataModel).filter_by(
+                symbol=symbol,
+                timeframe=timeframe,
+                timestamp=candle['timestamp']
+            ).first()
+            
+            if not existing:
+                session.add(MarketDataModel(symbol=symbol, timeframe=timeframe, **candle))
+        
+        session.commit()
+    finally:
+        session.close()
+
+
+def read_orm(storage, symbol, timeframe, limit):
+    """Previous implementation: ORM objects, then a list of dicts"""
+    session = storage.SessionLocal()
+    try:
+        records = session.query(MarketDataModel).filter_by(
+            symbol=symbol,
+            timeframe=timeframe
+        ).order_by(MarketDataModel.timestamp.desc()).limit(limit).all()
+        
+        data = [{
+            'timestamp': r.timestamp,
+            'open': r.open,
+            'high': r.high,
+            'low': r.low,
+            'close': r.close,
+            'volume': r.volume
+        } for r in records]
+        
+        return pd.DataFrame(data).sort_values('timestamp').reset_index(drop=True)
+    finally:
+        session.close()
+
+
+def run_reads(rows, symbols=('BTC/USDT', 'ETH/USDT')):
+    """Time full-series and last-1000 reads from a table of `rows` candles"""
+    candles = make_candles(rows // len(symbols))
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = SQLiteStorage(os.path.join(tmp, 'benchmark.db'))
+        for symbol in symbols:
+            storage.save_market_data(symbol, '1m', candles)
+        
+        for limit in (len(candles), 1000):
+            timings = {}
+            for name, read in (('orm', read_orm),
+                               ('raw cursor', lambda s, symbol, tf, limit: s.get_market_data(symbol, tf, limit=limit))):
+                start = time.perf_counter()
+                df = read(storage, symbols[0], '1m', limit)
+                timings[name] = time.perf_counter() - start
+                assert len(df) == limit
+            
+            logger.info(
+                f"read {limit:>9,} of {rows:,} rows: orm {timings['orm'] * 1000:.1f}ms, "
+                f"raw cursor {timings['raw cursor'] * 1000:.1f}ms "
+                f"({timings['orm'] / timings['raw cursor']:.1f}x)"
+            )
+        
+        storage.close()
+
+
+def run(name, save, candles, batch_size):
+    """Time inserting all candles in batches, then re-saving them (all duplicates)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = SQLiteStorage(os.path.join(tmp, 'benchmark.db'))
+        
+        start = time.perf_counter()
+        for i in range(0, len(candles), batch_size):
+            save(storage, 'BTC/USDT', '1m', candles[i:i + batch_size])
+        insert_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        save(storage, 'BTC/USDT', '1m', candles[-batch_size:])
+        duplicate_time = time.perf_counter() - start
+        
+        storage.close()
+    
+    logger.info(
+        f"{name:>12}: {len(candles) / insert_time:>10,.0f} inserts/sec "
+        f"({insert_time:.2f}s), re-saving {batch_size} duplicates {duplicate_time * 1000:.1f}ms"
+    )
+    return insert_time
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description='Benchmark market data storage')
+    parser.add_argument('--candles', type=int, default=100_000)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    parser.add_argument('--read-rows', type=int, default=1_000_000,
+                        help='Table size for the read benchmark (0 skips it)')
+    parser.add_argument('--skip-writes', action='store_true')
+    args = parser.parse_args()
+    
+    if args.read_rows:
+        run_reads(args.read_rows)
+    if args.skip_writes:
+        return
+    
+    candles = make_candles(args.candles)
+    
+    per_candle = run('per-candle', save_per_candle, candles, args.batch_size)
+    bulk = run('bulk upsert', lambda s, *a: s.save_market_data(*a), candles, args.batch_size)
+    
+    logger.info(f"Speedup: {per_candle / bulk:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""
+Script to convert historical CSV files into the partitioned Parquet store
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import glob
+import logging
+from src.backtesting.historical_store import HistoricalStore
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Convert every CSV in the input directory into the store"""
+    parser = argparse.ArgumentParser(description='Convert historical CSV files to the Parquet store')
+    parser.add_argument('--input-dir', default='data/historical', help='Directory with <BASE>_<QUOTE>_<timeframe>.csv files')
+    parser.add_argument('--store', default='data/store', help='Store root directory')
+    args = parser.parse_args()
+    
+    store = HistoricalStore(args.store)
+    
+    for csv_path in sorted(glob.glob(os.path.join(args.input_dir, '*.csv'))):
+        try:
+            symbol, timeframe, rows = store.convert_csv(csv_path)
+            logger.info(f"{symbol} {timeframe}: {rows} rows, {len(store.partitions(symbol, timeframe))} partitions")
+        except Exception as e:
+            logger.error(f"Error converting {csv_path}: {e}")
+            continue
+
+
+if __name__ == '__main__':
+    main()
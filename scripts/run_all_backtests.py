@@ -44,20 +44,32 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def run_backtest(strategy, symbol, timeframe, data_dir='data/historical'):
+def load_dataset(symbol, timeframe, datasets, data_dir='data/historical'):
+    """Load (symbol, timeframe) data once and share it between all strategies"""
+    key = (symbol, timeframe)
+    if key not in datasets:
+        downloader = DataDownloader()
+        dataset = downloader.load_dataset(symbol, timeframe, data_dir=data_dir, cache_dir='data/cache')
+        datasets[key] = dataset if len(dataset) > 0 else None
+    return datasets[key]
+
+
+def run_backtest(strategy, symbol, timeframe, data_dir='data/historical', datasets=None):
     """Run backtest for a single strategy"""
     try:
         logger.info(f"\n{'='*80}")
         logger.info(f"Running backtest: {strategy.name} on {symbol} {timeframe}")
         logger.info(f"{'='*80}")
         
-        downloader = DataDownloader()
-        df = downloader.load_data(symbol, timeframe, data_dir=data_dir)
+        if datasets is None:
+            datasets = {}
+        dataset = load_dataset(symbol, timeframe, datasets, data_dir=data_dir)
         
-        if len(df) == 0:
+        if dataset is None:
             logger.error(f"No data available for {symbol} {timeframe}")
             return None
         
+        df = dataset.to_frame()
         logger.info(f"Loaded {len(df)} rows from {df.index[0]} to {df.index[-1]}")
         
         engine = BacktestEngine(
@@ -123,19 +135,25 @@ def main():
     ]
     
     all_results = []
+    datasets = {}
     
-    for symbol in symbols:
-        for strategy_name, strategy_factory, timeframe in strategies_config:
-            strategy = strategy_factory(symbol)
-            results = run_backtest(strategy, symbol, timeframe)
-            
-            if results:
-                all_results.append({
-                    'strategy': strategy_name,
-                    'symbol': symbol,
-                    'timeframe': timeframe,
-                    **results
-                })
+    try:
+        for symbol in symbols:
+            for strategy_name, strategy_factory, timeframe in strategies_config:
+                strategy = strategy_factory(symbol)
+                results = run_backtest(strategy, symbol, timeframe, datasets=datasets)
+                
+                if results:
+                    all_results.append({
+                        'strategy': strategy_name,
+                        'symbol': symbol,
+                        'timeframe': timeframe,
+                        **results
+                    })
+    finally:
+        for dataset in datasets.values():
+            if dataset is not None:
+                dataset.close()
     
     logger.info("\n" + "="*80)
     logger.info("SUMMARY OF ALL BACKTESTS")
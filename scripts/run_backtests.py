@@ -148,7 +148,8 @@ def main():
             logger.info(f"\nLoading data: {test_config['symbol']} {test_config['timeframe']}")
             data = downloader.load_data(
                 symbol=test_config['symbol'],
-                timeframe=test_config['timeframe']
+                timeframe=test_config['timeframe'],
+                cache_dir='data/cache'
             )
             
             results, metrics = run_strategy_backtest(
@@ -8,6 +8,7 @@ Based on Phase G findings, this script implements:
 3. Adjusted strategy thresholds
 """
 
+import argparse
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -47,7 +48,7 @@ def load_data():
     return data_5m, data_1h
 
 
-def optimize_momentum(data_1h):
+def optimize_momentum(data_1h, n_jobs: int = -1):
     """
     Optimize Momentum_1h strategy with improved parameters
     
@@ -61,7 +62,7 @@ def optimize_momentum(data_1h):
     logger.info("="*80)
     
     engine = BacktestEngine(initial_capital=10000.0)
-    optimizer = ParameterOptimizer(engine, use_composite_objective=True)
+    optimizer = ParameterOptimizer(engine, use_composite_objective=True, n_jobs=n_jobs)
     
     param_grid = {
         'ema_fast': [8, 10, 12, 15],  # Wider range
@@ -82,22 +83,21 @@ def optimize_momentum(data_1h):
     best_score = float('-inf')
     robust_params = []
     
-    for i, combo in enumerate(product(*param_grid.values())):
+    combinations = list(product(*param_grid.values()))
+    all_cv_results = optimizer.cross_validate_many(
+        MomentumStrategy,
+        [
+            {'symbol': 'BTC/USDT', 'timeframe': '1h', **dict(zip(param_grid.keys(), combo))}
+            for combo in combinations
+        ],
+        data_1h,
+        n_splits=4,
+        symbol='BTC/USDT',
+        min_trades_per_fold=15  # RELAXED from 30
+    )
+    
+    for i, (combo, cv_results) in enumerate(zip(combinations, all_cv_results)):
         params = dict(zip(param_grid.keys(), combo))
-        config = {
-            'symbol': 'BTC/USDT',
-            'timeframe': '1h',
-            **params
-        }
-        
-        cv_results = optimizer.cross_validate(
-            MomentumStrategy,
-            config,
-            data_1h,
-            n_splits=4,
-            symbol='BTC/USDT',
-            min_trades_per_fold=15  # RELAXED from 30
-        )
         
         if cv_results.get('robust', False):
             composite_score = cv_results.get('sharpe_ratio_mean', 0) - \
@@ -129,7 +129,7 @@ def optimize_momentum(data_1h):
     return robust_params, best_params
 
 
-def optimize_universal_macd(data_5m):
+def optimize_universal_macd(data_5m, n_jobs: int = -1):
     """
     Optimize UniversalMacd_5m strategy with improved parameters
     
@@ -143,7 +143,7 @@ def optimize_universal_macd(data_5m):
     logger.info("="*80)
     
     engine = BacktestEngine(initial_capital=10000.0)
-    optimizer = ParameterOptimizer(engine, use_composite_objective=True)
+    optimizer = ParameterOptimizer(engine, use_composite_objective=True, n_jobs=n_jobs)
     
     param_grid = {
         'buy_umacd_min': [-0.03, -0.025, -0.02, -0.015],  # Wider range
@@ -164,22 +164,21 @@ def optimize_universal_macd(data_5m):
     best_score = float('-inf')
     robust_params = []
     
-    for i, combo in enumerate(product(*param_grid.values())):
+    combinations = list(product(*param_grid.values()))
+    all_cv_results = optimizer.cross_validate_many(
+        UniversalMacdStrategy,
+        [
+            {'symbol': 'BTC/USDT', 'timeframe': '5m', **dict(zip(param_grid.keys(), combo))}
+            for combo in combinations
+        ],
+        data_5m,
+        n_splits=4,
+        symbol='BTC/USDT',
+        min_trades_per_fold=15  # RELAXED from 30
+    )
+    
+    for i, (combo, cv_results) in enumerate(zip(combinations, all_cv_results)):
         params = dict(zip(param_grid.keys(), combo))
-        config = {
-            'symbol': 'BTC/USDT',
-            'timeframe': '5m',
-            **params
-        }
-        
-        cv_results = optimizer.cross_validate(
-            UniversalMacdStrategy,
-            config,
-            data_5m,
-            n_splits=4,
-            symbol='BTC/USDT',
-            min_trades_per_fold=15  # RELAXED from 30
-        )
         
         if cv_results.get('robust', False):
             composite_score = cv_results.get('sharpe_ratio_mean', 0) - \
@@ -211,7 +210,7 @@ def optimize_universal_macd(data_5m):
     return robust_params, best_params
 
 
-def optimize_volatility_system(data_1h):
+def optimize_volatility_system(data_1h, n_jobs: int = -1):
     """
     Optimize VolatilitySystem_1h strategy with improved parameters
     
@@ -225,7 +224,7 @@ def optimize_volatility_system(data_1h):
     logger.info("="*80)
     
     engine = BacktestEngine(initial_capital=10000.0)
-    optimizer = ParameterOptimizer(engine, use_composite_objective=True)
+    optimizer = ParameterOptimizer(engine, use_composite_objective=True, n_jobs=n_jobs)
     
     param_grid = {
         'atr_period': [10, 12, 14, 16, 20],  # Wider range
@@ -246,22 +245,21 @@ def optimize_volatility_system(data_1h):
     best_score = float('-inf')
     robust_params = []
     
-    for i, combo in enumerate(product(*param_grid.values())):
+    combinations = list(product(*param_grid.values()))
+    all_cv_results = optimizer.cross_validate_many(
+        VolatilitySystemStrategy,
+        [
+            {'symbol': 'BTC/USDT', 'timeframe': '1h', **dict(zip(param_grid.keys(), combo))}
+            for combo in combinations
+        ],
+        data_1h,
+        n_splits=4,
+        symbol='BTC/USDT',
+        min_trades_per_fold=15  # RELAXED from 30
+    )
+    
+    for i, (combo, cv_results) in enumerate(zip(combinations, all_cv_results)):
         params = dict(zip(param_grid.keys(), combo))
-        config = {
-            'symbol': 'BTC/USDT',
-            'timeframe': '1h',
-            **params
-        }
-        
-        cv_results = optimizer.cross_validate(
-            VolatilitySystemStrategy,
-            config,
-            data_1h,
-            n_splits=4,
-            symbol='BTC/USDT',
-            min_trades_per_fold=15  # RELAXED from 30
-        )
         
         if cv_results.get('robust', False):
             composite_score = cv_results.get('sharpe_ratio_mean', 0) - \
@@ -394,6 +392,10 @@ def generate_report(momentum_results, macd_results, volatility_results):
 
 def main():
     """Main optimization workflow"""
+    parser = argparse.ArgumentParser(description='Improved walk-forward optimization')
+    parser.add_argument('--n-jobs', type=int, default=-1, help='Parameter search workers (1 = serial, -1 = all cores)')
+    args = parser.parse_args()
+    
     logger.info("Starting improved walk-forward optimization...")
     logger.info(f"Start time: {datetime.now()}")
     
@@ -402,9 +404,9 @@ def main():
     
     data_5m, data_1h = load_data()
     
-    momentum_results = optimize_momentum(data_1h)
-    macd_results = optimize_universal_macd(data_5m)
-    volatility_results = optimize_volatility_system(data_1h)
+    momentum_results = optimize_momentum(data_1h, args.n_jobs)
+    macd_results = optimize_universal_macd(data_5m, args.n_jobs)
+    volatility_results = optimize_volatility_system(data_1h, args.n_jobs)
     
     report = generate_report(momentum_results, macd_results, volatility_results)
     
@@ -6,6 +6,7 @@ Runs 4-fold cross-validation with composite objective function
 and robustness checks on top 3 performing strategies.
 """
 
+import argparse
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -16,6 +17,7 @@ from datetime import datetime
 
 from src.backtesting.backtest_engine import BacktestEngine
 from src.backtesting.optimizer import ParameterOptimizer
+from src.backtesting.data_downloader import DataDownloader
 from src.strategies.momentum import MomentumStrategy
 from src.strategies.universal_macd_strategy import UniversalMacdStrategy
 from src.strategies.volatility_system_strategy import VolatilitySystemStrategy
@@ -35,12 +37,12 @@ def load_data(symbol: str, timeframe: str) -> pd.DataFrame:
         logger.error(f"Data file not found: {data_file}")
         return None
     
-    df = pd.read_csv(data_file, index_col=0, parse_dates=True)
+    df = DataDownloader().load_data(symbol, timeframe, cache_dir='data/cache')
     logger.info(f"Loaded {len(df)} rows from {data_file}")
     return df
 
 
-def run_walk_forward_momentum():
+def run_walk_forward_momentum(n_jobs: int = -1):
     """Run walk-forward optimization on Momentum_1h strategy"""
     logger.info("\n" + "="*80)
     logger.info("WALK-FORWARD OPTIMIZATION: Momentum_1h")
@@ -54,7 +56,8 @@ def run_walk_forward_momentum():
     optimizer = ParameterOptimizer(
         engine,
         optimization_metric='sharpe_ratio',
-        use_composite_objective=True
+        use_composite_objective=True,
+        n_jobs=n_jobs
     )
     
     base_config = {
@@ -84,18 +87,17 @@ def run_walk_forward_momentum():
     
     logger.info(f"\nTesting {len(combinations)} parameter combinations with 4-fold CV...")
     
-    for i, combo in enumerate(combinations):
+    all_cv_results = optimizer.cross_validate_many(
+        MomentumStrategy,
+        [{**base_config, **dict(zip(param_names, combo))} for combo in combinations],
+        data,
+        n_splits=4,
+        symbol='BTC/USDT',
+        min_trades_per_fold=30
+    )
+    
+    for i, (combo, cv_results) in enumerate(zip(combinations, all_cv_results)):
         params = dict(zip(param_names, combo))
-        config = {**base_config, **params}
-        
-        cv_results = optimizer.cross_validate(
-            MomentumStrategy,
-            config,
-            data,
-            n_splits=4,
-            symbol='BTC/USDT',
-            min_trades_per_fold=30
-        )
         
         if not cv_results.get('robust', False):
             logger.info(f"  [{i+1}/{len(combinations)}] {params} -> FAILED robustness check")
@@ -143,7 +145,7 @@ def run_walk_forward_momentum():
     }
 
 
-def run_walk_forward_universal_macd():
+def run_walk_forward_universal_macd(n_jobs: int = -1):
     """Run walk-forward optimization on UniversalMacd_5m strategy"""
     logger.info("\n" + "="*80)
     logger.info("WALK-FORWARD OPTIMIZATION: UniversalMacd_5m")
@@ -157,7 +159,8 @@ def run_walk_forward_universal_macd():
     optimizer = ParameterOptimizer(
         engine,
         optimization_metric='sharpe_ratio',
-        use_composite_objective=True
+        use_composite_objective=True,
+        n_jobs=n_jobs
     )
     
     base_config = {
@@ -188,18 +191,17 @@ def run_walk_forward_universal_macd():
     
     logger.info(f"\nTesting {len(combinations)} parameter combinations with 4-fold CV...")
     
-    for i, combo in enumerate(combinations):
+    all_cv_results = optimizer.cross_validate_many(
+        UniversalMacdStrategy,
+        [{**base_config, **dict(zip(param_names, combo))} for combo in combinations],
+        data,
+        n_splits=4,
+        symbol='BTC/USDT',
+        min_trades_per_fold=30
+    )
+    
+    for i, (combo, cv_results) in enumerate(zip(combinations, all_cv_results)):
         params = dict(zip(param_names, combo))
-        config = {**base_config, **params}
-        
-        cv_results = optimizer.cross_validate(
-            UniversalMacdStrategy,
-            config,
-            data,
-            n_splits=4,
-            symbol='BTC/USDT',
-            min_trades_per_fold=30
-        )
         
         if not cv_results.get('robust', False):
             logger.info(f"  [{i+1}/{len(combinations)}] {params} -> FAILED robustness check")
@@ -248,7 +250,7 @@ def run_walk_forward_universal_macd():
     }
 
 
-def run_walk_forward_volatility_system():
+def run_walk_forward_volatility_system(n_jobs: int = -1):
     """Run walk-forward optimization on VolatilitySystem_1h strategy"""
     logger.info("\n" + "="*80)
     logger.info("WALK-FORWARD OPTIMIZATION: VolatilitySystem_1h")
@@ -262,7 +264,8 @@ def run_walk_forward_volatility_system():
     optimizer = ParameterOptimizer(
         engine,
         optimization_metric='sharpe_ratio',
-        use_composite_objective=True
+        use_composite_objective=True,
+        n_jobs=n_jobs
     )
     
     base_config = {
@@ -293,18 +296,17 @@ def run_walk_forward_volatility_system():
     
     logger.info(f"\nTesting {len(combinations)} parameter combinations with 4-fold CV...")
     
-    for i, combo in enumerate(combinations):
+    all_cv_results = optimizer.cross_validate_many(
+        VolatilitySystemStrategy,
+        [{**base_config, **dict(zip(param_names, combo))} for combo in combinations],
+        data,
+        n_splits=4,
+        symbol='BTC/USDT',
+        min_trades_per_fold=30
+    )
+    
+    for i, (combo, cv_results) in enumerate(zip(combinations, all_cv_results)):
         params = dict(zip(param_names, combo))
-        config = {**base_config, **params}
-        
-        cv_results = optimizer.cross_validate(
-            VolatilitySystemStrategy,
-            config,
-            data,
-            n_splits=4,
-            symbol='BTC/USDT',
-            min_trades_per_fold=30
-        )
         
         if not cv_results.get('robust', False):
             logger.info(f"  [{i+1}/{len(combinations)}] {params} -> FAILED robustness check")
@@ -420,18 +422,22 @@ def create_optimization_report(results: list):
 
 def main():
     """Main execution"""
+    parser = argparse.ArgumentParser(description='Walk-forward optimization of the top strategies')
+    parser.add_argument('--n-jobs', type=int, default=-1, help='Parameter search workers (1 = serial, -1 = all cores)')
+    args = parser.parse_args()
+    
     logger.info("Starting Phase G: Walk-Forward Optimization")
     logger.info(f"Timestamp: {datetime.now()}\n")
     
     results = []
     
-    result1 = run_walk_forward_momentum()
+    result1 = run_walk_forward_momentum(args.n_jobs)
     results.append(result1)
     
-    result2 = run_walk_forward_universal_macd()
+    result2 = run_walk_forward_universal_macd(args.n_jobs)
     results.append(result2)
     
-    result3 = run_walk_forward_volatility_system()
+    result3 = run_walk_forward_volatility_system(args.n_jobs)
     results.append(result3)
     
     report = create_optimization_report(results)
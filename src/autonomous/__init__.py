@@ -3,6 +3,7 @@ Autonomous Trading Infrastructure
 
 Phase B: Core Autonomous Infrastructure
 - ExitPlanMonitor: Monitors and enforces exit plans
+- ExitTriggerBook: Sorted per-symbol stop/take-profit trigger levels
 - AutonomousDecisionEngine: Main decision-making loop
 - EnhancedRiskManager: Advanced risk management with daily limits
 
@@ -14,7 +15,7 @@ Phase E: Autonomous Trading System
 - Dashboard: Web-based monitoring dashboard
 """
 
-from src.autonomous.exit_plan_monitor import ExitPlanMonitor, ExitPlan, ExitReason
+from src.autonomous.exit_plan_monitor import ExitPlanMonitor, ExitPlan, ExitReason, ExitTriggerBook
 from src.autonomous.autonomous_decision_engine import AutonomousDecisionEngine, Position, DecisionLog
 from src.autonomous.enhanced_risk_manager import EnhancedRiskManager, DailyRiskState
 from src.autonomous.autonomous_trading_system import AutonomousTradingSystem
@@ -31,6 +32,7 @@ __all__ = [
     'ExitPlanMonitor',
     'ExitPlan',
     'ExitReason',
+    'ExitTriggerBook',
     'AutonomousDecisionEngine',
     'Position',
     'DecisionLog',
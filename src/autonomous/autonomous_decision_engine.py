@@ -2,7 +2,8 @@
 Autonomous Decision Engine
 
 Main engine for autonomous trading with zero human interaction.
-Runs continuous 2-3 minute loops to:
+Runs continuous 2-3 minute loops (or, with schedule='events', reacts to
+candle closes and price updates from the PriceFeed) to:
 1. Fetch market data
 2. Generate signals from all strategies
 3. Make trading decisions based on confidence
@@ -17,14 +18,15 @@ import logging
 import time
 import asyncio
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 from dataclasses import dataclass
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 from src.autonomous.exit_plan_monitor import ExitPlanMonitor, ExitPlan, ExitReason
 from src.autonomous.enhanced_risk_manager import EnhancedRiskManager
 from src.strategies.base_strategy import BaseStrategy, TradingSignal, SignalAction
-from src.data.price_feed import PriceFeed
+from src.data.price_feed import PriceFeedReader
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +65,13 @@ class AutonomousDecisionEngine:
     Main autonomous trading engine.
     
     Runs continuous loops to make trading decisions without human intervention.
+    
+    Schedules:
+    - 'interval': every loop_interval_seconds, evaluate every strategy and
+      check every open position
+    - 'events': evaluate a strategy when its (symbol, timeframe) closes a
+      candle, and check a position's exit plan when a price update crosses one
+      of its trigger levels (see ExitTriggerBook)
     """
     
     def __init__(
@@ -70,11 +79,15 @@ class AutonomousDecisionEngine:
         strategies: List[BaseStrategy],
         exit_monitor: ExitPlanMonitor,
         risk_manager: EnhancedRiskManager,
-        price_feed: PriceFeed,
+        price_feed: PriceFeedReader,
         loop_interval_seconds: int = 180,  # 3 minutes
         max_open_positions: int = 5,
         min_confidence_threshold: float = 0.7,
         enable_trading: bool = False,  # Safety: disabled by default
+        schedule: str = 'interval',
+        strategy_timeout: float = 30.0,
+        evaluation_budget: Optional[float] = None,
+        strategy_workers: int = 4,
     ):
         """
         Initialize autonomous decision engine
@@ -83,12 +96,27 @@ class AutonomousDecisionEngine:
             strategies: List of trading strategies to use
             exit_monitor: Exit plan monitor instance
             risk_manager: Enhanced risk manager instance
-            price_feed: Real-time price feed service
-            loop_interval_seconds: Time between decision loops (default 180s = 3min)
+            price_feed: Real-time price feed service (PriceFeed or RemotePriceFeed)
+            loop_interval_seconds: Time between decision loops (default 180s = 3min,
+                'interval' schedule only)
             max_open_positions: Maximum number of concurrent positions
             min_confidence_threshold: Minimum confidence to enter trades
             enable_trading: Whether to actually execute trades (safety flag)
+            schedule: 'interval' (fixed loop) or 'events' (candle closes and
+                price updates from the price feed)
+            strategy_timeout: Seconds a strategy may take to produce a signal
+                (a strategy's own evaluation_timeout attribute takes precedence)
+            evaluation_budget: Seconds all strategies of one loop may take
+                together (default: strategy_timeout)
+            strategy_workers: Threads running synchronous strategies
         """
+        if schedule not in ('interval', 'events'):
+            raise ValueError(f"Unsupported schedule: {schedule}")
+        if strategy_timeout <= 0 or (evaluation_budget is not None and evaluation_budget <= 0):
+            raise ValueError("strategy_timeout and evaluation_budget must be positive")
+        if strategy_workers < 1:
+            raise ValueError("strategy_workers must be at least 1")
+        
         self.strategies = strategies
         self.exit_monitor = exit_monitor
         self.risk_manager = risk_manager
@@ -97,6 +125,9 @@ class AutonomousDecisionEngine:
         self.max_open_positions = max_open_positions
         self.min_confidence_threshold = min_confidence_threshold
         self.enable_trading = enable_trading
+        self.strategy_timeout = strategy_timeout
+        self.evaluation_budget = evaluation_budget or strategy_timeout
+        self.strategy_workers = strategy_workers
         
         self.is_running = False
         self.open_positions: Dict[str, Position] = {}
@@ -105,9 +136,31 @@ class AutonomousDecisionEngine:
         self.total_loops = 0
         self.total_decisions = 0
         
+        self.schedule = schedule
+        self._subscribed = False
+        self._pending_candles: Dict[Tuple[str, str], float] = {}
+        self._pending_exits: Dict[str, Tuple[float, float]] = {}
+        self._decision_round: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self.event_metrics: Dict[str, Any] = {
+            'candle_events': 0,
+            'ticker_events': 0,
+            'strategies_evaluated': 0,
+            'exit_triggers': 0,
+            'last_latency_ms': 0.0,
+            'max_latency_ms': 0.0,
+            'last_exit_latency_ms': 0.0,
+            'max_exit_latency_ms': 0.0
+        }
+        
+        self._strategy_executor: Optional[ThreadPoolExecutor] = None
+        self._evaluating: Set[int] = set()
+        self.strategy_stats: Dict[str, Dict[str, Any]] = {}
+        
         logger.info(
             f"AutonomousDecisionEngine initialized: "
             f"{len(strategies)} strategies, "
+            f"schedule: {schedule}, "
             f"loop interval: {loop_interval_seconds}s, "
             f"max positions: {max_open_positions}, "
             f"min confidence: {min_confidence_threshold}, "
@@ -127,7 +180,14 @@ class AutonomousDecisionEngine:
             logger.warning("⚠️  TRADING DISABLED - Running in simulation mode only")
         
         try:
-            while self.is_running:
+            if self.schedule == 'events':
+                while self.is_running:
+                    try:
+                        await self.process_events(timeout=1.0)
+                    except Exception as e:
+                        logger.error(f"Error processing market events: {e}", exc_info=True)
+            
+            while self.is_running and self.schedule == 'interval':
                 loop_start = datetime.now()
                 
                 try:
@@ -157,9 +217,134 @@ class AutonomousDecisionEngine:
         """Stop the autonomous trading loop"""
         logger.info("Stopping autonomous trading engine...")
         self.is_running = False
+        
+        if self._subscribed:
+            self.price_feed.unsubscribe(self._on_candle_close)
+            self.price_feed.unsubscribe(self._on_price_update)
+            self._subscribed = False
+        
+        if self._decision_round is not None and not self._decision_round.done():
+            self._decision_round.cancel()
+        
+        if self._strategy_executor is not None:
+            self._strategy_executor.shutdown(wait=False)
+            self._strategy_executor = None
+    
+    def _subscribe_to_feed(self) -> None:
+        """Subscribe to candle closes of every strategy's key and to price updates"""
+        if self._subscribed:
+            return
+        
+        for symbol, timeframe in {self._strategy_key(strategy) for strategy in self.strategies}:
+            self.price_feed.subscribe_candles(symbol, timeframe, self._on_candle_close)
+        self.price_feed.subscribe_tickers(self._on_price_update)
+        self._subscribed = True
     
-    async def _run_decision_loop(self) -> None:
-        """Run one iteration of the decision loop"""
+    def _on_candle_close(self, symbol: str, timeframe: str, window: Any) -> None:
+        """Queue the strategies of a closed candle's key for evaluation"""
+        self.event_metrics['candle_events'] += 1
+        self._pending_candles.setdefault((symbol, timeframe), time.perf_counter())
+        self._wakeup.set()
+    
+    def _on_price_update(self, symbol: str, snapshot: Any) -> None:
+        """Queue an exit check when a price crosses an exit plan's trigger level"""
+        self.event_metrics['ticker_events'] += 1
+        
+        price = snapshot.price if snapshot is not None else self.price_feed.get_latest_price(symbol)
+        if price and self.exit_monitor.trigger_book.crossed(symbol, price):
+            received = self._pending_exits.get(symbol, (None, time.perf_counter()))[1]
+            self._pending_exits[symbol] = (price, received)
+            self._wakeup.set()
+    
+    async def process_events(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for candle-close or price events and act on them ('events' schedule)
+        
+        Exit checks run inline; strategy evaluation runs as a background
+        decision round, so a crossed trigger level is acted on while a slow
+        strategy is still computing. Events arriving while an exit batch or a
+        round is processed are coalesced into the next one: a burst of crossing
+        price updates costs one exit check per symbol, at the latest crossing
+        price, and candle closes wait for the running round to finish.
+        
+        Args:
+            timeout: Seconds to wait for an event (None waits indefinitely)
+            
+        Returns:
+            Whether any event was processed
+        """
+        self._subscribe_to_feed()
+        
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._wakeup.clear()
+        
+        exits, self._pending_exits = self._pending_exits, {}
+        if exits:
+            await self._check_exit_triggers(exits)
+        
+        candles: Dict[Tuple[str, str], float] = {}
+        if self._pending_candles and (self._decision_round is None or self._decision_round.done()):
+            candles, self._pending_candles = self._pending_candles, {}
+            self._decision_round = asyncio.create_task(self._run_candle_round(candles))
+        
+        return bool(exits or candles)
+    
+    async def _run_candle_round(self, candles: Dict[Tuple[str, str], float]) -> None:
+        """
+        Evaluate the strategies of closed candles (background decision round)
+        
+        Args:
+            candles: (symbol, timeframe) -> perf_counter time the close was received
+        """
+        try:
+            await self._run_decision_loop(keys=set(candles))
+        except Exception as e:
+            logger.error(f"Error in decision loop: {e}", exc_info=True)
+        finally:
+            latency_ms = (time.perf_counter() - min(candles.values())) * 1000
+            self.event_metrics['last_latency_ms'] = latency_ms
+            self.event_metrics['max_latency_ms'] = max(self.event_metrics['max_latency_ms'], latency_ms)
+            
+            if self._pending_candles:
+                self._wakeup.set()
+    
+    async def _check_exit_triggers(self, prices: Dict[str, Tuple[float, float]]) -> None:
+        """
+        Check the exit plans whose trigger levels were crossed, and close those that exit
+        
+        Args:
+            prices: Symbol -> (crossing price, perf_counter time it was received)
+        """
+        for symbol, (price, received) in prices.items():
+            self.event_metrics['exit_triggers'] += 1
+            
+            for position_id, exit_signal in self.exit_monitor.check_price(symbol, price):
+                position = self.open_positions.get(position_id)
+                if position is not None:
+                    await self._close_position(position, exit_signal)
+            
+            latency_ms = (time.perf_counter() - received) * 1000
+            self.event_metrics['last_exit_latency_ms'] = latency_ms
+            self.event_metrics['max_exit_latency_ms'] = max(
+                self.event_metrics['max_exit_latency_ms'], latency_ms
+            )
+    
+    @staticmethod
+    def _strategy_key(strategy: BaseStrategy) -> Tuple[str, str]:
+        """(symbol, timeframe) a strategy trades"""
+        return getattr(strategy, 'symbol', 'BTC/USDT'), getattr(strategy, 'timeframe', '1h')
+    
+    async def _run_decision_loop(self, keys: Optional[Set[Tuple[str, str]]] = None) -> None:
+        """
+        Run one iteration of the decision loop
+        
+        Args:
+            keys: Only evaluate strategies trading these (symbol, timeframe)
+                keys (default: all strategies)
+        """
         self.total_loops += 1
         self.last_loop_time = datetime.now()
         
@@ -181,7 +366,9 @@ class AutonomousDecisionEngine:
             )
             return
         
-        await self._monitor_exit_conditions()
+        await self._monitor_exit_conditions(
+            symbols=None if keys is None else {symbol for symbol, _ in keys}
+        )
         
         if len(self.open_positions) >= self.max_open_positions:
             logger.info(
@@ -189,7 +376,11 @@ class AutonomousDecisionEngine:
             )
             return
         
-        signals = await self._generate_signals_from_all_strategies()
+        strategies = None
+        if keys is not None:
+            strategies = [s for s in self.strategies if self._strategy_key(s) in keys]
+        
+        signals = await self._generate_signals_from_all_strategies(strategies)
         
         best_signal = self._select_best_signal(signals)
         
@@ -200,16 +391,25 @@ class AutonomousDecisionEngine:
         
         self._log_statistics()
     
-    async def _monitor_exit_conditions(self) -> None:
-        """Monitor all open positions and exit if conditions met"""
-        if not self.open_positions:
+    async def _monitor_exit_conditions(self, symbols: Optional[Set[str]] = None) -> None:
+        """
+        Monitor open positions and exit if conditions met
+        
+        Args:
+            symbols: Only check positions in these symbols (default: all)
+        """
+        positions = {
+            position_id: position for position_id, position in self.open_positions.items()
+            if symbols is None or position.symbol in symbols
+        }
+        if not positions:
             return
         
-        logger.info(f"👀 Monitoring {len(self.open_positions)} open positions...")
+        logger.debug(f"👀 Monitoring {len(positions)} open positions...")
         
         positions_to_close = []
         
-        for position_id, position in self.open_positions.items():
+        for position_id, position in positions.items():
             current_price = self.price_feed.get_latest_price(position.symbol)
             
             timeframe = position.metadata.get('timeframe', '1h')
@@ -247,6 +447,10 @@ class AutonomousDecisionEngine:
             position: Position to close
             exit_signal: Exit signal with reason and details
         """
+        if position.position_id not in self.open_positions:
+            # Already closed by the exit path while a decision round was running
+            return
+        
         exit_price = exit_signal['price']
         
         if position.side == 'long':
@@ -293,70 +497,175 @@ class AutonomousDecisionEngine:
         del self.open_positions[position.position_id]
         self.exit_monitor.remove_exit_plan(position.position_id)
     
-    async def _generate_signals_from_all_strategies(self) -> List[TradingSignal]:
+    async def _generate_signals_from_all_strategies(
+        self,
+        strategies: Optional[List[BaseStrategy]] = None
+    ) -> List[TradingSignal]:
         """
-        Generate signals from all strategies
+        Generate signals from all strategies concurrently
+        
+        Strategies that do not finish within the evaluation budget are
+        cancelled and contribute no signal.
         
+        Args:
+            strategies: Strategies to evaluate (default: all)
+            
         Returns:
-            List of trading signals
+            List of trading signals, in strategy order
         """
-        signals = []
+        strategies = self.strategies if strategies is None else strategies
+        self.event_metrics['strategies_evaluated'] += len(strategies)
         
-        logger.info(f"📡 Generating signals from {len(self.strategies)} strategies...")
+        logger.info(f"📡 Generating signals from {len(strategies)} strategies...")
         
-        for strategy in self.strategies:
-            try:
-                symbol = getattr(strategy, 'symbol', 'BTC/USDT')
-                timeframe = getattr(strategy, 'timeframe', '1h')
-                
-                current_price = self.price_feed.get_latest_price(symbol)
-                
-                if current_price == 0:
-                    logger.warning(f"No price data for {symbol}, skipping {strategy.name}")
-                    continue
-                
-                indicators = self.price_feed.get_indicators(symbol, timeframe)
-                latest_candle = self.price_feed.get_latest_candle(symbol, timeframe)
-                
-                market_data = {
-                    'symbol': symbol,
-                    'price': current_price,
-                    'timestamp': datetime.now(),
-                    'timeframe': timeframe,
-                    'volume': latest_candle['volume'] if latest_candle else 0.0,
-                    'open': latest_candle['open'] if latest_candle else current_price,
-                    'high': latest_candle['high'] if latest_candle else current_price,
-                    'low': latest_candle['low'] if latest_candle else current_price,
-                    'close': latest_candle['close'] if latest_candle else current_price
-                }
-                
-                has_position = any(
-                    p.symbol == symbol for p in self.open_positions.values()
-                )
-                
-                current_position = None
-                if has_position:
-                    current_position = {'symbol': symbol}
-                
-                signal = strategy.generate_signal(
-                    market_data,
-                    indicators,
-                    current_position
-                )
-                
-                if signal.action != SignalAction.HOLD:
-                    signals.append(signal)
-                    logger.info(
-                        f"  ✓ {strategy.name}: {signal.action.value} "
-                        f"confidence={signal.confidence:.2f} @ ${current_price:.2f}"
-                    )
-            
-            except Exception as e:
-                logger.error(f"Error generating signal from {strategy.name}: {e}")
+        tasks: Dict[asyncio.Task, BaseStrategy] = {}
+        for strategy in strategies:
+            if id(strategy) in self._evaluating:
+                logger.warning(f"  ✗ {strategy.name}: previous evaluation still running, skipping")
+                self._strategy_stats(strategy)['skipped'] += 1
+                continue
+            tasks[asyncio.create_task(self._evaluate_strategy(strategy))] = strategy
+        
+        if not tasks:
+            return []
+        
+        done, pending = await asyncio.wait(tasks, timeout=self.evaluation_budget)
+        
+        for task in pending:
+            task.cancel()
+            logger.warning(
+                f"  ✗ {tasks[task].name}: evaluation budget of {self.evaluation_budget}s exceeded"
+            )
+            self._strategy_stats(tasks[task])['timeouts'] += 1
+        await asyncio.gather(*pending, return_exceptions=True)
+        
+        signals = [
+            task.result() for task in tasks
+            if task in done and task.result() is not None
+        ]
         
         logger.info(f"📊 Generated {len(signals)} non-HOLD signals")
         return signals
     
+    async def _evaluate_strategy(self, strategy: BaseStrategy) -> Optional[TradingSignal]:
+        """
+        Evaluate one strategy within its timeout
+        
+        Coroutine strategies (e.g. SingleAgentStrategy) are awaited on the event
+        loop as generate_signal(symbol, timeframe, market_data); regular ones run
+        generate_signal(market_data, indicators, current_position) on the
+        strategy thread pool.
+        
+        Args:
+            strategy: Strategy to evaluate
+            
+        Returns:
+            Non-HOLD signal, or None
+        """
+        stats = self._strategy_stats(strategy)
+        symbol, timeframe = self._strategy_key(strategy)
+        
+        current_price = self.price_feed.get_latest_price(symbol)
+        
+        if current_price == 0:
+            logger.warning(f"No price data for {symbol}, skipping {strategy.name}")
+            return None
+        
+        indicators = self.price_feed.get_indicators(symbol, timeframe)
+        latest_candle = self.price_feed.get_latest_candle(symbol, timeframe)
+        
+        market_data = {
+            'symbol': symbol,
+            'price': current_price,
+            'timestamp': datetime.now(),
+            'timeframe': timeframe,
+            'volume': latest_candle['volume'] if latest_candle else 0.0,
+            'open': latest_candle['open'] if latest_candle else current_price,
+            'high': latest_candle['high'] if latest_candle else current_price,
+            'low': latest_candle['low'] if latest_candle else current_price,
+            'close': latest_candle['close'] if latest_candle else current_price
+        }
+        
+        has_position = any(
+            p.symbol == symbol for p in self.open_positions.values()
+        )
+        
+        current_position = None
+        if has_position:
+            current_position = {'symbol': symbol}
+        
+        timeout = getattr(strategy, 'evaluation_timeout', None) or self.strategy_timeout
+        key = id(strategy)
+        eval_start = time.perf_counter()
+        stats['evaluations'] += 1
+        
+        self._evaluating.add(key)
+        try:
+            if asyncio.iscoroutinefunction(strategy.generate_signal):
+                try:
+                    signal = await asyncio.wait_for(
+                        strategy.generate_signal(symbol, timeframe, market_data),
+                        timeout
+                    )
+                finally:
+                    self._evaluating.discard(key)
+            else:
+                # A timed-out call keeps its worker thread until it returns;
+                # the strategy stays marked as evaluating until then
+                try:
+                    future = self._get_strategy_executor().submit(
+                        strategy.generate_signal,
+                        market_data,
+                        indicators,
+                        current_position
+                    )
+                except Exception:
+                    self._evaluating.discard(key)
+                    raise
+                future.add_done_callback(lambda _: self._evaluating.discard(key))
+                signal = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        
+        except asyncio.TimeoutError:
+            stats['timeouts'] += 1
+            logger.warning(f"  ✗ {strategy.name}: no signal within {timeout}s")
+            return None
+        except Exception as e:
+            stats['errors'] += 1
+            logger.error(f"Error generating signal from {strategy.name}: {e}")
+            return None
+        finally:
+            stats['last_ms'] = (time.perf_counter() - eval_start) * 1000
+        
+        if signal is None or signal.action == SignalAction.HOLD:
+            return None
+        
+        logger.info(
+            f"  ✓ {strategy.name}: {signal.action.value} "
+            f"confidence={signal.confidence:.2f} @ ${current_price:.2f}"
+        )
+        return signal
+    
+    def _get_strategy_executor(self) -> ThreadPoolExecutor:
+        """Thread pool for synchronous strategies, created on first use"""
+        if self._strategy_executor is None:
+            self._strategy_executor = ThreadPoolExecutor(
+                max_workers=self.strategy_workers,
+                thread_name_prefix='strategy'
+            )
+        return self._strategy_executor
+    
+    def _strategy_stats(self, strategy: BaseStrategy) -> Dict[str, Any]:
+        """Evaluation counters of a strategy"""
+        if strategy.name not in self.strategy_stats:
+            self.strategy_stats[strategy.name] = {
+                'evaluations': 0,
+                'timeouts': 0,
+                'errors': 0,
+                'skipped': 0,
+                'last_ms': 0.0
+            }
+        return self.strategy_stats[strategy.name]
+    
     def _select_best_signal(
         self,
         signals: List[TradingSignal]
@@ -558,6 +867,9 @@ class AutonomousDecisionEngine:
             'open_positions': len(self.open_positions),
             'max_open_positions': self.max_open_positions,
             'last_loop_time': self.last_loop_time,
+            'schedule': self.schedule,
+            'event_metrics': dict(self.event_metrics),
+            'strategy_stats': {name: dict(stats) for name, stats in self.strategy_stats.items()},
             'enable_trading': self.enable_trading,
             'decision_log_size': len(self.decision_log)
         }
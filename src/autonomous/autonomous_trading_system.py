@@ -62,6 +62,7 @@ class AutonomousTradingSystem:
         dashboard_port: int = 8080,
         max_consecutive_errors: int = 5,
         error_cooldown_seconds: int = 300,
+        schedule: str = 'interval',
     ):
         """
         Initialize autonomous trading system
@@ -80,6 +81,8 @@ class AutonomousTradingSystem:
             dashboard_port: Port for web dashboard
             max_consecutive_errors: Max errors before system pause
             error_cooldown_seconds: Cooldown period after errors
+            schedule: 'interval' (fixed loop) or 'events' (candle closes and
+                price updates from the price feed)
         """
         self.strategies = strategies
         self.price_feed = price_feed
@@ -109,6 +112,7 @@ class AutonomousTradingSystem:
             max_open_positions=max_open_positions,
             min_confidence_threshold=min_confidence_threshold,
             enable_trading=enable_trading,
+            schedule=schedule,
         )
         self.performance_monitor = PerformanceMonitor(
             initial_capital=initial_capital,
@@ -208,7 +212,11 @@ class AutonomousTradingSystem:
                     self.error_recovery.reset_error_count()
                     continue
                 
-                await self.decision_engine._run_decision_loop()
+                if self.decision_engine.schedule == 'events':
+                    if not await self.decision_engine.process_events(timeout=1.0):
+                        continue
+                else:
+                    await self.decision_engine._run_decision_loop()
                 
                 self.error_recovery.record_success()
                 
@@ -230,7 +238,8 @@ class AutonomousTradingSystem:
                     logger.warning("⏸️  Pausing system for cooldown period")
                     await asyncio.sleep(self.error_recovery.cooldown_seconds)
             
-            await asyncio.sleep(self.loop_interval_seconds)
+            if self.decision_engine.schedule == 'interval':
+                await asyncio.sleep(self.loop_interval_seconds)
     
     async def _run_performance_monitoring(self) -> None:
         """Run continuous performance monitoring"""
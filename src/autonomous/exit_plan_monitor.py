@@ -11,8 +11,10 @@ This is a critical component for zero human interaction trading.
 """
 
 import logging
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -80,6 +82,141 @@ class ExitPlan:
             self.lowest_price = self.entry_price
 
 
+class SortedLevels:
+    """Price levels kept in ascending order, each tagged with a position ID"""
+    
+    def __init__(self):
+        self.prices: List[float] = []
+        self.position_ids: List[str] = []
+    
+    def __len__(self) -> int:
+        return len(self.prices)
+    
+    def add(self, price: float, position_id: str) -> None:
+        i = bisect_right(self.prices, price)
+        self.prices.insert(i, price)
+        self.position_ids.insert(i, position_id)
+    
+    def remove(self, price: float, position_id: str) -> None:
+        i = bisect_left(self.prices, price)
+        while self.position_ids[i] != position_id:
+            i += 1
+        del self.prices[i]
+        del self.position_ids[i]
+    
+    def at_or_below(self, price: float) -> List[str]:
+        return self.position_ids[:bisect_right(self.prices, price)]
+    
+    def at_or_above(self, price: float) -> List[str]:
+        return self.position_ids[bisect_left(self.prices, price):]
+
+
+class ExitTriggerBook:
+    """
+    Per-symbol sorted trigger levels of exit plans
+    
+    Each plan is indexed by the price band inside which checking it cannot
+    change anything: for a long, above its stop-loss and tiered pullback exit
+    and below its take-profit, next tiered peak and trailing high (mirrored
+    for shorts). A price update only visits the plans whose band it leaves,
+    found by bisection, instead of every open position.
+    
+    Levels are recomputed by ExitPlanMonitor whenever it checks a plan; the
+    time-based exit is not price-driven and needs a periodic full check.
+    """
+    
+    # Widen bands slightly so float rounding can never skip a crossing
+    TOLERANCE = 1e-9
+    
+    def __init__(self):
+        self.lower: Dict[str, SortedLevels] = defaultdict(SortedLevels)  # crossed at price <= level
+        self.upper: Dict[str, SortedLevels] = defaultdict(SortedLevels)  # crossed at price >= level
+        self.bands: Dict[str, Tuple[str, float, float]] = {}
+    
+    def __len__(self) -> int:
+        return len(self.bands)
+    
+    @staticmethod
+    def trigger_levels(plan: ExitPlan) -> Tuple[float, float]:
+        """
+        Price band of a plan
+        
+        Args:
+            plan: Exit plan
+            
+        Returns:
+            (lower, upper): the plan must be checked at or beyond either level
+        """
+        scale = plan.entry_price / (100.0 * (plan.leverage or 1.0))
+        side = -1.0 if plan.is_short else 1.0
+        
+        adverse = [plan.stop_loss]
+        favorable = [plan.take_profit]
+        
+        if plan.tiered_trailing_enabled:
+            # A new P&L peak moves the tiered stop; a 30% pullback from it exits
+            favorable.append(plan.entry_price + side * plan.peak_pnl_pct * scale)
+            if plan.peak_pnl_pct > 0:
+                adverse.append(plan.entry_price + side * 0.7 * plan.peak_pnl_pct * scale)
+        
+        if plan.trailing_stop_pct is not None:
+            favorable.append(plan.lowest_price if plan.is_short else plan.highest_price)
+        
+        if plan.is_short:
+            lower, upper = max(favorable), min(adverse)
+        else:
+            lower, upper = max(adverse), min(favorable)
+        
+        return lower * (1 + ExitTriggerBook.TOLERANCE), upper * (1 - ExitTriggerBook.TOLERANCE)
+    
+    def index(self, plan: ExitPlan) -> None:
+        """
+        Index (or re-index) a plan at its current levels
+        
+        Args:
+            plan: Exit plan
+        """
+        self.remove(plan.position_id)
+        
+        lower, upper = self.trigger_levels(plan)
+        self.lower[plan.symbol].add(lower, plan.position_id)
+        self.upper[plan.symbol].add(upper, plan.position_id)
+        self.bands[plan.position_id] = (plan.symbol, lower, upper)
+    
+    def remove(self, position_id: str) -> None:
+        """
+        Remove a plan
+        
+        Args:
+            position_id: Position identifier
+        """
+        band = self.bands.pop(position_id, None)
+        if band is None:
+            return
+        
+        symbol, lower, upper = band
+        self.lower[symbol].remove(lower, position_id)
+        self.upper[symbol].remove(upper, position_id)
+    
+    def crossed(self, symbol: str, price: float) -> List[str]:
+        """
+        Plans whose band a price leaves
+        
+        Args:
+            symbol: Trading pair symbol
+            price: Current market price
+            
+        Returns:
+            Position IDs to check
+        """
+        crossed = []
+        if symbol in self.lower:
+            crossed.extend(self.lower[symbol].at_or_above(price))
+        if symbol in self.upper:
+            crossed.extend(self.upper[symbol].at_or_below(price))
+        return crossed
+
+
 class ExitPlanMonitor:
     """
     Monitors exit plans for all open positions and determines when to exit.
@@ -101,6 +238,7 @@ class ExitPlanMonitor:
         self.exit_plans: Dict[str, ExitPlan] = {}
         self.exit_history: List[Dict[str, Any]] = []
         self.max_holding_hours = max_holding_hours
+        self.trigger_book = ExitTriggerBook()
         
         logger.info(f"ExitPlanMonitor initialized: max_holding_hours={max_holding_hours}")
     
@@ -112,6 +250,7 @@ class ExitPlanMonitor:
             exit_plan: ExitPlan object with stop-loss, take-profit, etc.
         """
         self.exit_plans[exit_plan.position_id] = exit_plan
+        self.trigger_book.index(exit_plan)
         
         logger.info(
             f"Added exit plan for {exit_plan.symbol} position {exit_plan.position_id}: "
@@ -128,6 +267,7 @@ class ExitPlanMonitor:
         """
         if position_id in self.exit_plans:
             del self.exit_plans[position_id]
+            self.trigger_book.remove(position_id)
             logger.info(f"Removed exit plan for position {position_id}")
     
     def check_tiered_trailing_profit(
@@ -311,7 +451,37 @@ class ExitPlanMonitor:
         if position_id not in self.exit_plans:
             return None
         
-        plan = self.exit_plans[position_id]
+        exit_signal = self._check_exit_conditions(self.exit_plans[position_id], current_price)
+        
+        if position_id in self.exit_plans:
+            self.trigger_book.index(self.exit_plans[position_id])
+        
+        return exit_signal
+    
+    def check_price(self, symbol: str, current_price: float) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Check the exit plans of a symbol whose trigger levels a price crossed
+        
+        Equivalent to check_exit_conditions on every plan of the symbol, except
+        for the max holding time, which needs a periodic full check.
+        
+        Args:
+            symbol: Trading pair symbol
+            current_price: Current market price
+            
+        Returns:
+            (position_id, exit signal) for every plan that should exit
+        """
+        exits = []
+        for position_id in self.trigger_book.crossed(symbol, current_price):
+            exit_signal = self.check_exit_conditions(position_id, current_price, {}, {})
+            if exit_signal and exit_signal['should_exit']:
+                exits.append((position_id, exit_signal))
+        return exits
+    
+    def _check_exit_conditions(self, plan: ExitPlan, current_price: float) -> Optional[Dict[str, Any]]:
+        """Check a plan's exit conditions, updating its trailing levels"""
+        position_id = plan.position_id
         
         holding_hours = (datetime.now() - plan.created_at).total_seconds() / 3600
         if holding_hours >= self.max_holding_hours:
@@ -8,10 +8,32 @@ from .backtest_engine import BacktestEngine
 from .performance import PerformanceMetrics
 from .optimizer import ParameterOptimizer
 from .walk_forward import WalkForwardOptimizer
+from .shared_dataset import SharedDataset, SharedDatasetHandle
+from .historical_store import HistoricalStore
+from .async_downloader import AsyncDataDownloader
+from .indicator_cache import IndicatorCache
+from .fill_model import IntrabarFillModel, first_touch
+from .portfolio_backtester import PortfolioBacktester, PortfolioSleeve
+from .timeframe_alignment import TimeframeAlignment, AlignedBars
+from .ledger import Trade, TradeLedger, EquityLedger
 
 __all__ = [
     'BacktestEngine',
     'PerformanceMetrics',
     'ParameterOptimizer',
-    'WalkForwardOptimizer'
+    'WalkForwardOptimizer',
+    'SharedDataset',
+    'SharedDatasetHandle',
+    'HistoricalStore',
+    'AsyncDataDownloader',
+    'IndicatorCache',
+    'IntrabarFillModel',
+    'first_touch',
+    'PortfolioBacktester',
+    'PortfolioSleeve',
+    'TimeframeAlignment',
+    'AlignedBars',
+    'Trade',
+    'TradeLedger',
+    'EquityLedger'
 ]
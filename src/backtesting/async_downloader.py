@@ -0,0 +1,440 @@
+"""
+Async Historical Downloader
+
+Concurrent, resumable OHLCV downloads into the HistoricalStore.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+import pandas as pd
+import numpy as np
+import ccxt
+import ccxt.async_support as ccxt_async
+
+from ..utils.rate_limiter import RateLimiter, get_rate_limiter, request_weight
+from .historical_store import HistoricalStore
+
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+
+def month_chunks(start_ts: int, end_ts: int) -> List[Tuple[int, int]]:
+    """
+    Split a millisecond range at calendar month boundaries (UTC)
+
+    Args:
+        start_ts: Range start (ms, inclusive)
+        end_ts: Range end (ms, exclusive)
+
+    Returns:
+        List of (start_ms, end_ms) chunks
+    """
+    chunks = []
+    current = start_ts
+    while current < end_ts:
+        month_start = pd.Timestamp(current, unit='ms').to_period('M').to_timestamp()
+        next_month = int((month_start + pd.offsets.MonthBegin(1)).value // 1_000_000)
+        chunks.append((current, min(next_month, end_ts)))
+        current = next_month
+    return chunks
+
+
+def candles_to_frame(candles: List[List[float]]) -> pd.DataFrame:
+    """Convert CCXT OHLCV rows into a timestamp-indexed DataFrame"""
+    df = pd.DataFrame(candles, columns=['timestamp'] + OHLCV_COLUMNS)
+    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+    df = df.set_index('timestamp')
+    return df[~df.index.duplicated(keep='last')].sort_index()
+
+
+class AsyncDataDownloader:
+    """
+    Download many symbol/timeframe series concurrently into a HistoricalStore
+
+    Each series is split into calendar-month chunks that are fetched
+    concurrently (bounded by max_concurrency) under the shared exchange rate
+    budget. Chunks write to the store every flush_rows candles (one writer per
+    series at a time), and their progress is checkpointed to disk after each
+    flush so an interrupted run resumes where it stopped. Failing requests are
+    retried with backoff; a chunk that keeps failing is reported instead of
+    retried forever. After downloading, gaps larger than 1.5 candles (the
+    validate_data criterion) are refetched once.
+
+    Usage:
+        downloader = AsyncDataDownloader('binance', store=HistoricalStore('data/store'))
+        summary = await downloader.download(['BTC/USDT'], ['5m'], '2024-01-01')
+        await downloader.close()
+    """
+
+    def __init__(
+        self,
+        exchange_id: str = 'binance',
+        store: Optional[HistoricalStore] = None,
+        checkpoint_dir: Optional[str] = None,
+        max_concurrency: int = 4,
+        limit: int = 1000,
+        flush_rows: int = 10000,
+        max_retries: int = 5,
+        retry_delay: float = 1.0,
+        exchange: Optional[Any] = None,
+        rate_limiter: Optional[RateLimiter] = None
+    ):
+        """
+        Initialize downloader
+
+        Args:
+            exchange_id: CCXT exchange ID
+            store: Target store (defaults to HistoricalStore())
+            checkpoint_dir: Checkpoint directory (defaults to <store root>/_checkpoints)
+            max_concurrency: Maximum chunks downloading at once
+            limit: Candles per request
+            flush_rows: Candles buffered per chunk before writing to the store
+            max_retries: Consecutive failures (rate limits included) before a chunk is abandoned
+            retry_delay: Initial delay between retries (seconds, doubles each retry)
+            exchange: Async CCXT exchange (created from exchange_id by default)
+            rate_limiter: Rate limiter (defaults to the shared one for the exchange)
+        """
+        self.exchange_id = exchange_id
+        self.store = store or HistoricalStore()
+        self.checkpoint_dir = checkpoint_dir or os.path.join(self.store.root, '_checkpoints')
+        self.max_concurrency = max_concurrency
+        self.limit = limit
+        self.flush_rows = flush_rows
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.rate_limiter = rate_limiter or get_rate_limiter(exchange_id)
+
+        # The shared token bucket paces requests; CCXT's per-instance throttle
+        # would serialize the concurrent chunks
+        self.exchange = exchange or getattr(ccxt_async, exchange_id)({
+            'enableRateLimit': False,
+            'options': {'defaultType': 'spot'}
+        })
+
+        self._checkpoints: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._write_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+    async def close(self):
+        """Close the exchange connection"""
+        if hasattr(self.exchange, 'close'):
+            await self.exchange.close()
+
+    async def download(
+        self,
+        symbols: List[str],
+        timeframes: List[str],
+        start_date: str,
+        end_date: Optional[str] = None,
+        backfill_gaps: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Download all symbol/timeframe pairs over a date range
+
+        Args:
+            symbols: Trading pairs
+            timeframes: Timeframes
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD, exclusive), defaults to now
+            backfill_gaps: Refetch gaps found after downloading
+
+        Returns:
+            Dict of 'SYMBOL timeframe' -> {'rows', 'chunks', 'failed_chunks', 'gaps', 'gaps_backfilled'}
+        """
+        start_ts = int(pd.Timestamp(start_date).value // 1_000_000)
+        end = pd.Timestamp(end_date) if end_date else pd.Timestamp.now(tz='UTC').tz_localize(None)
+        end_ts = int(end.value // 1_000_000)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        series = [(symbol, timeframe) for symbol in symbols for timeframe in timeframes]
+
+        results = await asyncio.gather(*[
+            self.download_series(symbol, timeframe, start_ts, end_ts, semaphore, backfill_gaps)
+            for symbol, timeframe in series
+        ])
+
+        return {f"{symbol} {timeframe}": result for (symbol, timeframe), result in zip(series, results)}
+
+    async def download_series(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_ts: int,
+        end_ts: int,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        backfill_gaps: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Download one series, resuming from its checkpoint
+
+        Args:
+            symbol: Trading pair
+            timeframe: Timeframe
+            start_ts: Range start (ms, inclusive)
+            end_ts: Range end (ms, exclusive)
+            semaphore: Shared concurrency limit
+            backfill_gaps: Refetch gaps found after downloading
+
+        Returns:
+            Summary dict
+        """
+        semaphore = semaphore or asyncio.Semaphore(self.max_concurrency)
+        checkpoint = self._load_checkpoint(symbol, timeframe)
+
+        chunks = month_chunks(start_ts, end_ts)
+        pending = []
+        for chunk_start, chunk_end in chunks:
+            if not self._chunk_state(checkpoint, chunk_start, chunk_end)['done']:
+                pending.append((chunk_start, chunk_end))
+
+        if len(pending) < len(chunks):
+            logger.info(
+                f"Resuming {symbol} {timeframe}: {len(chunks) - len(pending)}/{len(chunks)} chunks already done"
+            )
+
+        rows = await asyncio.gather(*[
+            self._download_chunk(symbol, timeframe, chunk_start, chunk_end, semaphore)
+            for chunk_start, chunk_end in pending
+        ])
+
+        failed = [
+            self._chunk_key(chunk_start) for chunk_start, _ in pending
+            if not checkpoint['chunks'][self._chunk_key(chunk_start)]['done']
+        ]
+
+        gaps = self.find_gaps(symbol, timeframe, start_ts, end_ts)
+        backfilled = 0
+        if backfill_gaps and gaps:
+            logger.info(f"Backfilling {len(gaps)} gap(s) in {symbol} {timeframe}")
+            backfilled = await self.backfill_gaps(symbol, timeframe, gaps, semaphore)
+            gaps = self.find_gaps(symbol, timeframe, start_ts, end_ts)
+
+        summary = {
+            'rows': int(sum(rows)) + backfilled,
+            'chunks': len(chunks),
+            'failed_chunks': failed,
+            'gaps': len(gaps),
+            'gaps_backfilled': backfilled
+        }
+        logger.info(f"Downloaded {symbol} {timeframe}: {summary}")
+        return summary
+
+    def find_gaps(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_ts: Optional[int] = None,
+        end_ts: Optional[int] = None
+    ) -> List[Tuple[int, int]]:
+        """
+        Find missing candle ranges in the store
+
+        Args:
+            symbol: Trading pair
+            timeframe: Timeframe
+            start_ts: Range start (ms)
+            end_ts: Range end (ms)
+
+        Returns:
+            List of (first_missing_ms, last_missing_ms) ranges
+        """
+        if not self.store.exists(symbol, timeframe):
+            return []
+
+        stored = self.store.read(
+            symbol,
+            timeframe,
+            columns=['close'],
+            start=pd.Timestamp(start_ts, unit='ms') if start_ts is not None else None,
+            end=pd.Timestamp(end_ts, unit='ms') if end_ts is not None else None
+        )
+        if len(stored) < 2:
+            return []
+
+        step = ccxt.Exchange.parse_timeframe(timeframe) * 1000
+        timestamps = stored.index.to_numpy(dtype='datetime64[ms]').view(np.int64)
+        diffs = np.diff(timestamps)
+        gap_positions = np.flatnonzero(diffs > step * 1.5)
+
+        return [
+            (int(timestamps[i] + step), int(timestamps[i + 1] - step))
+            for i in gap_positions
+        ]
+
+    async def backfill_gaps(
+        self,
+        symbol: str,
+        timeframe: str,
+        gaps: List[Tuple[int, int]],
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> int:
+        """
+        Refetch missing candle ranges
+
+        Args:
+            symbol: Trading pair
+            timeframe: Timeframe
+            gaps: Ranges from find_gaps
+            semaphore: Shared concurrency limit
+
+        Returns:
+            Number of candles stored
+        """
+        semaphore = semaphore or asyncio.Semaphore(self.max_concurrency)
+        rows = await asyncio.gather(*[
+            self._fetch_range(symbol, timeframe, gap_start, gap_end + 1, semaphore)
+            for gap_start, gap_end in gaps
+        ])
+        return int(sum(rows))
+
+    async def _download_chunk(
+        self,
+        symbol: str,
+        timeframe: str,
+        chunk_start: int,
+        chunk_end: int,
+        semaphore: asyncio.Semaphore
+    ) -> int:
+        """Download one checkpointed chunk"""
+        state = self._load_checkpoint(symbol, timeframe)['chunks'][self._chunk_key(chunk_start)]
+
+        def on_flush(next_ts: int, done: bool):
+            state['next'] = next_ts
+            state['done'] = done
+            self._save_checkpoint(symbol, timeframe)
+
+        return await self._fetch_range(symbol, timeframe, state['next'], chunk_end, semaphore, on_flush)
+
+    async def _fetch_range(
+        self,
+        symbol: str,
+        timeframe: str,
+        since: int,
+        end_ts: int,
+        semaphore: asyncio.Semaphore,
+        on_flush: Optional[Any] = None
+    ) -> int:
+        """Page through [since, end_ts), writing to the store every flush_rows candles"""
+        weight = request_weight(self.exchange_id, 'fetch_ohlcv', self.limit)
+        buffered: List[List[float]] = []
+        stored = 0
+        failures = 0
+        done = False
+
+        async with semaphore:
+            while since < end_ts:
+                try:
+                    await self.rate_limiter.acquire('market_data', weight)
+                    candles = await self.exchange.fetch_ohlcv(
+                        symbol, timeframe, since=since, limit=self.limit
+                    )
+                    failures = 0
+                except Exception as e:
+                    failures += 1
+                    if failures > self.max_retries:
+                        logger.error(
+                            f"Giving up on {symbol} {timeframe} from "
+                            f"{pd.Timestamp(since, unit='ms')} after {self.max_retries} retries: {e}"
+                        )
+                        break
+                    if isinstance(e, (ccxt.RateLimitExceeded, ccxt.DDoSProtection)):
+                        logger.warning(f"Rate limited downloading {symbol} {timeframe}: {e}")
+                        self.rate_limiter.penalize('market_data')
+                        continue
+                    delay = self.retry_delay * 2 ** (failures - 1)
+                    logger.warning(f"Error downloading {symbol} {timeframe} ({e}), retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+                    continue
+
+                candles = [candle for candle in candles if since <= candle[0] < end_ts]
+                if not candles:
+                    done = True
+                    break
+
+                buffered.extend(candles)
+                since = int(candles[-1][0]) + 1
+
+                if len(buffered) >= self.flush_rows:
+                    stored += await self._flush(symbol, timeframe, buffered)
+                    buffered = []
+                    if on_flush:
+                        on_flush(since, False)
+            else:
+                done = True
+
+            stored += await self._flush(symbol, timeframe, buffered)
+            if on_flush:
+                on_flush(since, done)
+
+        return stored
+
+    async def _flush(self, symbol: str, timeframe: str, candles: List[List[float]]) -> int:
+        """Write buffered candles to the store (one writer per series at a time)"""
+        if not candles:
+            return 0
+        df = candles_to_frame(candles)
+        lock = self._write_locks.setdefault((symbol, timeframe), asyncio.Lock())
+        async with lock:
+            return await asyncio.to_thread(self.store.write, df, symbol, timeframe, 'append')
+
+    @staticmethod
+    def _chunk_key(chunk_start: int) -> str:
+        """Checkpoint key of the month a chunk falls in (stable for open-ended ranges)"""
+        return pd.Timestamp(chunk_start, unit='ms').strftime('%Y-%m')
+
+    def _chunk_state(self, checkpoint: Dict[str, Any], chunk_start: int, chunk_end: int) -> Dict[str, Any]:
+        """
+        Get a chunk's checkpoint state, reconciled with the range requested now
+
+        The state records progress towards state['end']: [start, next) is
+        stored. A later run that asks for more of the month (the current month
+        of an open-ended download) resumes from next instead of starting over;
+        one that starts earlier in the month than the checkpoint restarts it.
+        """
+        key = self._chunk_key(chunk_start)
+        state = checkpoint['chunks'].get(key)
+
+        if state is None or state['start'] > chunk_start:
+            state = {'start': chunk_start, 'end': chunk_end, 'next': chunk_start, 'done': False}
+        elif not state['done'] or chunk_end > state['end']:
+            state['end'] = chunk_end
+            state['done'] = False
+
+        checkpoint['chunks'][key] = state
+        return state
+
+    def _checkpoint_path(self, symbol: str, timeframe: str) -> str:
+        symbol_clean = symbol.replace('/', '_').replace(':', '_')
+        return os.path.join(self.checkpoint_dir, f"{symbol_clean}_{timeframe}.json")
+
+    def _load_checkpoint(self, symbol: str, timeframe: str) -> Dict[str, Any]:
+        """Get the in-memory checkpoint of a series, reading it from disk once"""
+        key = (symbol, timeframe)
+        if key not in self._checkpoints:
+            checkpoint = {'symbol': symbol, 'timeframe': timeframe, 'chunks': {}}
+            path = self._checkpoint_path(symbol, timeframe)
+            if os.path.exists(path):
+                try:
+                    with open(path) as f:
+                        checkpoint = json.load(f)
+                except ValueError:
+                    logger.warning(f"Ignoring corrupt checkpoint {path}")
+                # Drop chunks written before checkpoints were keyed by month
+                checkpoint['chunks'] = {
+                    chunk_key: state for chunk_key, state in checkpoint['chunks'].items()
+                    if 'start' in state
+                }
+            self._checkpoints[key] = checkpoint
+        return self._checkpoints[key]
+
+    def _save_checkpoint(self, symbol: str, timeframe: str) -> None:
+        """Write a series checkpoint atomically"""
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        path = self._checkpoint_path(symbol, timeframe)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self._checkpoints[(symbol, timeframe)], f)
+        os.replace(tmp_path, path)
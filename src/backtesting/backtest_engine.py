@@ -6,35 +6,26 @@ Integrates with existing strategies and provides realistic simulation.
 """
 
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
 from dataclasses import dataclass, field
 
-from ..strategies.base_strategy import BaseStrategy, TradingSignal, SignalAction
+from ..strategies.base_strategy import BaseStrategy, TradingSignal, SignalAction, VectorizedSignals
 from ..data.indicators import TechnicalIndicators
+from .shared_dataset import SharedDataset, as_frame
+from .fill_model import IntrabarFillModel, BarFills
+from .ledger import Trade, TradeLedger, EquityLedger
+from .performance import max_drawdown_pct
+
+if TYPE_CHECKING:
+    from .timeframe_alignment import TimeframeAlignment
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
-class Trade:
-    """Represents a completed trade"""
-    entry_time: datetime
-    exit_time: datetime
-    symbol: str
-    side: str  # 'long' or 'short'
-    entry_price: float
-    exit_price: float
-    size: float
-    leverage: float
-    pnl: float
-    pnl_pct: float
-    fees: float
-    duration_minutes: float
-    exit_reason: str
-    metadata: Dict[str, Any] = field(default_factory=dict)
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
 
 
 @dataclass
@@ -49,6 +40,35 @@ class Position:
     stop_loss: Optional[float] = None
     take_profit: Optional[float] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    scheduled_exit: Optional[Tuple[int, float, str]] = None  # (bar, price, reason) from the fill model
+
+
+class BarView(Mapping):
+    """
+    Read-only view of a single bar over pre-extracted column arrays
+
+    Behaves like the per-bar dicts strategies have always received, but
+    values are read lazily from the shared arrays so building a view is
+    O(1) regardless of how many indicator columns the data carries.
+    """
+
+    __slots__ = ('_columns', '_index')
+
+    def __init__(self, columns: Dict[str, np.ndarray], index: int):
+        self._columns = columns
+        self._index = index
+
+    def __getitem__(self, key: str) -> Any:
+        return self._columns[key][self._index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __repr__(self) -> str:
+        return f"BarView({dict(self)})"
 
 
 class BacktestEngine:
@@ -62,6 +82,8 @@ class BacktestEngine:
     - Multiple timeframe support
     - Position tracking
     - Trade logging
+    - Intrabar stop-loss / take-profit fills (optional, see IntrabarFillModel)
+    - Closed higher-timeframe bars per base bar (optional, see TimeframeAlignment)
     """
     
     def __init__(
@@ -70,7 +92,10 @@ class BacktestEngine:
         maker_fee: float = 0.0002,  # 0.02%
         taker_fee: float = 0.0005,  # 0.05%
         slippage_pct: float = 0.0005,  # 0.05%
-        max_positions: int = 3
+        max_positions: int = 3,
+        use_array_kernel: bool = True,
+        use_vectorized_signals: bool = True,
+        fill_model: Optional[Union[str, IntrabarFillModel]] = None
     ):
         """
         Initialize backtest engine
@@ -81,17 +106,32 @@ class BacktestEngine:
             taker_fee: Taker fee percentage
             slippage_pct: Slippage percentage
             max_positions: Maximum concurrent positions
+            use_array_kernel: Feed strategies from pre-extracted NumPy arrays
+                instead of building a pandas row and dict per bar
+            use_vectorized_signals: Use a strategy's generate_signals_vectorized()
+                hook when it provides one
+            fill_model: Fill stops and targets against bar highs/lows, as an
+                IntrabarFillModel or its path name ('ohlc', 'worst_case');
+                None checks them against the close only
         """
+        if isinstance(fill_model, str):
+            fill_model = IntrabarFillModel(fill_model)
+        
         self.initial_capital = initial_capital
         self.maker_fee = maker_fee
         self.taker_fee = taker_fee
         self.slippage_pct = slippage_pct
         self.max_positions = max_positions
+        self.use_array_kernel = use_array_kernel
+        self.use_vectorized_signals = use_vectorized_signals
+        self.fill_model = fill_model
+        self._fills: Optional[BarFills] = None
+        self._alignment = None
         
         self.capital = initial_capital
         self.positions: List[Position] = []
-        self.trades: List[Trade] = []
-        self.equity_curve: List[Tuple[datetime, float]] = []
+        self.trades = TradeLedger()
+        self.equity_curve = EquityLedger()
         
         logger.info(
             f"BacktestEngine initialized: capital=${initial_capital}, "
@@ -99,34 +139,97 @@ class BacktestEngine:
             f"slippage={slippage_pct:.4f}"
         )
     
+    def get_config(self) -> Dict[str, Any]:
+        """
+        Get engine settings
+        
+        Returns:
+            Constructor arguments that build an equivalent, independent engine
+        """
+        return {
+            'initial_capital': self.initial_capital,
+            'maker_fee': self.maker_fee,
+            'taker_fee': self.taker_fee,
+            'slippage_pct': self.slippage_pct,
+            'max_positions': self.max_positions,
+            'use_array_kernel': self.use_array_kernel,
+            'use_vectorized_signals': self.use_vectorized_signals,
+            'fill_model': self.fill_model
+        }
+    
     def run_backtest(
         self,
         strategy: BaseStrategy,
-        data: pd.DataFrame,
-        symbol: str = 'BTC/USDT'
+        data: Union[pd.DataFrame, SharedDataset],
+        symbol: str = 'BTC/USDT',
+        higher_timeframes: Optional[Union['TimeframeAlignment', Dict[str, pd.DataFrame]]] = None
     ) -> Dict[str, Any]:
         """
         Run backtest for a strategy on historical data
         
         Args:
             strategy: Strategy instance to backtest
-            data: Historical OHLCV data with indicators
+            data: Historical OHLCV data with indicators (DataFrame or SharedDataset)
             symbol: Trading pair symbol
+            higher_timeframes: TimeframeAlignment for ``data``, or higher timeframe
+                data keyed by timeframe; bar-by-bar strategies then receive
+                market_data['timeframes'], mapping each timeframe to its last
+                closed bar (vectorized strategies should join
+                TimeframeAlignment.aligned_frame() onto ``data`` instead)
         
         Returns:
             Dict with backtest results and metrics
         """
+        data = as_frame(data)
+        
+        if isinstance(higher_timeframes, dict):
+            # Imported here: the alignment module builds on BarView
+            from .timeframe_alignment import TimeframeAlignment
+            higher_timeframes = TimeframeAlignment(data, higher_timeframes)
+        if higher_timeframes is not None and len(higher_timeframes) != len(data):
+            raise ValueError("Timeframe alignment was built for different base data")
+        self._alignment = higher_timeframes
+        
         logger.info(f"Starting backtest for {strategy.name} on {symbol}")
         logger.info(f"Data period: {data.index[0]} to {data.index[-1]} ({len(data)} bars)")
         
         self.capital = self.initial_capital
         self.positions = []
-        self.trades = []
-        self.equity_curve = []
+        self.trades = TradeLedger()
+        self.equity_curve = EquityLedger()
+        self._fills = self.fill_model.bind(data) if self.fill_model is not None else None
         
         if not strategy.is_initialized:
             strategy.initialize()
         
+        signals = None
+        if self.use_vectorized_signals:
+            signals = strategy.generate_signals_vectorized(data)
+        
+        if signals is not None:
+            self._run_vectorized_signals(strategy, data, symbol, signals)
+        elif self.use_array_kernel:
+            self._run_array_kernel(strategy, data, symbol)
+        else:
+            self._run_bar_loop(strategy, data, symbol)
+        
+        results = self._calculate_results()
+        
+        logger.info(
+            f"Backtest complete: {len(self.trades)} trades, "
+            f"Final equity: ${results['final_equity']:.2f}, "
+            f"Return: {results['total_return_pct']:.2f}%"
+        )
+        
+        return results
+    
+    def _run_bar_loop(
+        self,
+        strategy: BaseStrategy,
+        data: pd.DataFrame,
+        symbol: str
+    ):
+        """Reference loop: one pandas row and indicator dict per bar"""
         for i in range(len(data)):
             timestamp = data.index[i]
             current_bar = data.iloc[i]
@@ -140,6 +243,8 @@ class BacktestEngine:
                 'high': current_bar['high'],
                 'low': current_bar['low']
             }
+            if self._alignment is not None:
+                market_data['timeframes'] = self._alignment.bars(i)
             
             indicators = {
                 col: current_bar[col]
@@ -148,13 +253,13 @@ class BacktestEngine:
             }
             indicators['price'] = current_bar['close']
             
-            self._update_positions(timestamp, current_bar)
+            self._update_positions(timestamp, current_bar, i)
             
             if len(self.positions) < self.max_positions:
                 signal = strategy.generate_signal(market_data, indicators)
                 
                 if signal.action in [SignalAction.BUY, SignalAction.SELL]:
-                    self._open_position(signal, timestamp, current_bar)
+                    self._open_position(signal, timestamp, current_bar, i)
             
             equity = self._calculate_equity(current_bar['close'])
             self.equity_curve.append((timestamp, equity))
@@ -168,24 +273,137 @@ class BacktestEngine:
                     final_bar['close'],
                     'backtest_end'
                 )
+    
+    def _run_array_kernel(
+        self,
+        strategy: BaseStrategy,
+        data: pd.DataFrame,
+        symbol: str
+    ):
+        """
+        Array-native loop producing the same trades as _run_bar_loop
         
-        results = self._calculate_results()
+        Columns are extracted once from ``data.to_numpy()`` so each value keeps
+        the dtype a ``data.iloc[i]`` row would give it, and strategies read
+        indicators through a BarView instead of a freshly built dict.
+        """
+        matrix = data.to_numpy()
+        columns = {
+            col: np.ascontiguousarray(matrix[:, j])
+            for j, col in enumerate(data.columns)
+        }
         
-        logger.info(
-            f"Backtest complete: {len(self.trades)} trades, "
-            f"Final equity: ${results['final_equity']:.2f}, "
-            f"Return: {results['total_return_pct']:.2f}%"
-        )
+        indicator_columns = {
+            col: values
+            for col, values in columns.items()
+            if col not in OHLCV_COLUMNS
+        }
+        indicator_columns['price'] = columns['close']
+        
+        timestamps = data.index.tolist()
+        opens = columns['open']
+        highs = columns['high']
+        lows = columns['low']
+        closes = columns['close']
+        volumes = columns['volume']
+        alignment = self._alignment
+        
+        for i in range(len(timestamps)):
+            timestamp = timestamps[i]
+            current_bar = BarView(columns, i)
+            
+            market_data = {
+                'symbol': symbol,
+                'price': closes[i],
+                'timestamp': timestamp,
+                'volume': volumes[i],
+                'open': opens[i],
+                'high': highs[i],
+                'low': lows[i]
+            }
+            if alignment is not None:
+                market_data['timeframes'] = alignment.bars(i)
+            
+            self._update_positions(timestamp, current_bar, i)
+            
+            if len(self.positions) < self.max_positions:
+                signal = strategy.generate_signal(
+                    market_data, BarView(indicator_columns, i)
+                )
+                
+                if signal.action in [SignalAction.BUY, SignalAction.SELL]:
+                    self._open_position(signal, timestamp, current_bar, i)
+            
+            equity = self._calculate_equity(closes[i])
+            self.equity_curve.append((timestamp, equity))
         
-        return results
+        if self.positions:
+            for position in self.positions[:]:
+                self._close_position(
+                    position,
+                    timestamps[-1],
+                    closes[-1],
+                    'backtest_end'
+                )
+    
+    def _run_vectorized_signals(
+        self,
+        strategy: BaseStrategy,
+        data: pd.DataFrame,
+        symbol: str,
+        signals: VectorizedSignals
+    ):
+        """
+        Replay precomputed strategy signals through the position loop
+        
+        Positions, stops and equity are still path dependent and handled per
+        bar, but the strategy is only consulted for cooldown and daily limits
+        (can_trade/record_signal) on bars where it emitted a BUY or SELL.
+        """
+        matrix = data.to_numpy()
+        columns = {
+            col: np.ascontiguousarray(matrix[:, j])
+            for j, col in enumerate(data.columns)
+        }
+        
+        timestamps = data.index.tolist()
+        closes = columns['close']
+        actions = signals.action
+        
+        for i in range(len(timestamps)):
+            timestamp = timestamps[i]
+            current_bar = BarView(columns, i)
+            
+            self._update_positions(timestamp, current_bar, i)
+            
+            if actions[i] != VectorizedSignals.HOLD and len(self.positions) < self.max_positions:
+                can_trade, _ = strategy.can_trade(timestamp)
+                
+                if can_trade:
+                    signal = signals.to_signal(i, symbol, timestamp, closes[i])
+                    strategy.record_signal(signal)
+                    self._open_position(signal, timestamp, current_bar, i)
+            
+            equity = self._calculate_equity(closes[i])
+            self.equity_curve.append((timestamp, equity))
+        
+        if self.positions:
+            for position in self.positions[:]:
+                self._close_position(
+                    position,
+                    timestamps[-1],
+                    closes[-1],
+                    'backtest_end'
+                )
     
     def _open_position(
         self,
         signal: TradingSignal,
         timestamp: datetime,
-        current_bar: pd.Series
+        current_bar: Mapping,
+        index: Optional[int] = None
     ):
-        """Open a new position based on signal"""
+        """Open a new position based on signal (at bar ``index``)"""
         if signal.action == SignalAction.BUY:
             entry_price = current_bar['close'] * (1 + self.slippage_pct)
             side = 'long'
@@ -224,6 +442,11 @@ class BacktestEngine:
             }
         )
         
+        if self._fills is not None and index is not None:
+            position.scheduled_exit = self._fills.first_exit(
+                index + 1, side, position.stop_loss, position.take_profit
+            )
+        
         self.positions.append(position)
         
         logger.debug(
@@ -231,8 +454,15 @@ class BacktestEngine:
             f"leverage={leverage:.1f}x, fees=${fees:.2f}"
         )
     
-    def _update_positions(self, timestamp: datetime, current_bar: pd.Series):
-        """Update positions and check stop-loss/take-profit"""
+    def _update_positions(self, timestamp: datetime, current_bar: Mapping, index: Optional[int] = None):
+        """Update positions and check stop-loss/take-profit (at bar ``index``)"""
+        if self._fills is not None and index is not None:
+            for position in self.positions[:]:
+                if position.scheduled_exit is not None and position.scheduled_exit[0] == index:
+                    _, exit_price, exit_reason = position.scheduled_exit
+                    self._close_position(position, timestamp, exit_price, exit_reason)
+            return
+        
         current_price = current_bar['close']
         
         for position in self.positions[:]:  # Copy list to allow removal
@@ -285,7 +515,7 @@ class BacktestEngine:
         
         duration = (timestamp - position.entry_time).total_seconds() / 60
         
-        trade = Trade(
+        self.trades.add(
             entry_time=position.entry_time,
             exit_time=timestamp,
             symbol=position.symbol,
@@ -302,7 +532,6 @@ class BacktestEngine:
             metadata=position.metadata
         )
         
-        self.trades.append(trade)
         self.positions.remove(position)
         
         logger.debug(
@@ -338,7 +567,7 @@ class BacktestEngine:
                 'profit_factor': 0.0,
                 'sharpe_ratio': 0.0,
                 'max_drawdown_pct': 0.0,
-                'trades': [],
+                'trades': self.trades,
                 'equity_curve': self.equity_curve
             }
         
@@ -346,34 +575,26 @@ class BacktestEngine:
         total_return = final_equity - self.initial_capital
         total_return_pct = (total_return / self.initial_capital) * 100
         
-        winning_trades = [t for t in self.trades if t.pnl > 0]
-        losing_trades = [t for t in self.trades if t.pnl <= 0]
+        pnl = self.trades.column('pnl')
+        wins = pnl > 0
         
         num_trades = len(self.trades)
-        num_wins = len(winning_trades)
-        num_losses = len(losing_trades)
+        num_wins = int(wins.sum())
+        num_losses = num_trades - num_wins
         win_rate = (num_wins / num_trades * 100) if num_trades > 0 else 0.0
         
-        total_profit = sum(t.pnl for t in winning_trades)
-        total_loss = abs(sum(t.pnl for t in losing_trades))
+        total_profit = float(pnl[wins].sum())
+        total_loss = float(abs(pnl[~wins].sum()))
         profit_factor = (total_profit / total_loss) if total_loss > 0 else 0.0
         
         avg_win = (total_profit / num_wins) if num_wins > 0 else 0.0
         avg_loss = (total_loss / num_losses) if num_losses > 0 else 0.0
         avg_win_loss_ratio = (avg_win / avg_loss) if avg_loss > 0 else 0.0
         
-        equity_values = [eq for _, eq in self.equity_curve]
-        peak = equity_values[0]
-        max_drawdown = 0.0
+        max_drawdown = max_drawdown_pct(self.equity_curve.equity)
         
-        for equity in equity_values:
-            if equity > peak:
-                peak = equity
-            drawdown = ((peak - equity) / peak) * 100
-            max_drawdown = max(max_drawdown, drawdown)
-        
-        if len(self.trades) > 1:
-            returns = [t.pnl_pct for t in self.trades]
+        if num_trades > 1:
+            returns = self.trades.column('pnl_pct')
             avg_return = np.mean(returns)
             std_return = np.std(returns)
             sharpe_ratio = (avg_return / std_return) if std_return > 0 else 0.0
@@ -403,34 +624,8 @@ class BacktestEngine:
     
     def get_trade_dataframe(self) -> pd.DataFrame:
         """Convert trades to pandas DataFrame"""
-        if not self.trades:
-            return pd.DataFrame()
-        
-        trade_dicts = []
-        for trade in self.trades:
-            trade_dicts.append({
-                'entry_time': trade.entry_time,
-                'exit_time': trade.exit_time,
-                'symbol': trade.symbol,
-                'side': trade.side,
-                'entry_price': trade.entry_price,
-                'exit_price': trade.exit_price,
-                'size': trade.size,
-                'leverage': trade.leverage,
-                'pnl': trade.pnl,
-                'pnl_pct': trade.pnl_pct,
-                'fees': trade.fees,
-                'duration_minutes': trade.duration_minutes,
-                'exit_reason': trade.exit_reason
-            })
-        
-        return pd.DataFrame(trade_dicts)
+        return self.trades.to_frame()
     
     def get_equity_dataframe(self) -> pd.DataFrame:
         """Convert equity curve to pandas DataFrame"""
-        if not self.equity_curve:
-            return pd.DataFrame()
-        
-        df = pd.DataFrame(self.equity_curve, columns=['timestamp', 'equity'])
-        df.set_index('timestamp', inplace=True)
-        return df
+        return self.equity_curve.to_frame()
@@ -4,6 +4,7 @@ Historical Data Downloader
 Download and prepare historical cryptocurrency data for backtesting.
 """
 
+import asyncio
 import logging
 from typing import Dict, Any, List, Optional
 import pandas as pd
@@ -13,9 +14,27 @@ import time
 import os
 
 from ..data.indicators import TechnicalIndicators
+from ..utils.rate_limiter import get_rate_limiter, request_weight
+from .async_downloader import AsyncDataDownloader
+from .historical_store import HistoricalStore
+from .indicator_cache import IndicatorCache, file_fingerprint, frame_fingerprint
+from .shared_dataset import SharedDataset
 
 logger = logging.getLogger(__name__)
 
+# Parameters of the indicator set built by add_indicators. Part of the
+# indicator cache key, so bump the version whenever add_indicators changes.
+INDICATOR_CONFIG: Dict[str, Any] = {
+    'version': 1,
+    'ema_periods': [12, 26],
+    'sma_periods': [5, 20, 50, 200],
+    'donchian_periods': [10, 20],
+    'keltner': {'period': 20, 'atr_multiplier': 2.0},
+    'supertrend': {'period': 10, 'multiplier': 3.0},
+    'ichimoku': [9, 26, 52],
+    'htf': '1h'
+}
+
 
 class DataDownloader:
     """
@@ -26,7 +45,10 @@ class DataDownloader:
     - Data validation
     - Gap detection
     - Indicator calculation
-    - Data storage (CSV/Parquet)
+    - Data storage (CSV/Parquet/partitioned store)
+    - Memory-mapped indicator cache
+    - Incremental store updates
+    - Concurrent, resumable downloads (AsyncDataDownloader)
     """
     
     def __init__(self, exchange_id: str = 'binance'):
@@ -38,9 +60,11 @@ class DataDownloader:
         """
         self.exchange_id = exchange_id
         self.exchange = getattr(ccxt, exchange_id)({
-            'enableRateLimit': True,
+            # Paced by the shared RateLimiter only
+            'enableRateLimit': False,
             'options': {'defaultType': 'spot'}
         })
+        self.rate_limiter = get_rate_limiter(exchange_id)
         
         logger.info(f"DataDownloader initialized with {exchange_id}")
     
@@ -75,11 +99,34 @@ class DataDownloader:
         else:
             end_ts = int(datetime.now().timestamp() * 1000)
         
+        df = self._download_range(symbol, timeframe, start_ts, end_ts, limit)
+        
+        if len(df) > 0:
+            logger.info(
+                f"Downloaded {len(df)} candles from {df.index[0]} to {df.index[-1]}"
+            )
+        
+        return df
+    
+    def _download_range(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_ts: int,
+        end_ts: int,
+        limit: int = 1000,
+        max_retries: int = 5
+    ) -> pd.DataFrame:
+        """Download candles between two millisecond timestamps"""
         all_candles = []
+        failures = 0
         current_ts = start_ts
         
+        weight = request_weight(self.exchange_id, 'fetch_ohlcv', limit)
+        
         while current_ts < end_ts:
             try:
+                self.rate_limiter.acquire_blocking('market_data', weight)
                 candles = self.exchange.fetch_ohlcv(
                     symbol,
                     timeframe,
@@ -87,6 +134,8 @@ class DataDownloader:
                     limit=limit
                 )
                 
+                failures = 0
+                
                 if not candles:
                     break
                 
@@ -99,12 +148,23 @@ class DataDownloader:
                     f"last timestamp: {datetime.fromtimestamp(candles[-1][0]/1000)}"
                 )
                 
-                time.sleep(self.exchange.rateLimit / 1000)
-                
                 if candles[-1][0] >= end_ts:
                     break
                 
+            except (ccxt.RateLimitExceeded, ccxt.DDoSProtection) as e:
+                failures += 1
+                if failures > max_retries:
+                    logger.error(f"Giving up after {max_retries} rate-limited retries: {e}")
+                    break
+                logger.warning(f"Rate limited while downloading data: {e}")
+                self.rate_limiter.penalize('market_data')
+                continue
+            
             except Exception as e:
+                failures += 1
+                if failures > max_retries:
+                    logger.error(f"Giving up after {max_retries} retries: {e}")
+                    break
                 logger.error(f"Error downloading data: {e}")
                 time.sleep(5)
                 continue
@@ -121,12 +181,106 @@ class DataDownloader:
         
         df.sort_index(inplace=True)
         
-        logger.info(
-            f"Downloaded {len(df)} candles from {df.index[0]} to {df.index[-1]}"
-        )
-        
         return df
     
+    def download_to_store(
+        self,
+        symbols: List[str],
+        timeframes: List[str],
+        start_date: str,
+        end_date: Optional[str] = None,
+        store: Optional[HistoricalStore] = None,
+        max_concurrency: int = 4
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Download many series concurrently into a HistoricalStore, resuming
+        interrupted runs from their checkpoints (see AsyncDataDownloader)
+        
+        Args:
+            symbols: Trading pairs
+            timeframes: Timeframes
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD, exclusive), defaults to now
+            store: Target store (defaults to HistoricalStore())
+            max_concurrency: Maximum concurrent chunk downloads
+        
+        Returns:
+            Per-series download summary
+        """
+        async def run():
+            downloader = AsyncDataDownloader(
+                self.exchange_id,
+                store=store,
+                max_concurrency=max_concurrency
+            )
+            try:
+                return await downloader.download(symbols, timeframes, start_date, end_date)
+            finally:
+                await downloader.close()
+        
+        return asyncio.run(run())
+    
+    def update_store(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: str,
+        store: Optional[HistoricalStore] = None,
+        with_indicators: bool = True,
+        warmup_bars: int = 300,
+        limit: int = 1000
+    ) -> int:
+        """
+        Download only the candles missing from a HistoricalStore and append them
+        
+        Args:
+            symbol: Trading pair
+            timeframe: Timeframe
+            start_date: Start date (YYYY-MM-DD) used when nothing is stored yet
+            store: Target store (defaults to HistoricalStore())
+            with_indicators: Compute indicators for the new rows, seeded with
+                the last warmup_bars stored candles
+            warmup_bars: Stored candles used to warm up the indicators
+            limit: Number of candles per request
+        
+        Returns:
+            Number of new rows stored
+        """
+        store = store or HistoricalStore()
+        
+        last = store.last_timestamp(symbol, timeframe)
+        if last is None:
+            start_ts = int(datetime.strptime(start_date, '%Y-%m-%d').timestamp() * 1000)
+        else:
+            start_ts = int(last.value // 1_000_000) + 1
+        end_ts = int(datetime.now().timestamp() * 1000)
+        
+        new = self._download_range(symbol, timeframe, start_ts, end_ts, limit)
+        if last is not None:
+            new = new[new.index > last]
+        if new.empty:
+            logger.info(f"{symbol} {timeframe} store is up to date")
+            return 0
+        
+        if with_indicators:
+            history = pd.DataFrame()
+            if last is not None:
+                stored = store.read(
+                    symbol,
+                    timeframe,
+                    columns=list(new.columns),
+                    start=last - pd.Timedelta(self.exchange.parse_timeframe(timeframe) * warmup_bars, unit='s')
+                )
+                history = stored.iloc[-warmup_bars:]
+            
+            combined = self.add_indicators(pd.concat([history, new]))
+            new = combined[combined.index.isin(new.index)]
+        
+        rows = store.write(new, symbol, timeframe, mode='append')
+        logger.info(f"Appended {rows} {symbol} {timeframe} candles to the store")
+        
+        return rows
+    
     def validate_data(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
         Validate data quality
@@ -179,22 +333,47 @@ class DataDownloader:
         
         return validation
     
-    def add_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+    def add_indicators(
+        self,
+        df: pd.DataFrame,
+        symbol: Optional[str] = None,
+        timeframe: Optional[str] = None,
+        cache: Optional[IndicatorCache] = None
+    ) -> pd.DataFrame:
         """
         Add technical indicators to data
         
         Args:
             df: DataFrame with OHLCV data
+            symbol: Trading pair (required to use the cache)
+            timeframe: Timeframe (required to use the cache)
+            cache: Indicator cache; results for the same candles are mapped
+                from it instead of recomputed
         
         Returns:
-            DataFrame with indicators added
+            DataFrame with indicators added (read-only, float64 when served
+            from the cache)
         """
+        if cache is not None and symbol and timeframe:
+            dataset = cache.get_or_build(
+                symbol,
+                timeframe,
+                INDICATOR_CONFIG,
+                build=lambda: self._compute_indicators(df),
+                source=frame_fingerprint(df)
+            )
+            return dataset.to_frame()
+        
+        return self._compute_indicators(df)
+    
+    def _compute_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Compute the INDICATOR_CONFIG indicator set"""
         logger.info("Calculating technical indicators")
         
         indicators = TechnicalIndicators()
         
         df = indicators.calculate_rsi(df)
-        df = indicators.calculate_ema(df, periods=[12, 26])
+        df = indicators.calculate_ema(df, periods=INDICATOR_CONFIG['ema_periods'])
         df = indicators.calculate_macd(df)
         df = indicators.calculate_bollinger_bands(df)
         df = indicators.calculate_atr(df)
@@ -234,7 +413,7 @@ class DataDownloader:
         df['keltner_upper'] = df['keltner_middle'] + (2.0 * df['atr'])
         df['keltner_lower'] = df['keltner_middle'] - (2.0 * df['atr'])
         
-        df = self._calculate_supertrend(df, multiplier=3.0, period=10)
+        df = self._calculate_supertrend(df, **INDICATOR_CONFIG['supertrend'])
         
         df = self._calculate_ichimoku(df)
         
@@ -362,9 +541,13 @@ class DataDownloader:
             df: DataFrame to save
             symbol: Trading pair
             timeframe: Timeframe
-            format: File format ('csv' or 'parquet')
-            output_dir: Output directory
+            format: File format ('csv', 'parquet' or 'store')
+            output_dir: Output directory (store root for 'store')
         """
+        if format == 'store':
+            HistoricalStore(output_dir).write(df, symbol, timeframe, mode='overwrite')
+            return
+        
         os.makedirs(output_dir, exist_ok=True)
         
         symbol_clean = symbol.replace('/', '_')
@@ -385,7 +568,11 @@ class DataDownloader:
         symbol: str,
         timeframe: str,
         format: str = 'csv',
-        data_dir: str = 'data/historical'
+        data_dir: str = 'data/historical',
+        columns: Optional[List[str]] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        cache_dir: Optional[str] = None
     ) -> pd.DataFrame:
         """
         Load data from file
@@ -393,12 +580,27 @@ class DataDownloader:
         Args:
             symbol: Trading pair
             timeframe: Timeframe
-            format: File format ('csv' or 'parquet')
-            data_dir: Data directory
+            format: File format ('csv', 'parquet' or 'store')
+            data_dir: Data directory (store root for 'store')
+            columns: Columns to load ('store' only, defaults to all)
+            start: First timestamp to load ('store' only)
+            end: Last timestamp to load ('store' only)
+            cache_dir: Map the data from this indicator cache (see load_dataset)
         
         Returns:
             DataFrame with data
         """
+        if cache_dir is not None:
+            df = self.load_dataset(symbol, timeframe, format, data_dir, cache_dir).to_frame()
+            if columns is not None:
+                df = df[columns]
+            return df.loc[start:end] if start is not None or end is not None else df
+        
+        if format == 'store':
+            df = HistoricalStore(data_dir).read(symbol, timeframe, columns=columns, start=start, end=end)
+            logger.info(f"Loaded {len(df)} rows of {symbol} {timeframe} from store {data_dir}")
+            return df
+        
         symbol_clean = symbol.replace('/', '_')
         filename = f"{symbol_clean}_{timeframe}.{format}"
         filepath = os.path.join(data_dir, filename)
@@ -413,3 +615,44 @@ class DataDownloader:
         logger.info(f"Loaded {len(df)} rows from {filepath}")
         
         return df
+    
+    def load_dataset(
+        self,
+        symbol: str,
+        timeframe: str,
+        format: str = 'csv',
+        data_dir: str = 'data/historical',
+        cache_dir: str = 'data/cache'
+    ) -> SharedDataset:
+        """
+        Load data through the memory-mapped indicator cache
+        
+        The first load parses the file and writes a binary cache entry; later
+        loads (from any process) map that entry without parsing until the
+        source file changes.
+        
+        Args:
+            symbol: Trading pair
+            timeframe: Timeframe
+            format: Source format ('csv', 'parquet' or 'store')
+            data_dir: Data directory (store root for 'store')
+            cache_dir: Cache directory
+        
+        Returns:
+            Read-only memory-mapped SharedDataset
+        """
+        if format == 'store':
+            source_path = HistoricalStore(data_dir).dataset_path(symbol, timeframe)
+        else:
+            source_path = os.path.join(data_dir, f"{symbol.replace('/', '_')}_{timeframe}.{format}")
+        
+        dataset = IndicatorCache(cache_dir).get_or_build(
+            symbol,
+            timeframe,
+            {'source_format': format},
+            build=lambda: self.load_data(symbol, timeframe, format=format, data_dir=data_dir),
+            source=file_fingerprint(source_path)
+        )
+        logger.info(f"Mapped {len(dataset)} rows of {symbol} {timeframe} from {cache_dir}")
+        
+        return dataset
@@ -0,0 +1,238 @@
+"""
+Intrabar Fill Model
+
+Stop-loss and take-profit fills evaluated against each bar's high and low
+instead of only its close. The first bar touching either level is found with
+a vectorized search, and the order of hits inside that bar follows a
+configurable path assumption:
+
+- 'ohlc': price moves open -> high -> low -> close
+- 'worst_case': when a bar touches both levels, the stop-loss fills
+- 'subbar': a bar touching both levels is replayed on a lower-timeframe
+  dataset (falling back to 'worst_case' where that is still ambiguous)
+
+A bar that opens beyond a level fills at its open (gap), not at the level.
+"""
+
+import logging
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+FILL_PATHS = ('ohlc', 'worst_case', 'subbar')
+
+
+def first_touch(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    start: int,
+    below: Optional[float] = None,
+    above: Optional[float] = None,
+    end: Optional[int] = None,
+    chunk_size: int = 256
+) -> int:
+    """
+    Find the first bar whose range reaches a price level
+
+    Scans in chunks that double in size, so the cost follows the distance to
+    the hit rather than the length of the data.
+
+    Args:
+        highs: Bar highs
+        lows: Bar lows
+        start: First bar to search
+        below: Level hit when a bar's low is at or below it
+        above: Level hit when a bar's high is at or above it
+        end: Bar after the last one to search (default: all)
+        chunk_size: Size of the first chunk
+
+    Returns:
+        Index of the first touching bar, or -1
+    """
+    end = len(highs) if end is None else end
+    size = chunk_size
+
+    while start < end:
+        stop = min(end, start + size)
+
+        if below is not None and above is not None:
+            touched = (lows[start:stop] <= below) | (highs[start:stop] >= above)
+        elif below is not None:
+            touched = lows[start:stop] <= below
+        elif above is not None:
+            touched = highs[start:stop] >= above
+        else:
+            return -1
+
+        k = int(touched.argmax())
+        if touched[k]:
+            return start + k
+
+        start = stop
+        size *= 2
+
+    return -1
+
+
+class IntrabarFillModel:
+    """
+    Configuration of intrabar stop-loss / take-profit fills
+
+    Usage:
+        engine = BacktestEngine(fill_model='worst_case')
+        engine = BacktestEngine(fill_model=IntrabarFillModel('subbar', intrabar_data=df_1m))
+    """
+
+    def __init__(
+        self,
+        path: str = 'ohlc',
+        intrabar_data: Optional[pd.DataFrame] = None,
+        chunk_size: int = 256
+    ):
+        """
+        Initialize fill model
+
+        Args:
+            path: Intrabar path assumption ('ohlc', 'worst_case' or 'subbar')
+            intrabar_data: Lower-timeframe OHLC data ('subbar' path only)
+            chunk_size: First chunk size of the first-touch search
+        """
+        if path not in FILL_PATHS:
+            raise ValueError(f"Unsupported fill path: {path}")
+        if path == 'subbar' and intrabar_data is None:
+            raise ValueError("The 'subbar' fill path requires intrabar_data")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        self.path = path
+        self.intrabar_data = intrabar_data
+        self.chunk_size = chunk_size
+
+    def bind(self, data: pd.DataFrame) -> 'BarFills':
+        """
+        Bind the model to a dataset
+
+        Args:
+            data: OHLC data the backtest runs on
+
+        Returns:
+            Fill evaluator over the dataset's arrays
+        """
+        return BarFills(self, data)
+
+
+class BarFills:
+    """Fill model bound to the arrays of one dataset"""
+
+    def __init__(self, model: IntrabarFillModel, data: pd.DataFrame):
+        self.path = model.path
+        self.chunk_size = model.chunk_size
+
+        self.opens = data['open'].to_numpy(dtype=np.float64)
+        self.highs = data['high'].to_numpy(dtype=np.float64)
+        self.lows = data['low'].to_numpy(dtype=np.float64)
+
+        self.sub = None
+        if model.path == 'subbar':
+            sub = model.intrabar_data
+            index = data.index.to_numpy()
+            sub_index = sub.index.to_numpy()
+
+            bar_end = index[-1] + (index[-1] - index[-2] if len(index) > 1 else 0)
+            self.sub_starts = np.searchsorted(sub_index, index, side='left')
+            self.sub_ends = np.append(
+                self.sub_starts[1:],
+                np.searchsorted(sub_index, bar_end, side='left')
+            )
+            self.sub = BarFills(IntrabarFillModel('worst_case', chunk_size=model.chunk_size), sub)
+
+    def first_exit(
+        self,
+        start: int,
+        side: str,
+        stop_loss: Optional[float],
+        take_profit: Optional[float],
+        end: Optional[int] = None
+    ) -> Optional[Tuple[int, float, str]]:
+        """
+        Find where a position's stop-loss or take-profit fills
+
+        Args:
+            start: First bar the position is exposed to
+            side: 'long' or 'short'
+            stop_loss: Stop-loss price (None or 0 for none)
+            take_profit: Take-profit price (None or 0 for none)
+            end: Bar after the last one to search (default: all)
+
+        Returns:
+            (bar index, fill price, 'stop_loss' or 'take_profit'), or None
+        """
+        stop_loss = stop_loss or None
+        take_profit = take_profit or None
+
+        if side == 'long':
+            below, above = stop_loss, take_profit
+        else:
+            below, above = take_profit, stop_loss
+
+        i = first_touch(self.highs, self.lows, start, below, above, end, self.chunk_size)
+        if i < 0:
+            return None
+
+        price, reason = self.resolve_bar(i, side, stop_loss, take_profit)
+        return i, price, reason
+
+    def resolve_bar(
+        self,
+        i: int,
+        side: str,
+        stop_loss: Optional[float],
+        take_profit: Optional[float]
+    ) -> Tuple[float, str]:
+        """
+        Decide which level a touching bar fills, and at what price
+
+        Args:
+            i: Bar index
+            side: 'long' or 'short'
+            stop_loss: Stop-loss price or None
+            take_profit: Take-profit price or None
+
+        Returns:
+            (fill price, 'stop_loss' or 'take_profit')
+        """
+        o, h, l = self.opens[i], self.highs[i], self.lows[i]
+
+        if side == 'long':
+            if stop_loss is not None and o <= stop_loss:
+                return o, 'stop_loss'
+            if take_profit is not None and o >= take_profit:
+                return o, 'take_profit'
+            stop_hit = stop_loss is not None and l <= stop_loss
+            target_hit = take_profit is not None and h >= take_profit
+        else:
+            if stop_loss is not None and o >= stop_loss:
+                return o, 'stop_loss'
+            if take_profit is not None and o <= take_profit:
+                return o, 'take_profit'
+            stop_hit = stop_loss is not None and h >= stop_loss
+            target_hit = take_profit is not None and l <= take_profit
+
+        if stop_hit and target_hit:
+            if self.path == 'ohlc':
+                # High is visited first: a long reaches its target, a short its stop
+                stop_hit = side == 'short'
+            elif self.path == 'subbar':
+                fill = self.sub.first_exit(
+                    int(self.sub_starts[i]), side, stop_loss, take_profit, end=int(self.sub_ends[i])
+                )
+                if fill is not None:
+                    return fill[1], fill[2]
+                logger.debug(f"No intrabar data resolves bar {i}, assuming worst case")
+
+        if stop_hit:
+            return stop_loss, 'stop_loss'
+        return take_profit, 'take_profit'
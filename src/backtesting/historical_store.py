@@ -0,0 +1,334 @@
+"""
+Historical Store
+
+Partitioned columnar (Parquet) storage for backtest OHLCV + indicator data.
+
+Layout:
+    <root>/<SYMBOL>/<timeframe>/<YYYY-MM>.parquet
+
+One file per symbol, timeframe and calendar month. Reads only open the
+partitions that overlap the requested time range, only decode the requested
+columns, and push the range filter down to Parquet row groups. Appends only
+rewrite the months they touch. Timestamps are stored as naive UTC.
+"""
+
+import logging
+import os
+import re
+from typing import Any, List, Optional, Sequence, Tuple
+import pandas as pd
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TIMESTAMP_COLUMN = 'timestamp'
+PARTITION_PATTERN = re.compile(r'^(\d{4})-(\d{2})\.parquet$')
+CSV_NAME_PATTERN = re.compile(r'^(?P<symbol>.+)_(?P<timeframe>\d+[smhdwM])\.csv$')
+
+
+def _pyarrow():
+    """Import pyarrow lazily so the rest of the backtester works without it"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "HistoricalStore requires pyarrow. Install with: pip install pyarrow"
+        ) from e
+    return pa, pq
+
+
+def _naive_utc(timestamp: Optional[Any]) -> Optional[pd.Timestamp]:
+    """Normalize a range bound to a naive UTC timestamp"""
+    if timestamp is None:
+        return None
+    timestamp = pd.Timestamp(timestamp)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert('UTC').tz_localize(None)
+    return timestamp
+
+
+class HistoricalStore:
+    """
+    Parquet partition store for historical candles
+
+    Usage:
+        store = HistoricalStore('data/store')
+        store.write(df, 'BTC/USDT', '5m')
+        closes = store.read('BTC/USDT', '5m', columns=['close'], start='2024-03-01')
+    """
+
+    def __init__(
+        self,
+        root: str = 'data/store',
+        compression: str = 'snappy',
+        row_group_size: int = 16384
+    ):
+        """
+        Initialize store
+
+        Args:
+            root: Root directory of the store
+            compression: Parquet compression codec
+            row_group_size: Rows per Parquet row group (granularity of range pushdown)
+        """
+        self.root = root
+        self.compression = compression
+        self.row_group_size = row_group_size
+
+    def dataset_path(self, symbol: str, timeframe: str) -> str:
+        """Directory holding the partitions of a symbol/timeframe"""
+        return os.path.join(self.root, symbol.replace('/', '_').replace(':', '_'), timeframe)
+
+    def partitions(self, symbol: str, timeframe: str) -> List[str]:
+        """
+        List stored months
+
+        Args:
+            symbol: Trading pair
+            timeframe: Timeframe
+
+        Returns:
+            Sorted partition keys ('YYYY-MM')
+        """
+        path = self.dataset_path(symbol, timeframe)
+        if not os.path.isdir(path):
+            return []
+        return sorted(
+            name[:-len('.parquet')] for name in os.listdir(path) if PARTITION_PATTERN.match(name)
+        )
+
+    def exists(self, symbol: str, timeframe: str) -> bool:
+        """Whether any data is stored for a symbol/timeframe"""
+        return bool(self.partitions(symbol, timeframe))
+
+    def columns(self, symbol: str, timeframe: str) -> List[str]:
+        """
+        Get stored column names (from the latest partition's schema)
+
+        Args:
+            symbol: Trading pair
+            timeframe: Timeframe
+
+        Returns:
+            Column names, excluding the timestamp
+        """
+        partitions = self.partitions(symbol, timeframe)
+        if not partitions:
+            return []
+
+        _, pq = _pyarrow()
+        schema = pq.read_schema(self._partition_file(symbol, timeframe, partitions[-1]))
+        return [name for name in schema.names if name != TIMESTAMP_COLUMN]
+
+    def write(
+        self,
+        df: pd.DataFrame,
+        symbol: str,
+        timeframe: str,
+        mode: str = 'append'
+    ) -> int:
+        """
+        Write candles, split into monthly partitions
+
+        Args:
+            df: OHLCV (+ indicator) data with a DatetimeIndex
+            symbol: Trading pair
+            timeframe: Timeframe
+            mode: 'append' merges into existing months (new rows win on
+                duplicate timestamps), 'overwrite' replaces the whole dataset
+
+        Returns:
+            Number of rows written
+        """
+        if mode not in ('append', 'overwrite'):
+            raise ValueError(f"Unsupported write mode: {mode}")
+        if not isinstance(df.index, pd.DatetimeIndex):
+            raise ValueError("HistoricalStore requires a DatetimeIndex")
+        if df.index.tz is not None:
+            df = df.tz_convert('UTC').tz_localize(None)
+
+        path = self.dataset_path(symbol, timeframe)
+        if mode == 'overwrite':
+            for partition in self.partitions(symbol, timeframe):
+                os.remove(self._partition_file(symbol, timeframe, partition))
+
+        if df.empty:
+            return 0
+
+        os.makedirs(path, exist_ok=True)
+        df = df[~df.index.duplicated(keep='last')].sort_index()
+
+        months = df.index.year * 100 + df.index.month
+        boundaries = np.flatnonzero(np.diff(months)) + 1
+        starts = np.concatenate(([0], boundaries))
+        stops = np.concatenate((boundaries, [len(df)]))
+
+        existing = set(self.partitions(symbol, timeframe))
+        for start, stop in zip(starts, stops):
+            chunk = df.iloc[start:stop]
+            partition = f"{chunk.index[0].year:04d}-{chunk.index[0].month:02d}"
+
+            if partition in existing:
+                stored = self._read_partition(symbol, timeframe, partition)
+                stored = stored[~stored.index.isin(chunk.index)]
+                chunk = pd.concat([stored, chunk]).sort_index()
+
+            self._write_partition(chunk, symbol, timeframe, partition)
+
+        logger.info(
+            f"Stored {len(df)} {symbol} {timeframe} rows in {len(starts)} partition(s) under {path}"
+        )
+        return len(df)
+
+    def read(
+        self,
+        symbol: str,
+        timeframe: str,
+        columns: Optional[Sequence[str]] = None,
+        start: Optional[Any] = None,
+        end: Optional[Any] = None
+    ) -> pd.DataFrame:
+        """
+        Read candles
+
+        Args:
+            symbol: Trading pair
+            timeframe: Timeframe
+            columns: Columns to load (defaults to all)
+            start: First timestamp to include
+            end: Last timestamp to include
+
+        Returns:
+            DataFrame indexed by timestamp (empty if nothing matches)
+        """
+        pa, pq = _pyarrow()
+
+        start = _naive_utc(start)
+        end = _naive_utc(end)
+        partitions = [
+            partition for partition in self.partitions(symbol, timeframe)
+            if self._overlaps(partition, start, end)
+        ]
+
+        projection = None
+        if columns is not None:
+            projection = [TIMESTAMP_COLUMN] + [col for col in columns if col != TIMESTAMP_COLUMN]
+
+        filters = []
+        if start is not None:
+            filters.append((TIMESTAMP_COLUMN, '>=', start))
+        if end is not None:
+            filters.append((TIMESTAMP_COLUMN, '<=', end))
+
+        tables = [
+            pq.read_table(
+                self._partition_file(symbol, timeframe, partition),
+                columns=projection,
+                filters=filters or None
+            )
+            for partition in partitions
+        ]
+
+        if not tables:
+            return pd.DataFrame(
+                columns=[col for col in (projection or []) if col != TIMESTAMP_COLUMN],
+                index=pd.DatetimeIndex([], name=TIMESTAMP_COLUMN)
+            )
+
+        try:
+            df = pa.concat_tables(tables).to_pandas()
+        except pa.ArrowInvalid:
+            # Partitions written with different indicator sets
+            df = pd.concat([table.to_pandas() for table in tables], ignore_index=True)
+
+        return df.set_index(TIMESTAMP_COLUMN)
+
+    def last_timestamp(self, symbol: str, timeframe: str) -> Optional[pd.Timestamp]:
+        """
+        Get the most recent stored timestamp
+
+        Args:
+            symbol: Trading pair
+            timeframe: Timeframe
+
+        Returns:
+            Last timestamp, or None if nothing is stored
+        """
+        partitions = self.partitions(symbol, timeframe)
+        if not partitions:
+            return None
+
+        _, pq = _pyarrow()
+        timestamps = pq.read_table(
+            self._partition_file(symbol, timeframe, partitions[-1]),
+            columns=[TIMESTAMP_COLUMN]
+        ).column(TIMESTAMP_COLUMN)
+        return pd.Timestamp(timestamps[-1].as_py())
+
+    def convert_csv(
+        self,
+        csv_path: str,
+        symbol: Optional[str] = None,
+        timeframe: Optional[str] = None
+    ) -> Tuple[str, str, int]:
+        """
+        Import a DataDownloader CSV file into the store (replacing stored data)
+
+        Args:
+            csv_path: Path to a '<BASE>_<QUOTE>_<timeframe>.csv' file
+            symbol: Trading pair (parsed from the file name by default)
+            timeframe: Timeframe (parsed from the file name by default)
+
+        Returns:
+            Tuple of (symbol, timeframe, rows written)
+        """
+        if symbol is None or timeframe is None:
+            match = CSV_NAME_PATTERN.match(os.path.basename(csv_path))
+            if match is None:
+                raise ValueError(f"Cannot infer symbol/timeframe from {csv_path}")
+            symbol = symbol or match.group('symbol').replace('_', '/', 1)
+            timeframe = timeframe or match.group('timeframe')
+
+        df = pd.read_csv(csv_path, index_col=0, parse_dates=True)
+        rows = self.write(df, symbol, timeframe, mode='overwrite')
+
+        logger.info(f"Converted {csv_path} -> {self.dataset_path(symbol, timeframe)} ({rows} rows)")
+        return symbol, timeframe, rows
+
+    def _partition_file(self, symbol: str, timeframe: str, partition: str) -> str:
+        return os.path.join(self.dataset_path(symbol, timeframe), f"{partition}.parquet")
+
+    def _read_partition(self, symbol: str, timeframe: str, partition: str) -> pd.DataFrame:
+        _, pq = _pyarrow()
+        table = pq.read_table(self._partition_file(symbol, timeframe, partition))
+        return table.to_pandas().set_index(TIMESTAMP_COLUMN)
+
+    def _write_partition(self, df: pd.DataFrame, symbol: str, timeframe: str, partition: str) -> None:
+        """Write one month atomically (temp file + rename)"""
+        pa, pq = _pyarrow()
+
+        df = df.copy()
+        df.index.name = TIMESTAMP_COLUMN
+        table = pa.Table.from_pandas(df.reset_index(), preserve_index=False)
+
+        path = self._partition_file(symbol, timeframe, partition)
+        tmp_path = f"{path}.tmp"
+        pq.write_table(
+            table,
+            tmp_path,
+            compression=self.compression,
+            row_group_size=self.row_group_size
+        )
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _overlaps(partition: str, start: Optional[pd.Timestamp], end: Optional[pd.Timestamp]) -> bool:
+        """Whether a monthly partition can hold rows in [start, end]"""
+        month_start = pd.Timestamp(f"{partition}-01")
+        month_end = month_start + pd.offsets.MonthBegin(1)
+        if start is not None and start >= month_end:
+            return False
+        if end is not None and end < month_start:
+            return False
+        return True
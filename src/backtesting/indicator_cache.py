@@ -0,0 +1,240 @@
+"""
+Indicator Cache
+
+Memory-mapped cache of precomputed OHLCV + indicator matrices.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, Optional
+import pandas as pd
+import numpy as np
+
+from .shared_dataset import SharedDataset, SharedDatasetHandle
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+
+
+def config_hash(config: Dict[str, Any]) -> str:
+    """
+    Stable short hash of an indicator configuration
+
+    Args:
+        config: JSON-serializable indicator parameters
+
+    Returns:
+        Hex digest (16 characters)
+    """
+    payload = json.dumps({'format': CACHE_FORMAT_VERSION, 'config': config}, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+
+def file_fingerprint(path: str) -> str:
+    """
+    Fingerprint of a source file (size and modification time)
+
+    Args:
+        path: File or directory path (directories cover their files)
+
+    Returns:
+        Fingerprint string
+    """
+    if os.path.isdir(path):
+        parts = []
+        for dirpath, _, filenames in sorted(os.walk(path)):
+            for name in sorted(filenames):
+                parts.append(file_fingerprint(os.path.join(dirpath, name)))
+        return hashlib.sha1('|'.join(parts).encode()).hexdigest()
+
+    stat = os.stat(path)
+    return f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def frame_fingerprint(df: pd.DataFrame, columns=('open', 'high', 'low', 'close', 'volume')) -> str:
+    """
+    Fingerprint of the input candles of an indicator computation
+
+    Args:
+        df: OHLCV DataFrame
+        columns: Columns that determine the indicators
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(df.index.to_numpy(dtype='datetime64[ns]').view(np.int64).tobytes())
+    for col in columns:
+        if col in df.columns:
+            digest.update(col.encode())
+            digest.update(np.ascontiguousarray(df[col].to_numpy(dtype=np.float64)).tobytes())
+    return digest.hexdigest()
+
+
+class IndicatorCache:
+    """
+    Binary cache of indicator matrices keyed by (symbol, timeframe, config hash)
+
+    Each entry is a SharedDataset file (timestamps + one float64 array per
+    column) plus a JSON sidecar with the layout and the fingerprint of the
+    data it was built from. Loading maps the file read-only without parsing,
+    so concurrent backtest processes share the OS page cache and pages are
+    only read when a column is touched. Entries whose source fingerprint no
+    longer matches are rebuilt.
+
+    Usage:
+        cache = IndicatorCache('data/cache')
+        dataset = cache.get_or_build('BTC/USDT', '5m', config, build, source=fingerprint)
+        frame = dataset.to_frame()               # zero-copy, read-only
+    """
+
+    def __init__(self, root: str = 'data/cache'):
+        """
+        Initialize cache
+
+        Args:
+            root: Cache directory
+        """
+        self.root = root
+
+    def entry_path(self, symbol: str, timeframe: str, config: Dict[str, Any]) -> str:
+        """Path of the binary file for an entry (the sidecar adds '.json')"""
+        symbol_clean = symbol.replace('/', '_').replace(':', '_')
+        return os.path.join(self.root, f"{symbol_clean}_{timeframe}_{config_hash(config)}.bin")
+
+    def load(
+        self,
+        symbol: str,
+        timeframe: str,
+        config: Dict[str, Any],
+        source: Optional[str] = None
+    ) -> Optional[SharedDataset]:
+        """
+        Map a cached entry
+
+        Args:
+            symbol: Trading pair
+            timeframe: Timeframe
+            config: Indicator configuration
+            source: Expected source fingerprint (None skips the check)
+
+        Returns:
+            Read-only memory-mapped SharedDataset, or None on a miss
+        """
+        path = self.entry_path(symbol, timeframe, config)
+        try:
+            with open(f"{path}.json") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if source is not None and meta.get('source') != source:
+            logger.info(f"Indicator cache stale for {symbol} {timeframe}, rebuilding")
+            return None
+
+        expected_size = 8 * meta['num_rows'] * (len(meta['columns']) + 1)
+        if not os.path.exists(path) or os.path.getsize(path) != max(expected_size, 1):
+            return None
+
+        handle = SharedDatasetHandle(
+            columns=tuple(meta['columns']),
+            num_rows=meta['num_rows'],
+            path=path,
+            tz=meta.get('tz'),
+            index_name=meta.get('index_name')
+        )
+        logger.debug(f"Indicator cache hit: {path}")
+        return SharedDataset.attach(handle)
+
+    def store(
+        self,
+        df: pd.DataFrame,
+        symbol: str,
+        timeframe: str,
+        config: Dict[str, Any],
+        source: Optional[str] = None
+    ) -> SharedDataset:
+        """
+        Write an entry (atomically replacing any previous one)
+
+        Args:
+            df: OHLCV + indicator data (numeric columns, datetime index)
+            symbol: Trading pair
+            timeframe: Timeframe
+            config: Indicator configuration
+            source: Fingerprint of the data the entry was built from
+
+        Returns:
+            Read-only memory-mapped SharedDataset over the new entry
+        """
+        path = self.entry_path(symbol, timeframe, config)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+
+        dataset = SharedDataset.from_dataframe(df, path=tmp_path)
+        handle = dataset.handle
+        dataset.close()
+
+        meta = {
+            'symbol': symbol,
+            'timeframe': timeframe,
+            'config': config,
+            'source': source,
+            'columns': list(handle.columns),
+            'num_rows': handle.num_rows,
+            'tz': handle.tz,
+            'index_name': handle.index_name
+        }
+        with open(f"{tmp_path}.json", 'w') as f:
+            json.dump(meta, f, default=str)
+
+        os.replace(tmp_path, path)
+        os.replace(f"{tmp_path}.json", f"{path}.json")
+
+        logger.info(f"Indicator cache written: {path} ({len(df)} rows x {len(df.columns)} columns)")
+        return self.load(symbol, timeframe, config)
+
+    def get_or_build(
+        self,
+        symbol: str,
+        timeframe: str,
+        config: Dict[str, Any],
+        build: Callable[[], pd.DataFrame],
+        source: Optional[str] = None
+    ) -> SharedDataset:
+        """
+        Map a cached entry, building and storing it on a miss
+
+        Args:
+            symbol: Trading pair
+            timeframe: Timeframe
+            config: Indicator configuration
+            build: Computes the DataFrame on a miss
+            source: Source fingerprint
+
+        Returns:
+            Read-only memory-mapped SharedDataset
+        """
+        dataset = self.load(symbol, timeframe, config, source=source)
+        if dataset is not None:
+            return dataset
+        return self.store(build(), symbol, timeframe, config, source=source)
+
+    def clear(self) -> int:
+        """
+        Delete all entries
+
+        Returns:
+            Number of entries removed
+        """
+        if not os.path.isdir(self.root):
+            return 0
+
+        removed = 0
+        for name in os.listdir(self.root):
+            if name.endswith('.bin') or name.endswith('.bin.json'):
+                os.remove(os.path.join(self.root, name))
+                removed += name.endswith('.bin')
+        return removed
@@ -0,0 +1,391 @@
+"""
+Backtest Ledgers
+
+Columnar trade and equity records for the backtest engines. Rows go into
+preallocated NumPy arrays that double when full, timestamps are stored as
+int64 nanoseconds and repeated strings as codes into a lookup table. Trade
+objects, (timestamp, equity) tuples and DataFrames are only built when they
+are asked for, so long runs keep a few bytes per bar instead of a tuple, a
+Timestamp and a float object.
+"""
+
+import logging
+import numbers
+from abc import abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Trade:
+    """Represents a completed trade"""
+    entry_time: datetime
+    exit_time: datetime
+    symbol: str
+    side: str  # 'long' or 'short'
+    entry_price: float
+    exit_price: float
+    size: float
+    leverage: float
+    pnl: float
+    pnl_pct: float
+    fees: float
+    duration_minutes: float
+    exit_reason: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+class _ColumnarLedger(Sequence):
+    """Append-only table of NumPy columns that behaves like a list of rows"""
+
+    COLUMNS: Dict[str, Any] = {}
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize ledger
+
+        Args:
+            capacity: Initial number of rows allocated
+        """
+        self._size = 0
+        self._columns = {name: np.empty(max(1, capacity), dtype=dtype) for name, dtype in self.COLUMNS.items()}
+        self._tz = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ledger index out of range")
+        return self._row(index)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (_ColumnarLedger, list, tuple)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._size} rows)"
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        for name in self._column_groups():
+            state[name] = {key: values[:self._size].copy() for key, values in state[name].items()}
+        return state
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Read-only view of a column
+
+        Args:
+            name: Column name
+
+        Returns:
+            Array of the recorded rows
+        """
+        view = self._columns[name][:self._size]
+        view.flags.writeable = False
+        return view
+
+    @abstractmethod
+    def _row(self, i: int):
+        """Row i as the ledger's element type"""
+        pass
+
+    def _column_groups(self) -> Tuple[str, ...]:
+        """Attributes holding dicts of columns that grow together"""
+        return ('_columns',)
+
+    def _reserve(self) -> int:
+        """Index of the next row, doubling the columns when they are full"""
+        i = self._size
+        if i == len(self._columns[next(iter(self.COLUMNS))]):
+            capacity = max(16, 2 * i)
+            for name in self._column_groups():
+                group = getattr(self, name)
+                for key, values in group.items():
+                    grown = np.empty(capacity, dtype=values.dtype)
+                    grown[:i] = values[:i]
+                    group[key] = grown
+        self._size = i + 1
+        return i
+
+    def _time_ns(self, timestamp) -> int:
+        """Nanoseconds since the epoch (UTC for timezone-aware timestamps)"""
+        if self._size == 1:
+            # The first row sets the timezone rows are rebuilt in
+            self._tz = getattr(timestamp, 'tzinfo', None)
+        value = getattr(timestamp, 'value', None)
+        if value is None:
+            value = pd.Timestamp(timestamp).value
+        return value
+
+    def _timestamp(self, ns: int) -> pd.Timestamp:
+        if self._tz is None:
+            return pd.Timestamp(int(ns))
+        return pd.Timestamp(int(ns), tz='UTC').tz_convert(self._tz)
+
+    def _time_index(self, name: str) -> pd.DatetimeIndex:
+        index = pd.DatetimeIndex(self.column(name).view('datetime64[ns]'))
+        if self._tz is not None:
+            index = index.tz_localize('UTC').tz_convert(self._tz)
+        return index
+
+
+class EquityLedger(_ColumnarLedger):
+    """
+    Equity curve stored as int64 timestamps and float64 equity
+
+    Drop-in for the list of (timestamp, equity) tuples the engines used to
+    keep: append(), len(), indexing and iteration all work on tuples.
+
+    Usage:
+        curve = EquityLedger()
+        curve.append((timestamp, equity))
+        values = curve.equity                 # float64 array, no copy
+        df = curve.to_frame()
+    """
+
+    COLUMNS = {'timestamp': np.int64, 'equity': np.float64}
+
+    def append(self, entry: Tuple[datetime, float]) -> None:
+        """
+        Record one equity point
+
+        Args:
+            entry: (timestamp, equity)
+        """
+        timestamp, equity = entry
+        i = self._reserve()
+        self._columns['timestamp'][i] = self._time_ns(timestamp)
+        self._columns['equity'][i] = equity
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Timestamps as int64 nanoseconds"""
+        return self.column('timestamp')
+
+    @property
+    def equity(self) -> np.ndarray:
+        """Equity values"""
+        return self.column('equity')
+
+    def _row(self, i: int) -> Tuple[pd.Timestamp, float]:
+        return self._timestamp(self._columns['timestamp'][i]), float(self._columns['equity'][i])
+
+    def __iter__(self) -> Iterator[Tuple[pd.Timestamp, float]]:
+        return zip(self._time_index('timestamp'), self.equity.tolist())
+
+    def to_frame(self) -> pd.DataFrame:
+        """Equity curve as a DataFrame indexed by timestamp"""
+        if not self._size:
+            return pd.DataFrame()
+        index = self._time_index('timestamp').rename('timestamp')
+        return pd.DataFrame({'equity': self.equity.copy()}, index=index)
+
+
+class TradeLedger(_ColumnarLedger):
+    """
+    Completed trades stored column by column
+
+    Symbols, sides and exit reasons are stored as codes, and metadata as one
+    column per key, so a trade costs about a hundred bytes however many are
+    recorded. Indexing and iteration build Trade objects on demand.
+
+    Usage:
+        trades = TradeLedger()
+        trades.add(entry_time=..., exit_time=..., symbol='BTC/USDT', ...)
+        pnl = trades.column('pnl')            # float64 array, no copy
+        df = trades.to_frame()
+    """
+
+    COLUMNS = {
+        'entry_time': np.int64,
+        'exit_time': np.int64,
+        'symbol': np.int32,
+        'side': np.int8,
+        'entry_price': np.float64,
+        'exit_price': np.float64,
+        'size': np.float64,
+        'leverage': np.float64,
+        'pnl': np.float64,
+        'pnl_pct': np.float64,
+        'fees': np.float64,
+        'duration_minutes': np.float64,
+        'exit_reason': np.int32,
+    }
+    LABELED = ('symbol', 'side', 'exit_reason')
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize ledger
+
+        Args:
+            capacity: Initial number of trades allocated
+        """
+        super().__init__(capacity)
+        self._labels: Dict[str, List[str]] = {name: [] for name in self.LABELED}
+        self._codes: Dict[str, Dict[str, int]] = {name: {} for name in self.LABELED}
+        self._metadata: Dict[str, np.ndarray] = {}
+        self._present: Dict[str, np.ndarray] = {}
+
+    def append(self, trade: Trade) -> None:
+        """
+        Record a Trade object
+
+        Args:
+            trade: Completed trade
+        """
+        self.add(
+            entry_time=trade.entry_time,
+            exit_time=trade.exit_time,
+            symbol=trade.symbol,
+            side=trade.side,
+            entry_price=trade.entry_price,
+            exit_price=trade.exit_price,
+            size=trade.size,
+            leverage=trade.leverage,
+            pnl=trade.pnl,
+            pnl_pct=trade.pnl_pct,
+            fees=trade.fees,
+            duration_minutes=trade.duration_minutes,
+            exit_reason=trade.exit_reason,
+            metadata=trade.metadata
+        )
+
+    def add(
+        self,
+        entry_time: datetime,
+        exit_time: datetime,
+        symbol: str,
+        side: str,
+        entry_price: float,
+        exit_price: float,
+        size: float,
+        leverage: float,
+        pnl: float,
+        pnl_pct: float,
+        fees: float,
+        duration_minutes: float,
+        exit_reason: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Record a completed trade from its fields (see Trade)"""
+        i = self._reserve()
+        columns = self._columns
+
+        columns['entry_time'][i] = self._time_ns(entry_time)
+        columns['exit_time'][i] = self._time_ns(exit_time)
+        columns['symbol'][i] = self._code('symbol', symbol)
+        columns['side'][i] = self._code('side', side)
+        columns['entry_price'][i] = entry_price
+        columns['exit_price'][i] = exit_price
+        columns['size'][i] = size
+        columns['leverage'][i] = leverage
+        columns['pnl'][i] = pnl
+        columns['pnl_pct'][i] = pnl_pct
+        columns['fees'][i] = fees
+        columns['duration_minutes'][i] = duration_minutes
+        columns['exit_reason'][i] = self._code('exit_reason', exit_reason)
+
+        for present in self._present.values():
+            present[i] = False
+
+        for key, value in (metadata or {}).items():
+            self._set_metadata(i, key, value)
+
+    def _column_groups(self) -> Tuple[str, ...]:
+        return ('_columns', '_metadata', '_present')
+
+    def labels(self, name: str) -> List[str]:
+        """Values behind the codes of 'symbol', 'side' or 'exit_reason'"""
+        return list(self._labels[name])
+
+    def values(self, name: str) -> np.ndarray:
+        """
+        Decoded values of a labeled column
+
+        Args:
+            name: 'symbol', 'side' or 'exit_reason'
+
+        Returns:
+            Object array of strings
+        """
+        return np.asarray(self._labels[name], dtype=object)[self.column(name)]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Trades as a DataFrame (one row per trade, metadata excluded)"""
+        if not self._size:
+            return pd.DataFrame()
+
+        data = {}
+        for name in self.COLUMNS:
+            if name in ('entry_time', 'exit_time'):
+                data[name] = self._time_index(name)
+            elif name in self.LABELED:
+                data[name] = self.values(name)
+            else:
+                data[name] = self.column(name).copy()
+        return pd.DataFrame(data)
+
+    def _code(self, name: str, value: str) -> int:
+        codes = self._codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self._labels[name])
+            self._labels[name].append(value)
+        return code
+
+    def _set_metadata(self, i: int, key: str, value: Any) -> None:
+        """Store a metadata value, adding or widening its column as needed"""
+        numeric = isinstance(value, numbers.Real) and not isinstance(value, bool)
+        values = self._metadata.get(key)
+
+        if values is None:
+            capacity = len(self._columns['pnl'])
+            values = np.empty(capacity, dtype=np.float64 if numeric else object)
+            self._metadata[key] = values
+            self._present[key] = np.zeros(capacity, dtype=bool)
+        elif not numeric and values.dtype != object:
+            values = self._metadata[key] = values.astype(object)
+
+        values[i] = value
+        self._present[key][i] = True
+
+    def _row(self, i: int) -> Trade:
+        columns = self._columns
+        metadata = {}
+        for key, values in self._metadata.items():
+            if self._present[key][i]:
+                value = values[i]
+                metadata[key] = float(value) if values.dtype != object else value
+
+        return Trade(
+            entry_time=self._timestamp(columns['entry_time'][i]),
+            exit_time=self._timestamp(columns['exit_time'][i]),
+            symbol=self._labels['symbol'][columns['symbol'][i]],
+            side=self._labels['side'][columns['side'][i]],
+            entry_price=float(columns['entry_price'][i]),
+            exit_price=float(columns['exit_price'][i]),
+            size=float(columns['size'][i]),
+            leverage=float(columns['leverage'][i]),
+            pnl=float(columns['pnl'][i]),
+            pnl_pct=float(columns['pnl_pct'][i]),
+            fees=float(columns['fees'][i]),
+            duration_minutes=float(columns['duration_minutes'][i]),
+            exit_reason=self._labels['exit_reason'][columns['exit_reason'][i]],
+            metadata=metadata
+        )
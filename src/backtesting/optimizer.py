@@ -5,7 +5,9 @@ Grid search and random search optimization for strategy parameters.
 """
 
 import logging
-from typing import Dict, Any, List, Tuple, Callable
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, Tuple, Callable, Union
 import pandas as pd
 import numpy as np
 from itertools import product
@@ -13,9 +15,63 @@ import random
 
 from .backtest_engine import BacktestEngine
 from .performance import PerformanceMetrics
+from .shared_dataset import SharedDataset, SharedDatasetHandle, as_frame
 
 logger = logging.getLogger(__name__)
 
+# Per-process state installed by _init_worker
+_worker_dataset: Optional[SharedDataset] = None
+_worker_data: Optional[pd.DataFrame] = None
+_worker_engine: Optional[BacktestEngine] = None
+
+
+def _init_worker(data_handle: SharedDatasetHandle, engine_config: Dict[str, Any]):
+    """Attach the shared dataset and build this worker process's own engine"""
+    global _worker_dataset, _worker_data, _worker_engine
+    
+    logging.disable(logging.INFO)
+    
+    _worker_dataset = SharedDataset.attach(data_handle)
+    _worker_data = _worker_dataset.to_frame()
+    _worker_engine = BacktestEngine(**engine_config)
+
+
+def _run_combination(
+    strategy_class: type,
+    name: str,
+    config: Dict[str, Any],
+    symbol: str,
+    bounds: Optional[Tuple[int, int]] = None
+) -> Dict[str, Any]:
+    """Backtest one parameter combination inside a worker process (on a row range if bounded)"""
+    strategy = strategy_class(name, config)
+    return _worker_engine.run_backtest(strategy, _slice_rows(_worker_data, bounds), symbol)
+
+
+def _run_isolated(
+    engine_config: Dict[str, Any],
+    strategy_class: type,
+    name: str,
+    config: Dict[str, Any],
+    data: pd.DataFrame,
+    symbol: str
+) -> Dict[str, Any]:
+    """Backtest one parameter combination on a fresh engine (thread workers)"""
+    strategy = strategy_class(name, config)
+    return BacktestEngine(**engine_config).run_backtest(strategy, data, symbol)
+
+
+def _slice_rows(
+    data: Union[pd.DataFrame, SharedDataset],
+    bounds: Optional[Tuple[int, int]]
+) -> Union[pd.DataFrame, SharedDataset]:
+    """Rows [start, stop) of data (SharedDataset slices are zero-copy)"""
+    if bounds is None:
+        return data
+    if isinstance(data, SharedDataset):
+        return data.slice(*bounds)
+    return data.iloc[bounds[0]:bounds[1]]
+
 
 class ParameterOptimizer:
     """
@@ -24,6 +80,7 @@ class ParameterOptimizer:
     Supports:
     - Grid search optimization
     - Random search optimization
+    - Parallel evaluation on a process or thread pool
     - Cross-validation
     - Out-of-sample testing
     """
@@ -32,7 +89,9 @@ class ParameterOptimizer:
         self,
         backtest_engine: BacktestEngine,
         optimization_metric: str = 'sharpe_ratio',
-        use_composite_objective: bool = False
+        use_composite_objective: bool = False,
+        n_jobs: int = 1,
+        executor: str = 'process'
     ):
         """
         Initialize parameter optimizer
@@ -41,23 +100,34 @@ class ParameterOptimizer:
             backtest_engine: BacktestEngine instance
             optimization_metric: Metric to optimize (sharpe_ratio, total_return_pct, etc.)
             use_composite_objective: Use composite objective function (Sharpe - 0.5*DD - 0.0005*trades)
+            n_jobs: Number of workers for grid/random search and cross-validation
+                (1 = serial, -1 = all cores)
+            executor: Worker pool type ('process' or 'thread')
         """
+        if executor not in ('process', 'thread'):
+            raise ValueError(f"Unsupported executor: {executor}")
+        
         self.backtest_engine = backtest_engine
         self.optimization_metric = optimization_metric
         self.use_composite_objective = use_composite_objective
+        self.n_jobs = (os.cpu_count() or 1) if n_jobs == -1 else max(1, n_jobs)
+        self.executor = executor
         self.results: List[Dict[str, Any]] = []
         
         logger.info(f"ParameterOptimizer initialized with metric: {optimization_metric}")
         if use_composite_objective:
             logger.info("Using composite objective function: Sharpe - 0.5*DD - 0.0005*trades")
+        if self.n_jobs > 1:
+            logger.info(f"Parallel search enabled: {self.n_jobs} {executor} workers")
     
     def grid_search(
         self,
         strategy_class: type,
         base_config: Dict[str, Any],
         param_grid: Dict[str, List[Any]],
-        data: pd.DataFrame,
-        symbol: str = 'BTC/USDT'
+        data: Union[pd.DataFrame, SharedDataset],
+        symbol: str = 'BTC/USDT',
+        callback: Optional[Callable[[Dict[str, Any]], None]] = None
     ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
         """
         Perform grid search optimization
@@ -66,8 +136,9 @@ class ParameterOptimizer:
             strategy_class: Strategy class to optimize
             base_config: Base configuration dict
             param_grid: Dict of parameter names to lists of values to try
-            data: Historical data for backtesting
+            data: Historical data for backtesting (DataFrame or SharedDataset)
             symbol: Trading pair symbol
+            callback: Called with each result dict as soon as it is available
         
         Returns:
             Tuple of (best_params, all_results)
@@ -81,44 +152,11 @@ class ParameterOptimizer:
         
         logger.info(f"Testing {len(combinations)} parameter combinations")
         
-        self.results = []
-        best_score = float('-inf')
-        best_params = None
+        param_sets = [dict(zip(param_names, combo)) for combo in combinations]
         
-        for i, combo in enumerate(combinations):
-            config = base_config.copy()
-            params = dict(zip(param_names, combo))
-            config.update(params)
-            
-            strategy = strategy_class(f"opt_{i}", config)
-            
-            try:
-                results = self.backtest_engine.run_backtest(strategy, data, symbol)
-                
-                if self.use_composite_objective:
-                    score = self._calculate_composite_score(results)
-                else:
-                    score = results.get(self.optimization_metric, 0.0)
-                
-                result = {
-                    'params': params,
-                    'score': score,
-                    'metrics': results
-                }
-                self.results.append(result)
-                
-                if score > best_score:
-                    best_score = score
-                    best_params = params
-                
-                logger.debug(
-                    f"Combination {i+1}/{len(combinations)}: "
-                    f"{params} -> {self.optimization_metric}={score:.4f}"
-                )
-                
-            except Exception as e:
-                logger.error(f"Error testing combination {params}: {e}")
-                continue
+        best_params, best_score = self._evaluate(
+            strategy_class, base_config, param_sets, data, symbol, 'Combination', callback
+        )
         
         logger.info(
             f"Grid search complete. Best {self.optimization_metric}: {best_score:.4f}"
@@ -132,9 +170,10 @@ class ParameterOptimizer:
         strategy_class: type,
         base_config: Dict[str, Any],
         param_distributions: Dict[str, Tuple[Any, Any]],
-        data: pd.DataFrame,
+        data: Union[pd.DataFrame, SharedDataset],
         n_iterations: int = 50,
-        symbol: str = 'BTC/USDT'
+        symbol: str = 'BTC/USDT',
+        callback: Optional[Callable[[Dict[str, Any]], None]] = None
     ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
         """
         Perform random search optimization
@@ -143,9 +182,10 @@ class ParameterOptimizer:
             strategy_class: Strategy class to optimize
             base_config: Base configuration dict
             param_distributions: Dict of parameter names to (min, max) tuples
-            data: Historical data for backtesting
+            data: Historical data for backtesting (DataFrame or SharedDataset)
             n_iterations: Number of random combinations to try
             symbol: Trading pair symbol
+            callback: Called with each result dict as soon as it is available
         
         Returns:
             Tuple of (best_params, all_results)
@@ -153,10 +193,7 @@ class ParameterOptimizer:
         logger.info(f"Starting random search optimization ({n_iterations} iterations)")
         logger.info(f"Parameter distributions: {param_distributions}")
         
-        self.results = []
-        best_score = float('-inf')
-        best_params = None
-        
+        param_sets = []
         for i in range(n_iterations):
             params = {}
             for param_name, (min_val, max_val) in param_distributions.items():
@@ -166,39 +203,11 @@ class ParameterOptimizer:
                     params[param_name] = random.uniform(min_val, max_val)
                 else:
                     params[param_name] = random.choice([min_val, max_val])
-            
-            config = base_config.copy()
-            config.update(params)
-            
-            strategy = strategy_class(f"opt_{i}", config)
-            
-            try:
-                results = self.backtest_engine.run_backtest(strategy, data, symbol)
-                
-                if self.use_composite_objective:
-                    score = self._calculate_composite_score(results)
-                else:
-                    score = results.get(self.optimization_metric, 0.0)
-                
-                result = {
-                    'params': params,
-                    'score': score,
-                    'metrics': results
-                }
-                self.results.append(result)
-                
-                if score > best_score:
-                    best_score = score
-                    best_params = params
-                
-                logger.debug(
-                    f"Iteration {i+1}/{n_iterations}: "
-                    f"{params} -> {self.optimization_metric}={score:.4f}"
-                )
-                
-            except Exception as e:
-                logger.error(f"Error testing parameters {params}: {e}")
-                continue
+            param_sets.append(params)
+        
+        best_params, best_score = self._evaluate(
+            strategy_class, base_config, param_sets, data, symbol, 'Iteration', callback
+        )
         
         logger.info(
             f"Random search complete. Best {self.optimization_metric}: {best_score:.4f}"
@@ -207,11 +216,159 @@ class ParameterOptimizer:
         
         return best_params, self.results
     
+    def _evaluate(
+        self,
+        strategy_class: type,
+        base_config: Dict[str, Any],
+        param_sets: List[Dict[str, Any]],
+        data: Union[pd.DataFrame, SharedDataset],
+        symbol: str,
+        label: str,
+        callback: Optional[Callable[[Dict[str, Any]], None]]
+    ) -> Tuple[Optional[Dict[str, Any]], float]:
+        """
+        Backtest every parameter set and track the best score
+        
+        Results are appended to self.results in completion order. Ties on score
+        go to the earlier parameter set, so the best params do not depend on
+        worker scheduling.
+        
+        Returns:
+            Tuple of (best_params, best_score)
+        """
+        self.results = []
+        best_score = float('-inf')
+        best_params = None
+        best_index = len(param_sets)
+        total = len(param_sets)
+        
+        for i, params, results in self._iter_backtests(
+            strategy_class, base_config, param_sets, data, symbol
+        ):
+            if isinstance(results, Exception):
+                logger.error(f"Error testing parameters {params}: {results}")
+                continue
+            
+            if self.use_composite_objective:
+                score = self._calculate_composite_score(results)
+            else:
+                score = results.get(self.optimization_metric, 0.0)
+            
+            result = {
+                'params': params,
+                'score': score,
+                'metrics': results
+            }
+            self.results.append(result)
+            
+            if score > best_score or (score == best_score and i < best_index):
+                best_score = score
+                best_params = params
+                best_index = i
+            
+            logger.debug(
+                f"{label} {i+1}/{total}: "
+                f"{params} -> {self.optimization_metric}={score:.4f}"
+            )
+            
+            if callback:
+                callback(result)
+        
+        return best_params, best_score
+    
+    def _iter_backtests(
+        self,
+        strategy_class: type,
+        base_config: Dict[str, Any],
+        param_sets: List[Dict[str, Any]],
+        data: Union[pd.DataFrame, SharedDataset],
+        symbol: str
+    ):
+        """Yield (index, params, results_or_exception) as backtests finish"""
+        jobs = [
+            (f"opt_{i}", {**base_config, **params}, None)
+            for i, params in enumerate(param_sets)
+        ]
+        for i, results in self._run_jobs(strategy_class, jobs, data, symbol):
+            yield i, param_sets[i], results
+    
+    def _run_jobs(
+        self,
+        strategy_class: type,
+        jobs: List[Tuple[str, Dict[str, Any], Optional[Tuple[int, int]]]],
+        data: Union[pd.DataFrame, SharedDataset],
+        symbol: str
+    ):
+        """
+        Yield (index, results_or_exception) as backtests finish
+        
+        Each job is (strategy name, config, row bounds or None for all rows).
+        Serial mode reuses self.backtest_engine. Parallel mode gives every worker
+        its own engine built from the same settings; process workers attach to
+        a SharedDataset once instead of receiving a pickled copy with every
+        task. Passing a SharedDataset reuses its block as-is.
+        """
+        if self.n_jobs == 1 or len(jobs) <= 1:
+            frame = as_frame(data)
+            for i, (name, config, bounds) in enumerate(jobs):
+                strategy = strategy_class(name, config)
+                try:
+                    job_data = frame if bounds is None else _slice_rows(data, bounds)
+                    results = self.backtest_engine.run_backtest(strategy, job_data, symbol)
+                except Exception as e:
+                    results = e
+                yield i, results
+            return
+        
+        engine_config = self.backtest_engine.get_config()
+        workers = min(self.n_jobs, len(jobs))
+        owned: Optional[SharedDataset] = None
+        
+        try:
+            if self.executor == 'process':
+                if isinstance(data, SharedDataset):
+                    dataset = data
+                else:
+                    dataset = owned = SharedDataset.from_dataframe(data)
+                pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker,
+                    initargs=(dataset.handle, engine_config)
+                )
+            else:
+                frame = as_frame(data)
+                pool = ThreadPoolExecutor(max_workers=workers)
+            
+            with pool:
+                futures = {}
+                for i, (name, config, bounds) in enumerate(jobs):
+                    if self.executor == 'process':
+                        future = pool.submit(
+                            _run_combination, strategy_class, name, config, symbol, bounds
+                        )
+                    else:
+                        future = pool.submit(
+                            _run_isolated, engine_config, strategy_class,
+                            name, config, _slice_rows(frame, bounds), symbol
+                        )
+                    futures[future] = i
+                
+                for future in as_completed(futures):
+                    i = futures[future]
+                    try:
+                        results = future.result()
+                    except Exception as e:
+                        results = e
+                    yield i, results
+        finally:
+            if owned is not None:
+                owned.close()
+    
     def cross_validate(
         self,
         strategy_class: type,
         config: Dict[str, Any],
-        data: pd.DataFrame,
+        data: Union[pd.DataFrame, SharedDataset],
         n_splits: int = 5,
         symbol: str = 'BTC/USDT',
         min_trades_per_fold: int = 30
@@ -222,7 +379,7 @@ class ParameterOptimizer:
         Args:
             strategy_class: Strategy class to test
             config: Strategy configuration
-            data: Historical data
+            data: Historical data (SharedDataset folds are zero-copy slices)
             n_splits: Number of folds
             symbol: Trading pair symbol
             min_trades_per_fold: Minimum trades required per fold for robustness
@@ -230,41 +387,100 @@ class ParameterOptimizer:
         Returns:
             Dict with cross-validation results and robustness flags
         """
-        logger.info(f"Starting {n_splits}-fold cross-validation (min {min_trades_per_fold} trades/fold)")
+        return self.cross_validate_many(
+            strategy_class, [config], data, n_splits, symbol, min_trades_per_fold
+        )[0]
+    
+    def cross_validate_many(
+        self,
+        strategy_class: type,
+        configs: List[Dict[str, Any]],
+        data: Union[pd.DataFrame, SharedDataset],
+        n_splits: int = 5,
+        symbol: str = 'BTC/USDT',
+        min_trades_per_fold: int = 30
+    ) -> List[Dict[str, Any]]:
+        """
+        Cross-validate several configurations on one worker pool
         
-        fold_size = len(data) // n_splits
-        fold_results = []
-        failed_folds = []
+        Every (configuration, fold) backtest is a separate job, so all workers
+        stay busy across configurations, and the pool (and, for process
+        workers, the SharedDataset) is set up once for the whole batch.
+        
+        Args:
+            strategy_class: Strategy class to test
+            configs: Strategy configurations
+            data: Historical data (SharedDataset folds are zero-copy slices)
+            n_splits: Number of folds
+            symbol: Trading pair symbol
+            min_trades_per_fold: Minimum trades required per fold for robustness
         
+        Returns:
+            Cross-validation results per configuration, in order (see cross_validate)
+        """
+        logger.info(
+            f"Starting {n_splits}-fold cross-validation of {len(configs)} configuration(s) "
+            f"(min {min_trades_per_fold} trades/fold)"
+        )
+        
+        fold_size = len(data) // n_splits
+        folds = []
         for i in range(n_splits):
             start_idx = i * fold_size
             end_idx = start_idx + fold_size if i < n_splits - 1 else len(data)
-            
-            fold_data = data.iloc[start_idx:end_idx]
-            
-            strategy = strategy_class(f"cv_{i}", config)
-            
-            try:
-                results = self.backtest_engine.run_backtest(strategy, fold_data, symbol)
-                
-                num_trades = results.get('num_trades', 0)
-                if num_trades < min_trades_per_fold:
-                    logger.warning(
-                        f"Fold {i+1}/{n_splits}: Only {num_trades} trades (min {min_trades_per_fold} required) - FAILED robustness check"
-                    )
-                    failed_folds.append(i + 1)
-                else:
-                    logger.debug(
-                        f"Fold {i+1}/{n_splits}: {num_trades} trades, "
-                        f"{self.optimization_metric}={results.get(self.optimization_metric, 0):.4f}"
-                    )
-                
-                fold_results.append(results)
-                
-            except Exception as e:
-                logger.error(f"Error in fold {i+1}: {e}")
+            folds.append((start_idx, end_idx))
+        
+        jobs = [(f"cv_{i}", config, bounds) for config in configs for i, bounds in enumerate(folds)]
+        
+        # Summarize each configuration as soon as its folds are in, so fold
+        # results of the whole batch are never held at once
+        pending: Dict[int, Dict[int, Any]] = {}
+        summaries: List[Optional[Dict[str, Any]]] = [None] * len(configs)
+        for job, outcome in self._run_jobs(strategy_class, jobs, data, symbol):
+            c, i = divmod(job, n_splits)
+            pending.setdefault(c, {})[i] = outcome
+            if len(pending[c]) == n_splits:
+                outcomes = pending.pop(c)
+                summaries[c] = self._summarize_folds(
+                    [outcomes[i] for i in range(n_splits)], min_trades_per_fold
+                )
+        
+        return summaries
+    
+    def _summarize_folds(self, outcomes: List[Any], min_trades_per_fold: int) -> Dict[str, Any]:
+        """
+        Aggregate the fold results of one configuration
+        
+        Args:
+            outcomes: Backtest results (or the exception raised) per fold, in order
+            min_trades_per_fold: Minimum trades required per fold for robustness
+        
+        Returns:
+            Dict with cross-validation results and robustness flags
+        """
+        n_splits = len(outcomes)
+        fold_results = []
+        failed_folds = []
+        
+        for i, results in enumerate(outcomes):
+            if isinstance(results, Exception):
+                logger.error(f"Error in fold {i+1}: {results}")
                 failed_folds.append(i + 1)
                 continue
+            
+            num_trades = results.get('num_trades', 0)
+            if num_trades < min_trades_per_fold:
+                logger.warning(
+                    f"Fold {i+1}/{n_splits}: Only {num_trades} trades (min {min_trades_per_fold} required) - FAILED robustness check"
+                )
+                failed_folds.append(i + 1)
+            else:
+                logger.debug(
+                    f"Fold {i+1}/{n_splits}: {num_trades} trades, "
+                    f"{self.optimization_metric}={results.get(self.optimization_metric, 0):.4f}"
+                )
+            
+            fold_results.append(results)
         
         if not fold_results:
             return {'robust': False, 'failed_folds': failed_folds}
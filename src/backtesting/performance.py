@@ -2,16 +2,121 @@
 Performance Metrics Calculator
 
 Comprehensive performance metrics for backtest analysis.
+
+Metrics are computed with NumPy over the columns of a TradeLedger and an
+EquityLedger (lists of Trade objects and (timestamp, equity) tuples are
+converted first), so evaluating a backtest inside an optimization loop costs
+microseconds rather than a Python pass over every bar.
 """
 
 import logging
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Tuple
 import pandas as pd
 import numpy as np
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+DAY_NS = 86_400 * 10**9
+
+TRADE_COLUMNS = ('pnl', 'pnl_pct', 'fees', 'duration_minutes')
+
+
+def trade_arrays(trades: Any) -> Dict[str, np.ndarray]:
+    """
+    Columns of a TradeLedger or a list of Trade objects
+
+    Args:
+        trades: TradeLedger or sequence of Trade objects
+
+    Returns:
+        Dict of float64 arrays for pnl, pnl_pct, fees and duration_minutes
+    """
+    if hasattr(trades, 'column'):
+        return {name: trades.column(name) for name in TRADE_COLUMNS}
+
+    return {
+        name: np.fromiter((getattr(t, name) for t in trades), dtype=np.float64, count=len(trades))
+        for name in TRADE_COLUMNS
+    }
+
+
+def equity_arrays(equity_curve: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Timestamps and values of an EquityLedger or a list of (timestamp, equity)
+
+    Args:
+        equity_curve: EquityLedger or sequence of (timestamp, equity) tuples
+
+    Returns:
+        (int64 nanosecond timestamps, float64 equity)
+    """
+    if hasattr(equity_curve, 'equity'):
+        return equity_curve.timestamps, equity_curve.equity
+
+    timestamps = pd.DatetimeIndex([ts for ts, _ in equity_curve]).asi8
+    equity = np.fromiter((eq for _, eq in equity_curve), dtype=np.float64, count=len(equity_curve))
+    return timestamps, equity
+
+
+def drawdown_pct(equity: np.ndarray) -> np.ndarray:
+    """
+    Drawdown from the running peak at every point
+
+    Args:
+        equity: Equity values
+
+    Returns:
+        Drawdown percentages (0 at new highs)
+    """
+    peak = np.maximum.accumulate(equity)
+    return (peak - equity) / peak * 100
+
+
+def max_drawdown_pct(equity: np.ndarray) -> float:
+    """Maximum drawdown percentage of an equity series (0 when empty)"""
+    if not len(equity):
+        return 0.0
+    return max(0.0, float(drawdown_pct(equity).max()))
+
+
+def max_streaks(wins: np.ndarray) -> Tuple[int, int]:
+    """
+    Longest runs of wins and of losses
+
+    Args:
+        wins: Boolean array, True for a winning trade
+
+    Returns:
+        (max consecutive wins, max consecutive losses)
+    """
+    if not len(wins):
+        return 0, 0
+
+    bounds = np.concatenate(([0], np.flatnonzero(wins[1:] != wins[:-1]) + 1, [len(wins)]))
+    lengths = np.diff(bounds)
+    winning = wins[bounds[:-1]]
+
+    return int(lengths[winning].max(initial=0)), int(lengths[~winning].max(initial=0))
+
+
+def daily_returns(timestamps: np.ndarray, equity: np.ndarray) -> np.ndarray:
+    """
+    Returns of the equity curve resampled to the last value of each UTC day
+
+    Args:
+        timestamps: int64 nanosecond timestamps
+        equity: Equity values
+
+    Returns:
+        Day-over-day returns (days without data are skipped)
+    """
+    if len(equity) < 2:
+        return np.empty(0)
+
+    days = timestamps // DAY_NS
+    closes = equity[np.append(np.flatnonzero(days[1:] != days[:-1]), len(days) - 1)]
+    return closes[1:] / closes[:-1] - 1
+
 
 class PerformanceMetrics:
     """
@@ -19,7 +124,7 @@ class PerformanceMetrics:
     
     Metrics include:
     - Returns (total, annualized, monthly)
-    - Risk metrics (Sharpe, Sortino, Calmar)
+    - Risk metrics (Sharpe, Sortino, Calmar), per trade and from daily returns
     - Drawdown analysis
     - Trade statistics
     - Win/loss analysis
@@ -27,46 +132,57 @@ class PerformanceMetrics:
     
     @staticmethod
     def calculate_all_metrics(
-        trades: List[Any],
-        equity_curve: List[Tuple[datetime, float]],
+        trades: Any,
+        equity_curve: Any,
         initial_capital: float,
-        risk_free_rate: float = 0.02
+        risk_free_rate: float = 0.02,
+        periods_per_year: int = 365
     ) -> Dict[str, Any]:
         """
         Calculate all performance metrics
         
         Args:
-            trades: List of Trade objects
-            equity_curve: List of (timestamp, equity) tuples
+            trades: TradeLedger or list of Trade objects
+            equity_curve: EquityLedger or list of (timestamp, equity) tuples
             initial_capital: Starting capital
             risk_free_rate: Annual risk-free rate (default: 2%)
+            periods_per_year: Days per year used to annualize daily ratios
+                (default: 365, crypto trades every day)
         
         Returns:
             Dict with all performance metrics
         """
-        if not trades or not equity_curve:
+        if not len(trades) or not len(equity_curve):
             return PerformanceMetrics._empty_metrics()
         
+        columns = trade_arrays(trades)
+        timestamps, equity = equity_arrays(equity_curve)
+        peak = np.maximum.accumulate(equity)
+        
         metrics = {}
         
         metrics.update(PerformanceMetrics._calculate_returns(
-            equity_curve, initial_capital
+            timestamps, equity, initial_capital
         ))
         
         metrics.update(PerformanceMetrics._calculate_risk_metrics(
-            trades, equity_curve, initial_capital, risk_free_rate
+            columns, equity, peak, initial_capital, risk_free_rate
+        ))
+        
+        metrics.update(PerformanceMetrics._calculate_daily_ratios(
+            timestamps, equity, risk_free_rate, periods_per_year
         ))
         
         metrics.update(PerformanceMetrics._calculate_drawdown_metrics(
-            equity_curve
+            timestamps, equity, peak, equity_curve
         ))
         
-        metrics.update(PerformanceMetrics._calculate_trade_stats(trades))
+        metrics.update(PerformanceMetrics._calculate_trade_stats(columns))
         
-        metrics.update(PerformanceMetrics._calculate_win_loss_stats(trades))
+        metrics.update(PerformanceMetrics._calculate_win_loss_stats(columns))
         
         metrics.update(PerformanceMetrics._calculate_time_stats(
-            trades, equity_curve
+            columns, timestamps
         ))
         
         return metrics
@@ -80,6 +196,8 @@ class PerformanceMetrics:
             'sharpe_ratio': 0.0,
             'sortino_ratio': 0.0,
             'calmar_ratio': 0.0,
+            'daily_sharpe_ratio': 0.0,
+            'daily_sortino_ratio': 0.0,
             'max_drawdown_pct': 0.0,
             'num_trades': 0,
             'win_rate': 0.0,
@@ -88,17 +206,16 @@ class PerformanceMetrics:
     
     @staticmethod
     def _calculate_returns(
-        equity_curve: List[Tuple[datetime, float]],
+        timestamps: np.ndarray,
+        equity: np.ndarray,
         initial_capital: float
     ) -> Dict[str, Any]:
         """Calculate return metrics"""
-        final_equity = equity_curve[-1][1]
+        final_equity = float(equity[-1])
         total_return = final_equity - initial_capital
         total_return_pct = (total_return / initial_capital) * 100
         
-        start_date = equity_curve[0][0]
-        end_date = equity_curve[-1][0]
-        days = (end_date - start_date).days
+        days = int((timestamps[-1] - timestamps[0]) // DAY_NS)
         years = days / 365.25
         
         if years > 0:
@@ -115,13 +232,14 @@ class PerformanceMetrics:
     
     @staticmethod
     def _calculate_risk_metrics(
-        trades: List[Any],
-        equity_curve: List[Tuple[datetime, float]],
+        columns: Dict[str, np.ndarray],
+        equity: np.ndarray,
+        peak: np.ndarray,
         initial_capital: float,
         risk_free_rate: float
     ) -> Dict[str, Any]:
-        """Calculate risk-adjusted metrics"""
-        returns = [t.pnl_pct for t in trades]
+        """Calculate risk-adjusted metrics (per-trade returns)"""
+        returns = columns['pnl_pct']
         
         if len(returns) < 2:
             return {
@@ -130,28 +248,24 @@ class PerformanceMetrics:
                 'calmar_ratio': 0.0
             }
         
-        avg_return = np.mean(returns)
-        std_return = np.std(returns, ddof=1)
+        avg_return = float(returns.mean())
+        std_return = float(returns.std(ddof=1))
         
         if std_return > 0:
             sharpe_ratio = (avg_return - (risk_free_rate / 252)) / std_return
         else:
             sharpe_ratio = 0.0
         
-        negative_returns = [r for r in returns if r < 0]
-        if negative_returns:
-            downside_std = np.std(negative_returns, ddof=1)
+        negative_returns = returns[returns < 0]
+        sortino_ratio = 0.0
+        if len(negative_returns) > 1:
+            downside_std = float(negative_returns.std(ddof=1))
             if downside_std > 0:
                 sortino_ratio = (avg_return - (risk_free_rate / 252)) / downside_std
-            else:
-                sortino_ratio = 0.0
-        else:
-            sortino_ratio = 0.0
         
-        max_dd = PerformanceMetrics._calculate_max_drawdown(equity_curve)
+        max_dd = float(((peak - equity) / peak * 100).max())
         if max_dd > 0:
-            final_equity = equity_curve[-1][1]
-            total_return_pct = ((final_equity / initial_capital) - 1) * 100
+            total_return_pct = ((float(equity[-1]) / initial_capital) - 1) * 100
             calmar_ratio = total_return_pct / max_dd
         else:
             calmar_ratio = 0.0
@@ -164,75 +278,84 @@ class PerformanceMetrics:
             'std_return_pct': std_return
         }
     
+    @staticmethod
+    def _calculate_daily_ratios(
+        timestamps: np.ndarray,
+        equity: np.ndarray,
+        risk_free_rate: float,
+        periods_per_year: int
+    ) -> Dict[str, Any]:
+        """Calculate annualized Sharpe and Sortino from daily equity returns"""
+        returns = daily_returns(timestamps, equity)
+        
+        if len(returns) < 2:
+            return {'daily_sharpe_ratio': 0.0, 'daily_sortino_ratio': 0.0}
+        
+        excess = returns - risk_free_rate / periods_per_year
+        avg_excess = float(excess.mean())
+        annualize = np.sqrt(periods_per_year)
+        
+        std = float(returns.std(ddof=1))
+        sharpe_ratio = avg_excess / std * annualize if std > 0 else 0.0
+        
+        downside = float(np.sqrt(np.mean(np.minimum(excess, 0.0) ** 2)))
+        sortino_ratio = avg_excess / downside * annualize if downside > 0 else 0.0
+        
+        return {
+            'daily_sharpe_ratio': sharpe_ratio,
+            'daily_sortino_ratio': sortino_ratio
+        }
+    
     @staticmethod
     def _calculate_drawdown_metrics(
-        equity_curve: List[Tuple[datetime, float]]
+        timestamps: np.ndarray,
+        equity: np.ndarray,
+        peak: np.ndarray,
+        equity_curve: Any
     ) -> Dict[str, Any]:
-        """Calculate drawdown metrics"""
-        equity_values = [eq for _, eq in equity_curve]
-        timestamps = [ts for ts, _ in equity_curve]
+        """
+        Calculate drawdown metrics
+        
+        A drawdown period runs from the first point at or below the running
+        peak until the next new high; its duration counts only once that
+        high is reached.
+        """
+        drawdowns = (peak - equity) / peak * 100
+        
+        in_drawdown = np.ones(len(equity), dtype=bool)
+        in_drawdown[1:] = equity[1:] <= peak[:-1]
+        
+        starts = np.flatnonzero(in_drawdown & ~np.concatenate(([False], in_drawdown[:-1])))
+        ends = np.flatnonzero(~in_drawdown & np.concatenate(([False], in_drawdown[:-1])))
         
-        peak = equity_values[0]
-        max_drawdown = 0.0
         max_drawdown_duration = 0
-        current_drawdown_duration = 0
-        drawdown_start = None
+        if len(ends):
+            durations = (timestamps[ends] - timestamps[starts[:len(ends)]]) // DAY_NS
+            max_drawdown_duration = int(durations.max())
+        
+        max_drawdown = 0.0
         max_dd_start = None
         max_dd_end = None
         
-        drawdowns = []
-        
-        for i, equity in enumerate(equity_values):
-            if equity > peak:
-                if drawdown_start:
-                    drawdown_duration = (timestamps[i] - drawdown_start).days
-                    max_drawdown_duration = max(max_drawdown_duration, drawdown_duration)
-                    drawdown_start = None
-                    current_drawdown_duration = 0
-                peak = equity
-            else:
-                if not drawdown_start:
-                    drawdown_start = timestamps[i]
-                
-                drawdown = ((peak - equity) / peak) * 100
-                drawdowns.append(drawdown)
-                
-                if drawdown > max_drawdown:
-                    max_drawdown = drawdown
-                    max_dd_start = drawdown_start
-                    max_dd_end = timestamps[i]
-                
-                current_drawdown_duration = (timestamps[i] - drawdown_start).days
-        
-        avg_drawdown = np.mean(drawdowns) if drawdowns else 0.0
+        k = int(drawdowns.argmax())
+        if drawdowns[k] > 0:
+            max_drawdown = float(drawdowns[k])
+            max_dd_start = equity_curve[int(starts[np.searchsorted(starts, k, side='right') - 1])][0]
+            max_dd_end = equity_curve[k][0]
         
         return {
             'max_drawdown_pct': max_drawdown,
-            'avg_drawdown_pct': avg_drawdown,
+            'avg_drawdown_pct': float(drawdowns[in_drawdown].mean()),
             'max_drawdown_duration_days': max_drawdown_duration,
             'max_drawdown_start': max_dd_start,
             'max_drawdown_end': max_dd_end
         }
     
     @staticmethod
-    def _calculate_max_drawdown(equity_curve: List[Tuple[datetime, float]]) -> float:
-        """Calculate maximum drawdown percentage"""
-        equity_values = [eq for _, eq in equity_curve]
-        peak = equity_values[0]
-        max_drawdown = 0.0
-        
-        for equity in equity_values:
-            if equity > peak:
-                peak = equity
-            drawdown = ((peak - equity) / peak) * 100
-            max_drawdown = max(max_drawdown, drawdown)
-        
-        return max_drawdown
-    
-    @staticmethod
-    def _calculate_trade_stats(trades: List[Any]) -> Dict[str, Any]:
+    def _calculate_trade_stats(columns: Dict[str, np.ndarray]) -> Dict[str, Any]:
         """Calculate trade statistics"""
-        num_trades = len(trades)
+        pnls = columns['pnl']
+        num_trades = len(pnls)
         
         if num_trades == 0:
             return {
@@ -244,24 +367,24 @@ class PerformanceMetrics:
                 'total_fees': 0.0
             }
         
-        pnls = [t.pnl for t in trades]
-        pnl_pcts = [t.pnl_pct for t in trades]
-        fees = [t.fees for t in trades]
+        fees = columns['fees']
         
         return {
             'num_trades': num_trades,
-            'avg_trade_pnl': np.mean(pnls),
-            'avg_trade_pnl_pct': np.mean(pnl_pcts),
-            'best_trade_pnl': max(pnls),
-            'worst_trade_pnl': min(pnls),
-            'total_fees': sum(fees),
-            'avg_fees_per_trade': np.mean(fees)
+            'avg_trade_pnl': float(pnls.mean()),
+            'avg_trade_pnl_pct': float(columns['pnl_pct'].mean()),
+            'best_trade_pnl': float(pnls.max()),
+            'worst_trade_pnl': float(pnls.min()),
+            'total_fees': float(fees.sum()),
+            'avg_fees_per_trade': float(fees.mean())
         }
     
     @staticmethod
-    def _calculate_win_loss_stats(trades: List[Any]) -> Dict[str, Any]:
+    def _calculate_win_loss_stats(columns: Dict[str, np.ndarray]) -> Dict[str, Any]:
         """Calculate win/loss statistics"""
-        if not trades:
+        pnls = columns['pnl']
+        
+        if not len(pnls):
             return {
                 'num_wins': 0,
                 'num_losses': 0,
@@ -276,38 +399,26 @@ class PerformanceMetrics:
                 'consecutive_losses_max': 0
             }
         
-        winning_trades = [t for t in trades if t.pnl > 0]
-        losing_trades = [t for t in trades if t.pnl <= 0]
+        wins = pnls > 0
+        winning = pnls[wins]
+        losing = pnls[~wins]
         
-        num_wins = len(winning_trades)
-        num_losses = len(losing_trades)
-        win_rate = (num_wins / len(trades)) * 100
+        num_wins = len(winning)
+        num_losses = len(losing)
+        win_rate = (num_wins / len(pnls)) * 100
         
-        total_profit = sum(t.pnl for t in winning_trades)
-        total_loss = abs(sum(t.pnl for t in losing_trades))
+        total_profit = float(winning.sum())
+        total_loss = float(abs(losing.sum()))
         profit_factor = (total_profit / total_loss) if total_loss > 0 else 0.0
         
         avg_win = (total_profit / num_wins) if num_wins > 0 else 0.0
         avg_loss = (total_loss / num_losses) if num_losses > 0 else 0.0
         avg_win_loss_ratio = (avg_win / avg_loss) if avg_loss > 0 else 0.0
         
-        largest_win = max((t.pnl for t in winning_trades), default=0.0)
-        largest_loss = min((t.pnl for t in losing_trades), default=0.0)
-        
-        consecutive_wins = 0
-        consecutive_losses = 0
-        max_consecutive_wins = 0
-        max_consecutive_losses = 0
+        largest_win = float(winning.max()) if num_wins else 0.0
+        largest_loss = float(losing.min()) if num_losses else 0.0
         
-        for trade in trades:
-            if trade.pnl > 0:
-                consecutive_wins += 1
-                consecutive_losses = 0
-                max_consecutive_wins = max(max_consecutive_wins, consecutive_wins)
-            else:
-                consecutive_losses += 1
-                consecutive_wins = 0
-                max_consecutive_losses = max(max_consecutive_losses, consecutive_losses)
+        max_consecutive_wins, max_consecutive_losses = max_streaks(wins)
         
         expectancy = (win_rate / 100 * avg_win) - ((100 - win_rate) / 100 * avg_loss)
         
@@ -328,11 +439,13 @@ class PerformanceMetrics:
     
     @staticmethod
     def _calculate_time_stats(
-        trades: List[Any],
-        equity_curve: List[Tuple[datetime, float]]
+        columns: Dict[str, np.ndarray],
+        timestamps: np.ndarray
     ) -> Dict[str, Any]:
         """Calculate time-based statistics"""
-        if not trades:
+        durations = columns['duration_minutes']
+        
+        if not len(durations):
             return {
                 'avg_trade_duration_minutes': 0.0,
                 'avg_trade_duration_hours': 0.0,
@@ -341,19 +454,16 @@ class PerformanceMetrics:
                 'total_trading_days': 0
             }
         
-        durations = [t.duration_minutes for t in trades]
-        
-        start_date = equity_curve[0][0]
-        end_date = equity_curve[-1][0]
-        total_days = (end_date - start_date).days
+        avg_duration = float(durations.mean())
+        total_days = int((timestamps[-1] - timestamps[0]) // DAY_NS)
         
         return {
-            'avg_trade_duration_minutes': np.mean(durations),
-            'avg_trade_duration_hours': np.mean(durations) / 60,
-            'shortest_trade_minutes': min(durations),
-            'longest_trade_minutes': max(durations),
+            'avg_trade_duration_minutes': avg_duration,
+            'avg_trade_duration_hours': avg_duration / 60,
+            'shortest_trade_minutes': float(durations.min()),
+            'longest_trade_minutes': float(durations.max()),
             'total_trading_days': total_days,
-            'trades_per_day': len(trades) / max(total_days, 1)
+            'trades_per_day': len(durations) / max(total_days, 1)
         }
     
     @staticmethod
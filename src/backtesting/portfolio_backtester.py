@@ -0,0 +1,575 @@
+"""
+Portfolio Backtester
+
+Backtests many (symbol, timeframe) strategy sleeves against one capital pool.
+All series are merged into a single event index of bar close times, so a
+1h bar only becomes visible to decisions when it has closed, and every
+sleeve shares the same capital, max_positions and exposure limit.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from ..strategies.base_strategy import BaseStrategy, TradingSignal, SignalAction, VectorizedSignals
+from ..strategies.strategy_manager import StrategyManager
+from .backtest_engine import BacktestEngine, BarView, OHLCV_COLUMNS
+from .fill_model import IntrabarFillModel, BarFills
+from .ledger import TradeLedger, EquityLedger
+from .shared_dataset import SharedDataset, as_frame
+from .timeframe_alignment import bar_duration
+
+logger = logging.getLogger(__name__)
+
+EXIT_REASONS = ('stop_loss', 'take_profit')
+
+
+@dataclass
+class PortfolioSleeve:
+    """
+    One strategy trading one (symbol, timeframe) series
+
+    Attributes:
+        strategy: Strategy instance
+        symbol: Trading pair symbol
+        data: OHLCV data with indicators, indexed by bar open time
+        timeframe: Bar length, e.g. '5m' or '1h' (default: inferred from the index)
+        weight: Vote weight when signals on the same symbol are aggregated
+    """
+    strategy: BaseStrategy
+    symbol: str
+    data: Union[pd.DataFrame, SharedDataset]
+    timeframe: Optional[str] = None
+    weight: float = 1.0
+
+
+class PortfolioBacktester(BacktestEngine):
+    """
+    Multi-symbol backtester with a shared capital pool
+
+    Per event (bar close time):
+    1. Stops and targets of open positions are checked on each symbol's
+       finest series (or filled intrabar by the fill model)
+    2. Sleeves whose bar closed produce signals; actionable signals on the
+       same symbol are combined with StrategyManager.aggregate_signals
+    3. Entries are sized from the shared capital and admitted while fewer
+       than max_positions are open and StrategyManager.check_combined_exposure
+       approves them
+    4. Equity is marked to the latest close of every symbol
+
+    Open positions live in fixed-size NumPy arrays (one slot per allowed
+    position), and bars are read from pre-extracted column arrays, so no
+    pandas object is built per bar. Trades, equity curve and results have the
+    same format as BacktestEngine's, with timestamps at bar close.
+
+    Usage:
+        backtester = PortfolioBacktester(initial_capital=100000, max_positions=10)
+        results = backtester.run_portfolio([
+            PortfolioSleeve(MomentumStrategy(), 'BTC/USDT', btc_5m, '5m'),
+            PortfolioSleeve(KeltnerStrategy(), 'ETH/USDT', eth_1h, '1h'),
+        ])
+    """
+
+    def __init__(
+        self,
+        initial_capital: float = 10000.0,
+        maker_fee: float = 0.0002,
+        taker_fee: float = 0.0005,
+        slippage_pct: float = 0.0005,
+        max_positions: int = 10,
+        max_exposure_pct: Optional[float] = 100.0,
+        strategy_manager: Optional[StrategyManager] = None,
+        use_vectorized_signals: bool = True,
+        fill_model: Optional[Union[str, IntrabarFillModel]] = None
+    ):
+        """
+        Initialize portfolio backtester
+
+        Args:
+            initial_capital: Starting capital in USDT, shared by all sleeves
+            maker_fee: Maker fee percentage
+            taker_fee: Taker fee percentage
+            slippage_pct: Slippage percentage
+            max_positions: Maximum concurrent positions across all sleeves
+            max_exposure_pct: Maximum combined notional exposure as a
+                percentage of equity (None disables the check)
+            strategy_manager: Manager aggregating signals and checking exposure
+                (default: one with every sleeve's strategy and weight)
+            use_vectorized_signals: Use a strategy's generate_signals_vectorized()
+                hook when it provides one
+            fill_model: Intrabar stop/target fills, as for BacktestEngine
+        """
+        super().__init__(
+            initial_capital=initial_capital,
+            maker_fee=maker_fee,
+            taker_fee=taker_fee,
+            slippage_pct=slippage_pct,
+            max_positions=max_positions,
+            use_vectorized_signals=use_vectorized_signals,
+            fill_model=fill_model
+        )
+
+        if max_positions < 1:
+            raise ValueError("max_positions must be at least 1")
+
+        self.max_exposure_pct = max_exposure_pct
+        self.strategy_manager = strategy_manager
+        self.rejected_signals = 0
+
+    def get_config(self) -> Dict[str, Any]:
+        """
+        Get backtester settings
+
+        Returns:
+            Constructor arguments that build an equivalent, independent backtester
+        """
+        config = super().get_config()
+        config.pop('use_array_kernel')
+        config['max_exposure_pct'] = self.max_exposure_pct
+        config['strategy_manager'] = self.strategy_manager
+        return config
+
+    def run_portfolio(
+        self,
+        sleeves: Sequence[Union[PortfolioSleeve, Tuple]]
+    ) -> Dict[str, Any]:
+        """
+        Run a portfolio backtest
+
+        Args:
+            sleeves: PortfolioSleeve objects, or tuples of their fields
+
+        Returns:
+            Dict with backtest results and metrics (as BacktestEngine.run_backtest),
+            plus 'symbols', 'num_events' and 'rejected_signals'
+        """
+        sleeves = [s if isinstance(s, PortfolioSleeve) else PortfolioSleeve(*s) for s in sleeves]
+        if not sleeves:
+            raise ValueError("At least one sleeve is required")
+
+        self._prepare(sleeves)
+
+        logger.info(
+            f"Starting portfolio backtest: {len(sleeves)} sleeves, {len(self._symbols)} symbols, "
+            f"{len(self._timestamps)} events"
+        )
+
+        self.capital = self.initial_capital
+        self.trades = TradeLedger()
+        self.equity_curve = EquityLedger()
+        self.positions = []
+        self.rejected_signals = 0
+        self._reset_book()
+
+        pair_offsets = self._pair_offsets
+
+        for e, timestamp in enumerate(self._timestamps):
+            if self._n_open:
+                self._process_exits(e, timestamp)
+
+            candidates: Dict[int, List[Tuple[int, TradingSignal]]] = {}
+            start, stop = pair_offsets[e], pair_offsets[e + 1]
+            for j, i in zip(self._pair_sleeves[start:stop].tolist(), self._pair_bars[start:stop].tolist()):
+                if self._n_open >= self.max_positions:
+                    continue
+
+                signal = self._sleeve_signal(j, i, timestamp)
+                if signal is not None and signal.action in (SignalAction.BUY, SignalAction.SELL):
+                    candidates.setdefault(self._sleeve_symbol[j], []).append((j, signal))
+
+            for k, entries in candidates.items():
+                if self._n_open >= self.max_positions:
+                    break
+                self._enter(k, entries, e, timestamp)
+
+            self.equity_curve.append((timestamp, self._equity(e)))
+
+        last = len(self._timestamps) - 1
+        for slot in self._open_slots():
+            k = self._pos_symbol[slot]
+            self._close_slot(slot, last, self._flat_close[self._last_bar[last, k]], 'backtest_end')
+
+        results = self._calculate_results()
+        results['symbols'] = list(self._symbols)
+        results['num_events'] = len(self._timestamps)
+        results['rejected_signals'] = self.rejected_signals
+
+        logger.info(
+            f"Portfolio backtest complete: {len(self.trades)} trades, "
+            f"Final equity: ${results['final_equity']:.2f}, "
+            f"Return: {results['total_return_pct']:.2f}%"
+        )
+
+        return results
+
+    def _prepare(self, sleeves: List[PortfolioSleeve]) -> None:
+        """Build the merged event index and the per-sleeve and per-symbol arrays"""
+        frames = [as_frame(sleeve.data) for sleeve in sleeves]
+        durations = [bar_duration(frame, sleeve.timeframe) for frame, sleeve in zip(frames, sleeves)]
+        close_times = [
+            (frame.index + duration).asi8 for frame, duration in zip(frames, durations)
+        ]
+
+        events = np.unique(np.concatenate(close_times))
+        self._events = events
+        tz = frames[0].index.tz
+        event_index = pd.DatetimeIndex(events.astype('datetime64[ns]'))
+        if tz is not None:
+            event_index = event_index.tz_localize('UTC').tz_convert(tz)
+        self._timestamps = event_index.tolist()
+        self._sleeve_events = [np.searchsorted(events, times) for times in close_times]
+
+        self._symbols = sorted({sleeve.symbol for sleeve in sleeves})
+        symbol_index = {symbol: k for k, symbol in enumerate(self._symbols)}
+        self._sleeve_symbol = [symbol_index[sleeve.symbol] for sleeve in sleeves]
+        self._strategies = [sleeve.strategy for sleeve in sleeves]
+
+        manager = self.strategy_manager
+        if manager is None:
+            manager = StrategyManager()
+            for sleeve in sleeves:
+                if sleeve.strategy.name not in manager.strategies:
+                    manager.register_strategy(sleeve.strategy, sleeve.weight)
+        self._manager = manager
+
+        # Each symbol is marked and stopped out on its finest series
+        price_sleeve: Dict[int, int] = {}
+        for j, k in enumerate(self._sleeve_symbol):
+            if k not in price_sleeve or durations[j] < durations[price_sleeve[k]]:
+                price_sleeve[k] = j
+
+        n_events, n_symbols = len(events), len(self._symbols)
+        bar_at = np.full((n_events, n_symbols), -1, dtype=np.int64)
+        offsets = np.zeros(n_symbols, dtype=np.int64)
+        closes = []
+        offset = 0
+        self._price_fills: List[Optional[BarFills]] = []
+        self._price_events: List[np.ndarray] = []
+        self._price_close_times: List[np.ndarray] = []
+
+        for k in range(n_symbols):
+            j = price_sleeve[k]
+            frame = frames[j]
+            bar_at[self._sleeve_events[j], k] = offset + np.arange(len(frame))
+            offsets[k] = offset
+            offset += len(frame)
+            closes.append(frame['close'].to_numpy(dtype=np.float64))
+
+            self._price_events.append(self._sleeve_events[j])
+            self._price_close_times.append(close_times[j])
+            self._price_fills.append(self.fill_model.bind(frame) if self.fill_model is not None else None)
+
+        self._flat_close = np.concatenate(closes)
+        self._bar_at = bar_at
+        self._last_bar = np.maximum.accumulate(bar_at, axis=0)
+
+        self._columns: List[Dict[str, np.ndarray]] = []
+        self._indicator_columns: List[Optional[Dict[str, np.ndarray]]] = []
+        self._vectorized: List[Optional[VectorizedSignals]] = []
+        pairs = []
+
+        for j, (sleeve, frame) in enumerate(zip(sleeves, frames)):
+            if not sleeve.strategy.is_initialized:
+                sleeve.strategy.initialize()
+
+            matrix = frame.to_numpy()
+            columns = {
+                col: np.ascontiguousarray(matrix[:, c])
+                for c, col in enumerate(frame.columns)
+            }
+            self._columns.append(columns)
+
+            signals = None
+            if self.use_vectorized_signals:
+                signals = sleeve.strategy.generate_signals_vectorized(frame)
+            self._vectorized.append(signals)
+
+            if signals is not None:
+                self._indicator_columns.append(None)
+                bars = np.flatnonzero(signals.action != VectorizedSignals.HOLD)
+            else:
+                indicator_columns = {
+                    col: values
+                    for col, values in columns.items()
+                    if col not in OHLCV_COLUMNS
+                }
+                indicator_columns['price'] = columns['close']
+                self._indicator_columns.append(indicator_columns)
+                bars = np.arange(len(frame))
+
+            pairs.append(np.stack([
+                self._sleeve_events[j][bars],
+                np.full(len(bars), j, dtype=np.int64),
+                bars
+            ]))
+
+        # (event, sleeve, bar) schedule sorted by event then sleeve; the pairs of
+        # event e are rows pair_offsets[e]:pair_offsets[e + 1]
+        pairs = np.concatenate(pairs, axis=1)
+        order = np.lexsort((pairs[1], pairs[0]))
+        self._pair_events, self._pair_sleeves, self._pair_bars = pairs[:, order]
+        self._pair_offsets = np.searchsorted(self._pair_events, np.arange(n_events + 1))
+
+    def _reset_book(self) -> None:
+        """Empty the position arrays"""
+        n = self.max_positions
+        self._active = np.zeros(n, dtype=bool)
+        self._pos_symbol = np.zeros(n, dtype=np.int64)
+        self._side = np.zeros(n, dtype=np.int8)
+        self._entry_price = np.zeros(n)
+        self._size = np.zeros(n)
+        self._leverage = np.ones(n)
+        self._stop = np.full(n, np.nan)
+        self._target = np.full(n, np.nan)
+        self._entry_event = np.zeros(n, dtype=np.int64)
+        self._exit_event = np.full(n, -1, dtype=np.int64)
+        self._exit_price = np.zeros(n)
+        self._exit_reason = np.zeros(n, dtype=np.int8)
+        self._seq = np.zeros(n, dtype=np.int64)
+        self._metadata: List[Optional[Dict[str, Any]]] = [None] * n
+        self._n_open = 0
+        self._next_seq = 0
+
+    def _open_slots(self) -> np.ndarray:
+        """Active slots in the order their positions were opened"""
+        slots = np.flatnonzero(self._active)
+        return slots[np.argsort(self._seq[slots], kind='stable')]
+
+    def _sleeve_signal(self, j: int, i: int, timestamp: Any) -> Optional[TradingSignal]:
+        """Signal of sleeve j at its bar i"""
+        strategy = self._strategies[j]
+        columns = self._columns[j]
+        symbol = self._symbols[self._sleeve_symbol[j]]
+        signals = self._vectorized[j]
+
+        if signals is not None:
+            can_trade, _ = strategy.can_trade(timestamp)
+            if not can_trade:
+                return None
+            signal = signals.to_signal(i, symbol, timestamp, columns['close'][i])
+            strategy.record_signal(signal)
+            return signal
+
+        market_data = {
+            'symbol': symbol,
+            'price': columns['close'][i],
+            'timestamp': timestamp,
+            'volume': columns['volume'][i],
+            'open': columns['open'][i],
+            'high': columns['high'][i],
+            'low': columns['low'][i]
+        }
+        return strategy.generate_signal(market_data, BarView(self._indicator_columns[j], i))
+
+    def _combine(self, entries: List[Tuple[int, TradingSignal]]) -> Optional[Tuple[int, TradingSignal, float]]:
+        """
+        Combine the signals of one symbol
+
+        Returns:
+            (sleeve, signal whose levels are used, confidence), or None without consensus
+        """
+        if len(entries) == 1:
+            j, signal = entries[0]
+            return j, signal, signal.confidence
+
+        signals = []
+        for j, signal in entries:
+            signal.metadata.setdefault('strategy_name', self._strategies[j].name)
+            signals.append(signal)
+
+        aggregated = self._manager.aggregate_signals(signals)
+        if aggregated is None or aggregated.action not in (SignalAction.BUY, SignalAction.SELL):
+            return None
+
+        j, template = max(
+            (entry for entry in entries if entry[1].action == aggregated.action),
+            key=lambda entry: entry[1].confidence
+        )
+        return j, template, aggregated.confidence
+
+    def _enter(self, k: int, entries: List[Tuple[int, TradingSignal]], e: int, timestamp: Any) -> None:
+        """Open a position on symbol k from the signals of its sleeves"""
+        combined = self._combine(entries)
+        if combined is None:
+            return
+        j, signal, confidence = combined
+
+        close = self._columns[j]['close'][self._bar_of(j, e)]
+        if signal.action == SignalAction.BUY:
+            entry_price = close * (1 + self.slippage_pct)
+            side = 1
+        else:
+            entry_price = close * (1 - self.slippage_pct)
+            side = -1
+
+        position_size_pct = signal.position_size if signal.position_size else 0.1
+        leverage = signal.metadata.get('leverage', 1.0)
+
+        available_capital = self.capital * position_size_pct
+        position_value = available_capital * leverage
+        size = position_value / entry_price
+
+        fees = position_value * self.taker_fee
+
+        if fees > self.capital * 0.5:  # Don't use more than 50% capital on fees
+            logger.warning(f"Insufficient capital for {signal.symbol} position, skipping")
+            return
+
+        if self.max_exposure_pct is not None:
+            slots = np.flatnonzero(self._active)
+            marks = self._flat_close[self._last_bar[e, self._pos_symbol[slots]]]
+            approved, reason = self._manager.check_combined_exposure(
+                [{'size': size, 'price': entry_price}],
+                [{'size': s, 'price': m} for s, m in zip(self._size[slots], marks)],
+                max_exposure_pct=self.max_exposure_pct,
+                total_capital=self._equity(e)
+            )
+            if not approved:
+                self.rejected_signals += 1
+                logger.debug(f"Rejected {signal.action.value} {signal.symbol}: {reason}")
+                return
+
+        self.capital -= fees
+
+        slot = int(np.flatnonzero(~self._active)[0])
+        self._active[slot] = True
+        self._pos_symbol[slot] = k
+        self._side[slot] = side
+        self._entry_price[slot] = entry_price
+        self._size[slot] = size
+        self._leverage[slot] = leverage
+        self._stop[slot] = signal.stop_loss if signal.stop_loss else np.nan
+        self._target[slot] = signal.take_profit if signal.take_profit else np.nan
+        self._entry_event[slot] = e
+        self._seq[slot] = self._next_seq
+        self._metadata[slot] = {
+            'strategy': signal.metadata.get('strategy', 'unknown'),
+            'confidence': confidence,
+            'entry_fees': fees
+        }
+        self._next_seq += 1
+        self._n_open += 1
+
+        self._exit_event[slot] = -1
+        fills = self._price_fills[k]
+        if fills is not None:
+            start = int(np.searchsorted(self._price_close_times[k], self._events[e], side='right'))
+            fill = fills.first_exit(
+                start,
+                'long' if side > 0 else 'short',
+                signal.stop_loss,
+                signal.take_profit
+            )
+            if fill is not None:
+                bar, price, reason = fill
+                self._exit_event[slot] = self._price_events[k][bar]
+                self._exit_price[slot] = price
+                self._exit_reason[slot] = EXIT_REASONS.index(reason)
+
+        logger.debug(
+            f"Opened {'long' if side > 0 else 'short'} {signal.symbol}: {size:.6f} @ ${entry_price:.2f}, "
+            f"leverage={leverage:.1f}x, fees=${fees:.2f}"
+        )
+
+    def _bar_of(self, j: int, e: int) -> int:
+        """Bar of sleeve j closing at event e"""
+        return int(np.searchsorted(self._sleeve_events[j], e))
+
+    def _process_exits(self, e: int, timestamp: Any) -> None:
+        """Close positions whose stop-loss or take-profit fills at event e"""
+        slots = self._open_slots()
+
+        if self.fill_model is not None:
+            for slot in slots[self._exit_event[slots] == e]:
+                self._close_slot(slot, e, self._exit_price[slot], EXIT_REASONS[self._exit_reason[slot]])
+            return
+
+        bars = self._bar_at[e, self._pos_symbol[slots]]
+        has_bar = bars >= 0
+        slots, bars = slots[has_bar], bars[has_bar]
+        if not len(slots):
+            return
+
+        prices = self._flat_close[bars]
+        side = self._side[slots]
+        stop = self._stop[slots]
+        target = self._target[slots]
+
+        with np.errstate(invalid='ignore'):
+            stop_hit = ((side > 0) & (prices <= stop)) | ((side < 0) & (prices >= stop))
+            target_hit = ((side > 0) & (prices >= target)) | ((side < 0) & (prices <= target))
+
+        for slot, hit_stop, hit_target in zip(slots, stop_hit, target_hit):
+            if hit_stop:
+                self._close_slot(slot, e, self._stop[slot], 'stop_loss')
+            elif hit_target:
+                self._close_slot(slot, e, self._target[slot], 'take_profit')
+
+    def _close_slot(self, slot: int, e: int, exit_price: float, exit_reason: str) -> None:
+        """Close the position in a slot and record the trade"""
+        long = self._side[slot] > 0
+        entry_price = self._entry_price[slot]
+        size = self._size[slot]
+        leverage = self._leverage[slot]
+        metadata = self._metadata[slot]
+
+        if long:
+            exit_price = exit_price * (1 - self.slippage_pct)
+        else:
+            exit_price = exit_price * (1 + self.slippage_pct)
+
+        position_value = size * entry_price
+        exit_value = size * exit_price
+
+        if long:
+            pnl_before_fees = (exit_value - position_value) * leverage
+        else:
+            pnl_before_fees = (position_value - exit_value) * leverage
+
+        exit_fees = exit_value * self.taker_fee
+        total_fees = metadata['entry_fees'] + exit_fees
+
+        pnl = pnl_before_fees - exit_fees
+        pnl_pct = (pnl / (position_value / leverage)) * 100
+
+        self.capital += pnl
+
+        entry_time = self._timestamps[self._entry_event[slot]]
+        exit_time = self._timestamps[e]
+        duration = (exit_time - entry_time).total_seconds() / 60
+
+        self.trades.add(
+            entry_time=entry_time,
+            exit_time=exit_time,
+            symbol=self._symbols[self._pos_symbol[slot]],
+            side='long' if long else 'short',
+            entry_price=float(entry_price),
+            exit_price=float(exit_price),
+            size=float(size),
+            leverage=float(leverage),
+            pnl=float(pnl),
+            pnl_pct=float(pnl_pct),
+            fees=float(total_fees),
+            duration_minutes=duration,
+            exit_reason=exit_reason,
+            metadata=metadata
+        )
+
+        self._active[slot] = False
+        self._metadata[slot] = None
+        self._n_open -= 1
+
+    def _equity(self, e: int) -> float:
+        """Capital plus unrealized P&L marked to the latest closes at event e"""
+        if not self._n_open:
+            return self.capital
+
+        slots = np.flatnonzero(self._active)
+        marks = self._flat_close[self._last_bar[e, self._pos_symbol[slots]]]
+        position_value = self._size[slots] * self._entry_price[slots]
+        current_value = self._size[slots] * marks
+        unrealized = (current_value - position_value) * self._side[slots] * self._leverage[slots]
+        return float(self.capital + unrealized.sum())
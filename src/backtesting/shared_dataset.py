@@ -0,0 +1,286 @@
+"""
+Shared Dataset
+
+Read-only OHLCV + indicator matrix shared across processes without copying.
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Optional, Tuple, Union
+import pandas as pd
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SharedDatasetHandle:
+    """
+    Picklable reference to a SharedDataset
+
+    Attributes:
+        columns: Column names, in storage order
+        num_rows: Number of rows in the backing block
+        shm_name: Shared memory block name (None when file backed)
+        path: Memory-mapped file path (None when shared memory backed)
+        tz: Timezone of the datetime index
+        index_name: Name of the datetime index
+        start: First row of the view
+        stop: One past the last row of the view
+    """
+    columns: Tuple[str, ...]
+    num_rows: int
+    shm_name: Optional[str] = None
+    path: Optional[str] = None
+    tz: Optional[str] = None
+    index_name: Optional[str] = None
+    start: int = 0
+    stop: Optional[int] = None
+
+
+class SharedDataset:
+    """
+    OHLCV and indicator columns materialized once in a shared block
+
+    The block holds the int64 (ns) timestamps followed by one contiguous
+    float64 array per column. Any process can attach through the handle and
+    get read-only DataFrame views over it, so optimizer workers, CV folds and
+    walk-forward windows all read the same pages instead of each holding a
+    copy of the data.
+
+    Usage:
+        with SharedDataset.from_dataframe(df) as dataset:
+            frame = dataset.to_frame()           # zero-copy DataFrame
+            fold = dataset.slice(0, 1000)        # zero-copy window
+            handle = dataset.handle              # ship to other processes
+    """
+
+    def __init__(
+        self,
+        handle: SharedDatasetHandle,
+        buffer: Any,
+        shm: Optional[SharedMemory] = None,
+        owner: bool = False
+    ):
+        """
+        Initialize from an existing block (use from_dataframe or attach)
+
+        Args:
+            handle: Handle describing the block and the view
+            buffer: Buffer over the whole block (shared memory or np.memmap)
+            shm: Shared memory object keeping the mapping alive
+            owner: Whether this instance unlinks the block on close
+        """
+        self.handle = handle
+        self._buffer = buffer
+        self._shm = shm
+        self._owner = owner
+
+        num_rows = handle.num_rows
+        num_columns = len(handle.columns)
+
+        index = np.ndarray((num_rows,), dtype=np.int64, buffer=buffer)
+        matrix = np.ndarray(
+            (num_columns, num_rows), dtype=np.float64, buffer=buffer, offset=num_rows * 8
+        )
+        index.flags.writeable = False
+        matrix.flags.writeable = False
+
+        stop = num_rows if handle.stop is None else handle.stop
+        self._index = index[handle.start:stop]
+        self._matrix = matrix[:, handle.start:stop]
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        data: pd.DataFrame,
+        path: Optional[str] = None
+    ) -> 'SharedDataset':
+        """
+        Materialize a DataFrame into a new shared block
+
+        Args:
+            data: OHLCV data with indicators (numeric columns, datetime index)
+            path: Back the block with this memory-mapped file instead of shared memory
+
+        Returns:
+            SharedDataset owning the new block
+        """
+        if not isinstance(data.index, pd.DatetimeIndex):
+            raise ValueError("SharedDataset requires a DatetimeIndex")
+
+        num_rows = len(data)
+        columns = tuple(str(col) for col in data.columns)
+        nbytes = max(8 * num_rows * (len(columns) + 1), 1)
+
+        index = data.index
+        tz = str(index.tz) if index.tz is not None else None
+        if tz is not None:
+            index = index.tz_convert('UTC').tz_localize(None)
+
+        if path:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            buffer = np.memmap(path, dtype=np.uint8, mode='w+', shape=(nbytes,))
+            shm = None
+        else:
+            shm = SharedMemory(create=True, size=nbytes)
+            buffer = shm.buf
+
+        handle = SharedDatasetHandle(
+            columns=columns,
+            num_rows=num_rows,
+            shm_name=shm.name if shm else None,
+            path=path,
+            tz=tz,
+            index_name=data.index.name
+        )
+
+        target_index = np.ndarray((num_rows,), dtype=np.int64, buffer=buffer)
+        target_matrix = np.ndarray(
+            (len(columns), num_rows), dtype=np.float64, buffer=buffer, offset=num_rows * 8
+        )
+        target_index[:] = index.to_numpy(dtype='datetime64[ns]').view(np.int64)
+        for j, col in enumerate(data.columns):
+            target_matrix[j] = data[col].to_numpy(dtype=np.float64)
+
+        if path:
+            buffer.flush()
+            buffer = np.memmap(path, dtype=np.uint8, mode='r', shape=(nbytes,))
+
+        logger.info(
+            f"SharedDataset created: {num_rows} rows x {len(columns)} columns "
+            f"({nbytes / 1e6:.1f} MB, {'file ' + path if path else 'shared memory'})"
+        )
+
+        return cls(handle, buffer, shm=shm, owner=not path)
+
+    @classmethod
+    def attach(cls, handle: SharedDatasetHandle) -> 'SharedDataset':
+        """
+        Attach to a block created by another SharedDataset (possibly in another process)
+
+        Args:
+            handle: Handle of the dataset to attach to
+
+        Returns:
+            Non-owning SharedDataset over the same memory
+        """
+        if handle.path:
+            buffer = np.memmap(handle.path, dtype=np.uint8, mode='r')
+            return cls(handle, buffer)
+
+        shm = SharedMemory(name=handle.shm_name)
+        return cls(handle, shm.buf, shm=shm)
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        """Column names"""
+        return self.handle.columns
+
+    @property
+    def index(self) -> pd.DatetimeIndex:
+        """Datetime index of the view"""
+        index = pd.DatetimeIndex(self._index.view('datetime64[ns]'), name=self.handle.index_name)
+        if self.handle.tz is not None:
+            index = index.tz_localize('UTC').tz_convert(self.handle.tz)
+        return index
+
+    def __len__(self) -> int:
+        return self._index.shape[0]
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Get one column as a contiguous read-only array
+
+        Args:
+            name: Column name
+
+        Returns:
+            Zero-copy float64 array
+        """
+        return self._matrix[self.handle.columns.index(name)]
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Get the view as a DataFrame backed by the shared block
+
+        Returns:
+            Read-only, zero-copy DataFrame
+        """
+        return pd.DataFrame(
+            self._matrix.T,
+            index=self.index,
+            columns=list(self.handle.columns),
+            copy=False
+        )
+
+    def slice(self, start: int, stop: int) -> 'SharedDataset':
+        """
+        Get a row range as a SharedDataset over the same block
+
+        Positions follow iloc semantics relative to this view, so CV folds and
+        walk-forward windows can be handed to worker processes by handle.
+
+        Args:
+            start: First row (inclusive)
+            stop: Last row (exclusive)
+
+        Returns:
+            Non-owning SharedDataset
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        stop = max(start, stop)
+        base = self.handle.start
+        handle = SharedDatasetHandle(
+            columns=self.handle.columns,
+            num_rows=self.handle.num_rows,
+            shm_name=self.handle.shm_name,
+            path=self.handle.path,
+            tz=self.handle.tz,
+            index_name=self.handle.index_name,
+            start=base + start,
+            stop=base + stop
+        )
+        return SharedDataset(handle, self._buffer, shm=self._shm)
+
+    def close(self):
+        """Release this process's mapping (and the block itself if owned)"""
+        self._index = None
+        self._matrix = None
+        self._buffer = None
+
+        if self._shm is not None:
+            try:
+                self._shm.close()
+            except BufferError:
+                logger.debug("SharedDataset views still alive, leaving mapping open")
+            if self._owner:
+                self._shm.unlink()
+                self._owner = False
+            self._shm = None
+
+    def __enter__(self) -> 'SharedDataset':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"SharedDataset(rows={len(self) if self._index is not None else 0}, columns={len(self.columns)})"
+
+
+def as_frame(data: Union[pd.DataFrame, SharedDataset]) -> pd.DataFrame:
+    """
+    Accept either a DataFrame or a SharedDataset where a DataFrame is needed
+
+    Args:
+        data: DataFrame or SharedDataset
+
+    Returns:
+        DataFrame (zero-copy view for SharedDataset)
+    """
+    if isinstance(data, SharedDataset):
+        return data.to_frame()
+    return data
@@ -0,0 +1,301 @@
+"""
+Timeframe Alignment
+
+Maps every bar of a base timeframe to the last *closed* bar of each higher
+timeframe, so a backtest can read 15m/1h/4h indicators while stepping through
+5m bars without seeing a higher-timeframe candle before it has closed.
+
+The alignment is one searchsorted per timeframe over bar close times; after
+that every lookup is an array index.
+"""
+
+import logging
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .backtest_engine import BarView
+from .shared_dataset import SharedDataset, as_frame
+
+logger = logging.getLogger(__name__)
+
+TIME_SERIES_COLUMNS = [
+    'open', 'high', 'low', 'close', 'volume',
+    'ema_12', 'ema_26', 'ema_20', 'ema_50',
+    'macd', 'macd_signal', 'macd_hist',
+    'rsi', 'rsi_7', 'rsi_14',
+    'atr', 'adx',
+    'bb_upper', 'bb_middle', 'bb_lower',
+    'volume_avg', 'obv'
+]
+
+
+def bar_duration(data: pd.DataFrame, timeframe: Optional[str] = None) -> pd.Timedelta:
+    """
+    Bar length of a series, from its timeframe or its index spacing
+
+    Args:
+        data: Series indexed by bar open time
+        timeframe: Timeframe string such as '5m' or '4h' (optional)
+
+    Returns:
+        Bar length
+    """
+    if timeframe is not None:
+        try:
+            return pd.Timedelta(timeframe)
+        except ValueError:
+            pass
+    if len(data.index) < 2:
+        raise ValueError("Cannot infer the timeframe of a series with fewer than 2 bars")
+    return pd.Timedelta(np.median(np.diff(data.index.asi8)), unit='ns')
+
+
+class AlignedBars(Mapping):
+    """
+    Higher-timeframe bars visible at one base bar
+
+    Maps timeframe to a BarView of its last closed bar, or None when no bar
+    of that timeframe has closed yet. Views are built on access.
+    """
+
+    __slots__ = ('_alignment', '_index')
+
+    def __init__(self, alignment: 'TimeframeAlignment', index: int):
+        self._alignment = alignment
+        self._index = index
+
+    def __getitem__(self, timeframe: str) -> Optional[BarView]:
+        return self._alignment.bar(timeframe, self._index)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._alignment.timeframes)
+
+    def __len__(self) -> int:
+        return len(self._alignment.timeframes)
+
+    def __repr__(self) -> str:
+        return f"AlignedBars({self._alignment.base_timeframe}[{self._index}] -> {list(self)})"
+
+
+class TimeframeAlignment:
+    """
+    Precomputed base-bar -> closed higher-timeframe bar index
+
+    A base bar is acted on at its close, so bar i may use a higher bar j only
+    if j's close time is at or before i's close time. positions(tf)[i] holds
+    that j (or -1).
+
+    Usage:
+        alignment = TimeframeAlignment(df_5m, {'1h': df_1h, '4h': df_4h}, base_timeframe='5m')
+        rsi_1h = alignment.value('1h', 'rsi', i)
+        bar_4h = alignment.bar('4h', i)                      # BarView or None
+        engine.run_backtest(strategy, df_5m, higher_timeframes=alignment)
+    """
+
+    def __init__(
+        self,
+        base: Union[pd.DataFrame, SharedDataset],
+        frames: Dict[str, Union[pd.DataFrame, SharedDataset]],
+        base_timeframe: Optional[str] = None
+    ):
+        """
+        Build the alignment
+
+        Args:
+            base: Base timeframe data the backtest steps through
+            frames: Higher timeframe data keyed by timeframe ('15m', '1h', ...),
+                each indexed by bar open time
+            base_timeframe: Base bar length (default: inferred from the index)
+        """
+        base = as_frame(base)
+        base_duration = bar_duration(base, base_timeframe)
+
+        self.base_timeframe = base_timeframe or str(base_duration)
+        self.base_index = base.index
+        self.timeframes: List[str] = list(frames)
+
+        base_close = (base.index + base_duration).asi8
+
+        self._positions: Dict[str, np.ndarray] = {}
+        self._columns: Dict[str, Dict[str, np.ndarray]] = {}
+        self._open_times: Dict[str, pd.DatetimeIndex] = {}
+
+        for timeframe, frame in frames.items():
+            frame = as_frame(frame)
+            duration = bar_duration(frame, timeframe)
+            if duration < base_duration:
+                raise ValueError(
+                    f"Timeframe {timeframe} is shorter than the base timeframe {self.base_timeframe}"
+                )
+
+            close = (frame.index + duration).asi8
+            if len(close) > 1 and np.any(np.diff(close) <= 0):
+                raise ValueError(f"Timeframe {timeframe} index must be strictly increasing")
+
+            self._positions[timeframe] = np.searchsorted(close, base_close, side='right') - 1
+            self._columns[timeframe] = {
+                col: np.ascontiguousarray(frame[col].to_numpy())
+                for col in frame.columns
+            }
+            self._open_times[timeframe] = frame.index
+
+        logger.debug(
+            f"Aligned {len(base)} {self.base_timeframe} bars to {self.timeframes}"
+        )
+
+    def __len__(self) -> int:
+        return len(self.base_index)
+
+    def positions(self, timeframe: str) -> np.ndarray:
+        """
+        Last closed bar of a timeframe for every base bar
+
+        Args:
+            timeframe: Higher timeframe
+
+        Returns:
+            int64 array of bar positions (-1 before the first close)
+        """
+        return self._positions[timeframe]
+
+    def position(self, timeframe: str, i: int) -> int:
+        """Last closed bar of a timeframe at base bar i (-1 if none)"""
+        return int(self._positions[timeframe][i])
+
+    def value(self, timeframe: str, column: str, i: int) -> float:
+        """
+        Column value of the last closed higher bar at base bar i
+
+        Args:
+            timeframe: Higher timeframe
+            column: Column name
+            i: Base bar
+
+        Returns:
+            Value, or NaN when no bar has closed yet
+        """
+        j = self._positions[timeframe][i]
+        if j < 0:
+            return np.nan
+        return self._columns[timeframe][column][j]
+
+    def bar(self, timeframe: str, i: int) -> Optional[BarView]:
+        """Last closed higher bar at base bar i as a BarView (None if none)"""
+        j = self._positions[timeframe][i]
+        if j < 0:
+            return None
+        return BarView(self._columns[timeframe], int(j))
+
+    def bars(self, i: int) -> AlignedBars:
+        """Every timeframe's last closed bar at base bar i"""
+        return AlignedBars(self, i)
+
+    def bar_time(self, timeframe: str, i: int) -> Optional[pd.Timestamp]:
+        """Open time of the last closed higher bar at base bar i"""
+        j = self._positions[timeframe][i]
+        if j < 0:
+            return None
+        return self._open_times[timeframe][j]
+
+    def window(
+        self,
+        timeframe: str,
+        i: int,
+        lookback: int,
+        columns: Optional[Sequence[str]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Closed higher bars up to base bar i
+
+        Args:
+            timeframe: Higher timeframe
+            i: Base bar
+            lookback: Maximum number of bars
+            columns: Columns to include (default: all)
+
+        Returns:
+            Dict of read-only array views, oldest first (empty arrays before
+            the first close)
+        """
+        stop = int(self._positions[timeframe][i]) + 1
+        start = max(0, stop - lookback)
+        data = self._columns[timeframe]
+
+        result = {}
+        for col in (columns if columns is not None else data):
+            if col in data:
+                view = data[col][start:stop]
+                view.flags.writeable = False
+                result[col] = view
+        return result
+
+    def time_series_arrays(
+        self,
+        i: int,
+        timeframes: Optional[List[str]] = None,
+        lookback_bars: int = 50
+    ) -> Dict[str, Dict[str, List[float]]]:
+        """
+        Compact time-series arrays as PriceFeed.get_time_series_arrays returns them
+
+        Lets prompt-building strategies (e.g. SingleAgentStrategy) be replayed
+        on historical data with the same multi-timeframe input.
+
+        Args:
+            i: Base bar
+            timeframes: Timeframes to include (default: all)
+            lookback_bars: Number of recent closed bars per timeframe
+
+        Returns:
+            Dict mapping timeframe to dict of indicator lists
+        """
+        result = {}
+        for timeframe in (timeframes or self.timeframes):
+            window = self.window(timeframe, i, lookback_bars, TIME_SERIES_COLUMNS)
+            if not len(window.get('close', ())):
+                continue
+            result[timeframe] = {
+                col: np.where(np.isnan(values), 0, values).tolist()
+                for col, values in window.items()
+            }
+        return result
+
+    def aligned_frame(
+        self,
+        timeframe: str,
+        columns: Optional[Sequence[str]] = None,
+        suffix: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Higher-timeframe columns reindexed onto the base bars
+
+        Meant for vectorized strategies: join it onto the base data before
+        the backtest and every row only sees closed higher bars.
+
+        Args:
+            timeframe: Higher timeframe
+            columns: Columns to include (default: all)
+            suffix: Column name suffix (default: '_<timeframe>')
+
+        Returns:
+            DataFrame on the base index, NaN before the first close
+        """
+        suffix = f"_{timeframe}" if suffix is None else suffix
+        positions = self._positions[timeframe]
+        missing = positions < 0
+        take = np.where(missing, 0, positions)
+        data = self._columns[timeframe]
+
+        result = {}
+        for col in (columns if columns is not None else data):
+            if missing.all():
+                values = np.full(len(positions), np.nan)
+            else:
+                values = data[col][take].astype(np.float64)
+                values[missing] = np.nan
+            result[f"{col}{suffix}"] = values
+
+        return pd.DataFrame(result, index=self.base_index)
@@ -1,11 +1,11 @@
-c"""
+"""
 Walk-Forward Optimizer
 
 Rolling window optimization for strategy validation.
 """
 
 import logging
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, Union
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -13,6 +13,7 @@ from datetime import datetime, timedelta
 from .backtest_engine import BacktestEngine
 from .optimizer import ParameterOptimizer
 from .performance import PerformanceMetrics
+from .shared_dataset import SharedDataset
 
 logger = logging.getLogger(__name__)
 
@@ -52,7 +53,7 @@ class WalkForwardOptimizer:
         strategy_class: type,
         base_config: Dict[str, Any],
         param_grid: Dict[str, List[Any]],
-        data: pd.DataFrame,
+        data: Union[pd.DataFrame, SharedDataset],
         train_months: int = 6,
         test_months: int = 1,
         symbol: str = 'BTC/USDT'
@@ -64,7 +65,7 @@ class WalkForwardOptimizer:
             strategy_class: Strategy class to optimize
             base_config: Base configuration dict
             param_grid: Parameter grid for optimization
-            data: Full historical data
+            data: Full historical data (SharedDataset windows are zero-copy slices)
             train_months: Number of months for training window
             test_months: Number of months for test window
             symbol: Trading pair symbol
@@ -140,10 +141,10 @@ class WalkForwardOptimizer:
 
     def _generate_windows(
         self,
-        data: pd.DataFrame,
+        data: Union[pd.DataFrame, SharedDataset],
         train_months: int,
         test_months: int
-    ) -> List[Tuple[pd.DataFrame, pd.DataFrame]]:
+    ) -> List[Tuple[Any, Any]]:
         """Generate rolling windows for walk-forward"""
         windows = []
 
@@ -167,8 +168,12 @@ class WalkForwardOptimizer:
             if test_end > len(data):
                 test_end = len(data)
 
-            train_data = data.iloc[current_start:train_end]
-            test_data = data.iloc[train_end:test_end]
+            if isinstance(data, SharedDataset):
+                train_data = data.slice(current_start, train_end)
+                test_data = data.slice(train_end, test_end)
+            else:
+                train_data = data.iloc[current_start:train_end]
+                test_data = data.iloc[train_end:test_end]
 
             if len(train_data) > 0 and len(test_data) > 0:
                 windows.append((train_data, test_data))
@@ -6,11 +6,17 @@ Handles market data acquisition, storage, and technical indicator calculations.
 
 from .acquisition import MarketDataManager
 from .storage import SQLiteStorage, RedisCache
+from .write_behind import AsyncWriteBehind
 from .indicators import TechnicalIndicators
+from .streaming_indicators import StreamingIndicators
+from .ohlcv_buffer import OHLCVRingBuffer
 
 __all__ = [
     'MarketDataManager',
     'SQLiteStorage',
     'RedisCache',
+    'AsyncWriteBehind',
     'TechnicalIndicators',
+    'StreamingIndicators',
+    'OHLCVRingBuffer',
 ]
@@ -13,6 +13,7 @@ from collections import deque
 import json
 
 from ..utils.logger import get_logger
+from ..utils.rate_limiter import get_rate_limiter, request_weight
 from .storage import SQLiteStorage, RedisCache
 from .indicators import TechnicalIndicators
 
@@ -41,6 +42,8 @@ class MarketDataManager:
         self.exchange_name = exchange_config.get('name', 'binance')
         self.exchange: Optional[ccxt.Exchange] = None
         
+        self.rate_limiter = get_rate_limiter(self.exchange_name)
+        
         self.buffers: Dict[str, deque] = {}
         
         self.latest_prices: Dict[str, float] = {}
@@ -66,7 +69,8 @@ class MarketDataManager:
             config = {
                 'apiKey': api_key,
                 'secret': api_secret,
-                'enableRateLimit': True,
+                # Paced by the shared RateLimiter (see _acquire) only
+                'enableRateLimit': False,
                 'options': {
                     'defaultType': 'future',  # For perpetual futures
                 }
@@ -147,6 +151,8 @@ class MarketDataManager:
             if not self.exchange:
                 await self.initialize()
             
+            await self._acquire('market_data', request_weight(self.exchange_name, 'fetch_ohlcv', limit))
+            
             ohlcv = await self.exchange.fetch_ohlcv(
                 symbol,
                 timeframe=timeframe,
@@ -158,9 +164,31 @@ class MarketDataManager:
             return ohlcv
             
         except Exception as e:
+            self._check_rate_limit_error('market_data', e)
             logger.error(f"Error fetching OHLCV for {symbol}: {e}")
             raise
     
+    async def _acquire(self, endpoint: str, weight: float = 1.0):
+        """
+        Wait for budget on the shared exchange rate limiter.
+        
+        Args:
+            endpoint: Endpoint class ('market_data', 'account' or 'orders')
+            weight: Request weight
+        """
+        await self.rate_limiter.acquire(endpoint, weight)
+    
+    def _check_rate_limit_error(self, endpoint: str, error: Exception):
+        """
+        Back off all callers of an endpoint class after a rate limit rejection.
+        
+        Args:
+            endpoint: Endpoint class
+            error: Exception raised by the exchange
+        """
+        if isinstance(error, (ccxt.RateLimitExceeded, ccxt.DDoSProtection)):
+            self.rate_limiter.penalize(endpoint)
+    
     def _parse_ohlcv(self, ohlcv_data: List[List]) -> List[Dict[str, Any]]:
         """
         Parse OHLCV data from exchange format to dictionary format.
@@ -215,8 +243,6 @@ class MarketDataManager:
                 
                 if last_timestamp >= int(datetime.now().timestamp() * 1000):
                     break
-                
-                await asyncio.sleep(0.5)
             
             parsed_data = self._parse_ohlcv(all_data)
             self.storage.save_market_data(symbol, timeframe, parsed_data)
@@ -333,12 +359,14 @@ class MarketDataManager:
             if not self.exchange:
                 await self.initialize()
             
+            await self._acquire('account', request_weight(self.exchange_name, 'fetch_balance'))
             balance = await self.exchange.fetch_balance()
             
             logger.bind(data=True).info("Fetched account balance")
             return balance
             
         except Exception as e:
+            self._check_rate_limit_error('account', e)
             logger.error(f"Error fetching account balance: {e}")
             return {}
     
@@ -354,6 +382,7 @@ class MarketDataManager:
                 await self.initialize()
             
             if hasattr(self.exchange, 'fetch_positions'):
+                await self._acquire('account', request_weight(self.exchange_name, 'fetch_positions'))
                 positions = await self.exchange.fetch_positions()
                 open_positions = [p for p in positions if float(p.get('contracts', 0)) > 0]
                 logger.bind(data=True).info(f"Fetched {len(open_positions)} open positions")
@@ -362,6 +391,7 @@ class MarketDataManager:
             return []
             
         except Exception as e:
+            self._check_rate_limit_error('account', e)
             logger.error(f"Error fetching open positions: {e}")
             return []
     
@@ -380,12 +410,14 @@ class MarketDataManager:
             if not self.exchange:
                 await self.initialize()
             
+            await self._acquire('market_data', request_weight(self.exchange_name, 'fetch_order_book', limit))
             order_book = await self.exchange.fetch_order_book(symbol, limit=limit)
             
             logger.bind(data=True).debug(f"Fetched order book for {symbol}")
             return order_book
             
         except Exception as e:
+            self._check_rate_limit_error('market_data', e)
             logger.error(f"Error fetching order book: {e}")
             return {'bids': [], 'asks': []}
     
@@ -403,12 +435,14 @@ class MarketDataManager:
             if not self.exchange:
                 await self.initialize()
             
+            await self._acquire('market_data', request_weight(self.exchange_name, 'fetch_ticker'))
             ticker = await self.exchange.fetch_ticker(symbol)
             
             logger.bind(data=True).debug(f"Fetched ticker for {symbol}")
             return ticker
             
         except Exception as e:
+            self._check_rate_limit_error('market_data', e)
             logger.error(f"Error fetching ticker: {e}")
             return {}
     
@@ -428,7 +462,6 @@ class MarketDataManager:
             for symbol in symbols:
                 for timeframe in timeframes:
                     await self.fetch_initial_data(symbol, timeframe)
-                    await asyncio.sleep(1)  # Rate limiting
             
             while self.running:
                 for symbol in symbols:
@@ -437,8 +470,6 @@ class MarketDataManager:
                             await self.update_data(symbol, timeframe)
                         except Exception as e:
                             logger.error(f"Error updating {symbol} {timeframe}: {e}")
-                        
-                        await asyncio.sleep(0.5)  # Rate limiting between updates
                 
                 await asyncio.sleep(update_interval)
                 
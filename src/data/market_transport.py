@@ -0,0 +1,381 @@
+"""
+Market Data Transports
+
+Pluggable sources of live prices and candles for PriceFeed:
+- PollingTransport: REST ticker polling plus OHLCV refetch at candle close
+- WebSocketTransport: exchange ticker/trade/kline streams, falling back to
+  polling while the stream is disconnected
+"""
+
+import asyncio
+import json
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Type
+import websockets
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MarketEvent:
+    """Normalized message from a market data stream"""
+    kind: str
+    symbol: str
+    data: Dict[str, Any]
+    timeframe: Optional[str] = None
+
+
+def _float(value: Any) -> Optional[float]:
+    """Parse an optional numeric field"""
+    return float(value) if value not in (None, '') else None
+
+
+class StreamCodec(ABC):
+    """
+    Exchange-specific websocket subscriptions and message parsing
+
+    Subclasses turn raw stream messages into MarketEvents:
+    - ticker: {'last', 'bid', 'ask', 'quote_volume'} (None when not sent)
+    - trade: {'price', 'timestamp'}
+    - kline: {'candle': [timestamp_ms, open, high, low, close, volume], 'closed'}
+    """
+
+    urls: Dict[str, str] = {}
+    heartbeat: Optional[str] = None
+
+    def __init__(self, symbols: List[str], timeframes: List[str], testnet: bool = True):
+        """
+        Initialize codec
+
+        Args:
+            symbols: Symbols to subscribe to (e.g., ['BTC/USDT'])
+            timeframes: Kline timeframes to subscribe to
+            testnet: Use the testnet stream endpoint
+        """
+        self.symbols = symbols
+        self.timeframes = timeframes
+        self.url = self.urls['testnet' if testnet else 'live']
+        self.symbols_by_id = {self.market_id(symbol): symbol for symbol in symbols}
+
+    def market_id(self, symbol: str) -> str:
+        """Exchange market id for a unified symbol"""
+        return symbol.split(':')[0].replace('/', '')
+
+    @abstractmethod
+    def subscribe_messages(self) -> List[str]:
+        """Messages to send after connecting"""
+        pass
+
+    @abstractmethod
+    def parse(self, raw: str) -> List[MarketEvent]:
+        """Parse one stream message (subscription acks and unknown messages give no events)"""
+        pass
+
+
+class BinanceStreamCodec(StreamCodec):
+    """Binance USDⓈ-M futures streams (24hrTicker, aggTrade, kline)"""
+
+    urls = {
+        'live': 'wss://fstream.binance.com/ws',
+        'testnet': 'wss://stream.binancefuture.com/ws'
+    }
+
+    def market_id(self, symbol: str) -> str:
+        return super().market_id(symbol).lower()
+
+    def subscribe_messages(self) -> List[str]:
+        params = []
+        for market_id in self.symbols_by_id:
+            params.append(f"{market_id}@ticker")
+            params.append(f"{market_id}@aggTrade")
+            params.extend(f"{market_id}@kline_{tf}" for tf in self.timeframes)
+
+        return [json.dumps({'method': 'SUBSCRIBE', 'params': params, 'id': 1})]
+
+    def parse(self, raw: str) -> List[MarketEvent]:
+        message = json.loads(raw)
+        message = message.get('data', message)
+
+        symbol = self.symbols_by_id.get(str(message.get('s', '')).lower())
+        if symbol is None:
+            return []
+
+        event = message.get('e')
+        if event == '24hrTicker':
+            return [MarketEvent('ticker', symbol, {
+                'last': _float(message.get('c')),
+                'bid': _float(message.get('b')),
+                'ask': _float(message.get('a')),
+                'quote_volume': _float(message.get('q'))
+            })]
+
+        if event in ('aggTrade', 'trade'):
+            return [MarketEvent('trade', symbol, {
+                'price': float(message['p']),
+                'timestamp': message.get('T')
+            })]
+
+        if event == 'kline':
+            kline = message['k']
+            return [MarketEvent('kline', symbol, {
+                'candle': [
+                    int(kline['t']), float(kline['o']), float(kline['h']),
+                    float(kline['l']), float(kline['c']), float(kline['v'])
+                ],
+                'closed': bool(kline['x'])
+            }, timeframe=kline['i'])]
+
+        return []
+
+
+class BybitStreamCodec(StreamCodec):
+    """Bybit v5 linear public streams (tickers, publicTrade, kline)"""
+
+    urls = {
+        'live': 'wss://stream.bybit.com/v5/public/linear',
+        'testnet': 'wss://stream-testnet.bybit.com/v5/public/linear'
+    }
+    heartbeat = json.dumps({'op': 'ping'})
+
+    def __init__(self, symbols: List[str], timeframes: List[str], testnet: bool = True):
+        super().__init__(symbols, timeframes, testnet)
+        self.intervals = {self._interval(tf): tf for tf in timeframes}
+
+    @staticmethod
+    def _interval(timeframe: str) -> str:
+        """Bybit kline interval for a timeframe ('1m' -> '1', '1h' -> '60', '1d' -> 'D')"""
+        value, unit = int(timeframe[:-1]), timeframe[-1]
+        if unit == 'd':
+            return 'D'
+        if unit == 'w':
+            return 'W'
+        return str(value * 60 if unit == 'h' else value)
+
+    def subscribe_messages(self) -> List[str]:
+        args = []
+        for market_id in self.symbols_by_id:
+            args.append(f"tickers.{market_id}")
+            args.append(f"publicTrade.{market_id}")
+            args.extend(f"kline.{interval}.{market_id}" for interval in self.intervals)
+
+        return [json.dumps({'op': 'subscribe', 'args': args})]
+
+    def parse(self, raw: str) -> List[MarketEvent]:
+        message = json.loads(raw)
+        topic = message.get('topic')
+        if not topic:
+            return []
+
+        parts = topic.split('.')
+        symbol = self.symbols_by_id.get(parts[-1])
+        if symbol is None:
+            return []
+
+        data = message.get('data')
+        if parts[0] == 'tickers':
+            return [MarketEvent('ticker', symbol, {
+                'last': _float(data.get('lastPrice')),
+                'bid': _float(data.get('bid1Price')),
+                'ask': _float(data.get('ask1Price')),
+                'quote_volume': _float(data.get('turnover24h'))
+            })]
+
+        if parts[0] == 'publicTrade' and data:
+            trade = data[-1]
+            return [MarketEvent('trade', symbol, {
+                'price': float(trade['p']),
+                'timestamp': trade.get('T')
+            })]
+
+        if parts[0] == 'kline' and parts[1] in self.intervals:
+            return [
+                MarketEvent('kline', symbol, {
+                    'candle': [
+                        int(kline['start']), float(kline['open']), float(kline['high']),
+                        float(kline['low']), float(kline['close']), float(kline['volume'])
+                    ],
+                    'closed': bool(kline['confirm'])
+                }, timeframe=self.intervals[parts[1]])
+                for kline in data
+            ]
+
+        return []
+
+
+STREAM_CODECS: Dict[str, Type[StreamCodec]] = {
+    'binance': BinanceStreamCodec,
+    'bybit': BybitStreamCodec,
+}
+
+
+class PollingTransport:
+    """
+    REST polling transport
+
+    Runs the feed's ticker poll loop and one candle update loop per
+    symbol/timeframe pair.
+    """
+
+    name = 'rest'
+
+    def __init__(self, feed: Any):
+        """
+        Initialize polling transport
+
+        Args:
+            feed: PriceFeed to update
+        """
+        self.feed = feed
+        self.tasks: List[asyncio.Task] = []
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self.tasks)
+
+    async def start(self) -> None:
+        """Start the polling loops (no-op if already running)"""
+        if self.tasks:
+            return
+
+        self.tasks.append(asyncio.create_task(self.feed._ticker_poll_loop()))
+        for symbol in self.feed.symbols:
+            for timeframe in self.feed.timeframes:
+                self.tasks.append(asyncio.create_task(
+                    self.feed._candle_update_loop(symbol, timeframe)
+                ))
+
+    async def stop(self) -> None:
+        """Cancel the polling loops"""
+        tasks, self.tasks = self.tasks, []
+        for task in tasks:
+            task.cancel()
+        # gather (not a try/except around each await) so that cancelling the
+        # caller still propagates instead of being swallowed here
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class WebSocketTransport:
+    """
+    Websocket streaming transport with REST fallback
+
+    Streams ticker, trade and kline channels into the feed as they arrive.
+    Whenever the connection drops (or cannot be opened) the feed degrades to
+    PollingTransport until the stream reconnects, with exponential backoff.
+    """
+
+    name = 'websocket'
+
+    def __init__(
+        self,
+        feed: Any,
+        codec: StreamCodec,
+        url: Optional[str] = None,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 60.0,
+        heartbeat_interval: float = 20.0
+    ):
+        """
+        Initialize websocket transport
+
+        Args:
+            feed: PriceFeed to update
+            codec: Exchange stream codec
+            url: Stream URL (defaults to the codec's endpoint)
+            reconnect_delay: Initial delay between reconnect attempts (seconds)
+            max_reconnect_delay: Maximum delay between reconnect attempts (seconds)
+            heartbeat_interval: Seconds between application-level pings (if the codec needs them)
+        """
+        self.feed = feed
+        self.codec = codec
+        self.url = url or codec.url
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.heartbeat_interval = heartbeat_interval
+
+        self.fallback = PollingTransport(feed)
+        self.connected = False
+        self.messages_received = 0
+        self.disconnects = 0
+
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None
+
+    async def start(self) -> None:
+        """Start streaming in the background"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Close the stream and any fallback polling"""
+        if self._task is not None:
+            task, self._task = self._task, None
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        self.connected = False
+        await self.fallback.stop()
+
+    async def _run(self) -> None:
+        """Connect, stream and reconnect until cancelled"""
+        delay = self.reconnect_delay
+
+        while True:
+            try:
+                async with websockets.connect(self.url) as connection:
+                    for message in self.codec.subscribe_messages():
+                        await connection.send(message)
+
+                    self.connected = True
+                    delay = self.reconnect_delay
+                    await self.fallback.stop()
+                    logger.info(f"✅ Market data stream connected: {self.url}")
+
+                    await self._consume(connection)
+
+                logger.warning("Market data stream closed by server")
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Market data stream disconnected: {e}")
+
+            self.connected = False
+            self.disconnects += 1
+            if not self.fallback.is_running:
+                logger.warning("Falling back to REST polling until the stream reconnects")
+                await self.fallback.start()
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def _consume(self, connection: Any) -> None:
+        """Dispatch stream messages to the feed until the connection closes"""
+        heartbeat = None
+        if self.codec.heartbeat:
+            heartbeat = asyncio.create_task(self._heartbeat(connection))
+
+        try:
+            async for raw in connection:
+                self.messages_received += 1
+                try:
+                    events = self.codec.parse(raw)
+                except (ValueError, KeyError, TypeError) as e:
+                    logger.debug(f"Skipping unparseable stream message: {e}")
+                    continue
+
+                for event in events:
+                    await self.feed.handle_market_event(event)
+        finally:
+            if heartbeat:
+                heartbeat.cancel()
+
+    async def _heartbeat(self, connection: Any) -> None:
+        """Send the codec's keep-alive message periodically"""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            await connection.send(self.codec.heartbeat)
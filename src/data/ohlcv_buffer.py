@@ -0,0 +1,368 @@
+"""
+OHLCV Ring Buffer
+
+Fixed-capacity columnar storage for a rolling window of candles and indicators.
+"""
+
+import logging
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple, Union
+import pandas as pd
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class OHLCVRingBuffer:
+    """
+    Preallocated ring buffer holding one float64 array per column
+
+    Rows are keyed by candle timestamp. Every row is written twice (slot i and
+    slot i + capacity), so the most recent n rows are always one contiguous
+    slice and can be handed out as zero-copy arrays or DataFrames without
+    reassembling the wrap-around. Appending a candle or replacing the one that
+    is still forming costs O(columns) regardless of the window length, and the
+    memory footprint is fixed at construction (see estimate_nbytes).
+
+    Views returned by column() and view() are read-only and share memory with
+    the buffer: they stay valid until the next write to the buffer. Copy them
+    to keep or modify the data.
+
+    Usage:
+        buffer = OHLCVRingBuffer.from_frame(df, capacity=500)
+        buffer.upsert(timestamp, {'open': ..., 'close': ..., 'rsi': ...})
+        closes = buffer.column('close', 50)      # last 50 closes, zero-copy
+        frame = buffer.view(200)                 # last 200 rows, zero-copy
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        columns: Sequence[str],
+        int_columns: Sequence[str] = (),
+        datetime_index: bool = True,
+        tz: Optional[str] = None,
+        index_name: Optional[str] = None
+    ):
+        """
+        Allocate an empty buffer
+
+        Args:
+            capacity: Maximum number of rows kept
+            columns: Column names, in view order
+            int_columns: Columns restored as int64 in views (stored as float64)
+            datetime_index: Rows are keyed by timestamps (else integer labels)
+            tz: Timezone of the timestamps
+            index_name: Name of the index in views
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+
+        self.capacity = int(capacity)
+        self.columns: Tuple[str, ...] = tuple(str(col) for col in columns)
+        self.int_columns = tuple(col for col in self.columns if col in set(int_columns))
+        self.datetime_index = datetime_index
+        self.tz = tz
+        self.index_name = index_name
+
+        self._float_columns = [col for col in self.columns if col not in self.int_columns]
+        self._storage_order = self._float_columns + list(self.int_columns)
+        self._positions = {col: j for j, col in enumerate(self._storage_order)}
+        self._permutation = [self.columns.index(col) for col in self._storage_order]
+        self._values = np.full((len(self.columns), 2 * self.capacity), np.nan)
+        self._timestamps = np.zeros(2 * self.capacity, dtype=np.int64)
+        self._end = 0
+        self._size = 0
+
+    @classmethod
+    def from_frame(
+        cls,
+        data: pd.DataFrame,
+        capacity: Optional[int] = None,
+        int_columns: Optional[Sequence[str]] = None
+    ) -> 'OHLCVRingBuffer':
+        """
+        Create a buffer holding the last rows of a DataFrame
+
+        Args:
+            data: OHLCV data with indicators (numeric columns)
+            capacity: Maximum number of rows (defaults to len(data))
+            int_columns: Integer columns (defaults to the frame's integer dtypes)
+
+        Returns:
+            OHLCVRingBuffer loaded with the frame
+        """
+        if int_columns is None:
+            int_columns = [
+                col for col in data.columns if pd.api.types.is_integer_dtype(data[col].dtype)
+            ]
+
+        index = data.index
+        datetime_index = isinstance(index, pd.DatetimeIndex)
+        buffer = cls(
+            capacity=capacity or max(len(data), 1),
+            columns=list(data.columns),
+            int_columns=int_columns,
+            datetime_index=datetime_index,
+            tz=str(index.tz) if datetime_index and index.tz is not None else None,
+            index_name=index.name
+        )
+        buffer.load(data)
+        return buffer
+
+    @staticmethod
+    def estimate_nbytes(capacity: int, num_columns: int) -> int:
+        """
+        Memory needed by a buffer (timestamps plus mirrored column storage)
+
+        Args:
+            capacity: Maximum number of rows
+            num_columns: Number of columns
+
+        Returns:
+            Size in bytes
+        """
+        return 2 * capacity * (num_columns + 1) * 8
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by this buffer (fixed for its lifetime)"""
+        return self._values.nbytes + self._timestamps.nbytes
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return (
+            f"OHLCVRingBuffer(rows={self._size}, capacity={self.capacity}, "
+            f"columns={len(self.columns)})"
+        )
+
+    def load(self, data: pd.DataFrame) -> None:
+        """
+        Replace the buffer contents with the last rows of a DataFrame
+
+        Args:
+            data: Frame with the same columns as the buffer
+        """
+        if tuple(str(col) for col in data.columns) != self.columns:
+            raise ValueError("DataFrame columns do not match the buffer columns")
+
+        data = data.iloc[-self.capacity:]
+        num_rows = len(data)
+
+        self._values[:, :num_rows] = data[self._storage_order].to_numpy(dtype=np.float64).T
+        self._values[:, self.capacity:self.capacity + num_rows] = self._values[:, :num_rows]
+        if num_rows > 0:
+            timestamps = np.array([self._key(label) for label in data.index], dtype=np.int64)
+            self._timestamps[:num_rows] = timestamps
+            self._timestamps[self.capacity:self.capacity + num_rows] = timestamps
+
+        self._end = num_rows
+        self._size = num_rows
+
+    def append(self, timestamp: Any, values: Union[Mapping[str, Any], np.ndarray]) -> None:
+        """
+        Append a new candle, evicting the oldest one when full
+
+        Args:
+            timestamp: Candle timestamp
+            values: Column values (mapping, missing columns are NaN, or array in column order)
+        """
+        self._write(self._end % self.capacity, self._key(timestamp), values)
+        self._end += 1
+        self._size = min(self._size + 1, self.capacity)
+
+    def replace_last(self, timestamp: Any, values: Union[Mapping[str, Any], np.ndarray]) -> None:
+        """
+        Overwrite the most recent candle (e.g. the one still forming)
+
+        Args:
+            timestamp: Candle timestamp
+            values: Column values (mapping, missing columns are NaN, or array in column order)
+        """
+        if self._size == 0:
+            raise ValueError("Cannot replace the last row of an empty buffer")
+
+        self._write((self._end - 1) % self.capacity, self._key(timestamp), values)
+
+    def upsert(self, timestamp: Any, values: Union[Mapping[str, Any], np.ndarray]) -> bool:
+        """
+        Append a candle, or replace the last one when the timestamp matches
+
+        Args:
+            timestamp: Candle timestamp
+            values: Column values
+
+        Returns:
+            True if a row was appended, False if the last row was replaced
+        """
+        key = self._key(timestamp)
+        if self._size > 0:
+            last = self._timestamps[(self._end - 1) % self.capacity]
+            if key == last:
+                self.replace_last(timestamp, values)
+                return False
+            if key < last:
+                raise ValueError(f"Timestamp {timestamp} is older than the last row")
+
+        self.append(timestamp, values)
+        return True
+
+    def write_tail(self, name: str, values: np.ndarray) -> None:
+        """
+        Overwrite a column over the most recent rows
+
+        Used for values that depend on later candles or on the window start
+        (e.g. the lagging Ichimoku span, window-anchored cumulative indicators).
+
+        Args:
+            name: Column name
+            values: New values for the last len(values) rows
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) > self._size:
+            raise ValueError(f"Cannot write {len(values)} rows into a buffer of {self._size}")
+
+        slots = (self._end - len(values) + np.arange(len(values))) % self.capacity
+        position = self._positions[name]
+        self._values[position, slots] = values
+        self._values[position, slots + self.capacity] = values
+
+    def timestamp(self, i: int = -1) -> Any:
+        """
+        Get the timestamp (or label) of one row
+
+        Args:
+            i: Row position (negative counts from the most recent)
+
+        Returns:
+            pd.Timestamp, or int label for non-datetime buffers
+        """
+        key = int(self._timestamps[self._slot(i)])
+        if not self.datetime_index:
+            return key
+        timestamp = pd.Timestamp(key)
+        if self.tz is not None:
+            timestamp = timestamp.tz_localize('UTC').tz_convert(self.tz)
+        return timestamp
+
+    def row(self, i: int = -1) -> Dict[str, Any]:
+        """
+        Get one row as a dict
+
+        Args:
+            i: Row position (negative counts from the most recent)
+
+        Returns:
+            Dict of column values
+        """
+        values = self._values[:, self._slot(i)]
+        return {
+            col: int(values[self._positions[col]]) if col in self.int_columns
+            else float(values[self._positions[col]])
+            for col in self.columns
+        }
+
+    def column(self, name: str, n: Optional[int] = None) -> np.ndarray:
+        """
+        Get the most recent values of one column
+
+        Args:
+            name: Column name
+            n: Number of rows (defaults to all)
+
+        Returns:
+            Read-only zero-copy float64 array (int64 copy for integer columns)
+        """
+        start, stop = self._span(n)
+        values = self._values[self._positions[name], start:stop]
+        if name in self.int_columns:
+            return values.astype(np.int64)
+        values.flags.writeable = False
+        return values
+
+    def index(self, n: Optional[int] = None) -> pd.Index:
+        """
+        Get the index of the most recent rows
+
+        Args:
+            n: Number of rows (defaults to all)
+
+        Returns:
+            DatetimeIndex (or integer Index for non-datetime buffers)
+        """
+        start, stop = self._span(n)
+        timestamps = self._timestamps[start:stop].copy()
+        if not self.datetime_index:
+            return pd.Index(timestamps, name=self.index_name)
+
+        index = pd.DatetimeIndex(timestamps.view('datetime64[ns]'), name=self.index_name)
+        if self.tz is not None:
+            index = index.tz_localize('UTC').tz_convert(self.tz)
+        return index
+
+    def view(self, n: Optional[int] = None) -> pd.DataFrame:
+        """
+        Get the most recent rows as a DataFrame backed by the buffer
+
+        Args:
+            n: Number of rows (defaults to all)
+
+        Returns:
+            Read-only DataFrame sharing memory with the buffer
+        """
+        start, stop = self._span(n)
+        values = self._values[:len(self._float_columns), start:stop]
+        values.flags.writeable = False
+
+        frame = pd.DataFrame(
+            values.T,
+            index=self.index(n),
+            columns=self._float_columns,
+            copy=False
+        )
+        for col in self.int_columns:
+            frame.insert(
+                self.columns.index(col),
+                col,
+                self._values[self._positions[col], start:stop].astype(np.int64)
+            )
+        return frame
+
+    def _span(self, n: Optional[int]) -> Tuple[int, int]:
+        """Contiguous slot range holding the most recent n rows"""
+        n = self._size if n is None else max(0, min(int(n), self._size))
+        start = (self._end - n) % self.capacity
+        return start, start + n
+
+    def _slot(self, i: int) -> int:
+        """Slot holding row position i"""
+        if not -self._size <= i < self._size:
+            raise IndexError(f"Row {i} out of range for buffer of {self._size} rows")
+        if i >= 0:
+            i -= self._size
+        return (self._end + i) % self.capacity
+
+    def _key(self, timestamp: Any) -> int:
+        """Integer key of a timestamp or label"""
+        if not self.datetime_index:
+            return int(timestamp)
+        timestamp = pd.Timestamp(timestamp)
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.tz_convert('UTC').tz_localize(None)
+        return timestamp.as_unit('ns').value
+
+    def _write(self, slot: int, key: int, values: Union[Mapping[str, Any], np.ndarray]) -> None:
+        """Write one row into a slot and its mirror"""
+        if isinstance(values, Mapping):
+            row = np.array([values.get(col, np.nan) for col in self._storage_order], dtype=np.float64)
+        else:
+            row = np.asarray(values, dtype=np.float64)
+            if row.shape != (len(self.columns),):
+                raise ValueError(f"Expected {len(self.columns)} values, got {row.shape}")
+            row = row[self._permutation]
+
+        self._values[:, slot] = row
+        self._values[:, slot + self.capacity] = row
+        self._timestamps[slot] = key
+        self._timestamps[slot + self.capacity] = key
@@ -4,7 +4,8 @@ Real-Time Price Feed Service
 Central service for fetching and managing real-time price data for all strategies.
 Uses a hybrid approach for optimal performance:
 - REST API fetch_ohlcv for candle data and indicators
-- Fast background ticker polling (1-3s) for instant prices
+- Fast background ticker polling (1-3s) for instant prices, or websocket
+  ticker/trade/kline streams with automatic fallback to polling
 - In-memory storage with optional Redis mirroring
 
 This replaces simulated prices with actual market data.
@@ -12,21 +13,36 @@ This replaces simulated prices with actual market data.
 
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional, Set, Tuple
+import time
+from typing import Callable, Dict, Any, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 import pandas as pd
 import numpy as np
 from collections import defaultdict
 import ccxt.async_support as ccxt
-import redis.asyncio as aioredis
-import json
 
 from ..data.indicators import TechnicalIndicators
+from .storage import RedisCache
+from ..utils.rate_limiter import RateLimiter, get_rate_limiter, request_weight
+from .ohlcv_buffer import OHLCVRingBuffer
+from .market_transport import MarketEvent, PollingTransport, WebSocketTransport, STREAM_CODECS
+from .streaming_indicators import StreamingIndicators, CHIKOU_LAG, anchored_obv_vwap, find_mismatches
 
 logger = logging.getLogger(__name__)
 
 
+def feed_key(prefix: str, kind: str, *parts: str) -> str:
+    """
+    Redis key or channel of a published feed
+    
+    Channels: '<prefix>:prices' (snapshot batches), '<prefix>:candles' (windows
+    on candle close). Keys: '<prefix>:price:<symbol>', '<prefix>:window:<symbol>:<tf>'
+    (latest state, for consumers that join late).
+    """
+    return ':'.join((prefix, kind) + parts)
+
+
 @dataclass
 class PriceSnapshot:
     """Latest price snapshot for a symbol"""
@@ -46,42 +62,366 @@ class PriceSnapshot:
             'volume_24h': self.volume_24h,
             'timestamp': self.timestamp.isoformat()
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PriceSnapshot':
+        """Rebuild a snapshot from to_dict() output"""
+        return cls(
+            symbol=data['symbol'],
+            price=data['price'],
+            bid=data['bid'],
+            ask=data['ask'],
+            volume_24h=data['volume_24h'],
+            timestamp=datetime.fromisoformat(data['timestamp'])
+        )
 
 
-@dataclass
 class OHLCVWindow:
-    """Rolling OHLCV window for a symbol/timeframe"""
-    symbol: str
-    timeframe: str
-    df: pd.DataFrame
-    indicators: Dict[str, Any] = field(default_factory=dict)
-    last_update: datetime = field(default_factory=datetime.now)
-    last_candle_close: Optional[datetime] = None
+    """
+    Rolling OHLCV window for a symbol/timeframe
+    
+    Candles and indicators live in a fixed-capacity OHLCVRingBuffer; `df` is a
+    zero-copy, read-only view of it that is valid until the window's next update.
+    """
+    
+    def __init__(
+        self,
+        symbol: str,
+        timeframe: str,
+        df: Optional[pd.DataFrame] = None,
+        indicators: Optional[Dict[str, Any]] = None,
+        last_update: Optional[datetime] = None,
+        last_candle_close: Optional[datetime] = None,
+        buffer: Optional[OHLCVRingBuffer] = None
+    ):
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.buffer = buffer if buffer is not None or df is None else OHLCVRingBuffer.from_frame(df)
+        self.indicators = indicators if indicators is not None else {}
+        self.last_update = last_update or datetime.now()
+        self.last_candle_close = last_candle_close
+    
+    @property
+    def df(self) -> Optional[pd.DataFrame]:
+        """Whole window as a read-only DataFrame backed by the ring buffer"""
+        if self.buffer is None:
+            return None
+        return self.buffer.view()
     
     def get_latest_candle(self) -> Optional[Dict[str, Any]]:
         """Get the latest closed candle"""
-        if self.df is None or len(self.df) == 0:
+        if self.buffer is None or len(self.buffer) == 0:
             return None
         
-        latest = self.df.iloc[-1]
+        latest = self.buffer.row(-1)
         return {
-            'timestamp': latest.name,
+            'timestamp': self.buffer.timestamp(-1),
             'open': float(latest['open']),
             'high': float(latest['high']),
             'low': float(latest['low']),
             'close': float(latest['close']),
             'volume': float(latest['volume'])
         }
+    
+    def to_payload(self) -> Dict[str, Any]:
+        """Serializable copy of the window (all columns as one float64 matrix)"""
+        buffer = self.buffer
+        frame = buffer.view()
+        return {
+            'symbol': self.symbol,
+            'timeframe': self.timeframe,
+            'capacity': buffer.capacity,
+            'columns': list(buffer.columns),
+            'int_columns': list(buffer.int_columns),
+            'index': frame.index.asi8,
+            'tz': buffer.tz,
+            'index_name': buffer.index_name,
+            'values': frame.to_numpy(dtype=np.float64),
+            'indicators': self.indicators,
+            'last_update': self.last_update,
+            'last_candle_close': self.last_candle_close
+        }
+    
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> 'OHLCVWindow':
+        """Rebuild a window from to_payload() output (after a msgpack round trip)"""
+        index = pd.DatetimeIndex(
+            np.asarray(payload['index'], dtype=np.int64).view('datetime64[ns]'),
+            name=payload['index_name']
+        )
+        if payload['tz']:
+            index = index.tz_localize('UTC').tz_convert(payload['tz'])
+        
+        frame = pd.DataFrame(payload['values'], index=index, columns=payload['columns'])
+        for col in payload['int_columns']:
+            frame[col] = frame[col].astype(np.int64)
+        
+        last_update = payload['last_update']
+        last_candle_close = payload['last_candle_close']
+        return cls(
+            symbol=payload['symbol'],
+            timeframe=payload['timeframe'],
+            indicators=payload['indicators'],
+            last_update=datetime.fromisoformat(last_update) if last_update else None,
+            last_candle_close=pd.Timestamp(last_candle_close) if last_candle_close else None,
+            buffer=OHLCVRingBuffer.from_frame(frame, capacity=payload['capacity'],
+                                              int_columns=payload['int_columns'])
+        )
+
+
+class PriceFeedReader:
+    """
+    Read API over in-memory price snapshots and OHLCV windows
+    
+    Shared by PriceFeed (which fills them from the exchange) and
+    RemotePriceFeed (which mirrors a publishing PriceFeed over Redis).
+    Subclasses provide exchange_id, timeframes, price_snapshots and
+    ohlcv_windows, and notify subscribers of candle closes and price updates.
+    """
+    
+    exchange_id: str
+    timeframes: List[str]
+    price_snapshots: Dict[str, PriceSnapshot]
+    ohlcv_windows: Dict[Tuple[str, str], OHLCVWindow]
+    
+    def __init__(self):
+        self.candle_subscribers: Dict[Tuple[str, str], List[Callable]] = defaultdict(list)
+        self.ticker_subscribers: List[Callable] = []
+    
+    def subscribe_candles(self, symbol: str, timeframe: str, callback: Callable) -> None:
+        """
+        Call back on every candle close of a symbol/timeframe
+        
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Timeframe
+            callback: callback(symbol, timeframe, window), called synchronously;
+                schedule any slow work instead of doing it inline
+        """
+        if callback not in self.candle_subscribers[(symbol, timeframe)]:
+            self.candle_subscribers[(symbol, timeframe)].append(callback)
+    
+    def subscribe_tickers(self, callback: Callable) -> None:
+        """
+        Call back on every price update
+        
+        Args:
+            callback: callback(symbol, snapshot), called synchronously
+        """
+        if callback not in self.ticker_subscribers:
+            self.ticker_subscribers.append(callback)
+    
+    def unsubscribe(self, callback: Callable) -> None:
+        """Remove a callback from all candle and ticker subscriptions"""
+        for callbacks in self.candle_subscribers.values():
+            if callback in callbacks:
+                callbacks.remove(callback)
+        if callback in self.ticker_subscribers:
+            self.ticker_subscribers.remove(callback)
+    
+    def _notify_candle_close(self, symbol: str, timeframe: str, window: OHLCVWindow) -> None:
+        """Call the candle subscribers of a symbol/timeframe"""
+        for callback in self.candle_subscribers.get((symbol, timeframe), ()):
+            try:
+                callback(symbol, timeframe, window)
+            except Exception as e:
+                logger.error(f"Error in candle subscriber for {symbol} {timeframe}: {e}")
+    
+    def _notify_ticker(self, symbol: str, snapshot: PriceSnapshot) -> None:
+        """Call the ticker subscribers"""
+        for callback in self.ticker_subscribers:
+            try:
+                callback(symbol, snapshot)
+            except Exception as e:
+                logger.error(f"Error in ticker subscriber for {symbol}: {e}")
+    
+    def get_latest_price(self, symbol: str) -> float:
+        """
+        Get latest price for a symbol
+        
+        Args:
+            symbol: Trading pair symbol
+            
+        Returns:
+            Latest price
+        """
+        snapshot = self.price_snapshots.get(symbol)
+        if snapshot:
+            return snapshot.price
+        
+        logger.warning(f"No price data for {symbol}, returning 0")
+        return 0.0
+    
+    def get_price_snapshot(self, symbol: str) -> Optional[PriceSnapshot]:
+        """Get full price snapshot for a symbol"""
+        return self.price_snapshots.get(symbol)
+    
+    def get_ohlcv(self, symbol: str, timeframe: str) -> Optional[pd.DataFrame]:
+        """
+        Get OHLCV dataframe for a symbol/timeframe
+        
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Timeframe (e.g., '5m', '1h')
+            
+        Returns:
+            Read-only DataFrame with OHLCV data and indicators, backed by the
+            window's ring buffer (valid until its next update; copy() to keep)
+        """
+        key = (symbol, timeframe)
+        window = self.ohlcv_windows.get(key)
+        
+        if window and window.buffer is not None:
+            return window.df
+        
+        logger.warning(f"No OHLCV data for {symbol} {timeframe}")
+        return None
+    
+    def get_indicators(self, symbol: str, timeframe: str) -> Dict[str, Any]:
+        """
+        Get latest indicator values for a symbol/timeframe
+        
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Timeframe
+            
+        Returns:
+            Dict of indicator values
+        """
+        key = (symbol, timeframe)
+        window = self.ohlcv_windows.get(key)
+        
+        if window:
+            return window.indicators.copy()
+        
+        logger.warning(f"No indicators for {symbol} {timeframe}")
+        return {}
+    
+    def get_latest_candle(self, symbol: str, timeframe: str) -> Optional[Dict[str, Any]]:
+        """Get the latest closed candle for a symbol/timeframe"""
+        key = (symbol, timeframe)
+        window = self.ohlcv_windows.get(key)
+        
+        if window:
+            return window.get_latest_candle()
+        
+        return None
+    
+    def _get_windows(
+        self,
+        symbol: str,
+        timeframes: Optional[List[str]] = None
+    ) -> Dict[str, OHLCVWindow]:
+        """Resolve the windows for a symbol across timeframes (with MEXC 3m fallback)"""
+        if timeframes is None:
+            timeframes = self.timeframes
+        
+        result = {}
+        for tf in timeframes:
+            actual_tf = tf
+            if tf == '3m' and self.exchange_id == 'mexc':
+                actual_tf = '5m'
+                logger.debug(f"Using 5m data as fallback for 3m on MEXC")
+            
+            key = (symbol, actual_tf)
+            window = self.ohlcv_windows.get(key)
+            
+            if window and window.buffer is not None:
+                result[tf] = window
+            else:
+                logger.warning(f"No data for {symbol} {tf}")
+        
+        return result
+    
+    def get_multi_timeframe_data(
+        self,
+        symbol: str,
+        timeframes: Optional[List[str]] = None,
+        lookback_bars: int = 200
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Get OHLCV data across multiple timeframes for nof1-style prompts
+        
+        Args:
+            symbol: Trading pair symbol
+            timeframes: List of timeframes (defaults to all available)
+            lookback_bars: Number of bars to return per timeframe
+            
+        Returns:
+            Dict mapping timeframe to read-only DataFrame views with OHLCV and
+            indicators (valid until the window's next update)
+        """
+        return {
+            tf: window.buffer.view(lookback_bars)
+            for tf, window in self._get_windows(symbol, timeframes).items()
+        }
+    
+    def get_time_series_arrays(
+        self,
+        symbol: str,
+        timeframes: Optional[List[str]] = None,
+        lookback_bars: int = 50
+    ) -> Dict[str, Dict[str, List[float]]]:
+        """
+        Get compact time-series arrays for LLM prompts (nof1-style)
+        
+        Returns data in format:
+        {
+            '1m': {
+                'close': [100.1, 100.2, ...],
+                'ema_12': [99.8, 99.9, ...],
+                'rsi': [45.2, 46.1, ...],
+                ...
+            },
+            '5m': {...},
+            ...
+        }
+        
+        Args:
+            symbol: Trading pair symbol
+            timeframes: List of timeframes
+            lookback_bars: Number of recent bars to include
+            
+        Returns:
+            Dict mapping timeframe to dict of indicator arrays
+        """
+        result = {}
+        for tf, window in self._get_windows(symbol, timeframes).items():
+            buffer = window.buffer
+            if len(buffer) == 0:
+                continue
+            
+            tf_data = {}
+            
+            columns = ['open', 'high', 'low', 'close', 'volume'] + [
+                'ema_12', 'ema_26', 'ema_20', 'ema_50',
+                'macd', 'macd_signal', 'macd_hist',
+                'rsi', 'rsi_7', 'rsi_14',
+                'atr', 'adx',
+                'bb_upper', 'bb_middle', 'bb_lower',
+                'volume_avg', 'obv'
+            ]
+            
+            for col in columns:
+                if col in buffer.columns:
+                    values = buffer.column(col, lookback_bars)
+                    tf_data[col] = np.where(np.isnan(values), 0, values).tolist()
+            
+            result[tf] = tf_data
+        
+        return result
 
 
-class PriceFeed:
+class PriceFeed(PriceFeedReader):
     """
     Central price feed service for real-time market data.
     
     Features:
     - Fast ticker polling (1-3s) for instant prices
+    - Optional websocket streaming (tickers, trades, klines) with REST fallback
     - OHLCV fetching with indicator calculation
     - In-memory storage with Redis mirroring
+    - Optional Redis pub/sub publishing for RemotePriceFeed consumers
     - Shared across all strategies
     - Rate-limit aware
     """
@@ -96,7 +436,14 @@ class PriceFeed:
         ticker_poll_interval: float = 2.0,
         candle_lookback_bars: int = 500,
         redis_url: Optional[str] = None,
-        testnet: bool = True
+        testnet: bool = True,
+        indicator_mode: str = 'incremental',
+        transport: str = 'rest',
+        ws_url: Optional[str] = None,
+        ticker_batch_size: Optional[int] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        publish: bool = False,
+        channel_prefix: Optional[str] = None
     ):
         """
         Initialize price feed service
@@ -109,38 +456,82 @@ class PriceFeed:
             timeframes: List of timeframes (e.g., ['5m', '15m', '1h'])
             ticker_poll_interval: Seconds between ticker polls (default 2.0)
             candle_lookback_bars: Number of historical bars to maintain
-            redis_url: Redis URL for caching (optional)
+            redis_url: Redis URL for caching (optional; connections come from the
+                pool shared with other RedisCache users of the URL)
             testnet: Use testnet/demo mode
+            indicator_mode: 'incremental' (O(1) streaming update per new bar),
+                'batch' (recompute the whole window every update) or 'verify'
+                (incremental, checked against batch with fallback on mismatch)
+            transport: 'rest' (ticker polling and candle-close refetch) or
+                'websocket' (exchange streams, polling while disconnected)
+            ws_url: Override the exchange stream URL (websocket transport)
+            ticker_batch_size: Max symbols per bulk fetch_tickers request, and max
+                concurrent fetch_ticker requests on exchanges without bulk tickers
+                (default: all symbols at once)
+            rate_limiter: Request budget (defaults to the process-wide limiter
+                for the exchange, shared with other exchange clients)
+            publish: Publish price snapshots and candle-close windows on Redis
+                (requires redis_url) so RemotePriceFeed processes can mirror
+                this feed without their own exchange connection
+            channel_prefix: Prefix of the published channels and keys
+                (default 'pricefeed:<exchange_id>')
         """
+        if indicator_mode not in ('incremental', 'batch', 'verify'):
+            raise ValueError(f"Unsupported indicator_mode: {indicator_mode}")
+        if transport not in ('rest', 'websocket'):
+            raise ValueError(f"Unsupported transport: {transport}")
+        
+        super().__init__()
+        
         self.exchange_id = exchange_id.lower()
         self.api_key = api_key
         self.api_secret = api_secret
         self.symbols = symbols
         self.timeframes = timeframes
         self.ticker_poll_interval = ticker_poll_interval
+        self.ticker_batch_size = ticker_batch_size
         self.candle_lookback_bars = candle_lookback_bars
         self.redis_url = redis_url
         self.testnet = testnet
+        self.transport_mode = transport
+        self.ws_url = ws_url
         
         self.exchange: Optional[ccxt.Exchange] = None
-        self.redis: Optional[aioredis.Redis] = None
+        self.cache: Optional[RedisCache] = None
+        self._redis_pending: Dict[str, Tuple[Any, int]] = {}
+        self._redis_messages: List[Tuple[str, Any]] = []
+        self._published_prices: Dict[str, Dict[str, Any]] = {}
+        
+        self.publish = publish
+        self.channel_prefix = channel_prefix or f"pricefeed:{self.exchange_id}"
         
         self.price_snapshots: Dict[str, PriceSnapshot] = {}
         self.ohlcv_windows: Dict[Tuple[str, str], OHLCVWindow] = {}
         
         self.is_running = False
-        self.ticker_task: Optional[asyncio.Task] = None
-        self.candle_tasks: List[asyncio.Task] = []
+        self.transport: Optional[Any] = None
         
         self.indicators_calculator = TechnicalIndicators()
+        self.indicator_mode = indicator_mode
+        self.indicator_engines: Dict[Tuple[str, str], StreamingIndicators] = {}
         
-        self._rate_limit_delay = 0.1
-        self._last_request_time = datetime.now()
+        self.rate_limiter = rate_limiter or get_rate_limiter(self.exchange_id)
+        
+        self._bulk_tickers = True
+        self.ticker_metrics: Dict[str, Any] = {
+            'mode': None,
+            'cycles': 0,
+            'requests': 0,
+            'last_cycle_requests': 0,
+            'last_cycle_ms': 0.0,
+            'avg_cycle_ms': 0.0,
+            'max_cycle_ms': 0.0
+        }
         
         logger.info(
             f"PriceFeed initialized: {exchange_id}, "
             f"symbols={symbols}, timeframes={timeframes}, "
-            f"ticker_interval={ticker_poll_interval}s"
+            f"ticker_interval={ticker_poll_interval}s, transport={transport}"
         )
     
     async def start(self) -> None:
@@ -158,44 +549,40 @@ class PriceFeed:
         
         await self._fetch_initial_ohlcv()
         
-        self.ticker_task = asyncio.create_task(self._ticker_poll_loop())
-        
-        for symbol in self.symbols:
-            for timeframe in self.timeframes:
-                task = asyncio.create_task(
-                    self._candle_update_loop(symbol, timeframe)
-                )
-                self.candle_tasks.append(task)
+        self.transport = self._create_transport()
+        await self.transport.start()
         
-        logger.info("✅ PriceFeed started successfully")
+        logger.info(f"✅ PriceFeed started successfully ({self.transport.name} transport)")
     
     async def stop(self) -> None:
         """Stop the price feed service"""
         logger.info("Stopping PriceFeed...")
         self.is_running = False
         
-        if self.ticker_task:
-            self.ticker_task.cancel()
-            try:
-                await self.ticker_task
-            except asyncio.CancelledError:
-                pass
-        
-        for task in self.candle_tasks:
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+        if self.transport:
+            await self.transport.stop()
         
         if self.exchange:
             await self.exchange.close()
         
-        if self.redis:
-            await self.redis.close()
+        if self.cache:
+            await self._flush_redis()
+            await self.cache.disconnect()
         
         logger.info("✅ PriceFeed stopped")
     
+    def _create_transport(self) -> Any:
+        """Create the configured market data transport"""
+        if self.transport_mode == 'websocket':
+            codec_class = STREAM_CODECS.get(self.exchange_id)
+            if codec_class is not None:
+                codec = codec_class(self.symbols, self.timeframes, testnet=self.testnet)
+                return WebSocketTransport(self, codec, url=self.ws_url)
+            
+            logger.warning(f"No websocket streams for {self.exchange_id}, using REST polling")
+        
+        return PollingTransport(self)
+    
     async def _initialize_exchange(self) -> None:
         """Initialize CCXT exchange with async support"""
         try:
@@ -204,7 +591,8 @@ class PriceFeed:
             config = {
                 'apiKey': self.api_key,
                 'secret': self.api_secret,
-                'enableRateLimit': True,
+                # Paced by the shared RateLimiter (see _rate_limit) only
+                'enableRateLimit': False,
                 'options': {}
             }
             
@@ -232,16 +620,12 @@ class PriceFeed:
     async def _initialize_redis(self) -> None:
         """Initialize Redis connection"""
         try:
-            self.redis = await aioredis.from_url(
-                self.redis_url,
-                encoding="utf-8",
-                decode_responses=True
-            )
-            await self.redis.ping()
+            self.cache = RedisCache(self.redis_url)
+            await self.cache.connect()
             logger.info("✅ Redis connected")
         except Exception as e:
             logger.warning(f"Redis connection failed: {e}, continuing without Redis")
-            self.redis = None
+            self.cache = None
     
     async def _fetch_initial_ohlcv(self) -> None:
         """Fetch initial OHLCV data for all symbol/timeframe pairs"""
@@ -253,6 +637,7 @@ class PriceFeed:
                 tasks.append(self._fetch_ohlcv(symbol, timeframe, initial=True))
         
         await asyncio.gather(*tasks, return_exceptions=True)
+        await self._flush_redis()
         
         logger.info(f"✅ Initial OHLCV data fetched for {len(tasks)} pairs")
     
@@ -272,37 +657,204 @@ class PriceFeed:
                 await asyncio.sleep(5)
     
     async def _update_all_tickers(self) -> None:
-        """Update ticker prices for all symbols"""
+        """Update ticker prices for all symbols (bulk fetch_tickers when supported)"""
+        started = time.perf_counter()
+        requests = 0
+        
+        try:
+            size = self.ticker_batch_size or len(self.symbols) or 1
+            chunks = [self.symbols[i:i + size] for i in range(0, len(self.symbols), size)]
+            
+            if self._supports_bulk_tickers():
+                self.ticker_metrics['mode'] = 'bulk'
+                counts = await asyncio.gather(
+                    *(self._fetch_ticker_batch(chunk) for chunk in chunks),
+                    return_exceptions=True
+                )
+                requests = sum(count for count in counts if isinstance(count, int))
+            else:
+                self.ticker_metrics['mode'] = 'single'
+                for chunk in chunks:
+                    tasks = [self._fetch_ticker(symbol) for symbol in chunk]
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    requests += len(tasks)
+        
+        except Exception as e:
+            logger.error(f"Error updating tickers: {e}")
+        
+        await self._flush_redis()
+        self._record_ticker_cycle((time.perf_counter() - started) * 1000, requests)
+    
+    def _supports_bulk_tickers(self) -> bool:
+        """Whether the exchange can return several tickers in one request"""
+        has = getattr(self.exchange, 'has', None)
+        return self._bulk_tickers and isinstance(has, dict) and bool(has.get('fetchTickers'))
+    
+    async def _fetch_ticker_batch(self, symbols: List[str]) -> int:
+        """
+        Fetch tickers for several symbols in one request
+        
+        Args:
+            symbols: Symbols to fetch
+            
+        Returns:
+            Number of requests made
+        """
+        try:
+            await self._rate_limit(request_weight(self.exchange_id, 'fetch_tickers'))
+            tickers = await self.exchange.fetch_tickers(symbols)
+        
+        except ccxt.NotSupported as e:
+            logger.warning(f"Bulk tickers not supported ({e}), fetching per symbol")
+            self._bulk_tickers = False
+            await asyncio.gather(*(self._fetch_ticker(symbol) for symbol in symbols), return_exceptions=True)
+            return 1 + len(symbols)
+        
+        except Exception as e:
+            self._check_rate_limit_error(e)
+            logger.error(f"Error fetching tickers for {len(symbols)} symbols: {e}")
+            return 1
+        
+        for symbol in symbols:
+            ticker = tickers.get(symbol)
+            if ticker is None:
+                logger.debug(f"No ticker for {symbol} in bulk response")
+                continue
+            
+            try:
+                await self._store_ticker(symbol, ticker)
+            except Exception as e:
+                logger.error(f"Error processing ticker for {symbol}: {e}")
+        
+        return 1
+    
+    async def _fetch_ticker(self, symbol: str) -> None:
+        """Fetch ticker for a single symbol"""
+        try:
+            await self._rate_limit()
+            
+            ticker = await self.exchange.fetch_ticker(symbol)
+            await self._store_ticker(symbol, ticker)
+        
+        except Exception as e:
+            self._check_rate_limit_error(e)
+            logger.error(f"Error fetching ticker for {symbol}: {e}")
+    
+    async def _store_ticker(self, symbol: str, ticker: Dict[str, Any]) -> None:
+        """Store a CCXT ticker as the symbol's price snapshot"""
+        last = ticker.get('last')
+        snapshot = PriceSnapshot(
+            symbol=symbol,
+            price=float(last if last is not None else ticker.get('close') or 0),
+            bid=float(ticker.get('bid') or 0),
+            ask=float(ticker.get('ask') or 0),
+            volume_24h=float(ticker.get('quoteVolume') or 0),
+            timestamp=datetime.now()
+        )
+        
+        self.price_snapshots[symbol] = snapshot
+        
+        if self.cache:
+            self._cache_price_to_redis(snapshot)
+        
+        self._notify_ticker(symbol, snapshot)
+    
+    def _record_ticker_cycle(self, elapsed_ms: float, requests: int) -> None:
+        """Update ticker cycle latency and request-count metrics"""
+        metrics = self.ticker_metrics
+        metrics['cycles'] += 1
+        metrics['requests'] += requests
+        metrics['last_cycle_requests'] = requests
+        metrics['last_cycle_ms'] = elapsed_ms
+        metrics['avg_cycle_ms'] += (elapsed_ms - metrics['avg_cycle_ms']) / metrics['cycles']
+        metrics['max_cycle_ms'] = max(metrics['max_cycle_ms'], elapsed_ms)
+    
+    async def handle_market_event(self, event: MarketEvent) -> None:
+        """
+        Apply a streamed ticker, trade or kline update
+        
+        Args:
+            event: Normalized stream message
+        """
         try:
-            tasks = [self._fetch_ticker(symbol) for symbol in self.symbols]
-            await asyncio.gather(*tasks, return_exceptions=True)
+            if event.kind == 'ticker':
+                await self._apply_ticker(event.symbol, event.data)
+            elif event.kind == 'trade':
+                self._apply_trade(event.symbol, event.data)
+            elif event.kind == 'kline':
+                await self._apply_kline(event.symbol, event.timeframe, event.data)
         
         except Exception as e:
-            logger.error(f"Error updating tickers: {e}")
+            logger.error(f"Error applying {event.kind} update for {event.symbol}: {e}")
+        
+        await self._flush_redis()
     
-    async def _fetch_ticker(self, symbol: str) -> None:
-        """Fetch ticker for a single symbol"""
-        try:
-            await self._rate_limit()
-            
-            ticker = await self.exchange.fetch_ticker(symbol)
-            
+    async def _apply_ticker(self, symbol: str, data: Dict[str, Any]) -> None:
+        """Update the price snapshot from a streamed ticker (missing fields keep their value)"""
+        previous = self.price_snapshots.get(symbol)
+        
+        def value(name: str, current: float) -> float:
+            return data[name] if data.get(name) is not None else current
+        
+        snapshot = PriceSnapshot(
+            symbol=symbol,
+            price=value('last', previous.price if previous else 0.0),
+            bid=value('bid', previous.bid if previous else 0.0),
+            ask=value('ask', previous.ask if previous else 0.0),
+            volume_24h=value('quote_volume', previous.volume_24h if previous else 0.0),
+            timestamp=datetime.now()
+        )
+        
+        self.price_snapshots[symbol] = snapshot
+        
+        if self.cache:
+            self._cache_price_to_redis(snapshot)
+        
+        self._notify_ticker(symbol, snapshot)
+    
+    def _apply_trade(self, symbol: str, data: Dict[str, Any]) -> None:
+        """Move the latest price to a streamed trade"""
+        snapshot = self.price_snapshots.get(symbol)
+        
+        if snapshot is None:
             snapshot = PriceSnapshot(
                 symbol=symbol,
-                price=float(ticker.get('last', ticker.get('close', 0))),
-                bid=float(ticker.get('bid', 0)),
-                ask=float(ticker.get('ask', 0)),
-                volume_24h=float(ticker.get('quoteVolume', 0)),
+                price=data['price'],
+                bid=0.0,
+                ask=0.0,
+                volume_24h=0.0,
                 timestamp=datetime.now()
             )
-            
             self.price_snapshots[symbol] = snapshot
-            
-            if self.redis:
-                await self._cache_price_to_redis(snapshot)
+        else:
+            snapshot.price = data['price']
+            snapshot.timestamp = datetime.now()
         
-        except Exception as e:
-            logger.error(f"Error fetching ticker for {symbol}: {e}")
+        self._notify_ticker(symbol, snapshot)
+    
+    async def _apply_kline(self, symbol: str, timeframe: str, data: Dict[str, Any]) -> None:
+        """Write a streamed candle into its window (REST backfill when candles were missed)"""
+        key = (symbol, timeframe)
+        window = self.ohlcv_windows.get(key)
+        if window is None or window.buffer is None or len(window.buffer) == 0:
+            return
+        
+        df = pd.DataFrame(
+            [data['candle']],
+            columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
+        )
+        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+        df.set_index('timestamp', inplace=True)
+        
+        last_timestamp = window.buffer.timestamp(-1)
+        if df.index[0] < last_timestamp:
+            return
+        
+        if df.index[0] > last_timestamp + pd.Timedelta(seconds=self._timeframe_to_seconds(timeframe)):
+            await self._fetch_ohlcv(symbol, timeframe, initial=False)
+            return
+        
+        await self._apply_ohlcv(symbol, timeframe, df, initial=False, cache=data.get('closed', True))
     
     async def _candle_update_loop(self, symbol: str, timeframe: str) -> None:
         """Background task to update OHLCV on candle close"""
@@ -320,6 +872,7 @@ class PriceFeed:
                     await asyncio.sleep(sleep_duration)
                 
                 await self._fetch_ohlcv(symbol, timeframe, initial=False)
+                await self._flush_redis()
             
             except asyncio.CancelledError:
                 break
@@ -335,10 +888,10 @@ class PriceFeed:
     ) -> None:
         """Fetch OHLCV data and calculate indicators"""
         try:
-            await self._rate_limit()
-            
             limit = self.candle_lookback_bars if initial else 100
             
+            await self._rate_limit(request_weight(self.exchange_id, 'fetch_ohlcv', limit))
+            
             ohlcv = await self.exchange.fetch_ohlcv(
                 symbol,
                 timeframe,
@@ -356,37 +909,72 @@ class PriceFeed:
             df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
             df.set_index('timestamp', inplace=True)
             
+            await self._apply_ohlcv(symbol, timeframe, df, initial=initial)
+        
+        except Exception as e:
+            self._check_rate_limit_error(e)
+            logger.error(f"Error fetching OHLCV {symbol} {timeframe}: {e}")
+    
+    async def _apply_ohlcv(
+        self,
+        symbol: str,
+        timeframe: str,
+        df: pd.DataFrame,
+        initial: bool = False,
+        cache: bool = True
+    ) -> None:
+        """
+        Merge candles into a window and update its indicators
+        
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Timeframe
+            df: OHLCV candles indexed by timestamp
+            initial: Replace the window instead of merging
+            cache: The update closes a candle: mirror the window to Redis and
+                notify candle subscribers (False for a still-forming streamed candle)
+        """
+        try:
             key = (symbol, timeframe)
+            window = self.ohlcv_windows.get(key)
             
-            if key in self.ohlcv_windows and not initial:
-                existing_df = self.ohlcv_windows[key].df
-                df = pd.concat([existing_df, df])
-                df = df[~df.index.duplicated(keep='last')]
-                df = df.tail(self.candle_lookback_bars)
+            updated = False
+            if (window is not None and window.buffer is not None
+                    and not initial and self.indicator_mode != 'batch'):
+                updated = self._update_indicators_incremental(key, window.buffer, df)
             
-            df = self._calculate_indicators(df)
+            if not updated:
+                if window is not None and window.buffer is not None and not initial:
+                    df = pd.concat([window.df, df])
+                    df = df[~df.index.duplicated(keep='last')]
+                    df = df.tail(self.candle_lookback_bars)
+                
+                df = self._calculate_indicators(df)
+                
+                if self.indicator_mode != 'batch':
+                    self._seed_indicator_engine(key, df)
+                
+                window = self._store_window(key, window, df)
             
-            window = OHLCVWindow(
-                symbol=symbol,
-                timeframe=timeframe,
-                df=df,
-                indicators=self._extract_latest_indicators(df),
-                last_update=datetime.now(),
-                last_candle_close=df.index[-1] if len(df) > 0 else None
-            )
+            window.indicators = self._extract_latest_indicators(window.buffer.row(-1))
+            window.last_update = datetime.now()
+            window.last_candle_close = window.buffer.timestamp(-1)
             
             self.ohlcv_windows[key] = window
             
-            if self.redis:
-                await self._cache_ohlcv_to_redis(window)
+            if self.cache and cache:
+                self._cache_ohlcv_to_redis(window)
+            
+            if cache and not initial:
+                self._notify_candle_close(symbol, timeframe, window)
             
             logger.debug(
                 f"Updated OHLCV for {symbol} {timeframe}: "
-                f"{len(df)} bars, last close: {window.last_candle_close}"
+                f"{len(window.buffer)} bars, last close: {window.last_candle_close}"
             )
         
         except Exception as e:
-            logger.error(f"Error fetching OHLCV {symbol} {timeframe}: {e}")
+            logger.error(f"Error updating OHLCV {symbol} {timeframe}: {e}")
     
     def _calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         """Calculate technical indicators on OHLCV data"""
@@ -444,6 +1032,124 @@ class PriceFeed:
             logger.error(f"Error calculating indicators: {e}")
             return df
     
+    def _seed_indicator_engine(self, key: Tuple[str, str], df: pd.DataFrame) -> None:
+        """Build streaming indicator state for a window computed by the batch path"""
+        engine = StreamingIndicators(
+            window=self.candle_lookback_bars,
+            config=self.indicators_calculator.config
+        )
+        engine.seed(df)
+        self.indicator_engines[key] = engine
+    
+    def _store_window(
+        self,
+        key: Tuple[str, str],
+        window: Optional[OHLCVWindow],
+        df: pd.DataFrame
+    ) -> OHLCVWindow:
+        """Load a batch-computed frame into the window's ring buffer"""
+        if window is not None and window.buffer is not None and window.buffer.columns == tuple(df.columns):
+            window.buffer.load(df)
+            return window
+        
+        buffer = OHLCVRingBuffer.from_frame(
+            df,
+            capacity=self.candle_lookback_bars,
+            int_columns=[
+                col for col in df.columns
+                if col not in ['open', 'high', 'low', 'close', 'volume']
+                and pd.api.types.is_integer_dtype(df[col].dtype)
+            ]
+        )
+        logger.debug(f"Allocated OHLCV buffer for {key}: {buffer.nbytes / 1e3:.0f} KB")
+        return OHLCVWindow(symbol=key[0], timeframe=key[1], buffer=buffer)
+    
+    def _update_indicators_incremental(
+        self,
+        key: Tuple[str, str],
+        buffer: OHLCVRingBuffer,
+        new_df: pd.DataFrame
+    ) -> bool:
+        """
+        Write newly fetched candles into the window using the streaming indicator engine
+        
+        The last candle of the window is usually the one that was still forming
+        at the previous fetch, so it is replaced rather than appended. Returns
+        False when the window cannot be updated incrementally (no engine, the
+        fetched candles leave a gap after the window, or verify mode found a
+        divergence) so the caller recomputes it.
+        
+        Args:
+            key: (symbol, timeframe)
+            buffer: Ring buffer of the window
+            new_df: Freshly fetched OHLCV candles
+            
+        Returns:
+            True if the window was updated in place
+        """
+        engine = self.indicator_engines.get(key)
+        if engine is None or len(buffer) == 0:
+            return False
+        
+        last_timestamp = buffer.timestamp(-1)
+        if new_df.index[0] > last_timestamp + pd.Timedelta(seconds=self._timeframe_to_seconds(key[1])):
+            return False
+        
+        new_df = new_df[new_df.index >= last_timestamp]
+        
+        try:
+            revising = new_df.index[0] == last_timestamp
+            base_rows = len(buffer) - 1 if revising else len(buffer)
+            previous = buffer.row(base_rows - 1) if base_rows > 0 else {}
+            
+            for i, (timestamp, bar) in enumerate(new_df.iterrows()):
+                args = (bar['open'], bar['high'], bar['low'], bar['close'], bar['volume'])
+                if i == 0 and revising:
+                    values = engine.revise(*args)
+                else:
+                    values = engine.update(*args)
+                
+                record = {**values, **bar.to_dict()}
+                for col, value in record.items():
+                    if value != value:
+                        record[col] = previous.get(col, value)
+                buffer.upsert(timestamp, record)
+                previous = record
+            
+            columns = buffer.columns
+            if base_rows + len(new_df) > buffer.capacity and 'obv' in columns and 'vwap' in columns:
+                obv, vwap = anchored_obv_vwap(
+                    buffer.column('high'), buffer.column('low'),
+                    buffer.column('close'), buffer.column('volume')
+                )
+                buffer.write_tail('obv', obv)
+                buffer.write_tail('vwap', vwap)
+            
+            if 'chikou_span' in columns and len(buffer) > CHIKOU_LAG:
+                closes = buffer.column('close')
+                start = max(0, len(buffer) - len(new_df) - CHIKOU_LAG)
+                shifted = closes[start + CHIKOU_LAG:]
+                buffer.write_tail('chikou_span', np.concatenate(
+                    (shifted, np.full(len(buffer) - start - len(shifted), closes[-1]))
+                ))
+        
+        except Exception as e:
+            logger.error(f"Incremental indicator update failed for {key}: {e}")
+            return False
+        
+        if self.indicator_mode == 'verify':
+            df = buffer.view()
+            expected = self._calculate_indicators(df[['open', 'high', 'low', 'close', 'volume']].copy())
+            mismatches = find_mismatches(expected.iloc[-len(new_df):], df.iloc[-len(new_df):])
+            if mismatches:
+                logger.warning(
+                    f"Incremental indicators diverged from batch for {key}: {mismatches}, "
+                    f"resyncing"
+                )
+                return False
+        
+        return True
+    
     def _calculate_supertrend(self, df: pd.DataFrame, multiplier: float = 3.0) -> pd.DataFrame:
         """Calculate SuperTrend indicator"""
         try:
@@ -498,73 +1204,74 @@ class PriceFeed:
             logger.error(f"Error calculating RSI(2): {e}")
             return df
     
-    def _extract_latest_indicators(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """Extract latest indicator values from dataframe"""
-        if df is None or len(df) == 0:
+    def _extract_latest_indicators(self, latest: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Extract indicator values from the latest row of a window"""
+        if not latest:
             return {}
         
-        latest = df.iloc[-1]
         indicators = {}
         
-        for col in df.columns:
+        for col, value in latest.items():
             if col not in ['open', 'high', 'low', 'close', 'volume']:
                 try:
-                    indicators[col] = float(latest[col]) if not pd.isna(latest[col]) else 0.0
+                    indicators[col] = float(value) if not pd.isna(value) else 0.0
                 except:
                     indicators[col] = 0.0
         
         return indicators
     
-    async def _cache_price_to_redis(self, snapshot: PriceSnapshot) -> None:
-        """Cache price snapshot to Redis"""
-        try:
-            key = f"price:{snapshot.symbol}"
-            await self.redis.setex(
-                key,
-                30,
-                json.dumps(snapshot.to_dict())
-            )
-        except Exception as e:
-            logger.error(f"Error caching price to Redis: {e}")
+    def _cache_price_to_redis(self, snapshot: PriceSnapshot) -> None:
+        """Stage a price snapshot for the next Redis flush"""
+        payload = snapshot.to_dict()
+        self._redis_pending[f"price:{snapshot.symbol}"] = (payload, 30)
+        
+        if self.publish:
+            self._redis_pending[feed_key(self.channel_prefix, 'price', snapshot.symbol)] = (payload, 30)
+            self._published_prices[snapshot.symbol] = payload
     
-    async def _cache_ohlcv_to_redis(self, window: OHLCVWindow) -> None:
-        """Cache OHLCV window to Redis"""
-        try:
-            key = f"ohlcv:{window.symbol}:{window.timeframe}"
-            
-            data = {
-                'symbol': window.symbol,
-                'timeframe': window.timeframe,
-                'last_update': window.last_update.isoformat(),
-                'last_candle_close': window.last_candle_close.isoformat() if window.last_candle_close else None,
-                'latest_candle': window.get_latest_candle()
-            }
-            
-            await self.redis.setex(
-                key,
-                300,
-                json.dumps(data, default=str)
-            )
-            
-            indicators_key = f"indicators:{window.symbol}:{window.timeframe}"
-            await self.redis.setex(
-                indicators_key,
-                300,
-                json.dumps(window.indicators, default=str)
-            )
+    def _cache_ohlcv_to_redis(self, window: OHLCVWindow) -> None:
+        """Stage an OHLCV window summary and its indicators for the next Redis flush"""
+        data = {
+            'symbol': window.symbol,
+            'timeframe': window.timeframe,
+            'last_update': window.last_update,
+            'last_candle_close': window.last_candle_close,
+            'latest_candle': window.get_latest_candle()
+        }
+        self._redis_pending[f"ohlcv:{window.symbol}:{window.timeframe}"] = (data, 300)
+        self._redis_pending[f"indicators:{window.symbol}:{window.timeframe}"] = (window.indicators, 300)
         
-        except Exception as e:
-            logger.error(f"Error caching OHLCV to Redis: {e}")
+        if self.publish and window.buffer is not None:
+            payload = window.to_payload()
+            key = feed_key(self.channel_prefix, 'window', window.symbol, window.timeframe)
+            self._redis_pending[key] = (payload, 86400)
+            self._redis_messages.append((feed_key(self.channel_prefix, 'candles'), payload))
     
-    async def _rate_limit(self) -> None:
-        """Rate limiting to avoid exchange bans"""
-        now = datetime.now()
-        elapsed = (now - self._last_request_time).total_seconds()
+    async def _flush_redis(self) -> None:
+        """Write (and publish) everything staged since the last flush in one pipelined round trip"""
+        if not self._redis_pending and not self._redis_messages:
+            return
         
-        if elapsed < self._rate_limit_delay:
-            await asyncio.sleep(self._rate_limit_delay - elapsed)
+        pending, self._redis_pending = self._redis_pending, {}
+        messages, self._redis_messages = self._redis_messages, []
+        if self._published_prices:
+            messages.append((feed_key(self.channel_prefix, 'prices'), list(self._published_prices.values())))
+            self._published_prices = {}
         
-        self._last_request_time = datetime.now()
+        if self.cache:
+            await self.cache.set_many(
+                [(key, value, expire) for key, (value, expire) in pending.items()],
+                messages=messages
+            )
+    
+    async def _rate_limit(self, weight: float = 1.0) -> None:
+        """Wait for market data budget on the shared exchange rate limiter"""
+        await self.rate_limiter.acquire('market_data', weight)
+    
+    def _check_rate_limit_error(self, error: Exception) -> None:
+        """Back off all market data requests when the exchange rejects one for rate"""
+        if isinstance(error, (ccxt.RateLimitExceeded, ccxt.DDoSProtection)):
+            self.rate_limiter.penalize('market_data')
     
     def _timeframe_to_seconds(self, timeframe: str) -> int:
         """Convert timeframe string to seconds"""
@@ -579,77 +1286,6 @@ class PriceFeed:
         next_close = ((timestamp // timeframe_seconds) + 1) * timeframe_seconds
         return datetime.fromtimestamp(next_close)
     
-    def get_latest_price(self, symbol: str) -> float:
-        """
-        Get latest price for a symbol
-        
-        Args:
-            symbol: Trading pair symbol
-            
-        Returns:
-            Latest price
-        """
-        snapshot = self.price_snapshots.get(symbol)
-        if snapshot:
-            return snapshot.price
-        
-        logger.warning(f"No price data for {symbol}, returning 0")
-        return 0.0
-    
-    def get_price_snapshot(self, symbol: str) -> Optional[PriceSnapshot]:
-        """Get full price snapshot for a symbol"""
-        return self.price_snapshots.get(symbol)
-    
-    def get_ohlcv(self, symbol: str, timeframe: str) -> Optional[pd.DataFrame]:
-        """
-        Get OHLCV dataframe for a symbol/timeframe
-        
-        Args:
-            symbol: Trading pair symbol
-            timeframe: Timeframe (e.g., '5m', '1h')
-            
-        Returns:
-            DataFrame with OHLCV data and indicators
-        """
-        key = (symbol, timeframe)
-        window = self.ohlcv_windows.get(key)
-        
-        if window:
-            return window.df.copy()
-        
-        logger.warning(f"No OHLCV data for {symbol} {timeframe}")
-        return None
-    
-    def get_indicators(self, symbol: str, timeframe: str) -> Dict[str, Any]:
-        """
-        Get latest indicator values for a symbol/timeframe
-        
-        Args:
-            symbol: Trading pair symbol
-            timeframe: Timeframe
-            
-        Returns:
-            Dict of indicator values
-        """
-        key = (symbol, timeframe)
-        window = self.ohlcv_windows.get(key)
-        
-        if window:
-            return window.indicators.copy()
-        
-        logger.warning(f"No indicators for {symbol} {timeframe}")
-        return {}
-    
-    def get_latest_candle(self, symbol: str, timeframe: str) -> Optional[Dict[str, Any]]:
-        """Get the latest closed candle for a symbol/timeframe"""
-        key = (symbol, timeframe)
-        window = self.ohlcv_windows.get(key)
-        
-        if window:
-            return window.get_latest_candle()
-        
-        return None
-    
     def get_statistics(self) -> Dict[str, Any]:
         """Get price feed statistics"""
         return {
@@ -660,110 +1296,23 @@ class PriceFeed:
             'ticker_poll_interval': self.ticker_poll_interval,
             'price_snapshots_count': len(self.price_snapshots),
             'ohlcv_windows_count': len(self.ohlcv_windows),
-            'redis_connected': self.redis is not None,
+            'ohlcv_buffer_bytes': sum(
+                window.buffer.nbytes for window in self.ohlcv_windows.values()
+                if window.buffer is not None
+            ),
+            'redis_connected': self.cache is not None,
+            'redis_stats': self.cache.get_stats() if self.cache else None,
+            'publishing': self.publish and self.cache is not None,
+            'transport': self.transport.name if self.transport else self.transport_mode,
+            'stream_connected': bool(getattr(self.transport, 'connected', False)),
+            'ticker_metrics': dict(self.ticker_metrics),
+            'rate_limits': self.rate_limiter.get_statistics(),
             'latest_prices': {
                 symbol: snapshot.price
                 for symbol, snapshot in self.price_snapshots.items()
             }
         }
     
-    def get_multi_timeframe_data(
-        self,
-        symbol: str,
-        timeframes: Optional[List[str]] = None,
-        lookback_bars: int = 200
-    ) -> Dict[str, pd.DataFrame]:
-        """
-        Get OHLCV data across multiple timeframes for nof1-style prompts
-        
-        Args:
-            symbol: Trading pair symbol
-            timeframes: List of timeframes (defaults to all available)
-            lookback_bars: Number of bars to return per timeframe
-            
-        Returns:
-            Dict mapping timeframe to DataFrame with OHLCV and indicators
-        """
-        if timeframes is None:
-            timeframes = self.timeframes
-        
-        result = {}
-        for tf in timeframes:
-            actual_tf = tf
-            if tf == '3m' and self.exchange_id == 'mexc':
-                actual_tf = '5m'
-                logger.debug(f"Using 5m data as fallback for 3m on MEXC")
-            
-            key = (symbol, actual_tf)
-            window = self.ohlcv_windows.get(key)
-            
-            if window and window.df is not None:
-                df = window.df.tail(lookback_bars).copy()
-                result[tf] = df
-            else:
-                logger.warning(f"No data for {symbol} {tf}")
-        
-        return result
-    
-    def get_time_series_arrays(
-        self,
-        symbol: str,
-        timeframes: Optional[List[str]] = None,
-        lookback_bars: int = 50
-    ) -> Dict[str, Dict[str, List[float]]]:
-        """
-        Get compact time-series arrays for LLM prompts (nof1-style)
-        
-        Returns data in format:
-        {
-            '1m': {
-                'close': [100.1, 100.2, ...],
-                'ema_12': [99.8, 99.9, ...],
-                'rsi': [45.2, 46.1, ...],
-                ...
-            },
-            '5m': {...},
-            ...
-        }
-        
-        Args:
-            symbol: Trading pair symbol
-            timeframes: List of timeframes
-            lookback_bars: Number of recent bars to include
-            
-        Returns:
-            Dict mapping timeframe to dict of indicator arrays
-        """
-        multi_tf_data = self.get_multi_timeframe_data(symbol, timeframes, lookback_bars)
-        
-        result = {}
-        for tf, df in multi_tf_data.items():
-            if df is None or len(df) == 0:
-                continue
-            
-            tf_data = {}
-            
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                if col in df.columns:
-                    tf_data[col] = df[col].fillna(0).tolist()
-            
-            indicator_cols = [
-                'ema_12', 'ema_26', 'ema_20', 'ema_50',
-                'macd', 'macd_signal', 'macd_hist',
-                'rsi', 'rsi_7', 'rsi_14',
-                'atr', 'adx',
-                'bb_upper', 'bb_middle', 'bb_lower',
-                'volume_avg', 'obv'
-            ]
-            
-            for col in indicator_cols:
-                if col in df.columns:
-                    tf_data[col] = df[col].fillna(0).tolist()
-            
-            result[tf] = tf_data
-        
-        return result
-    
     async def get_funding_rate(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
         Get current funding rate for perpetual futures
@@ -811,7 +1360,7 @@ class PriceFeed:
             Dict with bids, asks, and depth metrics
         """
         try:
-            await self._rate_limit()
+            await self._rate_limit(request_weight(self.exchange_id, 'fetch_order_book', limit))
             
             order_book = await self.exchange.fetch_order_book(symbol, limit=limit)
             
@@ -838,5 +1387,6 @@ class PriceFeed:
             }
         
         except Exception as e:
+            self._check_rate_limit_error(e)
             logger.error(f"Error fetching order book for {symbol}: {e}")
             return None
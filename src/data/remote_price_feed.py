@@ -0,0 +1,208 @@
+"""
+Remote Price Feed
+
+Read-only mirror of a PriceFeed running in another process. The publishing
+feed (PriceFeed(..., publish=True)) sends price snapshots and candle-close
+windows over Redis pub/sub; RemotePriceFeed keeps them in memory and serves
+the same read API and candle/ticker subscriptions, so N strategy workers
+share one exchange connection.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+from .storage import RedisCache, unpack_value
+from .price_feed import PriceFeedReader, PriceSnapshot, OHLCVWindow, feed_key
+
+logger = logging.getLogger(__name__)
+
+
+class RemotePriceFeed(PriceFeedReader):
+    """
+    In-memory mirror of a publishing PriceFeed
+
+    On start the mirror subscribes to the feed's channels and then loads the
+    latest state the feed keeps in Redis, so it is complete immediately even
+    when it joins late. Each candle-close message carries the whole window, so
+    a missed message is repaired by the next one.
+
+    Usage:
+        feed = RemotePriceFeed('binance', redis_url='redis://localhost:6379/0')
+        await feed.start()
+        price = feed.get_latest_price('BTC/USDT')
+        df = feed.get_ohlcv('BTC/USDT', '5m')
+    """
+
+    def __init__(
+        self,
+        exchange_id: str,
+        redis_url: str = "redis://localhost:6379/0",
+        timeframes: Optional[List[str]] = None,
+        channel_prefix: Optional[str] = None,
+        cache: Optional[RedisCache] = None
+    ):
+        """
+        Initialize remote price feed
+
+        Args:
+            exchange_id: Exchange of the publishing feed
+            redis_url: Redis URL the feed publishes to
+            timeframes: Default timeframes for multi-timeframe reads
+                (defaults to every timeframe received)
+            channel_prefix: Prefix used by the publishing feed
+                (default 'pricefeed:<exchange_id>')
+            cache: Redis cache to use instead of one for redis_url
+        """
+        super().__init__()
+
+        self.exchange_id = exchange_id.lower()
+        self.channel_prefix = channel_prefix or f"pricefeed:{self.exchange_id}"
+        self.cache = cache or RedisCache(redis_url)
+        self.timeframes: List[str] = list(timeframes or [])
+        self._track_timeframes = timeframes is None
+
+        self.price_snapshots: Dict[str, PriceSnapshot] = {}
+        self.ohlcv_windows: Dict[Tuple[str, str], OHLCVWindow] = {}
+
+        self.is_running = False
+        self.messages_received = 0
+        self.last_message: Optional[datetime] = None
+
+        self._pubsub = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def symbols(self) -> List[str]:
+        """Symbols seen so far"""
+        symbols = set(self.price_snapshots)
+        symbols.update(symbol for symbol, _ in self.ohlcv_windows)
+        return sorted(symbols)
+
+    async def start(self) -> None:
+        """Subscribe to the feed and load its current state"""
+        if self.is_running:
+            logger.warning("RemotePriceFeed already running")
+            return
+
+        if not self.cache.redis:
+            await self.cache.connect()
+
+        self._pubsub = self.cache.redis.pubsub()
+        await self._pubsub.subscribe(
+            feed_key(self.channel_prefix, 'prices'),
+            feed_key(self.channel_prefix, 'candles')
+        )
+        await self._load_state()
+
+        self.is_running = True
+        self._task = asyncio.create_task(self._listen())
+
+        logger.info(
+            f"✅ RemotePriceFeed mirroring {self.channel_prefix}: "
+            f"{len(self.price_snapshots)} prices, {len(self.ohlcv_windows)} windows"
+        )
+
+    async def stop(self) -> None:
+        """Stop mirroring"""
+        self.is_running = False
+
+        if self._task is not None:
+            task, self._task = self._task, None
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        if self._pubsub is not None:
+            await self._pubsub.unsubscribe()
+            await self._pubsub.aclose()
+            self._pubsub = None
+
+        await self.cache.disconnect()
+        logger.info("✅ RemotePriceFeed stopped")
+
+    async def _load_state(self) -> None:
+        """Load the latest snapshots and windows the publishing feed stored"""
+        keys = [
+            key.decode() if isinstance(key, bytes) else key
+            async for key in self.cache.redis.scan_iter(match=f"{self.channel_prefix}:*", count=500)
+        ]
+        state_keys = [
+            key for key in keys
+            if key.startswith((f"{self.channel_prefix}:price:", f"{self.channel_prefix}:window:"))
+        ]
+
+        for key, value in (await self.cache.get_many(state_keys)).items():
+            if key.startswith(f"{self.channel_prefix}:price:"):
+                self._apply_prices([value])
+            else:
+                self._apply_window(value, notify=False)
+
+    async def _listen(self) -> None:
+        """Apply published messages until stopped"""
+        prices_channel = feed_key(self.channel_prefix, 'prices')
+
+        while self.is_running:
+            try:
+                message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message is None:
+                    continue
+
+                channel = message['channel']
+                if isinstance(channel, bytes):
+                    channel = channel.decode()
+
+                payload = unpack_value(message['data'])
+                if channel == prices_channel:
+                    self._apply_prices(payload)
+                else:
+                    self._apply_window(payload)
+
+                self.messages_received += 1
+                self.last_message = datetime.now()
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error applying published price feed update: {e}")
+                await asyncio.sleep(1)
+
+    def _apply_prices(self, snapshots: List[Dict[str, Any]]) -> None:
+        """Replace price snapshots with published ones"""
+        for data in snapshots:
+            snapshot = PriceSnapshot.from_dict(data)
+            self.price_snapshots[snapshot.symbol] = snapshot
+            self._notify_ticker(snapshot.symbol, snapshot)
+
+    def _apply_window(self, payload: Dict[str, Any], notify: bool = True) -> None:
+        """Replace a window with a published one (older windows are ignored)"""
+        window = OHLCVWindow.from_payload(payload)
+        key = (window.symbol, window.timeframe)
+
+        current = self.ohlcv_windows.get(key)
+        if (current is not None and current.last_candle_close is not None
+                and window.last_candle_close is not None
+                and window.last_candle_close < current.last_candle_close):
+            return
+
+        self.ohlcv_windows[key] = window
+        if self._track_timeframes and window.timeframe not in self.timeframes:
+            self.timeframes.append(window.timeframe)
+
+        if notify:
+            self._notify_candle_close(window.symbol, window.timeframe, window)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get mirror statistics"""
+        return {
+            'is_running': self.is_running,
+            'exchange': self.exchange_id,
+            'channel_prefix': self.channel_prefix,
+            'symbols': self.symbols,
+            'timeframes': self.timeframes,
+            'price_snapshots_count': len(self.price_snapshots),
+            'ohlcv_windows_count': len(self.ohlcv_windows),
+            'messages_received': self.messages_received,
+            'last_message': self.last_message,
+            'redis_stats': self.cache.get_stats()
+        }
@@ -6,12 +6,16 @@ and performance metrics using SQLite and Redis.
 """
 
 import json
+import time
 import asyncio
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
+import numpy as np
 import pandas as pd
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text, Boolean
+import msgpack
+from sqlalchemy import create_engine, event, text, Column, Integer, String, Float, DateTime, Text, Boolean, Index
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -29,15 +33,41 @@ class MarketDataModel(Base):
     __tablename__ = 'market_data'
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    symbol = Column(String(20), nullable=False, index=True)
-    timeframe = Column(String(10), nullable=False, index=True)
-    timestamp = Column(DateTime, nullable=False, index=True)
+    symbol = Column(String(20), nullable=False)
+    timeframe = Column(String(10), nullable=False)
+    timestamp = Column(DateTime, nullable=False)
     open = Column(Float, nullable=False)
     high = Column(Float, nullable=False)
     low = Column(Float, nullable=False)
     close = Column(Float, nullable=False)
     volume = Column(Float, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
+    
+    # Every lookup filters on symbol + timeframe and orders by timestamp, so the
+    # composite index serves them all (the old single-column indexes are dropped)
+    __table_args__ = (
+        Index('uq_market_data_candle', 'symbol', 'timeframe', 'timestamp', unique=True),
+    )
+
+
+OHLCV_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+# Row layout of the get_market_data read path. Timestamps arrive as the ISO
+# strings SQLAlchemy's DateTime type stores and are parsed in one vectorized pass.
+CANDLE_DTYPE = np.dtype([('timestamp', 'U32')] + [(field, 'f8') for field in OHLCV_FIELDS])
+
+LEGACY_MARKET_DATA_INDEXES = ('ix_market_data_symbol', 'ix_market_data_timeframe', 'ix_market_data_timestamp')
+
+# Connection pragmas: WAL lets readers run alongside the writer, NORMAL sync
+# is durable in WAL mode except on power loss, and the larger page cache and
+# in-memory temp store keep bulk inserts and index builds off the disk.
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'temp_store': 'MEMORY',
+    'cache_size': -64000,
+    'busy_timeout': 5000,
+}
 
 
 class TradeModel(Base):
@@ -106,107 +136,177 @@ class SQLiteStorage:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
-        self.engine = create_engine(
-            f'sqlite:///{self.db_path}',
-            connect_args={'check_same_thread': False},
-            poolclass=StaticPool
-        )
+        self.engine = self.new_engine()
         
         Base.metadata.create_all(self.engine)
+        self._ensure_candle_index()
         
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
         
         logger.info(f"SQLite storage initialized at {self.db_path}")
     
-    def save_market_data(self, symbol: str, timeframe: str, ohlcv_data: List[Dict[str, Any]]):
+    def new_engine(self):
+        """
+        Create an engine with its own connection to this database.
+        
+        Returns:
+            SQLAlchemy engine with SQLITE_PRAGMAS applied
+        """
+        # A second connection to ':memory:' would open a separate, empty database
+        if str(self.db_path) == ':memory:' and getattr(self, 'engine', None) is not None:
+            raise ValueError("An in-memory database cannot be opened by a second engine")
+        
+        engine = create_engine(
+            f'sqlite:///{self.db_path}',
+            connect_args={'check_same_thread': False},
+            poolclass=StaticPool
+        )
+        event.listen(engine, 'connect', self._apply_pragmas)
+        return engine
+    
+    @staticmethod
+    def _apply_pragmas(dbapi_connection, connection_record):
+        """Apply SQLITE_PRAGMAS to each new connection."""
+        cursor = dbapi_connection.cursor()
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+    
+    def _ensure_candle_index(self):
+        """
+        Add the unique (symbol, timeframe, timestamp) index to databases created
+        before it existed, dropping duplicate candles first (keeping the oldest row),
+        and drop the single-column indexes it replaces.
+        """
+        with self.engine.begin() as conn:
+            exists = conn.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'uq_market_data_candle'"
+            )).first()
+            if not exists:
+                conn.execute(text(
+                    "DELETE FROM market_data WHERE id NOT IN ("
+                    "SELECT MIN(id) FROM market_data GROUP BY symbol, timeframe, timestamp)"
+                ))
+                conn.execute(text(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS uq_market_data_candle "
+                    "ON market_data (symbol, timeframe, timestamp)"
+                ))
+            
+            for name in LEGACY_MARKET_DATA_INDEXES:
+                conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+    
+    def save_market_data(self, symbol: str, timeframe: str, ohlcv_data: List[Dict[str, Any]],
+                         update: bool = False) -> int:
         """
         Save OHLCV market data to database.
         
+        All candles are written in one transaction with a single executemany
+        INSERT; candles already stored are skipped (or overwritten with update=True)
+        by the unique (symbol, timeframe, timestamp) index.
+        
         Args:
             symbol: Trading symbol
             timeframe: Timeframe (e.g., '1m', '5m', '1h')
             ohlcv_data: List of OHLCV dictionaries
+            update: Overwrite OHLCV values of candles already stored
+            
+        Returns:
+            Number of rows inserted or updated
         """
-        session = self.SessionLocal()
+        if not ohlcv_data:
+            return 0
+        
+        created_at = datetime.utcnow()
+        rows = [{
+            'symbol': symbol,
+            'timeframe': timeframe,
+            'timestamp': candle['timestamp'],
+            'open': candle['open'],
+            'high': candle['high'],
+            'low': candle['low'],
+            'close': candle['close'],
+            'volume': candle['volume'],
+            'created_at': created_at
+        } for candle in ohlcv_data]
+        
+        stmt = sqlite_insert(MarketDataModel.__table__)
+        index_elements = ['symbol', 'timeframe', 'timestamp']
+        if update:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=index_elements,
+                set_={field: stmt.excluded[field] for field in OHLCV_FIELDS}
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=index_elements)
+        
         try:
-            for candle in ohlcv_data:
-                existing = session.query(MarketDataModel).filter_by(
-                    symbol=symbol,
-                    timeframe=timeframe,
-                    timestamp=candle['timestamp']
-                ).first()
-                
-                if not existing:
-                    record = MarketDataModel(
-                        symbol=symbol,
-                        timeframe=timeframe,
-                        timestamp=candle['timestamp'],
-                        open=candle['open'],
-                        high=candle['high'],
-                        low=candle['low'],
-                        close=candle['close'],
-                        volume=candle['volume']
-                    )
-                    session.add(record)
+            with self.engine.begin() as conn:
+                result = conn.execute(stmt, rows)
             
-            session.commit()
             logger.bind(data=True).debug(f"Saved {len(ohlcv_data)} candles for {symbol} {timeframe}")
+            return max(result.rowcount, 0)
         except Exception as e:
-            session.rollback()
             logger.error(f"Error saving market data: {e}")
             raise
-        finally:
-            session.close()
     
     def get_market_data(self, symbol: str, timeframe: str, start_time: Optional[datetime] = None,
-                       end_time: Optional[datetime] = None, limit: int = 1000) -> pd.DataFrame:
+                       end_time: Optional[datetime] = None, limit: Optional[int] = 1000) -> pd.DataFrame:
         """
         Retrieve market data from database.
         
+        Rows are read with a raw cursor over the composite candle index and
+        streamed straight into NumPy arrays (no ORM objects or per-row dicts).
+        
         Args:
             symbol: Trading symbol
             timeframe: Timeframe
             start_time: Start time filter (optional)
             end_time: End time filter (optional)
-            limit: Maximum number of records to retrieve
+            limit: Maximum number of records to retrieve (the most recent ones;
+                None returns every matching record)
             
         Returns:
             DataFrame with OHLCV data
         """
-        session = self.SessionLocal()
+        # Bind filters in the same string format the DateTime column stores
+        dialect = self.engine.dialect
+        process = MarketDataModel.__table__.c.timestamp.type.dialect_impl(dialect).bind_processor(dialect)
+        
+        sql = "SELECT timestamp, open, high, low, close, volume FROM market_data WHERE symbol = ? AND timeframe = ?"
+        params = [symbol, timeframe]
+        if start_time:
+            sql += " AND timestamp >= ?"
+            params.append(process(start_time))
+        if end_time:
+            sql += " AND timestamp <= ?"
+            params.append(process(end_time))
+        
+        if limit is None:
+            sql += " ORDER BY timestamp"
+        else:
+            sql += " ORDER BY timestamp DESC LIMIT ?"
+            params.append(limit)
+        
+        raw = self.engine.raw_connection()
         try:
-            query = session.query(MarketDataModel).filter_by(
-                symbol=symbol,
-                timeframe=timeframe
-            )
-            
-            if start_time:
-                query = query.filter(MarketDataModel.timestamp >= start_time)
-            if end_time:
-                query = query.filter(MarketDataModel.timestamp <= end_time)
-            
-            query = query.order_by(MarketDataModel.timestamp.desc()).limit(limit)
-            
-            records = query.all()
-            
-            if not records:
-                return pd.DataFrame()
-            
-            data = [{
-                'timestamp': r.timestamp,
-                'open': r.open,
-                'high': r.high,
-                'low': r.low,
-                'close': r.close,
-                'volume': r.volume
-            } for r in records]
-            
-            df = pd.DataFrame(data)
-            df = df.sort_values('timestamp').reset_index(drop=True)
-            
-            return df
+            cursor = raw.cursor()
+            cursor.execute(sql, params)
+            rows = np.fromiter(cursor, dtype=CANDLE_DTYPE)
+            cursor.close()
         finally:
-            session.close()
+            raw.close()
+        
+        if len(rows) == 0:
+            return pd.DataFrame()
+        
+        if limit is not None:
+            rows = rows[::-1]
+        
+        df = pd.DataFrame({'timestamp': rows['timestamp'].astype('datetime64[ns]')})
+        for field in OHLCV_FIELDS:
+            df[field] = rows[field]
+        
+        return df
     
     def save_trade(self, trade_data: Dict[str, Any]) -> int:
         """
@@ -220,14 +320,12 @@ class SQLiteStorage:
         """
         session = self.SessionLocal()
         try:
-            trade = TradeModel(**trade_data)
-            session.add(trade)
+            trade_id = self._add_trade(session, trade_data)
             session.commit()
-            session.refresh(trade)
             
-            logger.bind(trade=True).info(f"Saved trade: {trade.side} {trade.size} {trade.symbol} @ {trade.entry_price}")
+            self._log_trade(trade_data)
             
-            return trade.id
+            return trade_id
         except Exception as e:
             session.rollback()
             logger.error(f"Error saving trade: {e}")
@@ -245,10 +343,7 @@ class SQLiteStorage:
         """
         session = self.SessionLocal()
         try:
-            trade = session.query(TradeModel).filter_by(id=trade_id).first()
-            if trade:
-                for key, value in updates.items():
-                    setattr(trade, key, value)
+            if self._update_trade(session, trade_id, updates):
                 session.commit()
                 logger.bind(trade=True).info(f"Updated trade {trade_id}")
             else:
@@ -332,16 +427,8 @@ class SQLiteStorage:
         """
         session = self.SessionLocal()
         try:
-            metric = PerformanceMetricModel(
-                metric_name=metric_name,
-                metric_value=metric_value,
-                symbol=symbol,
-                strategy=strategy,
-                timeframe=timeframe,
-                timestamp=datetime.utcnow(),
-                metadata=json.dumps(metadata) if metadata else None
-            )
-            session.add(metric)
+            self._add_performance_metric(session, metric_name, metric_value, symbol=symbol,
+                                         strategy=strategy, timeframe=timeframe, metadata=metadata)
             session.commit()
             
             logger.bind(performance=True).info(f"Saved metric: {metric_name} = {metric_value}")
@@ -352,34 +439,205 @@ class SQLiteStorage:
         finally:
             session.close()
     
+    def apply_writes(self, operations: List[Tuple[str, tuple, Dict[str, Any]]], engine=None) -> List[Any]:
+        """
+        Apply a batch of write operations in one transaction, in order.
+        
+        Either every operation is committed or none is, so a batch can never
+        leave a later write on disk without the writes queued before it.
+        
+        Args:
+            operations: (name, args, kwargs) tuples, where name is 'save_trade',
+                'update_trade' or 'save_performance_metric' and args/kwargs are
+                those of the method of that name
+            engine: Engine to write through (defaults to this storage's engine)
+            
+        Returns:
+            Per-operation results: the trade ID for save_trade, whether the trade
+            was found for update_trade, None for save_performance_metric
+        """
+        handlers = {
+            'save_trade': self._add_trade,
+            'update_trade': self._update_trade,
+            'save_performance_metric': self._add_performance_metric,
+        }
+        
+        session = self.SessionLocal(bind=engine) if engine is not None else self.SessionLocal()
+        try:
+            results = [handlers[name](session, *args, **kwargs) for name, args, kwargs in operations]
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+        
+        for (name, args, kwargs), result in zip(operations, results):
+            if name == 'save_trade':
+                self._log_trade(*args, **kwargs)
+            elif name == 'update_trade' and not result:
+                logger.warning(f"Trade {args[0] if args else kwargs.get('trade_id')} not found")
+        
+        return results
+    
+    @staticmethod
+    def _add_trade(session, trade_data: Dict[str, Any]) -> int:
+        """Insert a trade in the session's transaction and return its ID."""
+        trade = TradeModel(**trade_data)
+        session.add(trade)
+        session.flush()
+        return trade.id
+    
+    @staticmethod
+    def _update_trade(session, trade_id: int, updates: Dict[str, Any]) -> bool:
+        """Update a trade in the session's transaction; False if it does not exist."""
+        trade = session.get(TradeModel, trade_id)
+        if trade is None:
+            return False
+        for key, value in updates.items():
+            setattr(trade, key, value)
+        session.flush()
+        return True
+    
+    @staticmethod
+    def _add_performance_metric(session, metric_name: str, metric_value: float,
+                                symbol: Optional[str] = None, strategy: Optional[str] = None,
+                                timeframe: Optional[str] = None, metadata: Optional[Dict] = None):
+        """Insert a performance metric in the session's transaction."""
+        session.add(PerformanceMetricModel(
+            metric_name=metric_name,
+            metric_value=metric_value,
+            symbol=symbol,
+            strategy=strategy,
+            timeframe=timeframe,
+            timestamp=datetime.utcnow(),
+            extra_metadata=json.dumps(metadata) if metadata else None
+        ))
+    
+    @staticmethod
+    def _log_trade(trade_data: Dict[str, Any]):
+        """Write a saved trade to the trade log."""
+        logger.bind(trade=True).info(
+            f"Saved trade: {trade_data.get('side')} {trade_data.get('size')} "
+            f"{trade_data.get('symbol')} @ {trade_data.get('entry_price')}"
+        )
+    
     def close(self):
         """Close database connection."""
         self.engine.dispose()
         logger.info("SQLite storage closed")
 
 
+_redis_pools: Dict[str, aioredis.ConnectionPool] = {}
+
+# msgpack extension type for NumPy arrays: (dtype, shape, raw bytes)
+NDARRAY_EXT_TYPE = 1
+
+
+def get_redis_pool(redis_url: str, max_connections: int = 50) -> aioredis.ConnectionPool:
+    """
+    Get the process-wide connection pool for a Redis URL.
+    
+    Every RedisCache for the same URL (MarketDataManager, PriceFeed) borrows
+    connections from this pool instead of opening its own.
+    
+    Args:
+        redis_url: Redis connection URL
+        max_connections: Pool size (used when the pool is created)
+        
+    Returns:
+        Shared connection pool
+    """
+    if redis_url not in _redis_pools:
+        _redis_pools[redis_url] = aioredis.ConnectionPool.from_url(redis_url, max_connections=max_connections)
+    return _redis_pools[redis_url]
+
+
+def _pack_default(value: Any) -> Any:
+    """Encode the non-msgpack types cached values contain."""
+    if isinstance(value, np.ndarray):
+        array = np.ascontiguousarray(value)
+        header = msgpack.packb([array.dtype.str, list(array.shape)])
+        return msgpack.ExtType(NDARRAY_EXT_TYPE, header + array.tobytes())
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (datetime, pd.Timestamp)):
+        return value.isoformat()
+    return str(value)
+
+
+def _unpack_ext(code: int, data: bytes) -> Any:
+    """Decode extension types written by _pack_default."""
+    if code == NDARRAY_EXT_TYPE:
+        unpacker = msgpack.Unpacker()
+        unpacker.feed(data)
+        dtype, shape = unpacker.unpack()
+        return np.frombuffer(data, dtype=dtype, offset=unpacker.tell()).reshape(shape)
+    return msgpack.ExtType(code, data)
+
+
+def pack_value(value: Any) -> bytes:
+    """
+    Serialize a value for the cache.
+    
+    Args:
+        value: msgpack-serializable value; NumPy arrays are stored as raw bytes,
+            NumPy scalars as Python numbers, datetimes as ISO strings
+            
+    Returns:
+        Encoded bytes
+    """
+    return msgpack.packb(value, default=_pack_default, use_bin_type=True)
+
+
+def unpack_value(data: bytes) -> Any:
+    """
+    Deserialize a value written by pack_value.
+    
+    Args:
+        data: Encoded bytes
+        
+    Returns:
+        Decoded value (NumPy arrays come back read-only)
+    """
+    return msgpack.unpackb(data, ext_hook=_unpack_ext, raw=False, strict_map_key=False)
+
+
 class RedisCache:
-    """Redis cache interface for real-time data."""
+    """
+    Redis cache interface for real-time data.
     
-    def __init__(self, redis_url: str = "redis://localhost:6379/0"):
+    Values are msgpack-encoded. Caches for the same URL share one connection
+    pool, set_many/get_many batch keys into a single round trip, and stats
+    counts hits, misses and command latency.
+    """
+    
+    def __init__(self, redis_url: str = "redis://localhost:6379/0", client: Optional[aioredis.Redis] = None):
         """
         Initialize Redis cache.
         
         Args:
             redis_url: Redis connection URL
+            client: Redis client to use instead of the shared pool (optional)
         """
         self.redis_url = redis_url
-        self.redis: Optional[aioredis.Redis] = None
+        self.redis: Optional[aioredis.Redis] = client
+        self.stats: Dict[str, Any] = {
+            'hits': 0,
+            'misses': 0,
+            'writes': 0,
+            'errors': 0,
+            'round_trips': 0,
+            'total_latency_ms': 0.0,
+            'max_latency_ms': 0.0
+        }
         logger.info(f"Redis cache configured with URL: {redis_url}")
     
     async def connect(self):
         """Connect to Redis."""
         try:
-            self.redis = await aioredis.from_url(
-                self.redis_url,
-                encoding="utf-8",
-                decode_responses=True
-            )
+            if self.redis is None:
+                self.redis = aioredis.Redis(connection_pool=get_redis_pool(self.redis_url))
             await self.redis.ping()
             logger.info("Redis cache connected")
         except Exception as e:
@@ -387,28 +645,54 @@ class RedisCache:
             raise
     
     async def disconnect(self):
-        """Disconnect from Redis."""
+        """Disconnect from Redis (the shared pool stays open for other caches)."""
         if self.redis:
-            await self.redis.close()
+            await self.redis.aclose()
             logger.info("Redis cache disconnected")
     
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss and latency counters.
+        
+        Returns:
+            Counters plus hit_rate and avg_latency_ms
+        """
+        stats = dict(self.stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        stats['avg_latency_ms'] = stats['total_latency_ms'] / stats['round_trips'] if stats['round_trips'] else 0.0
+        return stats
+    
+    def _record(self, started: float, hits: int = 0, misses: int = 0, writes: int = 0):
+        """Count one round trip."""
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        stats = self.stats
+        stats['round_trips'] += 1
+        stats['total_latency_ms'] += elapsed_ms
+        stats['max_latency_ms'] = max(stats['max_latency_ms'], elapsed_ms)
+        stats['hits'] += hits
+        stats['misses'] += misses
+        stats['writes'] += writes
+    
     async def set(self, key: str, value: Any, expire: Optional[int] = None):
         """
         Set a value in cache.
         
         Args:
             key: Cache key
-            value: Value to cache (will be JSON serialized)
+            value: Value to cache (msgpack serialized)
             expire: Expiration time in seconds (optional)
         """
         if not self.redis:
             await self.connect()
         
         try:
-            serialized = json.dumps(value)
-            await self.redis.set(key, serialized, ex=expire)
+            started = time.perf_counter()
+            await self.redis.set(key, pack_value(value), ex=expire)
+            self._record(started, writes=1)
             logger.bind(data=True).debug(f"Cached: {key}")
         except Exception as e:
+            self.stats['errors'] += 1
             logger.error(f"Error setting cache key {key}: {e}")
     
     async def get(self, key: str) -> Optional[Any]:
@@ -425,14 +709,73 @@ class RedisCache:
             await self.connect()
         
         try:
+            started = time.perf_counter()
             value = await self.redis.get(key)
-            if value:
-                return json.loads(value)
+            self._record(started, hits=int(value is not None), misses=int(value is None))
+            if value is not None:
+                return unpack_value(value)
             return None
         except Exception as e:
+            self.stats['errors'] += 1
             logger.error(f"Error getting cache key {key}: {e}")
             return None
     
+    async def set_many(self, entries: List[Tuple[str, Any, Optional[int]]],
+                       messages: Optional[List[Tuple[str, Any]]] = None):
+        """
+        Set several values in one pipelined round trip.
+        
+        Args:
+            entries: (key, value, expire) tuples; expire may be None
+            messages: (channel, message) pairs published in the same pipeline
+                (msgpack encoded, like values)
+        """
+        messages = messages or []
+        if not entries and not messages:
+            return
+        if not self.redis:
+            await self.connect()
+        
+        try:
+            started = time.perf_counter()
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, value, expire in entries:
+                    pipe.set(key, pack_value(value), ex=expire)
+                for channel, message in messages:
+                    pipe.publish(channel, pack_value(message))
+                await pipe.execute()
+            self._record(started, writes=len(entries) + len(messages))
+            logger.bind(data=True).debug(f"Cached {len(entries)} keys, published {len(messages)} messages")
+        except Exception as e:
+            self.stats['errors'] += 1
+            logger.error(f"Error setting {len(entries)} cache keys: {e}")
+    
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get several values in one round trip.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Dictionary of the keys found and their values
+        """
+        if not keys:
+            return {}
+        if not self.redis:
+            await self.connect()
+        
+        try:
+            started = time.perf_counter()
+            values = await self.redis.mget(keys)
+            found = {key: unpack_value(value) for key, value in zip(keys, values) if value is not None}
+            self._record(started, hits=len(found), misses=len(keys) - len(found))
+            return found
+        except Exception as e:
+            self.stats['errors'] += 1
+            logger.error(f"Error getting {len(keys)} cache keys: {e}")
+            return {}
+    
     async def delete(self, key: str):
         """
         Delete a key from cache.
@@ -0,0 +1,832 @@
+"""
+Streaming Indicators Module
+
+Incremental (O(1) per bar) versions of the indicators PriceFeed computes on
+every candle close. Each indicator keeps its own running state and reproduces
+the TA-Lib / pandas batch values in TechnicalIndicators and
+PriceFeed._calculate_indicators when fed the same bars.
+
+Every state object supports undo() of its most recent push, so the forming
+candle at the end of the window can be revised when it closes.
+"""
+
+import math
+from collections import deque
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+NAN = float('nan')
+
+# Output columns in the order PriceFeed._calculate_indicators produces them
+INDICATOR_COLUMNS = [
+    'rsi', 'ema_12', 'ema_26', 'macd', 'macd_signal', 'macd_hist',
+    'bb_upper', 'bb_middle', 'bb_lower', 'bb_width', 'atr', 'adx', 'obv', 'vwap',
+    'sma_20', 'sma_50', 'sma_200', 'sma_5', 'std_dev',
+    'volume_avg', 'volume_trend', 'price_change_pct', 'roc',
+    'macd_histogram', 'ema_12_prev', 'ema_26_prev', 'macd_histogram_prev',
+    'donchian_high_20', 'donchian_low_20', 'donchian_high_10', 'donchian_low_10',
+    'keltner_middle', 'keltner_upper', 'keltner_lower',
+    'supertrend', 'supertrend_direction',
+    'tenkan_sen', 'kijun_sen', 'senkou_span_a', 'senkou_span_b', 'chikou_span',
+    'rsi_2'
+]
+
+# chikou_span is close.shift(-26), forward-filled by the batch path
+CHIKOU_LAG = 26
+
+
+def _is_zero(value: float) -> bool:
+    """TA-Lib's TA_IS_ZERO"""
+    return -0.00000001 < value < 0.00000001
+
+
+def _pct_change(current: float, previous: float) -> float:
+    """pandas pct_change for scalars (x / prev - 1, inf/nan on zero)"""
+    if previous == 0:
+        if current == 0 or current != current:
+            return NAN
+        return math.copysign(math.inf, current)
+    return current / previous - 1
+
+
+class _EMA:
+    """TA-Lib EMA: seeded with the SMA of the first `period` values after `delay`"""
+    __slots__ = ('period', 'k', 'delay', 'count', 'seed', 'value', '_undo')
+
+    def __init__(self, period: int, delay: int = 0):
+        self.period = period
+        self.k = 2.0 / (period + 1)
+        self.delay = delay
+        self.count = 0
+        self.seed = 0.0
+        self.value = NAN
+        self._undo = None
+
+    def push(self, x: float) -> float:
+        self._undo = (self.count, self.seed, self.value)
+        self.count += 1
+        n = self.count - self.delay
+        if n <= 0:
+            return self.value
+        if n < self.period:
+            self.seed += x
+        elif n == self.period:
+            self.seed += x
+            self.value = self.seed / self.period
+        else:
+            self.value = ((x - self.value) * self.k) + self.value
+        return self.value
+
+    def undo(self):
+        self.count, self.seed, self.value = self._undo
+
+
+class _RSI:
+    """TA-Lib RSI with Wilder smoothing of average gain/loss"""
+    __slots__ = ('period', 'count', 'prev_close', 'gain', 'loss', 'value', '_undo')
+
+    def __init__(self, period: int):
+        self.period = period
+        self.count = 0
+        self.prev_close = NAN
+        self.gain = 0.0
+        self.loss = 0.0
+        self.value = NAN
+        self._undo = None
+
+    def push(self, close: float) -> float:
+        self._undo = (self.count, self.prev_close, self.gain, self.loss, self.value)
+        self.count += 1
+        if self.count == 1:
+            self.prev_close = close
+            return self.value
+
+        diff = close - self.prev_close
+        self.prev_close = close
+        period = self.period
+
+        if self.count <= period + 1:
+            if diff < 0:
+                self.loss -= diff
+            else:
+                self.gain += diff
+            if self.count < period + 1:
+                return self.value
+            self.loss /= period
+            self.gain /= period
+        else:
+            self.loss *= (period - 1)
+            self.gain *= (period - 1)
+            if diff < 0:
+                self.loss -= diff
+            else:
+                self.gain += diff
+            self.loss /= period
+            self.gain /= period
+
+        total = self.gain + self.loss
+        self.value = 100.0 * (self.gain / total) if not _is_zero(total) else 0.0
+        return self.value
+
+    def undo(self):
+        self.count, self.prev_close, self.gain, self.loss, self.value = self._undo
+
+
+def _true_range(high: float, low: float, prev_close: float) -> float:
+    """TA-Lib TRUE_RANGE"""
+    value = high - low
+    other = abs(high - prev_close)
+    if other > value:
+        value = other
+    other = abs(low - prev_close)
+    if other > value:
+        value = other
+    return value
+
+
+class _ATR:
+    """TA-Lib ATR: SMA of the first `period` true ranges, then Wilder smoothing"""
+    __slots__ = ('period', 'count', 'prev_close', 'total', 'value', '_undo')
+
+    def __init__(self, period: int):
+        self.period = period
+        self.count = 0
+        self.prev_close = NAN
+        self.total = 0.0
+        self.value = NAN
+        self._undo = None
+
+    def push(self, high: float, low: float, close: float) -> float:
+        self._undo = (self.count, self.prev_close, self.total, self.value)
+        self.count += 1
+        prev_close = self.prev_close
+        self.prev_close = close
+        if self.count == 1:
+            return self.value
+
+        tr = _true_range(high, low, prev_close)
+        period = self.period
+        if self.count <= period + 1:
+            self.total += tr
+            if self.count == period + 1:
+                self.value = self.total / period
+        else:
+            self.value = (self.value * (period - 1) + tr) / period
+        return self.value
+
+    def undo(self):
+        self.count, self.prev_close, self.total, self.value = self._undo
+
+
+class _ADX:
+    """TA-Lib ADX (Wilder-smoothed +DM/-DM/TR, DX summed over the second period)"""
+    __slots__ = (
+        'period', 'count', 'prev_high', 'prev_low', 'prev_close',
+        'plus_dm', 'minus_dm', 'tr', 'sum_dx', 'value', '_undo'
+    )
+
+    def __init__(self, period: int):
+        self.period = period
+        self.count = 0
+        self.prev_high = NAN
+        self.prev_low = NAN
+        self.prev_close = NAN
+        self.plus_dm = 0.0
+        self.minus_dm = 0.0
+        self.tr = 0.0
+        self.sum_dx = 0.0
+        self.value = NAN
+        self._undo = None
+
+    def _dx(self) -> Optional[float]:
+        if _is_zero(self.tr):
+            return None
+        minus_di = 100.0 * (self.minus_dm / self.tr)
+        plus_di = 100.0 * (self.plus_dm / self.tr)
+        total = minus_di + plus_di
+        if _is_zero(total):
+            return None
+        return 100.0 * (abs(minus_di - plus_di) / total)
+
+    def push(self, high: float, low: float, close: float) -> float:
+        self._undo = (
+            self.count, self.prev_high, self.prev_low, self.prev_close,
+            self.plus_dm, self.minus_dm, self.tr, self.sum_dx, self.value
+        )
+        self.count += 1
+        period = self.period
+
+        if self.count == 1:
+            self.prev_high, self.prev_low, self.prev_close = high, low, close
+            return self.value
+
+        diff_p = high - self.prev_high
+        diff_m = self.prev_low - low
+        self.prev_high = high
+        self.prev_low = low
+        tr = _true_range(high, low, self.prev_close)
+        self.prev_close = close
+
+        if self.count > period:
+            self.minus_dm -= self.minus_dm / period
+            self.plus_dm -= self.plus_dm / period
+        if diff_m > 0 and diff_p < diff_m:
+            self.minus_dm += diff_m
+        elif diff_p > 0 and diff_p > diff_m:
+            self.plus_dm += diff_p
+
+        if self.count <= period:
+            self.tr += tr
+            return self.value
+
+        self.tr = self.tr - (self.tr / period) + tr
+        dx = self._dx()
+
+        if self.count < 2 * period:
+            if dx is not None:
+                self.sum_dx += dx
+        elif self.count == 2 * period:
+            if dx is not None:
+                self.sum_dx += dx
+            self.value = self.sum_dx / period
+        elif dx is not None:
+            self.value = ((self.value * (period - 1)) + dx) / period
+        return self.value
+
+    def undo(self):
+        (
+            self.count, self.prev_high, self.prev_low, self.prev_close,
+            self.plus_dm, self.minus_dm, self.tr, self.sum_dx, self.value
+        ) = self._undo
+
+
+class _RollingWindow:
+    """
+    Fixed-length window with running sums for mean and variance
+
+    Sums are kept relative to a shift value so the variance does not lose
+    precision on large prices; they are rebuilt from the buffer once per
+    `period` pushes to stop floating-point drift.
+    """
+    __slots__ = ('period', 'values', 'shift', 'total', 'total_sq', 'pushes', '_undo')
+
+    def __init__(self, period: int):
+        self.period = period
+        self.values = deque()
+        self.shift = NAN
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.pushes = 0
+        self._undo = None
+
+    def push(self, x: float):
+        evicted = None
+        self._undo = (self.shift, self.total, self.total_sq, self.pushes)
+
+        if self.shift != self.shift:
+            self.shift = x
+        self.values.append(x)
+        d = x - self.shift
+        self.total += d
+        self.total_sq += d * d
+
+        if len(self.values) > self.period:
+            evicted = self.values.popleft()
+            d = evicted - self.shift
+            self.total -= d
+            self.total_sq -= d * d
+        self._undo += (evicted,)
+
+        self.pushes += 1
+        if self.pushes % self.period == 0:
+            self._resync()
+
+    def _resync(self):
+        self.shift = sum(self.values) / len(self.values)
+        self.total = 0.0
+        self.total_sq = 0.0
+        for value in self.values:
+            d = value - self.shift
+            self.total += d
+            self.total_sq += d * d
+
+    def undo(self):
+        self.shift, self.total, self.total_sq, self.pushes, evicted = self._undo
+        self.values.pop()
+        if evicted is not None:
+            self.values.appendleft(evicted)
+
+    @property
+    def full(self) -> bool:
+        return len(self.values) == self.period
+
+    def mean(self) -> float:
+        if not self.full:
+            return NAN
+        return self.shift + self.total / self.period
+
+    def variance(self, ddof: int = 0) -> float:
+        if not self.full or self.period <= ddof:
+            return NAN
+        n = self.period
+        variance = (self.total_sq - self.total * self.total / n) / (n - ddof)
+        return variance if variance > 0 else 0.0
+
+
+class _RollingExtreme:
+    """Rolling max (or min) over a monotonic deque of (index, value)"""
+    __slots__ = ('period', 'sign', 'window', 'count', '_undo')
+
+    def __init__(self, period: int, maximum: bool = True):
+        self.period = period
+        self.sign = 1.0 if maximum else -1.0
+        self.window = deque()
+        self.count = 0
+        self._undo = None
+
+    def push(self, x: float):
+        x = self.sign * x
+        index = self.count
+        self.count += 1
+
+        window = self.window
+        popped = []
+        while window and window[-1][1] <= x:
+            popped.append(window.pop())
+        window.append((index, x))
+
+        expired = None
+        if window[0][0] <= index - self.period:
+            expired = window.popleft()
+        self._undo = (popped, expired)
+
+    def undo(self):
+        popped, expired = self._undo
+        if expired is not None:
+            self.window.appendleft(expired)
+        self.window.pop()
+        self.window.extend(reversed(popped))
+        self.count -= 1
+
+    def value(self) -> float:
+        if self.count < self.period:
+            return NAN
+        return self.sign * self.window[0][1]
+
+
+class _Delay:
+    """Value pushed `lag` bars ago (pandas shift)"""
+    __slots__ = ('lag', 'values', '_undo')
+
+    def __init__(self, lag: int):
+        self.lag = lag
+        self.values = deque()
+        self._undo = None
+
+    def push(self, x: float):
+        self.values.append(x)
+        self._undo = self.values.popleft() if len(self.values) > self.lag + 1 else None
+
+    def undo(self):
+        self.values.pop()
+        if self._undo is not None:
+            self.values.appendleft(self._undo)
+
+    def value(self) -> float:
+        if len(self.values) <= self.lag:
+            return NAN
+        return self.values[0]
+
+
+class _EWMA:
+    """pandas ewm(span=...).mean() with adjust=True"""
+    __slots__ = ('alpha', 'weighted', 'old_wt', '_undo')
+
+    def __init__(self, span: int):
+        self.alpha = 1.0 / (1.0 + (span - 1) / 2.0)
+        self.weighted = NAN
+        self.old_wt = 1.0
+        self._undo = None
+
+    def push(self, x: float) -> float:
+        self._undo = (self.weighted, self.old_wt)
+        if self.weighted != self.weighted:
+            self.weighted = x
+            self.old_wt = 1.0
+        elif x == x:
+            self.old_wt *= 1.0 - self.alpha
+            if self.weighted != x:
+                self.weighted = ((self.old_wt * self.weighted) + x) / (self.old_wt + 1.0)
+            self.old_wt += 1.0
+        return self.weighted
+
+    def undo(self):
+        self.weighted, self.old_wt = self._undo
+
+
+class _AnchoredWindow:
+    """
+    OBV and VWAP anchored at the first bar of the rolling window
+
+    The batch path recomputes both from the first row of the (tail-truncated)
+    window, so they are kept as running sums over the same `window` bars.
+    """
+    __slots__ = ('window', 'bars', 'pv', 'volume', 'signed', 'prev_close', 'pushes', '_undo')
+
+    def __init__(self, window: int):
+        self.window = window
+        self.bars = deque()
+        self.pv = 0.0
+        self.volume = 0.0
+        self.signed = 0.0
+        self.prev_close = NAN
+        self.pushes = 0
+        self._undo = None
+
+    def push(self, high: float, low: float, close: float, volume: float):
+        undo = (self.pv, self.volume, self.signed, self.prev_close, self.pushes)
+
+        if close > self.prev_close:
+            signed = volume
+        elif close < self.prev_close:
+            signed = -volume
+        else:
+            signed = 0.0
+        self.prev_close = close
+
+        pv = (high + low + close) / 3 * volume
+        self.bars.append((pv, volume, signed))
+        self.pv += pv
+        self.volume += volume
+        self.signed += signed
+
+        evicted = None
+        if len(self.bars) > self.window:
+            evicted = self.bars.popleft()
+            self.pv -= evicted[0]
+            self.volume -= evicted[1]
+            self.signed -= evicted[2]
+        self._undo = undo + (evicted,)
+
+        self.pushes += 1
+        if self.pushes % self.window == 0:
+            self.pv = sum(bar[0] for bar in self.bars)
+            self.volume = sum(bar[1] for bar in self.bars)
+            self.signed = sum(bar[2] for bar in self.bars)
+
+    def undo(self):
+        self.pv, self.volume, self.signed, self.prev_close, self.pushes, evicted = self._undo
+        self.bars.pop()
+        if evicted is not None:
+            self.bars.appendleft(evicted)
+
+    def obv(self) -> float:
+        first = self.bars[0]
+        return first[1] + (self.signed - first[2])
+
+    def vwap(self) -> float:
+        if self.volume == 0:
+            return NAN
+        return self.pv / self.volume
+
+
+class StreamingIndicators:
+    """
+    Incremental indicator engine for one symbol/timeframe window.
+
+    Produces the same columns as PriceFeed._calculate_indicators for each new
+    bar in O(1), instead of recomputing every indicator over the whole window.
+    Values match the batch path to floating-point precision once past warmup,
+    as long as the window holds enough bars for the recursive indicators
+    (EMA, RSI, ATR, ADX) to forget their seed.
+    """
+
+    def __init__(self, window: int = 500, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize streaming indicators.
+
+        Args:
+            window: Rolling window length (candle lookback) OBV/VWAP are anchored to
+            config: TechnicalIndicators config (same keys and defaults)
+        """
+        config = config or {}
+        macd_config = config.get('macd', {})
+        bb_config = config.get('bollinger_bands', {})
+
+        fast = macd_config.get('fast', 12)
+        slow = macd_config.get('slow', 26)
+        if slow < fast:
+            fast, slow = slow, fast
+
+        self.window = window
+        self.count = 0
+        self.bb_std_dev = bb_config.get('std_dev', 2)
+
+        self._rsi = _RSI(config.get('rsi', {}).get('period', 14))
+        self._ema_12 = _EMA(12)
+        self._ema_26 = _EMA(26)
+        self._macd_fast = _EMA(fast, delay=slow - fast)
+        self._macd_slow = _EMA(slow)
+        self._macd_signal = _EMA(macd_config.get('signal', 9), delay=slow - 1)
+        self._bb = _RollingWindow(bb_config.get('period', 20))
+        self._atr = _ATR(config.get('atr', {}).get('period', 14))
+        self._adx = _ADX(14)
+        self._anchored = _AnchoredWindow(window)
+
+        self._sma_5 = _RollingWindow(5)
+        self._sma_20 = _RollingWindow(20)
+        self._sma_50 = _RollingWindow(50)
+        self._sma_200 = _RollingWindow(200)
+        self._volume_20 = _RollingWindow(20)
+        self._close_lag = _Delay(5)
+        self._volume_lag = _Delay(5)
+
+        self._high_20 = _RollingExtreme(20)
+        self._low_20 = _RollingExtreme(20, maximum=False)
+        self._high_10 = _RollingExtreme(10)
+        self._low_10 = _RollingExtreme(10, maximum=False)
+        self._high_9 = _RollingExtreme(9)
+        self._low_9 = _RollingExtreme(9, maximum=False)
+        self._high_26 = _RollingExtreme(26)
+        self._low_26 = _RollingExtreme(26, maximum=False)
+        self._high_52 = _RollingExtreme(52)
+        self._low_52 = _RollingExtreme(52, maximum=False)
+        self._senkou_a = _Delay(26)
+        self._senkou_b = _Delay(26)
+
+        self._keltner = _EWMA(20)
+        self._gain_loss = _Delay(1)
+
+        self._states = [
+            value for value in vars(self).values()
+            if hasattr(value, 'undo')
+        ]
+        self._last: Dict[str, float] = {}
+        self._undo = None
+
+    def update(
+        self,
+        open_: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float
+    ) -> Dict[str, float]:
+        """
+        Add a new bar.
+
+        Args:
+            open_: Open price
+            high: High price
+            low: Low price
+            close: Close price
+            volume: Volume
+
+        Returns:
+            Dictionary of indicator values for the bar (NaN during warmup)
+        """
+        self._undo = (self.count, self._last)
+        self.count += 1
+
+        rsi = self._rsi.push(close)
+        ema_12 = self._ema_12.push(close)
+        ema_26 = self._ema_26.push(close)
+
+        fast = self._macd_fast.push(close)
+        slow = self._macd_slow.push(close)
+        line = fast - slow
+        signal = self._macd_signal.push(line)
+        macd = macd_signal = macd_hist = NAN
+        if signal == signal:
+            macd = line
+            macd_signal = signal
+            macd_hist = line - signal
+
+        self._bb.push(close)
+        bb_middle = self._bb.mean()
+        bb_upper = bb_lower = bb_width = NAN
+        if bb_middle == bb_middle:
+            variance = self._bb.variance()
+            std = math.sqrt(variance) if variance >= 0.00000001 else 0.0
+            band = std * self.bb_std_dev
+            bb_upper = bb_middle + band
+            bb_lower = bb_middle - band
+            bb_width = ((bb_upper - bb_lower) / bb_middle) * 100
+
+        atr = self._atr.push(high, low, close)
+        adx = self._adx.push(high, low, close)
+        self._anchored.push(high, low, close, volume)
+
+        self._sma_5.push(close)
+        self._sma_20.push(close)
+        self._sma_50.push(close)
+        self._sma_200.push(close)
+        self._volume_20.push(volume)
+        std_dev = self._sma_20.variance(ddof=1)
+        if std_dev == std_dev:
+            std_dev = math.sqrt(std_dev)
+
+        self._close_lag.push(close)
+        self._volume_lag.push(volume)
+        close_5 = self._close_lag.value()
+        volume_5 = self._volume_lag.value()
+        prev_close = self._close_lag.values[-2] if len(self._close_lag.values) > 1 else NAN
+
+        for extreme, value in (
+            (self._high_20, high), (self._low_20, low),
+            (self._high_10, high), (self._low_10, low),
+            (self._high_9, high), (self._low_9, low),
+            (self._high_26, high), (self._low_26, low),
+            (self._high_52, high), (self._low_52, low)
+        ):
+            extreme.push(value)
+
+        tenkan_sen = (self._high_9.value() + self._low_9.value()) / 2
+        kijun_sen = (self._high_26.value() + self._low_26.value()) / 2
+        self._senkou_a.push((tenkan_sen + kijun_sen) / 2)
+        self._senkou_b.push((self._high_52.value() + self._low_52.value()) / 2)
+
+        keltner_middle = self._keltner.push(close)
+        supertrend = (high + low) / 2 + (3.0 * atr)
+
+        if prev_close == prev_close:
+            delta = close - prev_close
+            gain, loss = (delta if delta > 0 else 0.0), (-delta if delta < 0 else 0.0)
+        else:
+            gain = loss = 0.0
+        self._gain_loss.push((gain, loss))
+        rsi_2 = NAN
+        if len(self._gain_loss.values) == 2:
+            (prev_gain, prev_loss), _ = self._gain_loss.values
+            rs = ((prev_gain + gain) / 2) / (((prev_loss + loss) / 2) + 1e-10)
+            rsi_2 = 100 - (100 / (1 + rs))
+
+        previous = self._last
+        self._last = {
+            'rsi': rsi,
+            'ema_12': ema_12,
+            'ema_26': ema_26,
+            'macd': macd,
+            'macd_signal': macd_signal,
+            'macd_hist': macd_hist,
+            'bb_upper': bb_upper,
+            'bb_middle': bb_middle,
+            'bb_lower': bb_lower,
+            'bb_width': bb_width,
+            'atr': atr,
+            'adx': adx,
+            'obv': self._anchored.obv(),
+            'vwap': self._anchored.vwap(),
+            'sma_20': self._sma_20.mean(),
+            'sma_50': self._sma_50.mean(),
+            'sma_200': self._sma_200.mean(),
+            'sma_5': self._sma_5.mean(),
+            'std_dev': std_dev,
+            'volume_avg': self._volume_20.mean(),
+            'volume_trend': _pct_change(volume, volume_5) * 100,
+            'price_change_pct': _pct_change(close, prev_close) * 100,
+            'roc': _pct_change(close, close_5) * 100,
+            'macd_histogram': macd_hist,
+            'ema_12_prev': previous.get('ema_12', NAN),
+            'ema_26_prev': previous.get('ema_26', NAN),
+            'macd_histogram_prev': previous.get('macd_histogram', NAN),
+            'donchian_high_20': self._high_20.value(),
+            'donchian_low_20': self._low_20.value(),
+            'donchian_high_10': self._high_10.value(),
+            'donchian_low_10': self._low_10.value(),
+            'keltner_middle': keltner_middle,
+            'keltner_upper': keltner_middle + (2.0 * atr),
+            'keltner_lower': keltner_middle - (2.0 * atr),
+            'supertrend': supertrend,
+            'supertrend_direction': int(close > supertrend),
+            'tenkan_sen': tenkan_sen,
+            'kijun_sen': kijun_sen,
+            'senkou_span_a': self._senkou_a.value(),
+            'senkou_span_b': self._senkou_b.value(),
+            'chikou_span': NAN,
+            'rsi_2': rsi_2
+        }
+        return self._last
+
+    def revise(
+        self,
+        open_: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float
+    ) -> Dict[str, float]:
+        """
+        Replace the most recent bar (e.g. the forming candle once it closes).
+
+        Args:
+            open_: Open price
+            high: High price
+            low: Low price
+            close: Close price
+            volume: Volume
+
+        Returns:
+            Dictionary of indicator values for the revised bar
+        """
+        if self._undo is None:
+            raise ValueError("No bar to revise")
+
+        for state in self._states:
+            state.undo()
+        self.count, self._last = self._undo
+        return self.update(open_, high, low, close, volume)
+
+    def seed(self, df: pd.DataFrame) -> None:
+        """
+        Replay a window of OHLCV bars to build up indicator state.
+
+        Args:
+            df: DataFrame with open/high/low/close/volume columns
+        """
+        columns = [df[col].to_numpy(dtype=np.float64) for col in ('open', 'high', 'low', 'close', 'volume')]
+        for open_, high, low, close, volume in zip(*(col.tolist() for col in columns)):
+            self.update(open_, high, low, close, volume)
+
+    @property
+    def latest(self) -> Dict[str, float]:
+        """Indicator values of the most recent bar"""
+        return dict(self._last)
+
+
+def anchored_obv_vwap(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    OBV and VWAP accumulated from the first bar of a window.
+
+    The batch path accumulates both from the window's first bar, so every row
+    shifts when the window slides; this redoes that in one vectorized pass.
+
+    Args:
+        high: High prices
+        low: Low prices
+        close: Close prices
+        volume: Volumes
+
+    Returns:
+        (obv, vwap) arrays
+    """
+    close = np.asarray(close, dtype=np.float64)
+    volume = np.asarray(volume, dtype=np.float64)
+
+    signed = np.where(np.diff(close) > 0, volume[1:], np.where(np.diff(close) < 0, -volume[1:], 0.0))
+    obv = np.cumsum(np.concatenate((volume[:1], signed)))
+
+    typical_price = (np.asarray(high, dtype=np.float64) + np.asarray(low, dtype=np.float64) + close) / 3
+    vwap = np.cumsum(typical_price * volume) / np.cumsum(volume)
+    return obv, vwap
+
+
+def anchor_cumulative(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Re-anchor OBV and VWAP at the first row of a window (in place).
+
+    Args:
+        df: Window with OHLCV, obv and vwap columns
+
+    Returns:
+        The same DataFrame
+    """
+    df['obv'], df['vwap'] = anchored_obv_vwap(df['high'], df['low'], df['close'], df['volume'])
+    return df
+
+
+def find_mismatches(
+    expected: pd.DataFrame,
+    actual: pd.DataFrame,
+    rtol: float = 1e-6,
+    atol: float = 1e-8
+) -> List[str]:
+    """
+    Compare streaming output against the batch path.
+
+    Args:
+        expected: Batch-computed rows
+        actual: Streaming rows with the same index
+        rtol: Relative tolerance
+        atol: Absolute tolerance
+
+    Returns:
+        Names of the columns that differ (empty when equivalent)
+    """
+    mismatches = []
+    for col in expected.columns:
+        if col not in actual.columns:
+            mismatches.append(col)
+            continue
+        a = expected[col].to_numpy(dtype=np.float64)
+        b = actual[col].to_numpy(dtype=np.float64)
+        if not np.allclose(a, b, rtol=rtol, atol=atol, equal_nan=True):
+            mismatches.append(col)
+    return mismatches
@@ -0,0 +1,223 @@
+"""
+Write-Behind Persistence
+
+Async front end for SQLiteStorage trade and metric writes. Operations are
+queued from the event loop and committed in batches on a dedicated writer
+thread, so trading loops never wait on disk I/O.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
+
+from ..utils.logger import get_logger
+from .storage import SQLiteStorage
+
+logger = get_logger()
+
+
+class AsyncWriteBehind:
+    """
+    Bounded write-behind queue in front of SQLiteStorage.
+
+    Guarantees:
+    - Operations are applied first in, first out, by a single writer thread
+      with its own database connection.
+    - Each batch is one transaction (one per operation when a failed batch is
+      retried), so after a crash the database holds a prefix of the queued
+      operations, minus rejected ones; at most the uncommitted tail is lost.
+    - A failed operation and the rest of its batch are rejected (their futures
+      raise) and not retried; the operations before it in the batch are
+      committed. Later batches are applied normally, without the rejected ones.
+    - A full queue makes callers wait (backpressure) instead of growing memory.
+    - close() commits everything queued before returning.
+
+    Usage:
+        writer = AsyncWriteBehind(storage)
+        await writer.start()
+        trade_id = await (await writer.save_trade(trade_data))
+        await writer.update_trade(trade_id, {'status': 'closed'})   # fire and forget
+        await writer.close()
+    """
+
+    def __init__(self, storage: SQLiteStorage, max_queue: int = 10000,
+                 batch_size: int = 500, flush_interval: float = 0.25):
+        """
+        Initialize write-behind queue.
+
+        Args:
+            storage: SQLite storage to write to
+            max_queue: Maximum number of queued operations before callers wait
+            batch_size: Maximum number of operations per transaction
+            flush_interval: Seconds to collect operations into a batch after
+                the first one arrives
+        """
+        if max_queue < 1 or batch_size < 1:
+            raise ValueError("max_queue and batch_size must be at least 1")
+        if flush_interval < 0:
+            raise ValueError("flush_interval must be non-negative")
+
+        self.storage = storage
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._engine = None
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        """Number of operations queued but not yet committed."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def start(self):
+        """Start the writer."""
+        if self._task is not None:
+            return
+
+        self._engine = self.storage.new_engine()
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sqlite-writer')
+        self._closed = False
+        self._task = asyncio.create_task(self._run())
+
+        logger.info(f"Write-behind persistence started (max queue {self.max_queue}, batch {self.batch_size})")
+
+    async def save_trade(self, trade_data: Dict[str, Any]) -> asyncio.Future:
+        """
+        Queue a trade insert.
+
+        Args:
+            trade_data: Dictionary containing trade information
+
+        Returns:
+            Future resolving to the trade ID once committed
+        """
+        return await self._enqueue('save_trade', (trade_data,), {})
+
+    async def update_trade(self, trade_id: int, updates: Dict[str, Any]) -> asyncio.Future:
+        """
+        Queue a trade update.
+
+        Args:
+            trade_id: Trade ID
+            updates: Dictionary of fields to update
+
+        Returns:
+            Future resolving to whether the trade was found, once committed
+        """
+        return await self._enqueue('update_trade', (trade_id, updates), {})
+
+    async def save_performance_metric(self, metric_name: str, metric_value: float,
+                                      **kwargs) -> asyncio.Future:
+        """
+        Queue a performance metric insert.
+
+        Args:
+            metric_name: Name of the metric
+            metric_value: Value of the metric
+            **kwargs: symbol, strategy, timeframe and metadata as for
+                SQLiteStorage.save_performance_metric
+
+        Returns:
+            Future resolving once committed
+        """
+        return await self._enqueue('save_performance_metric', (metric_name, metric_value), kwargs)
+
+    async def flush(self):
+        """Wait until every operation queued so far is committed."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self):
+        """Commit everything queued, then stop the writer."""
+        if self._task is None:
+            return
+
+        self._closed = True
+        await self.flush()
+
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+        self._executor.shutdown(wait=True)
+        self._engine.dispose()
+
+        logger.info("Write-behind persistence stopped")
+
+    async def _enqueue(self, name: str, args: tuple, kwargs: Dict[str, Any]) -> asyncio.Future:
+        """Queue an operation, waiting while the queue is full."""
+        if self._task is None or self._closed:
+            raise RuntimeError("Write-behind persistence is not running")
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((name, args, kwargs, future))
+        return future
+
+    async def _run(self):
+        """Collect operations into batches and commit them on the writer thread."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            results = await loop.run_in_executor(self._executor, self._write, batch)
+
+            for (_, _, _, future), result in zip(batch, results):
+                if not future.done():
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+                self._queue.task_done()
+
+    def _write(self, batch: List[tuple]) -> List[Any]:
+        """
+        Commit a batch (runs on the writer thread).
+
+        A failing batch is retried one operation per transaction, in order, up
+        to the operation that fails; that operation and the rest of the batch
+        are rejected, so nothing is written past a failed write.
+        """
+        operations = [(name, args, kwargs) for name, args, kwargs, _ in batch]
+        try:
+            return self.storage.apply_writes(operations, engine=self._engine)
+        except Exception as e:
+            logger.warning(f"Write-behind batch of {len(operations)} failed ({e}), retrying one at a time")
+
+        results = []
+        for i, operation in enumerate(operations):
+            try:
+                results.append(self.storage.apply_writes([operation], engine=self._engine)[0])
+            except Exception as e:
+                logger.error(
+                    f"Write-behind {operation[0]} failed: {e}; "
+                    f"rejecting {len(operations) - i - 1} later operations of its batch"
+                )
+                results.append(e)
+                results.extend(
+                    RuntimeError(f"Not written: an earlier {operation[0]} in the same batch failed ({e})")
+                    for _ in operations[i + 1:]
+                )
+                break
+        return results
@@ -10,6 +10,8 @@ from typing import Dict, List, Optional, Any
 import ccxt
 from loguru import logger
 
+from ..utils.rate_limiter import get_rate_limiter, request_weight
+
 
 class ExchangeInterface(ABC):
     """
@@ -49,6 +51,18 @@ class ExchangeInterface(ABC):
     async def get_positions(self) -> List[Dict[str, Any]]:
         """Get open positions"""
         pass
+    
+    async def _acquire(self, endpoint: str, weight: float = 1.0) -> None:
+        """Wait for budget on the exchange's shared rate limiter"""
+        rate_limiter = getattr(self, 'rate_limiter', None)
+        if rate_limiter is not None:
+            await rate_limiter.acquire(endpoint, weight)
+    
+    def _check_rate_limit_error(self, endpoint: str, error: Exception) -> None:
+        """Back off all callers of an endpoint class after a rate limit rejection"""
+        rate_limiter = getattr(self, 'rate_limiter', None)
+        if rate_limiter is not None and isinstance(error, (ccxt.RateLimitExceeded, ccxt.DDoSProtection)):
+            rate_limiter.penalize(endpoint)
 
 
 class BinanceExchange(ExchangeInterface):
@@ -70,6 +84,7 @@ class BinanceExchange(ExchangeInterface):
         self.api_key = api_key
         self.api_secret = api_secret
         self.testnet = testnet
+        self.rate_limiter = get_rate_limiter('binance')
         
         if testnet:
             self.exchange = ccxt.binance({
@@ -120,6 +135,8 @@ class BinanceExchange(ExchangeInterface):
             if client_order_id:
                 params['clientOrderId'] = client_order_id
             
+            await self._acquire('orders')
+            
             if order_type == 'MARKET':
                 order = await self.exchange.create_market_order(
                     symbol=symbol,
@@ -164,6 +181,7 @@ class BinanceExchange(ExchangeInterface):
             }
             
         except Exception as e:
+            self._check_rate_limit_error('orders', e)
             logger.error(f"Failed to submit order: {e}")
             raise
     
@@ -179,10 +197,12 @@ class BinanceExchange(ExchangeInterface):
             Cancellation response
         """
         try:
+            await self._acquire('orders')
             result = await self.exchange.cancel_order(order_id, symbol)
             logger.info(f"Order canceled: {order_id}")
             return result
         except Exception as e:
+            self._check_rate_limit_error('orders', e)
             logger.error(f"Failed to cancel order {order_id}: {e}")
             raise
     
@@ -198,6 +218,7 @@ class BinanceExchange(ExchangeInterface):
             Order status information
         """
         try:
+            await self._acquire('account')
             order = await self.exchange.fetch_order(order_id, symbol)
             return {
                 'order_id': order.get('id'),
@@ -214,6 +235,7 @@ class BinanceExchange(ExchangeInterface):
                 'timestamp': order.get('timestamp')
             }
         except Exception as e:
+            self._check_rate_limit_error('account', e)
             logger.error(f"Failed to get order status {order_id}: {e}")
             raise
     
@@ -225,6 +247,7 @@ class BinanceExchange(ExchangeInterface):
             Account balance information
         """
         try:
+            await self._acquire('account', request_weight(self.rate_limiter.exchange_id, 'fetch_balance'))
             balance = await self.exchange.fetch_balance()
             return {
                 'total': balance.get('total', {}),
@@ -233,6 +256,7 @@ class BinanceExchange(ExchangeInterface):
                 'timestamp': balance.get('timestamp')
             }
         except Exception as e:
+            self._check_rate_limit_error('account', e)
             logger.error(f"Failed to get balance: {e}")
             raise
     
@@ -244,6 +268,7 @@ class BinanceExchange(ExchangeInterface):
             List of open positions
         """
         try:
+            await self._acquire('account', request_weight(self.rate_limiter.exchange_id, 'fetch_positions'))
             positions = await self.exchange.fetch_positions()
             return [
                 {
@@ -262,6 +287,7 @@ class BinanceExchange(ExchangeInterface):
                 if pos.get('contracts', 0) != 0
             ]
         except Exception as e:
+            self._check_rate_limit_error('account', e)
             logger.error(f"Failed to get positions: {e}")
             raise
 
@@ -285,6 +311,7 @@ class BybitExchange(ExchangeInterface):
         self.api_key = api_key
         self.api_secret = api_secret
         self.testnet = testnet
+        self.rate_limiter = get_rate_limiter('bybit')
         
         if testnet:
             self.exchange = ccxt.bybit({
@@ -354,6 +381,7 @@ class MexcExchange(ExchangeInterface):
         self.api_key = api_key
         self.api_secret = api_secret
         self.testnet = testnet
+        self.rate_limiter = get_rate_limiter('mexc')
         
         self.exchange = ccxt.mexc({
             'apiKey': api_key,
@@ -397,6 +425,8 @@ class MexcExchange(ExchangeInterface):
             if client_order_id:
                 params['newClientOrderId'] = client_order_id
             
+            await self._acquire('orders')
+            
             if order_type == 'MARKET':
                 order = await self.exchange.create_market_order(
                     symbol=symbol,
@@ -441,6 +471,7 @@ class MexcExchange(ExchangeInterface):
             }
             
         except Exception as e:
+            self._check_rate_limit_error('orders', e)
             logger.error(f"Failed to submit MEXC order: {e}")
             raise
     
@@ -456,10 +487,12 @@ class MexcExchange(ExchangeInterface):
             Cancellation response
         """
         try:
+            await self._acquire('orders')
             result = await self.exchange.cancel_order(order_id, symbol)
             logger.info(f"MEXC order canceled: {order_id}")
             return result
         except Exception as e:
+            self._check_rate_limit_error('orders', e)
             logger.error(f"Failed to cancel MEXC order {order_id}: {e}")
             raise
     
@@ -475,6 +508,7 @@ class MexcExchange(ExchangeInterface):
             Order status information
         """
         try:
+            await self._acquire('account')
             order = await self.exchange.fetch_order(order_id, symbol)
             return {
                 'order_id': order.get('id'),
@@ -491,6 +525,7 @@ class MexcExchange(ExchangeInterface):
                 'timestamp': order.get('timestamp')
             }
         except Exception as e:
+            self._check_rate_limit_error('account', e)
             logger.error(f"Failed to get MEXC order status {order_id}: {e}")
             raise
     
@@ -502,6 +537,7 @@ class MexcExchange(ExchangeInterface):
             Account balance information
         """
         try:
+            await self._acquire('account', request_weight(self.rate_limiter.exchange_id, 'fetch_balance'))
             balance = await self.exchange.fetch_balance()
             return {
                 'total': balance.get('total', {}),
@@ -510,6 +546,7 @@ class MexcExchange(ExchangeInterface):
                 'timestamp': balance.get('timestamp')
             }
         except Exception as e:
+            self._check_rate_limit_error('account', e)
             logger.error(f"Failed to get MEXC balance: {e}")
             raise
     
@@ -524,6 +561,7 @@ class MexcExchange(ExchangeInterface):
             List of open orders (MEXC spot equivalent of positions)
         """
         try:
+            await self._acquire('account', request_weight(self.rate_limiter.exchange_id, 'fetch_open_orders'))
             open_orders = await self.exchange.fetch_open_orders()
             return [
                 {
@@ -540,6 +578,7 @@ class MexcExchange(ExchangeInterface):
                 for order in open_orders
             ]
         except Exception as e:
+            self._check_rate_limit_error('account', e)
             logger.error(f"Failed to get MEXC positions: {e}")
             raise
 
@@ -20,8 +20,9 @@ import logging
 from datetime import datetime
 from typing import Dict, Any, Optional
 import numpy as np
+import pandas as pd
 
-from src.strategies.base_strategy import BaseStrategy, TradingSignal, SignalAction
+from src.strategies.base_strategy import BaseStrategy, TradingSignal, SignalAction, VectorizedSignals
 
 logger = logging.getLogger(__name__)
 
@@ -238,6 +239,46 @@ class BandtasticStrategy(BaseStrategy):
             logger.error(f"Error generating Bandtastic signal: {e}")
             return self._create_hold_signal(current_price, timestamp)
     
+    def generate_signals_vectorized(self, data: pd.DataFrame) -> VectorizedSignals:
+        """
+        Generate Bandtastic entry signals for every bar in one pass
+        
+        Only the flat-position (entry) branch of generate_signal is vectorized.
+        
+        Args:
+            data: OHLCV data with indicator columns
+        
+        Returns:
+            VectorizedSignals matching generate_signal bar for bar
+        """
+        price = data['close'].to_numpy(dtype=np.float64)
+        bb_upper = self._column(data, 'bb_upper', price * 1.02)
+        bb_middle = self._column(data, 'bb_middle', price)
+        rsi = self._column(data, 'rsi', 50)
+        mfi = self._column(data, 'mfi', 50)
+        ema_12 = self._column(data, 'ema_12', price)
+        
+        bb_std = (bb_upper - bb_middle) / 2.0
+        buy_bb_lower = bb_middle - (self.buy_bb_level * bb_std)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            distance_from_lower = np.where(bb_std > 0, (price - buy_bb_lower) / bb_std, 0)
+        
+        buy = (
+            (price < buy_bb_lower) &
+            (rsi < self.buy_rsi_threshold) &
+            (mfi < self.buy_mfi_threshold) &
+            (price > ema_12)
+        )
+        
+        return VectorizedSignals(
+            action=np.where(buy, VectorizedSignals.BUY, VectorizedSignals.HOLD).astype(np.int8),
+            confidence=np.minimum(0.9, 0.6 + (0.3 * np.abs(distance_from_lower))),
+            stop_loss=np.where(buy, price * (1 - self.stop_loss_pct), np.nan),
+            take_profit=np.where(buy, price * (1 + self.take_profit_pct), np.nan),
+            metadata={'strategy': 'Bandtastic'}
+        )
+    
     def _create_hold_signal(
         self,
         current_price: float,
@@ -6,10 +6,12 @@ Provides a consistent interface for strategy development and execution.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Any, Optional, List
+from typing import Deque, Dict, Any, Optional, List
+import numpy as np
 import pandas as pd
 
 
@@ -58,6 +60,73 @@ class TradingSignal:
             raise ValueError(f"Position size must be between 0.0 and 1.0, got {self.position_size}")
 
 
+@dataclass
+class VectorizedSignals:
+    """
+    Entry signals for every bar of a dataset, generated in one pass
+    
+    Attributes:
+        action: Per-bar action codes (1 = BUY, -1 = SELL, 0 = HOLD)
+        confidence: Per-bar confidence (only meaningful where action != 0)
+        stop_loss: Per-bar stop-loss prices (NaN for none)
+        take_profit: Per-bar take-profit prices (NaN for none)
+        position_size: Per-bar position sizes (NaN leaves the default), optional
+        leverage: Per-bar leverage, optional
+        metadata: Metadata attached to every emitted signal
+    """
+    action: np.ndarray
+    confidence: np.ndarray
+    stop_loss: np.ndarray
+    take_profit: np.ndarray
+    position_size: Optional[np.ndarray] = None
+    leverage: Optional[np.ndarray] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    BUY = 1
+    SELL = -1
+    HOLD = 0
+    
+    def to_signal(self, i: int, symbol: str, timestamp: datetime, price: float) -> TradingSignal:
+        """
+        Materialize the signal at bar ``i`` as a TradingSignal
+        
+        Args:
+            i: Bar position
+            symbol: Trading pair symbol
+            timestamp: Bar timestamp
+            price: Bar close price
+            
+        Returns:
+            TradingSignal equivalent to what generate_signal returns for that bar
+        """
+        if self.action[i] == self.BUY:
+            action = SignalAction.BUY
+        elif self.action[i] == self.SELL:
+            action = SignalAction.SELL
+        else:
+            action = SignalAction.HOLD
+        
+        metadata = dict(self.metadata)
+        if self.leverage is not None:
+            metadata['leverage'] = self.leverage[i]
+        
+        stop_loss = self.stop_loss[i]
+        take_profit = self.take_profit[i]
+        position_size = self.position_size[i] if self.position_size is not None else None
+        
+        return TradingSignal(
+            action=action,
+            confidence=self.confidence[i],
+            symbol=symbol,
+            timestamp=timestamp,
+            metadata=metadata,
+            price=price,
+            stop_loss=None if np.isnan(stop_loss) else stop_loss,
+            take_profit=None if np.isnan(take_profit) else take_profit,
+            position_size=None if position_size is None or np.isnan(position_size) else position_size
+        )
+
+
 class BaseStrategy(ABC):
     """
     Abstract base class for all trading strategies
@@ -81,7 +150,7 @@ class BaseStrategy(ABC):
         self.config = config
         self.is_initialized = False
         self.last_signal: Optional[TradingSignal] = None
-        self.signal_history: List[TradingSignal] = []
+        self.signal_history: Deque[TradingSignal] = deque(maxlen=1000)
         
         self.last_trade_time: Optional[datetime] = None
         self.daily_trade_count: int = 0
@@ -142,6 +211,41 @@ class BaseStrategy(ABC):
         """
         pass
     
+    def generate_signals_vectorized(self, data: pd.DataFrame) -> Optional[VectorizedSignals]:
+        """
+        Generate entry signals for every bar of ``data`` in one pass
+        
+        Optional fast path used by the backtester. Strategies whose signals are
+        pure functions of the current bar's indicator columns override this and
+        must reproduce generate_signal bar for bar (without a current position).
+        Cooldowns and daily trade limits are applied by the caller through
+        can_trade() and record_signal().
+        
+        Args:
+            data: OHLCV data with indicator columns
+            
+        Returns:
+            VectorizedSignals, or None if the strategy must be evaluated bar by bar
+        """
+        return None
+    
+    @staticmethod
+    def _column(data: pd.DataFrame, name: str, default: Any) -> np.ndarray:
+        """
+        Vectorized counterpart of ``indicators.get(name, default)``
+        
+        Args:
+            data: OHLCV data with indicator columns
+            name: Column name
+            default: Scalar or array used when the column is missing
+            
+        Returns:
+            Float array with one value per bar
+        """
+        if name in data.columns:
+            return data[name].to_numpy(dtype=np.float64)
+        return np.broadcast_to(np.asarray(default, dtype=np.float64), (len(data),))
+    
     def update_parameters(self, params: Dict[str, Any]) -> None:
         """
         Update strategy parameters
@@ -192,9 +296,6 @@ class BaseStrategy(ABC):
                 self.last_trade_date = signal.timestamp
             else:
                 self.daily_trade_count += 1
-        
-        if len(self.signal_history) > 1000:
-            self.signal_history = self.signal_history[-1000:]
     
     def get_signal_history(self, limit: int = 100) -> List[TradingSignal]:
         """
@@ -206,12 +307,12 @@ class BaseStrategy(ABC):
         Returns:
             List of recent trading signals
         """
-        return self.signal_history[-limit:]
+        return list(self.signal_history)[-limit:]
     
     def reset(self) -> None:
         """Reset strategy state"""
         self.last_signal = None
-        self.signal_history = []
+        self.signal_history.clear()
         self.is_initialized = False
         self.last_trade_time = None
         self.daily_trade_count = 0
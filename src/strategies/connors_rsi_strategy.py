@@ -13,8 +13,10 @@ Exit: RSI(2) crosses back above 50 (longs) or below 50 (shorts)
 import logging
 from typing import Dict, Any, Optional
 from datetime import datetime
+import numpy as np
+import pandas as pd
 
-from .base_strategy import BaseStrategy, TradingSignal, SignalAction
+from .base_strategy import BaseStrategy, TradingSignal, SignalAction, VectorizedSignals
 
 logger = logging.getLogger(__name__)
 
@@ -204,6 +206,51 @@ class ConnorsRSIStrategy(BaseStrategy):
             logger.error(f"Error generating Connors RSI signal: {e}")
             return self._create_hold_signal(current_price, timestamp)
     
+    def generate_signals_vectorized(self, data: pd.DataFrame) -> VectorizedSignals:
+        """
+        Generate Connors RSI(2) signals for every bar in one pass
+        
+        Cooldown and daily limits are left to the caller via can_trade().
+        
+        Args:
+            data: OHLCV data with indicator columns
+        
+        Returns:
+            VectorizedSignals matching generate_signal bar for bar
+        """
+        price = data['close'].to_numpy(dtype=np.float64)
+        volume = data['volume'].to_numpy(dtype=np.float64)
+        rsi_2 = self._column(data, 'rsi_2', 50)
+        sma_200 = self._column(data, 'sma_200', price)
+        adx = self._column(data, 'adx', 0)
+        volume_avg = self._column(data, 'volume_avg', volume)
+        
+        sma_200 = np.where(sma_200 == 0, price, sma_200)
+        
+        tradable = ~(adx > self.adx_max) & ~(volume < volume_avg * 1.2)
+        
+        long_setup = tradable & (rsi_2 < self.rsi_oversold) & (price > sma_200)
+        short_setup = tradable & ~long_setup & (rsi_2 > self.rsi_overbought) & (price < sma_200)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            long_strength = np.minimum(1.0, 0.7 + (0.2 * ((self.rsi_oversold - rsi_2) / self.rsi_oversold))
+                                       + (0.1 * np.minimum(((price - sma_200) / sma_200) * 10, 1.0)))
+            short_strength = np.minimum(1.0, 0.7 + (0.2 * ((rsi_2 - self.rsi_overbought) / (100 - self.rsi_overbought)))
+                                        + (0.1 * np.minimum(((sma_200 - price) / sma_200) * 10, 1.0)))
+        
+        buy = long_setup & (long_strength >= self.min_confidence)
+        sell = short_setup & (short_strength >= self.min_confidence)
+        
+        stop_distance = price * (self.stop_loss_pct / 100)
+        profit_distance = price * (self.take_profit_pct / 100)
+        
+        return VectorizedSignals(
+            action=np.where(buy, VectorizedSignals.BUY, np.where(sell, VectorizedSignals.SELL, VectorizedSignals.HOLD)).astype(np.int8),
+            confidence=np.where(buy, long_strength, np.where(sell, short_strength, 0.0)),
+            stop_loss=np.where(buy, price - stop_distance, np.where(sell, price + stop_distance, np.nan)),
+            take_profit=np.where(buy, price + profit_distance, np.where(sell, price - profit_distance, np.nan))
+        )
+    
     def _calculate_stop_loss(
         self,
         entry_price: float,
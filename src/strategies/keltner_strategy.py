@@ -11,8 +11,10 @@ Exit: Price returns to middle band or opposite band breakout
 import logging
 from typing import Dict, Any, Optional
 from datetime import datetime
+import numpy as np
+import pandas as pd
 
-from .base_strategy import BaseStrategy, TradingSignal, SignalAction
+from .base_strategy import BaseStrategy, TradingSignal, SignalAction, VectorizedSignals
 
 logger = logging.getLogger(__name__)
 
@@ -196,6 +198,47 @@ class KeltnerStrategy(BaseStrategy):
             logger.error(f"Error generating Keltner signal: {e}")
             return self._create_hold_signal(current_price, timestamp)
     
+    def generate_signals_vectorized(self, data: pd.DataFrame) -> VectorizedSignals:
+        """
+        Generate Keltner breakout signals for every bar in one pass
+        
+        Args:
+            data: OHLCV data with indicator columns
+        
+        Returns:
+            VectorizedSignals matching generate_signal bar for bar
+        """
+        price = data['close'].to_numpy(dtype=np.float64)
+        keltner_upper = self._column(data, 'keltner_upper', 0)
+        keltner_middle = self._column(data, 'keltner_middle', 0)
+        keltner_lower = self._column(data, 'keltner_lower', 0)
+        atr = self._column(data, 'atr', 0)
+        
+        channel_width = keltner_upper - keltner_lower
+        valid = (keltner_upper != 0) & (keltner_lower != 0) & (atr != 0) & (channel_width != 0)
+        
+        breakout_up = valid & (price > keltner_upper)
+        breakout_down = valid & ~breakout_up & (price < keltner_lower)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            up_strength = np.minimum(1.0, 0.7 + (0.15 * np.minimum((price - keltner_upper) / atr, 1.0))
+                                     + (0.15 * ((price - keltner_middle) / channel_width)))
+            down_strength = np.minimum(1.0, 0.7 + (0.15 * np.minimum((keltner_lower - price) / atr, 1.0))
+                                       + (0.15 * ((keltner_middle - price) / channel_width)))
+        
+        buy = breakout_up & (up_strength >= self.min_confidence)
+        sell = breakout_down & (down_strength >= self.min_confidence)
+        
+        stop_distance = atr * self.stop_loss_atr_multiplier
+        profit_distance = atr * self.take_profit_atr_multiplier
+        
+        return VectorizedSignals(
+            action=np.where(buy, VectorizedSignals.BUY, np.where(sell, VectorizedSignals.SELL, VectorizedSignals.HOLD)).astype(np.int8),
+            confidence=np.where(buy, up_strength, np.where(sell, down_strength, 0.0)),
+            stop_loss=np.where(buy, price - stop_distance, np.where(sell, price + stop_distance, np.nan)),
+            take_profit=np.where(buy, price + profit_distance, np.where(sell, price - profit_distance, np.nan))
+        )
+    
     def _calculate_stop_loss(
         self,
         entry_price: float,
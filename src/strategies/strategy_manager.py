@@ -408,7 +408,8 @@ class StrategyManager:
         self,
         proposed_trades: List[Dict[str, Any]],
         current_positions: List[Dict[str, Any]],
-        max_exposure_pct: float = 30.0
+        max_exposure_pct: float = 30.0,
+        total_capital: Optional[float] = None
     ) -> tuple[bool, str]:
         """
         Check if combined exposure from all strategies is within limits
@@ -417,6 +418,8 @@ class StrategyManager:
             proposed_trades: List of proposed trades from strategies
             current_positions: List of current open positions
             max_exposure_pct: Maximum total exposure percentage
+            total_capital: Capital the exposure is a percentage of (default:
+                exposure is taken as a percentage of 100 units)
         
         Returns:
             Tuple of (approved, reason)
@@ -433,7 +436,10 @@ class StrategyManager:
         
         total_exposure = current_exposure + proposed_exposure
         
-        exposure_pct = (total_exposure / 100) * 100
+        if total_capital is not None:
+            exposure_pct = (total_exposure / total_capital) * 100 if total_capital > 0 else float('inf')
+        else:
+            exposure_pct = (total_exposure / 100) * 100
         
         if exposure_pct > max_exposure_pct:
             return False, f"Combined exposure {exposure_pct:.1f}% exceeds limit {max_exposure_pct:.1f}%"
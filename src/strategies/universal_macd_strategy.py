@@ -21,8 +21,9 @@ import logging
 from datetime import datetime
 from typing import Dict, Any, Optional
 import numpy as np
+import pandas as pd
 
-from src.strategies.base_strategy import BaseStrategy, TradingSignal, SignalAction
+from src.strategies.base_strategy import BaseStrategy, TradingSignal, SignalAction, VectorizedSignals
 
 logger = logging.getLogger(__name__)
 
@@ -222,6 +223,44 @@ class UniversalMacdStrategy(BaseStrategy):
             logger.error(f"Error generating UniversalMacd signal: {e}")
             return self._create_hold_signal(current_price, timestamp)
     
+    def generate_signals_vectorized(self, data: pd.DataFrame) -> VectorizedSignals:
+        """
+        Generate Universal MACD entry signals for every bar in one pass
+        
+        Only the flat-position (entry) branch of generate_signal is vectorized.
+        
+        Args:
+            data: OHLCV data with indicator columns
+        
+        Returns:
+            VectorizedSignals matching generate_signal bar for bar
+        """
+        price = data['close'].to_numpy(dtype=np.float64)
+        ema_12 = self._column(data, 'ema_12', price)
+        ema_26 = self._column(data, 'ema_26', price)
+        trend_1h = self._column(data, 'trend_1h', 1)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            umacd = np.where(ema_26 > 0, (ema_12 / ema_26) - 1.0, 0.0)
+        
+        buy = (self.buy_umacd_min <= umacd) & (umacd <= self.buy_umacd_max) & (trend_1h == 1)
+        
+        if self.buy_umacd_min >= self.buy_umacd_max:
+            confidence = np.full(len(data), 0.5)
+        else:
+            range_size = self.buy_umacd_max - self.buy_umacd_min
+            center = (self.buy_umacd_min + self.buy_umacd_max) / 2.0
+            confidence = 1.0 - (np.abs(umacd - center) / (range_size / 2.0))
+            confidence = np.maximum(0.5, np.minimum(0.95, confidence))
+        
+        return VectorizedSignals(
+            action=np.where(buy, VectorizedSignals.BUY, VectorizedSignals.HOLD).astype(np.int8),
+            confidence=confidence,
+            stop_loss=np.where(buy, price * (1 - self.stop_loss_pct), np.nan),
+            take_profit=np.where(buy, price * (1 + self.take_profit_pct), np.nan),
+            metadata={'strategy': 'UniversalMacd'}
+        )
+    
     def _create_hold_signal(
         self,
         current_price: float,
@@ -0,0 +1,322 @@
+"""
+Rate Limiter Module
+
+Weight-aware token buckets shared by everything that talks to an exchange,
+so market data, account and order requests draw from one budget per exchange
+instead of each component sleeping on its own schedule.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from loguru import logger
+
+
+# Request budgets per exchange and endpoint class: (limit, interval seconds).
+# Binance shares one IP weight budget across market data and account
+# endpoints, so it is split between the two; orders have their own count.
+DEFAULT_BUDGETS: Dict[str, Dict[str, Tuple[float, float]]] = {
+    'binance': {
+        'market_data': (1800, 60),
+        'account': (600, 60),
+        'orders': (1200, 60),
+    },
+    'bybit': {
+        'market_data': (600, 5),
+        'account': (10, 1),
+        'orders': (10, 1),
+    },
+    'mexc': {
+        'market_data': (20, 1),
+        'account': (5, 1),
+        'orders': (5, 1),
+    },
+    'default': {
+        'market_data': (10, 1),
+        'account': (5, 1),
+        'orders': (5, 1),
+    },
+}
+
+
+def request_weight(
+    exchange_id: str,
+    method: str,
+    limit: Optional[int] = None
+) -> float:
+    """
+    Weight of a REST request against the exchange budget.
+
+    Args:
+        exchange_id: Exchange name
+        method: CCXT method name (e.g., 'fetch_ohlcv')
+        limit: Requested number of rows, for endpoints weighted by size
+
+    Returns:
+        Request weight (1 for exchanges that count requests)
+    """
+    if exchange_id != 'binance':
+        return 1.0
+
+    if method == 'fetch_ohlcv':
+        limit = limit or 500
+        if limit < 100:
+            return 1.0
+        if limit < 500:
+            return 2.0
+        return 5.0 if limit <= 1000 else 10.0
+
+    if method == 'fetch_order_book':
+        limit = limit or 100
+        if limit <= 50:
+            return 2.0
+        if limit <= 100:
+            return 5.0
+        return 10.0 if limit <= 500 else 20.0
+
+    if method == 'fetch_tickers':
+        return 40.0
+
+    if method in ('fetch_balance', 'fetch_positions'):
+        return 5.0
+
+    if method == 'fetch_open_orders':
+        return 40.0
+
+    return 1.0
+
+
+class TokenBucket:
+    """
+    Token bucket with reservations.
+
+    Callers reserve their weight up front, which may take the balance
+    negative; each then waits until the refill covers its reservation. Waits
+    are therefore granted in request order, and the number of tokens spent in
+    any window of `interval` seconds never exceeds capacity + rate * interval.
+    """
+
+    def __init__(self, capacity: float, rate: float):
+        """
+        Initialize the bucket.
+
+        Args:
+            capacity: Maximum burst (tokens)
+            rate: Refill rate (tokens per second)
+        """
+        if capacity <= 0 or rate <= 0:
+            raise ValueError("capacity and rate must be positive")
+
+        self.capacity = float(capacity)
+        self.rate = float(rate)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.weight = 0.0
+        self.waits = 0
+        self.wait_time = 0.0
+
+    @classmethod
+    def for_budget(cls, limit: float, interval: float, burst: float = 0.25) -> 'TokenBucket':
+        """
+        Create a bucket that never spends more than `limit` per `interval`.
+
+        Args:
+            limit: Allowed weight per interval
+            interval: Interval length in seconds
+            burst: Fraction of the limit available as an immediate burst
+
+        Returns:
+            TokenBucket
+        """
+        capacity = max(limit * burst, 1.0)
+        return cls(capacity=capacity, rate=(limit - capacity) / interval)
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, weight: float = 1.0) -> float:
+        """
+        Reserve tokens.
+
+        Args:
+            weight: Tokens to take (capped at capacity)
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= min(weight, self.capacity)
+            self.requests += 1
+            self.weight += weight
+
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            if delay > 0:
+                self.waits += 1
+                self.wait_time += delay
+            return delay
+
+    def penalize(self, seconds: float) -> None:
+        """
+        Drain the bucket so that every caller backs off (e.g. after a 429).
+
+        Args:
+            seconds: How long to hold further requests
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+    async def acquire(self, weight: float = 1.0) -> float:
+        """
+        Wait until a request of this weight may be sent.
+
+        Args:
+            weight: Request weight
+
+        Returns:
+            Seconds waited
+        """
+        delay = self.reserve(weight)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def acquire_blocking(self, weight: float = 1.0) -> float:
+        """
+        Blocking variant of acquire for synchronous clients.
+
+        Args:
+            weight: Request weight
+
+        Returns:
+            Seconds waited
+        """
+        delay = self.reserve(weight)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available (negative while reservations are pending)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+
+class RateLimiter:
+    """
+    Per-exchange set of token buckets, one per endpoint class.
+
+    Endpoint classes:
+    - market_data: tickers, candles, order books
+    - account: balances, positions, order status
+    - orders: order placement and cancellation
+    """
+
+    def __init__(
+        self,
+        exchange_id: str,
+        budgets: Optional[Dict[str, Tuple[float, float]]] = None,
+        burst: float = 0.25
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            exchange_id: Exchange name
+            budgets: Endpoint class -> (limit, interval seconds); defaults per exchange
+            burst: Fraction of each budget available as an immediate burst
+        """
+        self.exchange_id = exchange_id.lower()
+        self.budgets = dict(DEFAULT_BUDGETS.get(self.exchange_id, DEFAULT_BUDGETS['default']))
+        if budgets:
+            self.budgets.update(budgets)
+
+        self.buckets = {
+            endpoint: TokenBucket.for_budget(limit, interval, burst)
+            for endpoint, (limit, interval) in self.budgets.items()
+        }
+
+    def bucket(self, endpoint: str) -> TokenBucket:
+        """Get the bucket for an endpoint class"""
+        if endpoint not in self.buckets:
+            raise ValueError(f"Unknown endpoint class: {endpoint}")
+        return self.buckets[endpoint]
+
+    async def acquire(self, endpoint: str = 'market_data', weight: float = 1.0) -> float:
+        """
+        Wait for budget before an async request.
+
+        Args:
+            endpoint: Endpoint class
+            weight: Request weight
+
+        Returns:
+            Seconds waited
+        """
+        return await self.bucket(endpoint).acquire(weight)
+
+    def acquire_blocking(self, endpoint: str = 'market_data', weight: float = 1.0) -> float:
+        """
+        Wait for budget before a synchronous request.
+
+        Args:
+            endpoint: Endpoint class
+            weight: Request weight
+
+        Returns:
+            Seconds waited
+        """
+        return self.bucket(endpoint).acquire_blocking(weight)
+
+    def penalize(self, endpoint: str = 'market_data', seconds: float = 5.0) -> None:
+        """
+        Back off every caller of an endpoint class after the exchange pushed back.
+
+        Args:
+            endpoint: Endpoint class
+            seconds: Back-off duration
+        """
+        logger.warning(f"Rate limit hit on {self.exchange_id} {endpoint}, backing off {seconds:.1f}s")
+        self.bucket(endpoint).penalize(seconds)
+
+    def get_statistics(self) -> Dict[str, Dict[str, float]]:
+        """Get per-endpoint usage statistics"""
+        return {
+            endpoint: {
+                'requests': bucket.requests,
+                'weight': bucket.weight,
+                'waits': bucket.waits,
+                'wait_time': bucket.wait_time,
+                'tokens': bucket.tokens,
+            }
+            for endpoint, bucket in self.buckets.items()
+        }
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(exchange_id: str) -> RateLimiter:
+    """
+    Get the process-wide rate limiter for an exchange.
+
+    Args:
+        exchange_id: Exchange name
+
+    Returns:
+        Shared RateLimiter instance
+    """
+    key = exchange_id.lower()
+    with _limiters_lock:
+        if key not in _limiters:
+            _limiters[key] = RateLimiter(key)
+        return _limiters[key]
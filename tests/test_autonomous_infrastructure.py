@@ -11,11 +11,13 @@ import unittest
 from datetime import datetime, date
 from unittest.mock import Mock, patch
 import asyncio
+import time
 
 from src.autonomous.exit_plan_monitor import ExitPlanMonitor, ExitPlan, ExitReason
 from src.autonomous.enhanced_risk_manager import EnhancedRiskManager
 from src.autonomous.autonomous_decision_engine import AutonomousDecisionEngine, Position
 from src.strategies.base_strategy import BaseStrategy, TradingSignal, SignalAction
+from src.data.price_feed import PriceFeedReader
 
 
 class TestExitPlanMonitor(unittest.TestCase):
@@ -126,6 +128,77 @@ class TestExitPlanMonitor(unittest.TestCase):
         self.assertAlmostEqual(stats['take_profit_pct'], 66.67, places=1)
 
 
+class TestExitTriggerBook(unittest.TestCase):
+    """Test ExitTriggerBook indexing"""
+    
+    def make_plans(self, monitor, count=300, seed=7):
+        import random
+        rng = random.Random(seed)
+        for i in range(count):
+            entry = 100.0 * (1 + rng.uniform(-0.05, 0.05))
+            is_short = i % 2 == 1
+            sl, tp = (entry * 1.04, entry * 0.9) if is_short else (entry * 0.96, entry * 1.1)
+            monitor.add_exit_plan(ExitPlan(
+                position_id=f'pos_{i}',
+                symbol='BTC/USDT',
+                entry_price=entry,
+                stop_loss=sl,
+                take_profit=tp,
+                invalidation_conditions=[],
+                trailing_stop_pct=0.02 if i % 3 == 0 else None,
+                is_short=is_short,
+                leverage=rng.choice([1.0, 3.0, 10.0]),
+                tiered_trailing_enabled=i % 4 != 0
+            ))
+        return rng
+    
+    def test_matches_full_scan(self):
+        """Test checking crossed levels only gives the same exits and stops as checking every plan"""
+        indexed, scanned = ExitPlanMonitor(), ExitPlanMonitor()
+        rng = self.make_plans(indexed)
+        self.make_plans(scanned)
+        
+        price = 100.0
+        for _ in range(2000):
+            price *= 1 + rng.gauss(0, 0.004)
+            
+            indexed_exits = indexed.check_price('BTC/USDT', price)
+            scanned_exits = []
+            for position_id in list(scanned.exit_plans):
+                exit_signal = scanned.check_exit_conditions(position_id, price, {}, {})
+                if exit_signal and exit_signal['should_exit']:
+                    scanned_exits.append((position_id, exit_signal))
+            
+            self.assertEqual(
+                sorted((pid, e['reason']) for pid, e in indexed_exits),
+                sorted((pid, e['reason']) for pid, e in scanned_exits)
+            )
+            for position_id, _ in indexed_exits:
+                indexed.remove_exit_plan(position_id)
+                scanned.remove_exit_plan(position_id)
+            for position_id, plan in indexed.exit_plans.items():
+                self.assertAlmostEqual(plan.stop_loss, scanned.exit_plans[position_id].stop_loss)
+        
+        self.assertLess(len(indexed.exit_plans), 300)
+        self.assertEqual(len(indexed.trigger_book), len(indexed.exit_plans))
+    
+    def test_quiet_prices_touch_no_plans(self):
+        """Test prices inside every band cross nothing"""
+        monitor = ExitPlanMonitor()
+        monitor.add_exit_plan(ExitPlan(
+            position_id='long', symbol='BTC/USDT', entry_price=100.0, stop_loss=95.0,
+            take_profit=110.0, invalidation_conditions=[], tiered_trailing_enabled=False
+        ))
+        
+        self.assertEqual(monitor.trigger_book.crossed('BTC/USDT', 100.0), [])
+        self.assertEqual(monitor.trigger_book.crossed('ETH/USDT', 1.0), [])
+        self.assertEqual(monitor.trigger_book.crossed('BTC/USDT', 95.0), ['long'])
+        self.assertEqual(monitor.trigger_book.crossed('BTC/USDT', 111.0), ['long'])
+        
+        monitor.remove_exit_plan('long')
+        self.assertEqual(monitor.trigger_book.crossed('BTC/USDT', 90.0), [])
+
+
 class TestEnhancedRiskManager(unittest.TestCase):
     """Test EnhancedRiskManager functionality"""
     
@@ -319,6 +392,283 @@ class TestAutonomousDecisionEngine(unittest.TestCase):
         self.assertEqual(stats['max_open_positions'], 5)
 
 
+class StubPriceFeed(PriceFeedReader):
+    """Price feed serving fixed prices, driven by the test"""
+    
+    def __init__(self, prices):
+        super().__init__()
+        self.prices = prices
+    
+    def get_latest_price(self, symbol):
+        return self.prices.get(symbol, 0.0)
+    
+    def get_indicators(self, symbol, timeframe):
+        return {}
+    
+    def get_latest_candle(self, symbol, timeframe):
+        return None
+
+
+class TestEventDrivenSchedule(unittest.TestCase):
+    """Test the candle-close / price-update driven schedule"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.feed = StubPriceFeed({'BTC/USDT': 50000.0, 'ETH/USDT': 3000.0})
+        
+        self.btc_strategy = MockStrategy('BTC1h', SignalAction.HOLD, 0.5)
+        self.btc_strategy.timeframe = '1h'
+        self.eth_strategy = MockStrategy('ETH5m', SignalAction.HOLD, 0.5)
+        self.eth_strategy.symbol = 'ETH/USDT'
+        self.eth_strategy.timeframe = '5m'
+        
+        self.engine = AutonomousDecisionEngine(
+            strategies=[self.btc_strategy, self.eth_strategy],
+            exit_monitor=ExitPlanMonitor(),
+            risk_manager=EnhancedRiskManager(initial_capital=10000.0),
+            price_feed=self.feed,
+            schedule='events'
+        )
+    
+    def test_invalid_schedule(self):
+        """Test unknown schedules are rejected"""
+        with self.assertRaises(ValueError):
+            AutonomousDecisionEngine(
+                strategies=[],
+                exit_monitor=ExitPlanMonitor(),
+                risk_manager=EnhancedRiskManager(initial_capital=10000.0),
+                price_feed=self.feed,
+                schedule='cron'
+            )
+    
+    def test_candle_close_evaluates_only_subscribed_strategies(self):
+        """Test a candle close evaluates only the strategies on that key"""
+        evaluated = []
+        for strategy in (self.btc_strategy, self.eth_strategy):
+            original = strategy.generate_signal
+            strategy.generate_signal = (
+                lambda *args, _s=strategy, _g=original: evaluated.append(_s.name) or _g(*args)
+            )
+        
+        async def run():
+            self.assertFalse(await self.engine.process_events(timeout=0.01))
+            
+            self.feed._notify_candle_close('ETH/USDT', '5m', None)
+            self.feed._notify_candle_close('ETH/USDT', '5m', None)
+            self.feed._notify_candle_close('BTC/USDT', '5m', None)
+            processed = await self.engine.process_events(timeout=1.0)
+            await self.engine._decision_round
+            return processed
+        
+        self.assertTrue(asyncio.run(run()))
+        self.assertEqual(evaluated, ['ETH5m'])
+        self.assertEqual(self.engine.total_loops, 1)
+        self.assertEqual(self.engine.event_metrics['candle_events'], 2)
+        self.assertEqual(self.engine.event_metrics['strategies_evaluated'], 1)
+    
+    def test_price_update_closes_crossed_positions(self):
+        """Test price updates close positions whose trigger levels they cross"""
+        for position_id, symbol, entry in [('p1', 'BTC/USDT', 50000.0), ('p2', 'ETH/USDT', 3000.0)]:
+            self.engine.open_positions[position_id] = Position(
+                position_id=position_id, symbol=symbol, side='long', entry_price=entry,
+                quantity=0.1, leverage=1.0, entry_time=datetime.now(),
+                strategy_name='Test', confidence=0.8, metadata={}
+            )
+            self.engine.exit_monitor.add_exit_plan(ExitPlan(
+                position_id=position_id, symbol=symbol, entry_price=entry,
+                stop_loss=entry * 0.95, take_profit=entry * 1.1,
+                invalidation_conditions=[], tiered_trailing_enabled=False
+            ))
+        
+        original = self.eth_strategy.generate_signal
+        self.eth_strategy.generate_signal = (
+            lambda *args: time.sleep(0.5) or original(*args)
+        )
+        
+        async def run():
+            self.engine._subscribe_to_feed()
+            for price in (49900.0, 48000.0, 50500.0):
+                self.feed._notify_ticker('BTC/USDT', Mock(price=price))
+            self.assertFalse(await self.engine.process_events(timeout=0.01))
+            
+            # Exits are checked while the ETH strategy round is still computing
+            self.feed._notify_candle_close('ETH/USDT', '5m', None)
+            self.assertTrue(await self.engine.process_events(timeout=1.0))
+            
+            self.feed._notify_ticker('BTC/USDT', Mock(price=47400.0))
+            self.feed._notify_ticker('ETH/USDT', Mock(price=3100.0))
+            processed = await self.engine.process_events(timeout=1.0)
+            self.assertFalse(self.engine._decision_round.done())
+            
+            await self.engine._decision_round
+            return processed
+        
+        self.assertTrue(asyncio.run(run()))
+        self.assertEqual(list(self.engine.open_positions), ['p2'])
+        self.assertEqual(list(self.engine.exit_monitor.exit_plans), ['p2'])
+        self.assertEqual(self.engine.exit_monitor.exit_history[-1]['exit_reason'], 'STOP_LOSS')
+        self.assertEqual(self.engine.event_metrics['exit_triggers'], 1)
+        self.assertLess(self.engine.event_metrics['max_exit_latency_ms'], 100)
+        self.assertEqual(self.engine.total_loops, 1)
+        
+        self.engine.stop()
+        self.assertEqual(self.feed.ticker_subscribers, [])
+        self.assertFalse(any(self.feed.candle_subscribers.values()))
+
+
+class SlowAsyncStrategy(MockStrategy):
+    """Coroutine strategy (SingleAgentStrategy API) that waits before answering"""
+    
+    def __init__(self, name: str, delay: float):
+        super().__init__(name, SignalAction.BUY, 0.9)
+        self.delay = delay
+    
+    async def generate_signal(self, symbol, timeframe, data):
+        await asyncio.sleep(self.delay)
+        return super().generate_signal(data, {})
+
+
+class SlowSyncStrategy(MockStrategy):
+    """Blocking strategy that computes for a while before answering"""
+    
+    def __init__(self, name: str, delay: float):
+        super().__init__(name, SignalAction.BUY, 0.85)
+        self.delay = delay
+    
+    def generate_signal(self, market_data, indicators, current_position=None):
+        time.sleep(self.delay)
+        return super().generate_signal(market_data, indicators, current_position)
+
+
+class TestEventDrivenExitsDuringDecisionRound(unittest.TestCase):
+    """Test exits are not held back by a running strategy evaluation"""
+    
+    def test_stop_closes_while_slow_strategy_evaluates(self):
+        """Test a crossed stop closes while a slow strategy round is in flight"""
+        feed = StubPriceFeed({'BTC/USDT': 50000.0, 'ETH/USDT': 3000.0})
+        slow = SlowSyncStrategy('SlowETH', 1.0)
+        slow.symbol = 'ETH/USDT'
+        slow.timeframe = '5m'
+        engine = AutonomousDecisionEngine(
+            strategies=[slow],
+            exit_monitor=ExitPlanMonitor(),
+            risk_manager=EnhancedRiskManager(initial_capital=10000.0),
+            price_feed=feed,
+            schedule='events'
+        )
+        engine.open_positions['p1'] = Position(
+            position_id='p1', symbol='BTC/USDT', side='long', entry_price=50000.0,
+            quantity=0.1, leverage=1.0, entry_time=datetime.now(),
+            strategy_name='Test', confidence=0.8, metadata={}
+        )
+        engine.exit_monitor.add_exit_plan(ExitPlan(
+            position_id='p1', symbol='BTC/USDT', entry_price=50000.0,
+            stop_loss=47500.0, take_profit=55000.0,
+            invalidation_conditions=[], tiered_trailing_enabled=False
+        ))
+        
+        async def run():
+            engine._subscribe_to_feed()
+            feed._notify_candle_close('ETH/USDT', '5m', None)
+            self.assertTrue(await engine.process_events(timeout=1.0))
+            await asyncio.sleep(0.05)
+            
+            feed._notify_ticker('BTC/USDT', Mock(price=47000.0))
+            start = time.perf_counter()
+            self.assertTrue(await engine.process_events(timeout=1.0))
+            elapsed = time.perf_counter() - start
+            round_running = not engine._decision_round.done()
+            
+            await engine._decision_round
+            return elapsed, round_running
+        
+        elapsed, round_running = asyncio.run(run())
+        engine.stop()
+        
+        self.assertTrue(round_running)
+        self.assertLess(elapsed, 0.2)
+        self.assertNotIn('p1', engine.open_positions)
+        self.assertLess(engine.event_metrics['last_exit_latency_ms'], 200)
+        self.assertEqual(engine.total_loops, 1)
+
+
+class TestConcurrentStrategyEvaluation(unittest.TestCase):
+    """Test concurrent strategy evaluation with timeouts"""
+    
+    def make_engine(self, strategies, **kwargs):
+        return AutonomousDecisionEngine(
+            strategies=strategies,
+            exit_monitor=ExitPlanMonitor(),
+            risk_manager=EnhancedRiskManager(initial_capital=10000.0),
+            price_feed=StubPriceFeed({'BTC/USDT': 50000.0}),
+            **kwargs
+        )
+    
+    def test_strategies_run_concurrently(self):
+        """Test slow strategies overlap instead of queueing"""
+        strategies = [SlowAsyncStrategy('LLM', 0.3), SlowSyncStrategy('Heavy', 0.3),
+                      MockStrategy('Fast', SignalAction.BUY, 0.8)]
+        engine = self.make_engine(strategies)
+        
+        start = time.perf_counter()
+        signals = asyncio.run(engine._generate_signals_from_all_strategies())
+        elapsed = time.perf_counter() - start
+        engine.stop()
+        
+        self.assertEqual([s.metadata['strategy'] for s in signals], ['LLM', 'Heavy', 'Fast'])
+        self.assertLess(elapsed, 0.55)
+    
+    def test_slow_strategies_time_out(self):
+        """Test timed-out strategies are dropped without holding back the others"""
+        slow_llm = SlowAsyncStrategy('LLM', 5.0)
+        slow_llm.evaluation_timeout = 0.1
+        heavy = SlowSyncStrategy('Heavy', 0.5)
+        engine = self.make_engine(
+            [slow_llm, heavy, MockStrategy('Fast', SignalAction.BUY, 0.8)],
+            strategy_timeout=0.2
+        )
+        
+        async def run():
+            first = await engine._generate_signals_from_all_strategies()
+            # Heavy is still computing in its worker thread
+            second = await engine._generate_signals_from_all_strategies()
+            return first, second
+        
+        start = time.perf_counter()
+        first, second = asyncio.run(run())
+        elapsed = time.perf_counter() - start
+        engine.stop()
+        
+        self.assertEqual([s.metadata['strategy'] for s in first], ['Fast'])
+        self.assertEqual([s.metadata['strategy'] for s in second], ['Fast'])
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(engine.strategy_stats['LLM']['timeouts'], 2)
+        self.assertEqual(engine.strategy_stats['Heavy']['timeouts'], 1)
+        self.assertEqual(engine.strategy_stats['Heavy']['skipped'], 1)
+    
+    def test_evaluation_budget(self):
+        """Test the budget bounds a whole evaluation round"""
+        engine = self.make_engine(
+            [SlowAsyncStrategy('A', 1.0), SlowAsyncStrategy('B', 1.0)],
+            strategy_timeout=5.0,
+            evaluation_budget=0.1
+        )
+        
+        start = time.perf_counter()
+        signals = asyncio.run(engine._generate_signals_from_all_strategies())
+        
+        self.assertEqual(signals, [])
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual(engine.get_statistics()['strategy_stats']['A']['timeouts'], 1)
+    
+    def test_invalid_timeouts(self):
+        """Test non-positive timeouts are rejected"""
+        with self.assertRaises(ValueError):
+            self.make_engine([], strategy_timeout=0)
+        with self.assertRaises(ValueError):
+            self.make_engine([], strategy_workers=0)
+
+
 def run_async_test(coro):
     """Helper to run async tests"""
     loop = asyncio.get_event_loop()
@@ -2,16 +2,32 @@
 Unit tests for backtesting module
 """
 
+import asyncio
 import unittest
+from unittest.mock import Mock
+import ccxt
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
-from src.backtesting.backtest_engine import BacktestEngine, Trade, Position
+from src.backtesting.backtest_engine import BacktestEngine, BarView, Trade, Position
 from src.backtesting.performance import PerformanceMetrics
 from src.backtesting.optimizer import ParameterOptimizer
+from src.backtesting.shared_dataset import SharedDataset, SharedDatasetHandle
+from src.backtesting.historical_store import HistoricalStore
+from src.backtesting.async_downloader import AsyncDataDownloader
+from src.backtesting.indicator_cache import IndicatorCache, config_hash, frame_fingerprint
 from src.backtesting.walk_forward import WalkForwardOptimizer
-from src.strategies.base_strategy import BaseStrategy, TradingSignal, SignalAction
+from src.backtesting.fill_model import IntrabarFillModel, first_touch
+from src.backtesting.portfolio_backtester import PortfolioBacktester, PortfolioSleeve
+from src.backtesting.timeframe_alignment import TimeframeAlignment
+from src.backtesting.ledger import TradeLedger, EquityLedger
+from src.strategies.base_strategy import BaseStrategy, TradingSignal, SignalAction, VectorizedSignals
+from src.strategies.momentum import MomentumStrategy
+from src.strategies.keltner_strategy import KeltnerStrategy
+from src.strategies.connors_rsi_strategy import ConnorsRSIStrategy
+from src.strategies.universal_macd_strategy import UniversalMacdStrategy
+from src.strategies.bandtastic_strategy import BandtasticStrategy
 
 
 class MockStrategy(BaseStrategy):
@@ -55,6 +71,27 @@ class MockStrategy(BaseStrategy):
         )
 
 
+class MockVectorizedStrategy(MockStrategy):
+    """Mock strategy emitting the same signal on every bar in one pass"""
+    
+    def generate_signals_vectorized(self, data):
+        n = len(data)
+        code = {
+            SignalAction.BUY: VectorizedSignals.BUY,
+            SignalAction.SELL: VectorizedSignals.SELL
+        }.get(self.signal_action, VectorizedSignals.HOLD)
+        prices = data['close'].to_numpy()
+        
+        return VectorizedSignals(
+            action=np.full(n, code, dtype=np.int8),
+            confidence=np.full(n, self.signal_confidence),
+            stop_loss=prices * 0.98,
+            take_profit=prices * 1.02,
+            position_size=np.full(n, 0.1),
+            leverage=np.ones(n)
+        )
+
+
 class TestBacktestEngine(unittest.TestCase):
     """Test BacktestEngine"""
     
@@ -161,6 +198,590 @@ class TestBacktestEngine(unittest.TestCase):
         
         stop_loss_trades = [t for t in results['trades'] if t.exit_reason == 'stop_loss']
         self.assertGreater(len(stop_loss_trades), 0)
+    
+    def test_array_kernel_matches_bar_loop(self):
+        """Test array kernel produces identical trades to the row-by-row loop"""
+        data = self._create_test_data(num_bars=300)
+        
+        results = []
+        for use_array_kernel in (False, True):
+            engine = BacktestEngine(initial_capital=10000.0, use_array_kernel=use_array_kernel)
+            strategy = MockStrategy('test', {
+                'signal_action': SignalAction.SELL,
+                'signal_confidence': 0.8
+            })
+            results.append(engine.run_backtest(strategy, data, 'BTC/USDT'))
+        
+        legacy, kernel = results
+        self.assertGreater(len(legacy['trades']), 0)
+        self.assertEqual(legacy['trades'], kernel['trades'])
+        self.assertEqual(legacy['equity_curve'], kernel['equity_curve'])
+        self.assertEqual(legacy['final_equity'], kernel['final_equity'])
+    
+    def test_bar_view(self):
+        """Test BarView exposes one row of the column arrays"""
+        columns = {
+            'close': np.array([1.0, 2.0, 3.0]),
+            'rsi': np.array([40.0, 50.0, 60.0])
+        }
+        view = BarView(columns, 1)
+        
+        self.assertEqual(view['close'], 2.0)
+        self.assertEqual(view.get('rsi'), 50.0)
+        self.assertEqual(view.get('adx', 25), 25)
+        self.assertIn('rsi', view)
+        self.assertEqual(len(view), 2)
+        self.assertEqual(dict(view), {'close': 2.0, 'rsi': 50.0})
+
+
+class TestVectorizedSignals(unittest.TestCase):
+    """Test the vectorized signal fast path"""
+    
+    def _create_indicator_data(self, num_bars=600):
+        """Create OHLCV data with the indicator columns used by the strategies"""
+        dates = pd.date_range(start='2024-01-01', periods=num_bars, freq='1h')
+        
+        rng = np.random.default_rng(7)
+        close = 50000 * (1 + rng.normal(0, 0.01, num_bars)).cumprod()
+        close_series = pd.Series(close, index=dates)
+        atr = close * 0.01
+        volume = rng.uniform(100, 1000, num_bars)
+        ema_12 = close_series.ewm(span=12).mean()
+        ema_26 = close_series.ewm(span=26).mean()
+        macd_histogram = (ema_12 - ema_26) - (ema_12 - ema_26).ewm(span=9).mean()
+        keltner_middle = close_series.ewm(span=20).mean()
+        
+        data = pd.DataFrame({
+            'open': close * 0.999,
+            'high': close * 1.004,
+            'low': close * 0.996,
+            'close': close,
+            'volume': volume,
+            'rsi': rng.uniform(20, 80, num_bars),
+            'rsi_2': rng.uniform(0, 100, num_bars),
+            'adx': rng.uniform(10, 50, num_bars),
+            'plus_di': rng.uniform(0, 40, num_bars),
+            'minus_di': rng.uniform(0, 40, num_bars),
+            'atr': atr,
+            'ema_12': ema_12,
+            'ema_26': ema_26,
+            'ema_12_prev': ema_12.shift(1).bfill(),
+            'ema_26_prev': ema_26.shift(1).bfill(),
+            'macd_histogram': macd_histogram,
+            'macd_histogram_prev': macd_histogram.shift(1).bfill(),
+            'bb_upper': keltner_middle + 2 * atr,
+            'bb_middle': keltner_middle,
+            'bb_lower': keltner_middle - 2 * atr,
+            'keltner_middle': keltner_middle,
+            'keltner_upper': keltner_middle + 1.5 * atr,
+            'keltner_lower': keltner_middle - 1.5 * atr,
+            'sma_200': close_series.rolling(200, min_periods=1).mean(),
+            'volume_avg': pd.Series(volume, index=dates).rolling(20, min_periods=1).mean(),
+            'volume_trend': rng.normal(0, 10, num_bars),
+            'price_change_pct': close_series.pct_change().fillna(0) * 100,
+            'trend_1h': (ema_12 > ema_26).astype(int)
+        }, index=dates)
+        
+        return data
+    
+    def _strategy_factories(self):
+        """Strategies with a vectorized implementation, tuned to trade often"""
+        return [
+            lambda: MomentumStrategy('momentum', {'min_confidence': 0.2}),
+            lambda: KeltnerStrategy('BTC/USDT'),
+            lambda: ConnorsRSIStrategy(
+                'BTC/USDT', rsi_oversold=30, rsi_overbought=70,
+                min_confidence=0.7, adx_max=40
+            ),
+            lambda: UniversalMacdStrategy(
+                'BTC/USDT', buy_umacd_min=-0.01, buy_umacd_max=0.01,
+                stop_loss_pct=0.01, take_profit_pct=0.02
+            ),
+            lambda: BandtasticStrategy(
+                'BTC/USDT', buy_bb_level=0, buy_rsi_threshold=100,
+                buy_mfi_threshold=100, stop_loss_pct=0.01, take_profit_pct=0.01
+            )
+        ]
+    
+    def test_vectorized_matches_bar_by_bar(self):
+        """Test vectorized signals reproduce the per-bar trades exactly"""
+        data = self._create_indicator_data()
+        
+        for factory in self._strategy_factories():
+            per_bar = BacktestEngine(use_vectorized_signals=False).run_backtest(factory(), data)
+            vectorized = BacktestEngine(use_vectorized_signals=True).run_backtest(factory(), data)
+            
+            name = type(factory()).__name__
+            self.assertGreater(len(per_bar['trades']), 0, name)
+            self.assertEqual(per_bar['trades'], vectorized['trades'], name)
+            self.assertEqual(per_bar['equity_curve'], vectorized['equity_curve'], name)
+    
+    def test_vectorized_honors_daily_trade_limit(self):
+        """Test the fast path applies max_daily_trades through can_trade"""
+        data = self._create_indicator_data(num_bars=96)
+        strategy = MockVectorizedStrategy('test', {
+            'signal_action': SignalAction.BUY,
+            'signal_confidence': 0.8,
+            'max_daily_trades': 2
+        })
+        
+        results = BacktestEngine(max_positions=10).run_backtest(strategy, data)
+        
+        entries_per_day = pd.Series(
+            [t.entry_time.date() for t in results['trades']]
+        ).value_counts()
+        self.assertEqual(len(entries_per_day), 4)
+        self.assertTrue((entries_per_day == 2).all())
+    
+    def test_vectorized_honors_cooldown(self):
+        """Test the fast path applies min_minutes_between_trades"""
+        data = self._create_indicator_data(num_bars=48)
+        strategy = MockVectorizedStrategy('test', {
+            'signal_action': SignalAction.SELL,
+            'signal_confidence': 0.8,
+            'min_minutes_between_trades': 180
+        })
+        
+        results = BacktestEngine(max_positions=10).run_backtest(strategy, data)
+        
+        entry_times = sorted(t.entry_time for t in results['trades'])
+        gaps = np.diff([ts.value for ts in entry_times]) / 60e9
+        self.assertGreater(len(entry_times), 1)
+        self.assertTrue((gaps >= 180).all())
+    
+    def test_base_strategy_has_no_vectorized_signals(self):
+        """Test strategies without the hook fall back to per-bar evaluation"""
+        strategy = MockStrategy('test', {'signal_action': SignalAction.BUY})
+        
+        self.assertIsNone(strategy.generate_signals_vectorized(self._create_indicator_data(10)))
+
+
+class OneShotStrategy(MockStrategy):
+    """Mock strategy entering once, on the first bar"""
+    
+    def generate_signal(self, market_data, indicators):
+        signal = super().generate_signal(market_data, indicators)
+        self.signal_action = SignalAction.HOLD
+        return signal
+
+
+class TestIntrabarFills(unittest.TestCase):
+    """Test intrabar stop-loss / take-profit fills"""
+    
+    def _bars(self, rows, freq='1h', start='2024-01-01'):
+        """Build OHLCV data from (open, high, low, close) rows"""
+        rows = np.asarray(rows, dtype=float)
+        return pd.DataFrame({
+            'open': rows[:, 0],
+            'high': rows[:, 1],
+            'low': rows[:, 2],
+            'close': rows[:, 3],
+            'volume': 100.0
+        }, index=pd.date_range(start=start, periods=len(rows), freq=freq))
+    
+    def _run(self, data, fill_model, action=SignalAction.BUY):
+        engine = BacktestEngine(slippage_pct=0.0, fill_model=fill_model)
+        strategy = OneShotStrategy('test', {'signal_action': action, 'signal_confidence': 0.8})
+        return engine.run_backtest(strategy, data)['trades']
+    
+    def test_first_touch_matches_scan(self):
+        """Test the chunked search finds the same bar as a full scan"""
+        rng = np.random.default_rng(3)
+        closes = 100 * np.cumprod(1 + rng.normal(0, 0.002, 20000))
+        highs = closes * 1.001
+        lows = closes * 0.999
+        
+        for start in (0, 500, 19990):
+            for below, above in [(95.0, None), (None, 106.0), (97.0, 103.0), (1.0, 1e9)]:
+                touched = np.zeros(len(closes), dtype=bool)
+                if below is not None:
+                    touched |= lows <= below
+                if above is not None:
+                    touched |= highs >= above
+                hits = np.flatnonzero(touched[start:])
+                expected = start + hits[0] if len(hits) else -1
+                
+                self.assertEqual(first_touch(highs, lows, start, below, above, chunk_size=8), expected)
+    
+    def test_wick_triggers_stop(self):
+        """Test a wick through the stop fills it even when the close recovers"""
+        data = self._bars([
+            (100, 100, 100, 100),
+            (100, 101, 97, 100),   # wick below the 98 stop
+            (100, 101, 99, 100),
+        ])
+        
+        self.assertEqual(self._run(data, None)[0].exit_reason, 'backtest_end')
+        
+        trade = self._run(data, 'ohlc')[0]
+        self.assertEqual(trade.exit_reason, 'stop_loss')
+        self.assertEqual(trade.exit_time, data.index[1])
+        self.assertAlmostEqual(trade.exit_price, 98.0)
+    
+    def test_gap_fills_at_open(self):
+        """Test a bar opening through the stop fills at its open"""
+        data = self._bars([
+            (100, 100, 100, 100),
+            (96, 97, 95, 96),
+        ])
+        
+        trade = self._run(data, 'worst_case')[0]
+        self.assertEqual(trade.exit_reason, 'stop_loss')
+        self.assertAlmostEqual(trade.exit_price, 96.0)
+    
+    def test_ambiguous_bar_paths(self):
+        """Test path assumptions when one bar touches both levels"""
+        data = self._bars([
+            (100, 100, 100, 100),
+            (100, 103, 97, 100),   # touches the 98 stop and the 102 target
+        ])
+        
+        self.assertEqual(self._run(data, 'ohlc')[0].exit_reason, 'take_profit')
+        self.assertEqual(self._run(data, 'worst_case')[0].exit_reason, 'stop_loss')
+        self.assertEqual(self._run(data, 'ohlc', SignalAction.SELL)[0].exit_reason, 'stop_loss')
+        
+        for sub_rows, expected in [
+            ([(100, 100.5, 99, 99.5), (99.5, 99.5, 97, 98), (98, 103, 98, 100)], 'stop_loss'),
+            ([(100, 102.5, 99.5, 102), (102, 102, 97, 98), (98, 100, 98, 100)], 'take_profit'),
+        ]:
+            minutes = self._bars(sub_rows, freq='20min', start='2024-01-01 01:00')
+            model = IntrabarFillModel('subbar', intrabar_data=minutes)
+            trade = self._run(data, model)[0]
+            self.assertEqual(trade.exit_reason, expected)
+            self.assertEqual(trade.exit_time, data.index[1])
+    
+    def test_fill_model_same_across_loops(self):
+        """Test every engine loop produces the same trades with a fill model"""
+        dates = pd.date_range(start='2024-01-01', periods=400, freq='1h')
+        rng = np.random.default_rng(11)
+        prices = 50000 * np.cumprod(1 + rng.normal(0, 0.006, len(dates)))
+        data = pd.DataFrame({
+            'open': prices * 0.999,
+            'high': prices * 1.012,
+            'low': prices * 0.985,
+            'close': prices,
+            'volume': 100.0
+        }, index=dates)
+        
+        results = []
+        for use_array_kernel, use_vectorized_signals in [(False, False), (True, False), (True, True)]:
+            engine = BacktestEngine(
+                max_positions=5,
+                use_array_kernel=use_array_kernel,
+                use_vectorized_signals=use_vectorized_signals,
+                fill_model='ohlc'
+            )
+            strategy = MockVectorizedStrategy('test', {
+                'signal_action': SignalAction.BUY,
+                'signal_confidence': 0.8
+            })
+            results.append(engine.run_backtest(strategy, data))
+        
+        self.assertGreater(len(results[0]['trades']), 10)
+        for other in results[1:]:
+            self.assertEqual(results[0]['trades'], other['trades'])
+            self.assertEqual(results[0]['equity_curve'], other['equity_curve'])
+    
+    def test_invalid_fill_model(self):
+        """Test unknown paths and subbar without data are rejected"""
+        with self.assertRaises(ValueError):
+            BacktestEngine(fill_model='random')
+        with self.assertRaises(ValueError):
+            IntrabarFillModel('subbar')
+
+
+class TestPortfolioBacktester(unittest.TestCase):
+    """Test PortfolioBacktester"""
+    
+    def _series(self, num_bars=300, freq='1h', seed=5, start_price=100.0):
+        """Random-walk OHLCV data"""
+        rng = np.random.default_rng(seed)
+        prices = start_price * np.cumprod(1 + rng.normal(0, 0.008, num_bars))
+        return pd.DataFrame({
+            'open': prices * 0.999,
+            'high': prices * 1.01,
+            'low': prices * 0.99,
+            'close': prices,
+            'volume': 100.0
+        }, index=pd.date_range(start='2024-01-01', periods=num_bars, freq=freq))
+    
+    def _strategy(self, cls, action, name='test'):
+        return cls(name, {'signal_action': action, 'signal_confidence': 0.8})
+    
+    def test_single_sleeve_matches_backtest_engine(self):
+        """Test one sleeve reproduces BacktestEngine (timestamps move to bar close)"""
+        data = self._series()
+        
+        for cls in (MockStrategy, MockVectorizedStrategy):
+            for fill_model in (None, 'ohlc'):
+                expected = BacktestEngine(max_positions=3, fill_model=fill_model).run_backtest(
+                    self._strategy(cls, SignalAction.BUY), data
+                )
+                
+                shifted = data.copy()
+                shifted.index = data.index - pd.Timedelta('1h')
+                results = PortfolioBacktester(
+                    max_positions=3, max_exposure_pct=None, fill_model=fill_model
+                ).run_portfolio([(self._strategy(cls, SignalAction.BUY), 'BTC/USDT', shifted, '1h')])
+                
+                self.assertGreater(len(expected['trades']), 5)
+                self.assertEqual(expected['trades'], results['trades'])
+                np.testing.assert_allclose(
+                    [eq for _, eq in expected['equity_curve']],
+                    [eq for _, eq in results['equity_curve']]
+                )
+                self.assertEqual(
+                    [ts for ts, _ in expected['equity_curve']],
+                    [ts for ts, _ in results['equity_curve']]
+                )
+    
+    def test_shared_position_limit(self):
+        """Test sleeves on different symbols share max_positions"""
+        sleeves = [
+            PortfolioSleeve(self._strategy(MockStrategy, SignalAction.BUY, 'a'), 'AAA/USDT',
+                            self._series(num_bars=600, freq='5min', seed=1), '5m'),
+            PortfolioSleeve(self._strategy(MockStrategy, SignalAction.SELL, 'b'), 'BBB/USDT',
+                            self._series(num_bars=50, freq='1h', seed=2), '1h'),
+            PortfolioSleeve(self._strategy(MockVectorizedStrategy, SignalAction.BUY, 'c'), 'CCC/USDT',
+                            self._series(num_bars=200, freq='15min', seed=3)),
+        ]
+        
+        results = PortfolioBacktester(max_positions=2, max_exposure_pct=None).run_portfolio(sleeves)
+        trades = results['trades']
+        
+        self.assertEqual(results['symbols'], ['AAA/USDT', 'BBB/USDT', 'CCC/USDT'])
+        self.assertGreater(len({t.symbol for t in trades}), 1)
+        
+        changes = sorted([(t.entry_time, 1) for t in trades] + [(t.exit_time, -1) for t in trades])
+        self.assertLessEqual(max(np.cumsum([delta for _, delta in changes])), 2)
+    
+    def test_events_at_bar_close(self):
+        """Test coarse bars are acted on when they close, in time order with fine bars"""
+        results = PortfolioBacktester(max_positions=5, max_exposure_pct=None).run_portfolio([
+            PortfolioSleeve(self._strategy(MockStrategy, SignalAction.SELL, 'b'), 'BBB/USDT',
+                            self._series(num_bars=50, freq='1h', seed=2), '1h'),
+            PortfolioSleeve(self._strategy(MockStrategy, SignalAction.BUY, 'c'), 'CCC/USDT',
+                            self._series(num_bars=200, freq='15min', seed=3)),
+        ])
+        
+        hourly = [t for t in results['trades'] if t.symbol == 'BBB/USDT']
+        self.assertGreater(len(hourly), 0)
+        self.assertEqual(min(t.entry_time for t in hourly), pd.Timestamp('2024-01-01 01:00'))
+        self.assertTrue(all(t.entry_time.minute == 0 for t in hourly))
+        
+        timestamps = [ts for ts, _ in results['equity_curve']]
+        self.assertEqual(timestamps[0], pd.Timestamp('2024-01-01 00:15'))
+        self.assertEqual(timestamps, sorted(set(timestamps)))
+        self.assertEqual(results['num_events'], len(timestamps))
+    
+    def test_signals_on_a_symbol_are_aggregated(self):
+        """Test opposing sleeves on one symbol resolve by weighted vote"""
+        data = self._series(num_bars=30)
+        
+        results = PortfolioBacktester(max_positions=1, max_exposure_pct=None).run_portfolio([
+            PortfolioSleeve(self._strategy(MockStrategy, SignalAction.BUY, 'long'), 'BTC/USDT', data, weight=1.0),
+            PortfolioSleeve(self._strategy(MockStrategy, SignalAction.SELL, 'short'), 'BTC/USDT', data, weight=3.0),
+        ])
+        
+        self.assertGreater(len(results['trades']), 0)
+        self.assertTrue(all(t.side == 'short' for t in results['trades']))
+    
+    def test_exposure_limit(self):
+        """Test check_combined_exposure caps concurrent positions"""
+        sleeves = [
+            PortfolioSleeve(self._strategy(MockStrategy, SignalAction.BUY, name), name, self._series(seed=i))
+            for i, name in enumerate(['AAA/USDT', 'BBB/USDT', 'CCC/USDT'])
+        ]
+        
+        results = PortfolioBacktester(max_positions=3, max_exposure_pct=15.0).run_portfolio(sleeves)
+        
+        self.assertGreater(results['rejected_signals'], 0)
+        changes = sorted([(t.entry_time, 1) for t in results['trades']] +
+                         [(t.exit_time, -1) for t in results['trades']])
+        self.assertEqual(max(np.cumsum([delta for _, delta in changes])), 1)
+
+
+class HigherTimeframeRecorder(MockStrategy):
+    """Mock strategy recording the higher-timeframe bars it is shown"""
+    
+    def __init__(self, name: str, config: dict):
+        super().__init__(name, config)
+        self.seen = []
+    
+    def generate_signal(self, market_data, indicators):
+        bar = market_data['timeframes']['1h']
+        self.seen.append(np.nan if bar is None else bar['close'])
+        return super().generate_signal(market_data, indicators)
+
+
+class TestTimeframeAlignment(unittest.TestCase):
+    """Test TimeframeAlignment"""
+    
+    def setUp(self):
+        rng = np.random.default_rng(11)
+        prices = 100 * np.cumprod(1 + rng.normal(0, 0.002, 2000))
+        self.base = pd.DataFrame({
+            'open': prices,
+            'high': prices * 1.002,
+            'low': prices * 0.998,
+            'close': prices,
+            'volume': 1.0
+        }, index=pd.date_range(start='2024-01-01 00:10', periods=2000, freq='5min'))
+        
+        ohlc = {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'}
+        self.frames = {tf: self.base.resample(freq).agg(ohlc) for tf, freq in (('1h', '1h'), ('4h', '4h'))}
+    
+    def test_positions_are_last_closed_bars(self):
+        """Test each base bar maps to the last higher bar closed by its own close"""
+        alignment = TimeframeAlignment(self.base, self.frames, base_timeframe='5m')
+        base_close = self.base.index + pd.Timedelta('5m')
+        
+        for tf, frame in self.frames.items():
+            close = frame.index + pd.Timedelta(tf)
+            expected = [int((close <= t).sum()) - 1 for t in base_close]
+            np.testing.assert_array_equal(alignment.positions(tf), expected)
+        
+        # 00:10 .. 00:50 bars close before 01:00, the 00:55 bar closes the first hour
+        self.assertEqual(alignment.position('1h', 8), -1)
+        self.assertIsNone(alignment.bar('1h', 8))
+        self.assertEqual(alignment.position('1h', 9), 0)
+        self.assertEqual(alignment.bar_time('1h', 9), pd.Timestamp('2024-01-01 00:00'))
+    
+    def test_no_lookahead(self):
+        """Test a higher bar's close is never a base close from the future"""
+        alignment = TimeframeAlignment(self.base, self.frames)
+        closes = self.base['close'].to_numpy()
+        
+        for tf in self.frames:
+            aligned = alignment.aligned_frame(tf)
+            for i in range(len(self.base)):
+                value = alignment.value(tf, 'close', i)
+                if np.isnan(value):
+                    self.assertTrue(np.isnan(aligned[f"close_{tf}"].iloc[i]))
+                    continue
+                self.assertIn(value, closes[:i + 1])
+                self.assertEqual(aligned[f"close_{tf}"].iloc[i], value)
+        
+        window = alignment.window('4h', 500, 3, ['close'])
+        self.assertEqual(window['close'][-1], alignment.value('4h', 'close', 500))
+        self.assertEqual(len(window['close']), 3)
+        self.assertEqual(len(alignment.window('4h', 0, 3)['close']), 0)
+        
+        arrays = alignment.time_series_arrays(500, lookback_bars=5)
+        self.assertEqual(set(arrays), {'1h', '4h'})
+        self.assertEqual(len(arrays['1h']['close']), 5)
+    
+    def test_engine_passes_closed_higher_bars(self):
+        """Test bar-by-bar strategies receive the aligned bars through market_data"""
+        alignment = TimeframeAlignment(self.base, self.frames)
+        expected = [alignment.value('1h', 'close', i) for i in range(len(self.base))]
+        
+        for use_array_kernel in (True, False):
+            for higher_timeframes in (alignment, self.frames):
+                strategy = HigherTimeframeRecorder('recorder', {})
+                BacktestEngine(use_array_kernel=use_array_kernel).run_backtest(
+                    strategy, self.base, higher_timeframes=higher_timeframes
+                )
+                np.testing.assert_array_equal(strategy.seen, expected)
+        
+        with self.assertRaises(ValueError):
+            BacktestEngine().run_backtest(HigherTimeframeRecorder('recorder', {}), self.base.iloc[:100],
+                                          higher_timeframes=alignment)
+    
+    def test_invalid_timeframes(self):
+        """Test timeframes finer than the base are rejected"""
+        with self.assertRaises(ValueError):
+            TimeframeAlignment(self.frames['1h'], {'5m': self.base})
+
+
+class TestLedgers(unittest.TestCase):
+    """Test TradeLedger and EquityLedger"""
+    
+    def _trade(self, i, tz=None, **overrides):
+        entry = pd.Timestamp('2024-01-01', tz=tz) + pd.Timedelta(hours=i)
+        fields = dict(
+            entry_time=entry, exit_time=entry + pd.Timedelta(minutes=30),
+            symbol='BTC/USDT' if i % 2 else 'ETH/USDT', side='long' if i % 3 else 'short',
+            entry_price=100.0 + i, exit_price=101.0 + i, size=0.5, leverage=2.0,
+            pnl=float(i - 5), pnl_pct=float(i - 5) / 10, fees=0.1, duration_minutes=30.0,
+            exit_reason='take_profit', metadata={'strategy': 'momentum', 'confidence': 0.8, 'entry_fees': 0.05}
+        )
+        fields.update(overrides)
+        return Trade(**fields)
+    
+    def test_trade_ledger_round_trip(self):
+        """Test trades come back equal after growing past the initial capacity"""
+        trades = [self._trade(i, tz='UTC') for i in range(40)]
+        trades[7].metadata['note'] = 'manual'
+        trades[9].metadata['confidence'] = 'high'
+        
+        ledger = TradeLedger(capacity=4)
+        for trade in trades:
+            ledger.append(trade)
+        
+        self.assertEqual(len(ledger), 40)
+        self.assertEqual(ledger, trades)
+        self.assertEqual(ledger[-1], trades[-1])
+        self.assertEqual(ledger[5:8], trades[5:8])
+        self.assertNotIn('note', ledger[6].metadata)
+        self.assertEqual(ledger[7].entry_time.tz, trades[7].entry_time.tz)
+        np.testing.assert_array_equal(ledger.column('pnl'), [t.pnl for t in trades])
+        self.assertEqual(list(ledger.values('symbol')), [t.symbol for t in trades])
+        
+        df = ledger.to_frame()
+        self.assertEqual(list(df['exit_reason'].unique()), ['take_profit'])
+        self.assertEqual(list(df['entry_time']), [t.entry_time for t in trades])
+        
+        with self.assertRaises(IndexError):
+            ledger[40]
+        with self.assertRaises(ValueError):
+            ledger.column('pnl')[0] = 1.0
+    
+    def test_equity_ledger(self):
+        """Test the equity ledger behaves like the list of tuples it replaces"""
+        curve = [(pd.Timestamp('2024-01-01') + pd.Timedelta(minutes=i), 1000.0 + i) for i in range(100)]
+        
+        ledger = EquityLedger(capacity=1)
+        for entry in curve:
+            ledger.append(entry)
+        
+        self.assertEqual(ledger, curve)
+        self.assertEqual(ledger[10], curve[10])
+        self.assertEqual([eq for _, eq in ledger], [eq for _, eq in curve])
+        self.assertEqual(ledger.timestamps[1] - ledger.timestamps[0], 60 * 10**9)
+        pd.testing.assert_frame_equal(
+            ledger.to_frame(),
+            pd.DataFrame(curve, columns=['timestamp', 'equity']).set_index('timestamp')
+        )
+        self.assertTrue(EquityLedger().to_frame().empty)
+    
+    def test_pickle(self):
+        """Test ledgers survive pickling (process-pool optimizers return them)"""
+        import pickle
+        
+        ledger = TradeLedger()
+        for i in range(5):
+            ledger.append(self._trade(i))
+        
+        restored = pickle.loads(pickle.dumps(ledger))
+        self.assertEqual(restored, ledger)
+        restored.append(self._trade(5))
+        self.assertEqual(len(restored), 6)
+        self.assertEqual(restored[5].metadata['strategy'], 'momentum')
+    
+    def test_engine_results(self):
+        """Test engine results and DataFrames are built from the ledgers"""
+        data = TestPortfolioBacktester()._series(num_bars=500)
+        engine = BacktestEngine()
+        results = engine.run_backtest(MockStrategy('test', {'signal_action': SignalAction.BUY}), data)
+        
+        trades = list(results['trades'])
+        self.assertIsInstance(results['trades'], TradeLedger)
+        self.assertIsInstance(trades[0], Trade)
+        self.assertEqual(results['num_wins'], sum(t.pnl > 0 for t in trades))
+        self.assertAlmostEqual(results['total_profit'], sum(t.pnl for t in trades if t.pnl > 0))
+        self.assertEqual(len(engine.get_trade_dataframe()), len(trades))
+        self.assertEqual(list(engine.get_equity_dataframe().index), list(data.index))
 
 
 class TestPerformanceMetrics(unittest.TestCase):
@@ -262,6 +883,53 @@ class TestPerformanceMetrics(unittest.TestCase):
         
         self.assertEqual(metrics['total_return_pct'], 0.0)
         self.assertEqual(metrics['num_trades'], 0)
+    
+    def test_drawdowns_and_streaks(self):
+        """Test drawdown periods and win/loss streaks on a hand-built run"""
+        base_time = datetime(2024, 1, 1)
+        values = [100, 110, 99, 110, 121, 100, 90, 95]
+        equity_curve = [(base_time + timedelta(days=i), v) for i, v in enumerate(values)]
+        trades = [
+            Trade(base_time, base_time + timedelta(hours=1), 'BTC/USDT', 'long', 1, 1, 1, 1,
+                  pnl, pnl / 10, 0.1, 60, 'take_profit')
+            for pnl in [5, 3, -1, -2, -4, 6, 0]
+        ]
+        
+        metrics = PerformanceMetrics.calculate_all_metrics(trades, equity_curve, 100.0)
+        
+        # Day 2 opens a drawdown, day 3 only matches the peak, day 4 is the next high
+        self.assertEqual(metrics['max_drawdown_duration_days'], 2)
+        self.assertAlmostEqual(metrics['max_drawdown_pct'], (121 - 90) / 121 * 100)
+        self.assertEqual(metrics['max_drawdown_start'], base_time + timedelta(days=5))
+        self.assertEqual(metrics['max_drawdown_end'], base_time + timedelta(days=6))
+        self.assertEqual(metrics['consecutive_wins_max'], 2)
+        self.assertEqual(metrics['consecutive_losses_max'], 3)
+        self.assertEqual(metrics['largest_loss'], -4)
+        
+        ledger_trades, ledger_curve = TradeLedger(), EquityLedger()
+        for trade in trades:
+            ledger_trades.append(trade)
+        for entry in equity_curve:
+            ledger_curve.append(entry)
+        self.assertEqual(PerformanceMetrics.calculate_all_metrics(ledger_trades, ledger_curve, 100.0), metrics)
+    
+    def test_daily_ratios(self):
+        """Test Sharpe and Sortino from daily returns of an intraday equity curve"""
+        base_time = datetime(2024, 1, 1)
+        daily = [100, 101, 100.5, 102, 101, 103]
+        equity_curve = [
+            (base_time + timedelta(days=d, hours=h), daily[d] - (1 if h < 23 else 0))
+            for d in range(len(daily)) for h in range(24)
+        ]
+        
+        metrics = PerformanceMetrics.calculate_all_metrics(
+            self._create_test_trades(), equity_curve, 100.0, risk_free_rate=0.0
+        )
+        
+        returns = np.diff(daily) / np.array(daily[:-1])
+        downside = np.sqrt(np.mean(np.minimum(returns, 0) ** 2))
+        self.assertAlmostEqual(metrics['daily_sharpe_ratio'], returns.mean() / returns.std(ddof=1) * np.sqrt(365))
+        self.assertAlmostEqual(metrics['daily_sortino_ratio'], returns.mean() / downside * np.sqrt(365))
 
 
 class TestParameterOptimizer(unittest.TestCase):
@@ -331,6 +999,524 @@ class TestParameterOptimizer(unittest.TestCase):
         self.assertEqual(len(results), 5)
 
 
+    def _scores_by_params(self, results):
+        """Order-independent view of optimization results"""
+        return sorted((str(r['params']), r['score'], r['metrics']['num_trades']) for r in results)
+    
+    def test_parallel_grid_search_matches_serial(self):
+        """Test process and thread pools reproduce serial grid search"""
+        data = self._create_test_data()
+        param_grid = {'signal_confidence': [0.5, 0.7, 0.9]}
+        base_config = {'signal_action': SignalAction.BUY}
+        
+        serial_best, serial_results = self.optimizer.grid_search(
+            MockStrategy, base_config, param_grid, data, 'BTC/USDT'
+        )
+        
+        for executor in ('process', 'thread'):
+            optimizer = ParameterOptimizer(self.engine, 'sharpe_ratio', n_jobs=2, executor=executor)
+            streamed = []
+            best_params, results = optimizer.grid_search(
+                MockStrategy, base_config, param_grid, data, 'BTC/USDT',
+                callback=streamed.append
+            )
+            
+            self.assertEqual(best_params, serial_best)
+            self.assertEqual(self._scores_by_params(results), self._scores_by_params(serial_results))
+            self.assertEqual(len(streamed), 3)
+    
+    def test_parallel_random_search(self):
+        """Test random search on a process pool"""
+        data = self._create_test_data()
+        optimizer = ParameterOptimizer(self.engine, 'sharpe_ratio', n_jobs=2)
+        
+        best_params, results = optimizer.random_search(
+            MockStrategy,
+            {'signal_action': SignalAction.BUY},
+            {'signal_confidence': (0.5, 1.0)},
+            data,
+            n_iterations=4,
+            symbol='BTC/USDT'
+        )
+        
+        self.assertIsInstance(best_params, dict)
+        self.assertEqual(len(results), 4)
+    
+    def test_parallel_search_on_shared_dataset(self):
+        """Test process workers attach to a caller-owned SharedDataset"""
+        data = self._create_test_data()
+        param_grid = {'signal_confidence': [0.5, 0.7, 0.9]}
+        base_config = {'signal_action': SignalAction.BUY}
+        
+        serial_best, serial_results = self.optimizer.grid_search(
+            MockStrategy, base_config, param_grid, data, 'BTC/USDT'
+        )
+        
+        with SharedDataset.from_dataframe(data) as dataset:
+            optimizer = ParameterOptimizer(self.engine, 'sharpe_ratio', n_jobs=2)
+            best_params, results = optimizer.grid_search(
+                MockStrategy, base_config, param_grid, dataset, 'BTC/USDT'
+            )
+            
+            self.assertEqual(best_params, serial_best)
+            self.assertEqual(self._scores_by_params(results), self._scores_by_params(serial_results))
+            self.assertEqual(len(dataset), len(data))
+    
+    def test_parallel_cross_validate_matches_serial(self):
+        """Test cross-validation folds on a process pool reproduce serial folds"""
+        data = self._create_test_data()
+        config = {'signal_action': SignalAction.BUY, 'signal_confidence': 0.8}
+        
+        serial = self.optimizer.cross_validate(MockStrategy, config, data, n_splits=3, min_trades_per_fold=0)
+        optimizer = ParameterOptimizer(self.engine, 'sharpe_ratio', n_jobs=3)
+        parallel = optimizer.cross_validate(MockStrategy, config, data, n_splits=3, min_trades_per_fold=0)
+        
+        self.assertEqual(parallel, serial)
+        self.assertEqual(parallel['passed_folds'], 3)
+    
+    def test_cross_validate_many_shares_one_pool(self):
+        """Test configurations x folds run on one pool and match per-config cross-validation"""
+        from unittest.mock import patch
+        from concurrent.futures import ProcessPoolExecutor
+        
+        data = self._create_test_data()
+        configs = [
+            {'signal_action': SignalAction.BUY, 'signal_confidence': confidence}
+            for confidence in (0.5, 0.7, 0.9)
+        ]
+        serial = [
+            self.optimizer.cross_validate(MockStrategy, config, data, n_splits=2, min_trades_per_fold=0)
+            for config in configs
+        ]
+        
+        optimizer = ParameterOptimizer(self.engine, 'sharpe_ratio', n_jobs=4)
+        with patch('src.backtesting.optimizer.ProcessPoolExecutor', wraps=ProcessPoolExecutor) as pool_class, \
+                patch.object(SharedDataset, 'from_dataframe', wraps=SharedDataset.from_dataframe) as from_dataframe:
+            parallel = optimizer.cross_validate_many(MockStrategy, configs, data, n_splits=2, min_trades_per_fold=0)
+        
+        self.assertEqual(parallel, serial)
+        self.assertEqual(pool_class.call_count, 1)
+        self.assertEqual(pool_class.call_args.kwargs['max_workers'], 4)
+        self.assertEqual(from_dataframe.call_count, 1)
+    
+    def test_invalid_executor(self):
+        """Test unknown executor types are rejected"""
+        with self.assertRaises(ValueError):
+            ParameterOptimizer(self.engine, executor='cluster')
+
+
+class TestSharedDataset(unittest.TestCase):
+    """Test SharedDataset"""
+    
+    def _create_test_data(self, tz=None):
+        """Create test data"""
+        dates = pd.date_range(start='2024-01-01', periods=50, freq='1h', tz=tz, name='timestamp')
+        np.random.seed(7)
+        prices = 50000 * (1 + np.random.normal(0.0001, 0.01, 50)).cumprod()
+        
+        return pd.DataFrame({
+            'open': prices,
+            'high': prices * 1.001,
+            'low': prices * 0.999,
+            'close': prices,
+            'volume': np.random.uniform(100, 1000, 50),
+            'rsi': np.random.uniform(30, 70, 50)
+        }, index=dates)
+    
+    def test_roundtrip(self):
+        """Test frames read back from shared memory match the source"""
+        for tz in (None, 'UTC'):
+            data = self._create_test_data(tz)
+            with SharedDataset.from_dataframe(data) as dataset:
+                pd.testing.assert_frame_equal(dataset.to_frame(), data, check_freq=False)
+                np.testing.assert_array_equal(dataset.column('close'), data['close'].to_numpy())
+    
+    def test_attach_by_handle(self):
+        """Test a second mapping sees the same memory"""
+        data = self._create_test_data()
+        with SharedDataset.from_dataframe(data) as dataset:
+            handle = dataset.handle
+            self.assertIsInstance(handle, SharedDatasetHandle)
+            
+            with SharedDataset.attach(handle) as attached:
+                pd.testing.assert_frame_equal(attached.to_frame(), data, check_freq=False)
+    
+    def test_views_are_read_only(self):
+        """Test views cannot write into the shared block"""
+        with SharedDataset.from_dataframe(self._create_test_data()) as dataset:
+            with self.assertRaises(ValueError):
+                dataset.column('close')[0] = 0.0
+    
+    def test_slice_matches_iloc(self):
+        """Test slices follow iloc semantics and survive a handle roundtrip"""
+        data = self._create_test_data()
+        with SharedDataset.from_dataframe(data) as dataset:
+            window = dataset.slice(10, 30)
+            nested = window.slice(5, -5)
+            
+            pd.testing.assert_frame_equal(window.to_frame(), data.iloc[10:30], check_freq=False)
+            pd.testing.assert_frame_equal(nested.to_frame(), data.iloc[15:25], check_freq=False)
+            
+            with SharedDataset.attach(nested.handle) as attached:
+                pd.testing.assert_frame_equal(attached.to_frame(), data.iloc[15:25], check_freq=False)
+    
+    def test_memory_mapped_file(self):
+        """Test file-backed datasets can be reattached by path"""
+        import tempfile
+        import os
+        
+        data = self._create_test_data()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'BTC_USDT_1h.bin')
+            with SharedDataset.from_dataframe(data, path=path) as dataset:
+                handle = dataset.handle
+            
+            with SharedDataset.attach(handle) as attached:
+                pd.testing.assert_frame_equal(attached.to_frame(), data, check_freq=False)
+    
+    def test_backtest_on_shared_dataset(self):
+        """Test the engine runs directly on a SharedDataset"""
+        data = self._create_test_data()
+        strategy_config = {'signal_action': SignalAction.BUY, 'signal_confidence': 0.8}
+        
+        expected = BacktestEngine(initial_capital=10000.0).run_backtest(
+            MockStrategy('test', strategy_config), data
+        )
+        with SharedDataset.from_dataframe(data) as dataset:
+            results = BacktestEngine(initial_capital=10000.0).run_backtest(
+                MockStrategy('test', strategy_config), dataset
+            )
+        
+        self.assertEqual(results['num_trades'], expected['num_trades'])
+        self.assertEqual(results['total_return_pct'], expected['total_return_pct'])
+
+
+class TestHistoricalStore(unittest.TestCase):
+    """Test HistoricalStore"""
+    
+    def setUp(self):
+        """Set up a temporary store"""
+        import tempfile
+        self._tmp = tempfile.TemporaryDirectory()
+        self.store = HistoricalStore(self._tmp.name)
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def _create_test_data(self, start='2024-01-30', periods=200):
+        """Create test data spanning a month boundary"""
+        dates = pd.date_range(start=start, periods=periods, freq='1h', name='timestamp')
+        np.random.seed(11)
+        prices = 50000 * (1 + np.random.normal(0.0001, 0.01, periods)).cumprod()
+        
+        return pd.DataFrame({
+            'open': prices,
+            'high': prices * 1.001,
+            'low': prices * 0.999,
+            'close': prices,
+            'volume': np.random.uniform(100, 1000, periods),
+            'trend_1h': np.random.randint(0, 2, periods)
+        }, index=dates)
+    
+    def test_roundtrip_partitions(self):
+        """Test data is split by month and reads back unchanged"""
+        data = self._create_test_data()
+        self.assertEqual(self.store.write(data, 'BTC/USDT', '1h'), 200)
+        
+        self.assertEqual(self.store.partitions('BTC/USDT', '1h'), ['2024-01', '2024-02'])
+        self.assertEqual(self.store.columns('BTC/USDT', '1h'), list(data.columns))
+        pd.testing.assert_frame_equal(self.store.read('BTC/USDT', '1h'), data, check_freq=False)
+    
+    def test_projection_and_range(self):
+        """Test column projection and time range filtering"""
+        data = self._create_test_data()
+        self.store.write(data, 'BTC/USDT', '1h')
+        
+        result = self.store.read(
+            'BTC/USDT', '1h', columns=['close'], start='2024-02-01 05:00', end='2024-02-03'
+        )
+        expected = data.loc[pd.Timestamp('2024-02-01 05:00'):pd.Timestamp('2024-02-03'), ['close']]
+        pd.testing.assert_frame_equal(result, expected, check_freq=False)
+        
+        empty = self.store.read('BTC/USDT', '1h', columns=['close'], start='2025-01-01')
+        self.assertEqual(len(empty), 0)
+        self.assertEqual(list(empty.columns), ['close'])
+    
+    def test_incremental_append(self):
+        """Test appends merge into existing months and newer rows win"""
+        data = self._create_test_data()
+        self.store.write(data.iloc[:120], 'BTC/USDT', '1h')
+        
+        update = data.iloc[100:].copy()
+        update.loc[update.index[0], 'close'] = 1.0
+        self.store.write(update, 'BTC/USDT', '1h')
+        
+        expected = data.copy()
+        expected.loc[update.index[0], 'close'] = 1.0
+        pd.testing.assert_frame_equal(self.store.read('BTC/USDT', '1h'), expected, check_freq=False)
+        self.assertEqual(self.store.last_timestamp('BTC/USDT', '1h'), data.index[-1])
+    
+    def test_convert_csv(self):
+        """Test DataDownloader CSV files convert into the store"""
+        import os
+        
+        data = self._create_test_data()
+        csv_path = os.path.join(self._tmp.name, 'ETH_USDT_1h.csv')
+        data.to_csv(csv_path)
+        
+        symbol, timeframe, rows = self.store.convert_csv(csv_path)
+        
+        self.assertEqual((symbol, timeframe, rows), ('ETH/USDT', '1h', 200))
+        pd.testing.assert_frame_equal(self.store.read('ETH/USDT', '1h'), data, check_freq=False)
+    
+    def test_invalid_write(self):
+        """Test unsupported modes and non-datetime frames are rejected"""
+        with self.assertRaises(ValueError):
+            self.store.write(self._create_test_data(), 'BTC/USDT', '1h', mode='upsert')
+        with self.assertRaises(ValueError):
+            self.store.write(pd.DataFrame({'close': [1.0]}), 'BTC/USDT', '1h')
+
+
+class TestIndicatorCache(unittest.TestCase):
+    """Test IndicatorCache"""
+    
+    CONFIG = {'version': 1, 'rsi': 14}
+    
+    def setUp(self):
+        """Set up a temporary cache"""
+        import tempfile
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = IndicatorCache(self._tmp.name)
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def _create_test_data(self):
+        """Create test data"""
+        dates = pd.date_range(start='2024-01-01', periods=100, freq='1h', name='timestamp')
+        np.random.seed(5)
+        prices = 50000 * (1 + np.random.normal(0.0001, 0.01, 100)).cumprod()
+        
+        return pd.DataFrame({
+            'open': prices,
+            'high': prices * 1.001,
+            'low': prices * 0.999,
+            'close': prices,
+            'volume': np.random.uniform(100, 1000, 100),
+            'rsi': np.random.uniform(30, 70, 100)
+        }, index=dates)
+    
+    def test_build_once_then_map(self):
+        """Test the builder only runs on a miss and hits are memory-mapped"""
+        data = self._create_test_data()
+        builds = []
+        
+        def build():
+            builds.append(1)
+            return data
+        
+        for _ in range(3):
+            dataset = self.cache.get_or_build('BTC/USDT', '1h', self.CONFIG, build, source='v1')
+            pd.testing.assert_frame_equal(dataset.to_frame(), data, check_freq=False)
+            self.assertIsNotNone(dataset.handle.path)
+            dataset.close()
+        
+        self.assertEqual(len(builds), 1)
+    
+    def test_stale_source_rebuilds(self):
+        """Test a changed source fingerprint or config misses the cache"""
+        data = self._create_test_data()
+        self.cache.store(data, 'BTC/USDT', '1h', self.CONFIG, source=frame_fingerprint(data))
+        
+        changed = data.copy()
+        changed.loc[changed.index[-1], 'close'] += 1.0
+        
+        self.assertIsNotNone(self.cache.load('BTC/USDT', '1h', self.CONFIG, source=frame_fingerprint(data)))
+        self.assertIsNone(self.cache.load('BTC/USDT', '1h', self.CONFIG, source=frame_fingerprint(changed)))
+        self.assertIsNone(self.cache.load('BTC/USDT', '1h', {'version': 2, 'rsi': 14}))
+        self.assertNotEqual(config_hash(self.CONFIG), config_hash({'rsi': 14, 'version': 2}))
+        self.assertEqual(config_hash(self.CONFIG), config_hash({'rsi': 14, 'version': 1}))
+    
+    def test_load_data_through_cache(self):
+        """Test DataDownloader maps CSV data from the cache and notices file changes"""
+        import os
+        from src.backtesting.data_downloader import DataDownloader
+        
+        data = self._create_test_data()
+        data_dir = os.path.join(self._tmp.name, 'historical')
+        cache_dir = os.path.join(self._tmp.name, 'cache')
+        os.makedirs(data_dir)
+        csv_path = os.path.join(data_dir, 'BTC_USDT_1h.csv')
+        data.to_csv(csv_path)
+        
+        downloader = DataDownloader('binance')
+        first = downloader.load_data('BTC/USDT', '1h', data_dir=data_dir, cache_dir=cache_dir)
+        second = downloader.load_dataset('BTC/USDT', '1h', data_dir=data_dir, cache_dir=cache_dir)
+        
+        pd.testing.assert_frame_equal(first, data, check_freq=False)
+        pd.testing.assert_frame_equal(second.to_frame(), data, check_freq=False)
+        
+        data.iloc[:50].to_csv(csv_path)
+        os.utime(csv_path, ns=(0, 0))
+        self.assertEqual(len(downloader.load_dataset('BTC/USDT', '1h', data_dir=data_dir, cache_dir=cache_dir)), 50)
+
+
+class FakePagedExchange:
+    """Async CCXT-like exchange serving hourly candles in pages"""
+    
+    def __init__(self, start='2024-01-01', periods=24 * 75, missing_once=(), fail_after=None, always_fail=False,
+                 error=ConnectionError):
+        start_ms = int(pd.Timestamp(start).value // 1_000_000)
+        self.candles = [
+            [start_ms + i * 3_600_000, 100.0 + i, 101.0 + i, 99.0 + i, 100.5 + i, 10.0]
+            for i in range(periods)
+        ]
+        self.missing_once = set(missing_once)
+        self.fail_after = fail_after
+        self.always_fail = always_fail
+        self.error = error
+        self.calls = 0
+    
+    async def fetch_ohlcv(self, symbol, timeframe, since=None, limit=500):
+        self.calls += 1
+        if self.always_fail or (self.fail_after is not None and self.calls > self.fail_after):
+            raise self.error('exchange unavailable')
+        
+        await asyncio.sleep(0)
+        page = [c for c in self.candles if c[0] >= since][:limit]
+        served = [c for c in page if c[0] not in self.missing_once]
+        self.missing_once -= {c[0] for c in page}
+        return served
+    
+    async def close(self):
+        pass
+
+
+class TestAsyncDataDownloader(unittest.TestCase):
+    """Test AsyncDataDownloader"""
+    
+    def setUp(self):
+        """Set up a temporary store"""
+        import tempfile
+        self._tmp = tempfile.TemporaryDirectory()
+        self.store = HistoricalStore(self._tmp.name)
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def _downloader(self, exchange, **kwargs):
+        from src.utils.rate_limiter import RateLimiter
+        return AsyncDataDownloader(
+            'binance',
+            store=self.store,
+            limit=100,
+            flush_rows=300,
+            retry_delay=0.0,
+            exchange=exchange,
+            rate_limiter=RateLimiter('test', budgets={'market_data': (100000, 1)}),
+            **kwargs
+        )
+    
+    def _expected(self, exchange):
+        return pd.DataFrame(
+            exchange.candles, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
+        ).assign(timestamp=lambda df: pd.to_datetime(df['timestamp'], unit='ms')).set_index('timestamp')
+    
+    def test_concurrent_download(self):
+        """Test month chunks are fetched concurrently and stored completely"""
+        exchange = FakePagedExchange()
+        downloader = self._downloader(exchange, max_concurrency=3)
+        
+        summary = asyncio.run(downloader.download(['BTC/USDT'], ['1h'], '2024-01-01', '2024-03-16'))
+        
+        result = summary['BTC/USDT 1h']
+        self.assertEqual(result['chunks'], 3)
+        self.assertEqual(result['rows'], 1800)
+        self.assertEqual(result['failed_chunks'], [])
+        self.assertEqual(self.store.partitions('BTC/USDT', '1h'), ['2024-01', '2024-02', '2024-03'])
+        pd.testing.assert_frame_equal(self.store.read('BTC/USDT', '1h'), self._expected(exchange))
+    
+    def test_resume_after_failure(self):
+        """Test an interrupted download resumes from the checkpoint"""
+        failing = FakePagedExchange(fail_after=12)
+        first = asyncio.run(
+            self._downloader(failing, max_concurrency=1, max_retries=1).download(
+                ['BTC/USDT'], ['1h'], '2024-01-01', '2024-03-16', backfill_gaps=False
+            )
+        )
+        self.assertTrue(first['BTC/USDT 1h']['failed_chunks'])
+        
+        exchange = FakePagedExchange()
+        second = asyncio.run(
+            self._downloader(exchange).download(['BTC/USDT'], ['1h'], '2024-01-01', '2024-03-16')
+        )
+        
+        self.assertEqual(second['BTC/USDT 1h']['failed_chunks'], [])
+        self.assertLess(exchange.calls, 18)
+        pd.testing.assert_frame_equal(self.store.read('BTC/USDT', '1h'), self._expected(exchange))
+    
+    def test_open_ended_download_resumes_current_month(self):
+        """Test the current month keeps its checkpoint when end_date is now"""
+        import json
+        import os
+        from unittest.mock import patch
+        
+        with patch.object(pd.Timestamp, 'now', return_value=pd.Timestamp('2024-03-10', tz='UTC')):
+            first = asyncio.run(
+                self._downloader(FakePagedExchange()).download(['BTC/USDT'], ['1h'], '2024-01-01')
+            )
+        self.assertEqual(first['BTC/USDT 1h']['failed_chunks'], [])
+        
+        exchange = FakePagedExchange()
+        with patch.object(pd.Timestamp, 'now', return_value=pd.Timestamp('2024-03-16', tz='UTC')):
+            second = asyncio.run(
+                self._downloader(exchange).download(['BTC/USDT'], ['1h'], '2024-01-01')
+            )
+        
+        self.assertEqual(second['BTC/USDT 1h']['failed_chunks'], [])
+        self.assertEqual(exchange.calls, 3)
+        pd.testing.assert_frame_equal(self.store.read('BTC/USDT', '1h'), self._expected(exchange))
+        
+        with open(os.path.join(self.store.root, '_checkpoints', 'BTC_USDT_1h.json')) as f:
+            chunks = json.load(f)['chunks']
+        self.assertEqual(sorted(chunks), ['2024-01', '2024-02', '2024-03'])
+    
+    def test_gap_backfill(self):
+        """Test candles missing from the first pass are found and refetched"""
+        exchange = FakePagedExchange()
+        missing = [candle[0] for candle in exchange.candles[500:510]]
+        exchange.missing_once = set(missing)
+        downloader = self._downloader(exchange)
+        
+        summary = asyncio.run(downloader.download(['BTC/USDT'], ['1h'], '2024-01-01', '2024-03-16'))
+        
+        self.assertEqual(summary['BTC/USDT 1h']['gaps_backfilled'], 10)
+        self.assertEqual(summary['BTC/USDT 1h']['gaps'], 0)
+        self.assertEqual(downloader.find_gaps('BTC/USDT', '1h'), [])
+        pd.testing.assert_frame_equal(self.store.read('BTC/USDT', '1h'), self._expected(exchange))
+    
+    def test_persistent_errors_give_up(self):
+        """Test a chunk that keeps failing is reported instead of retried forever"""
+        exchange = FakePagedExchange(always_fail=True)
+        downloader = self._downloader(exchange, max_retries=2)
+        
+        summary = asyncio.run(downloader.download(['BTC/USDT'], ['1h'], '2024-01-01', '2024-02-01'))
+        
+        self.assertEqual(len(summary['BTC/USDT 1h']['failed_chunks']), 1)
+        self.assertEqual(exchange.calls, 3)
+        self.assertFalse(self.store.exists('BTC/USDT', '1h'))
+        
+        throttled = FakePagedExchange(always_fail=True, error=ccxt.RateLimitExceeded)
+        downloader = self._downloader(throttled, max_retries=2)
+        downloader.rate_limiter.penalize = Mock()
+        
+        summary = asyncio.run(downloader.download(['BTC/USDT'], ['1h'], '2024-01-01', '2024-02-01'))
+        
+        self.assertEqual(len(summary['BTC/USDT 1h']['failed_chunks']), 1)
+        self.assertEqual(throttled.calls, 3)
+        self.assertEqual(downloader.rate_limiter.penalize.call_count, 2)
+
+
 class TestWalkForwardOptimizer(unittest.TestCase):
     """Test WalkForwardOptimizer"""
     
@@ -372,6 +1558,20 @@ class TestWalkForwardOptimizer(unittest.TestCase):
         self.assertIsInstance(test_data, pd.DataFrame)
         self.assertGreater(len(train_data), 0)
         self.assertGreater(len(test_data), 0)
+    
+    def test_generate_windows_on_shared_dataset(self):
+        """Test windows over a SharedDataset are zero-copy slices of the same rows"""
+        data = self._create_test_data()
+        
+        expected = self.wf_optimizer._generate_windows(data, train_months=6, test_months=1)
+        with SharedDataset.from_dataframe(data) as dataset:
+            windows = self.wf_optimizer._generate_windows(dataset, train_months=6, test_months=1)
+            
+            self.assertEqual(len(windows), len(expected))
+            train_data, test_data = windows[0]
+            self.assertIsInstance(train_data, SharedDataset)
+            pd.testing.assert_frame_equal(train_data.to_frame(), expected[0][0], check_freq=False)
+            pd.testing.assert_frame_equal(test_data.to_frame(), expected[0][1], check_freq=False)
 
 
 if __name__ == '__main__':
@@ -8,6 +8,7 @@ import numpy as np
 from datetime import datetime, timedelta
 
 from src.data.indicators import TechnicalIndicators
+from src.data.streaming_indicators import StreamingIndicators, anchor_cumulative
 
 
 @pytest.fixture
@@ -240,5 +241,73 @@ class TestTechnicalIndicators:
         assert len(df) == 5
 
 
+
+def _stream(df, engine=None):
+    """Feed every bar through a StreamingIndicators engine."""
+    engine = engine or StreamingIndicators(window=len(df))
+    rows = [
+        dict(engine.update(bar.open, bar.high, bar.low, bar.close, bar.volume))
+        for bar in df.itertuples(index=False)
+    ]
+    return pd.DataFrame(rows, index=df.index)
+
+
+class TestStreamingIndicators:
+    """Test suite for StreamingIndicators against the batch path."""
+    
+    def test_matches_talib(self, indicators, sample_ohlcv_data):
+        """Test streaming values equal TA-Lib wherever TA-Lib has output."""
+        df = sample_ohlcv_data.astype({'volume': float})
+        batch = indicators.calculate_bollinger_bands(
+            indicators.calculate_macd(indicators.calculate_ema(indicators.calculate_rsi(df)))
+        )
+        batch = indicators.calculate_obv(indicators.calculate_adx(indicators.calculate_atr(batch)))
+        stream = _stream(df)
+        
+        for col in ['rsi', 'ema_12', 'ema_26', 'macd', 'macd_signal', 'macd_hist',
+                    'bb_upper', 'bb_middle', 'bb_lower', 'atr', 'adx', 'obv']:
+            np.testing.assert_allclose(stream[col], batch[col], rtol=1e-9, equal_nan=True, err_msg=col)
+    
+    def test_matches_pandas_rolling(self, sample_ohlcv_data):
+        """Test rolling and pandas-based columns."""
+        df = sample_ohlcv_data.astype({'volume': float})
+        stream = _stream(df)
+        
+        np.testing.assert_allclose(stream['sma_20'], df['close'].rolling(20).mean(), rtol=1e-9)
+        np.testing.assert_allclose(stream['std_dev'], df['close'].rolling(20).std(), rtol=1e-9)
+        np.testing.assert_allclose(stream['donchian_high_20'], df['high'].rolling(20).max())
+        np.testing.assert_allclose(stream['donchian_low_10'], df['low'].rolling(10).min())
+        np.testing.assert_allclose(stream['keltner_middle'], df['close'].ewm(span=20).mean(), rtol=1e-9)
+        np.testing.assert_allclose(stream['roc'], df['close'].pct_change(periods=5) * 100, rtol=1e-9)
+        np.testing.assert_allclose(stream['vwap'], anchor_cumulative(df.copy())['vwap'], rtol=1e-9)
+    
+    def test_revise_replaces_last_bar(self, sample_ohlcv_data):
+        """Test revising the forming bar gives the same state as pushing the final bar."""
+        df = sample_ohlcv_data.astype({'volume': float})
+        expected = _stream(df)
+        
+        engine = StreamingIndicators(window=len(df))
+        rows = []
+        for bar in df.itertuples(index=False):
+            engine.update(bar.open, bar.high * 1.01, bar.low * 0.98, bar.close * 1.02, bar.volume * 2)
+            rows.append(dict(engine.revise(bar.open, bar.high, bar.low, bar.close, bar.volume)))
+        
+        pd.testing.assert_frame_equal(pd.DataFrame(rows, index=df.index), expected)
+    
+    def test_anchored_window_slides(self, sample_ohlcv_data):
+        """Test OBV/VWAP follow the batch path's re-anchoring at the window start."""
+        df = sample_ohlcv_data.astype({'volume': float})
+        stream = _stream(df, StreamingIndicators(window=30))
+        expected = anchor_cumulative(df.iloc[-30:].copy())
+        
+        assert stream['obv'].iloc[-1] == pytest.approx(expected['obv'].iloc[-1])
+        assert stream['vwap'].iloc[-1] == pytest.approx(expected['vwap'].iloc[-1])
+    
+    def test_revise_without_bar(self):
+        """Test revising an empty engine is rejected."""
+        with pytest.raises(ValueError):
+            StreamingIndicators().revise(1, 1, 1, 1, 1)
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
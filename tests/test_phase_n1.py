@@ -7,12 +7,19 @@ Tests:
 - Funding rate and order book fetching
 """
 
+import asyncio
+import json
 import pytest
+import numpy as np
+import websockets
 import pandas as pd
 from datetime import datetime, timedelta
 from unittest.mock import Mock, AsyncMock, patch
 
 from src.data.price_feed import PriceFeed, OHLCVWindow
+from src.data.ohlcv_buffer import OHLCVRingBuffer
+from src.data.market_transport import BybitStreamCodec
+from src.utils.rate_limiter import RateLimiter, TokenBucket, get_rate_limiter, request_weight
 from src.ai.prompt_builder import PromptBuilder
 
 
@@ -199,6 +206,575 @@ class TestPriceFeedMultiTimeframe:
         assert result['imbalance'] > 0
 
 
+class TestPriceFeedIncrementalIndicators:
+    """Test streaming indicator updates against the batch path"""
+    
+    def _make_feed(self, mode, bars, state):
+        """PriceFeed with a mock exchange serving bars[:state['t']], last one still forming"""
+        price_feed = PriceFeed(
+            exchange_id='binance',
+            api_key='test',
+            api_secret='test',
+            symbols=['BTC/USDT'],
+            timeframes=['1h'],
+            candle_lookback_bars=250,
+            testnet=True,
+            indicator_mode=mode
+        )
+        price_feed.rate_limiter = RateLimiter('binance')
+        
+        async def fetch_ohlcv(symbol, timeframe, limit):
+            candles = [list(bar) for bar in bars[max(0, state['t'] - limit):state['t']]]
+            candles[-1][4] *= 1.002
+            candles[-1][5] *= 0.5
+            return candles
+        
+        price_feed.exchange = AsyncMock()
+        price_feed.exchange.fetch_ohlcv = fetch_ohlcv
+        return price_feed
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('mode', ['incremental', 'verify'])
+    async def test_incremental_matches_batch(self, mode):
+        """Test streamed windows match a full recompute, including the revised forming candle"""
+        np.random.seed(11)
+        n = 260
+        closes = 50000 * np.cumprod(1 + np.random.normal(0, 0.01, n))
+        timestamps = pd.date_range('2024-01-01', periods=n, freq='1h').astype('int64') // 10**6
+        bars = [
+            [int(timestamps[i]), closes[i] * 0.999, closes[i] * 1.005, closes[i] * 0.995,
+             closes[i], float(np.random.uniform(100, 1000))]
+            for i in range(n)
+        ]
+        
+        windows = {}
+        for feed_mode in ('batch', mode):
+            state = {'t': 240}
+            price_feed = self._make_feed(feed_mode, bars, state)
+            await price_feed._fetch_ohlcv('BTC/USDT', '1h', initial=True)
+            for t in range(241, n + 1):
+                state['t'] = t
+                await price_feed._fetch_ohlcv('BTC/USDT', '1h')
+            windows[feed_mode] = price_feed.ohlcv_windows[('BTC/USDT', '1h')]
+        
+        expected, actual = windows['batch'], windows[mode]
+        assert list(actual.df.columns) == list(expected.df.columns)
+        assert len(actual.df) == len(expected.df) == 250
+        pd.testing.assert_frame_equal(actual.df.iloc[-5:], expected.df.iloc[-5:], rtol=1e-6)
+        for name, value in expected.indicators.items():
+            assert actual.indicators[name] == pytest.approx(value, rel=1e-6, abs=1e-8), name
+        assert actual.buffer.nbytes == OHLCVRingBuffer.estimate_nbytes(250, len(actual.buffer.columns))
+    
+    def test_invalid_indicator_mode(self):
+        """Test unknown indicator modes are rejected"""
+        with pytest.raises(ValueError):
+            PriceFeed(
+                exchange_id='binance',
+                api_key='test',
+                api_secret='test',
+                symbols=['BTC/USDT'],
+                timeframes=['1h'],
+                indicator_mode='sometimes'
+            )
+
+
+class FakeTickerExchange:
+    """CCXT-like exchange that counts ticker requests"""
+    
+    def __init__(self, bulk=True, bulk_raises=None):
+        self.has = {'fetchTickers': bulk}
+        self.bulk_raises = bulk_raises
+        self.calls = {'fetch_ticker': 0, 'fetch_tickers': 0}
+    
+    def _ticker(self, symbol):
+        return {'symbol': symbol, 'last': 100.0 + len(symbol), 'bid': 99.0, 'ask': 101.0, 'quoteVolume': 1e6}
+    
+    async def fetch_ticker(self, symbol):
+        self.calls['fetch_ticker'] += 1
+        return self._ticker(symbol)
+    
+    async def fetch_tickers(self, symbols):
+        self.calls['fetch_tickers'] += 1
+        if self.bulk_raises:
+            raise self.bulk_raises
+        return {symbol: self._ticker(symbol) for symbol in symbols}
+
+
+class TestPriceFeedTickers:
+    """Test bulk ticker polling"""
+    
+    SYMBOLS = [f'COIN{i}/USDT' for i in range(40)]
+    
+    def _make_feed(self, exchange, **kwargs):
+        price_feed = PriceFeed(
+            exchange_id='binance',
+            api_key='test',
+            api_secret='test',
+            symbols=self.SYMBOLS,
+            timeframes=['1m'],
+            testnet=True,
+            **kwargs
+        )
+        price_feed.rate_limiter = RateLimiter('binance')
+        price_feed.exchange = exchange
+        return price_feed
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('batch_size,requests', [(None, 1), (15, 3)])
+    async def test_bulk_tickers(self, batch_size, requests):
+        """Test all symbols are fetched with one request per chunk"""
+        exchange = FakeTickerExchange()
+        price_feed = self._make_feed(exchange, ticker_batch_size=batch_size)
+        
+        await price_feed._update_all_tickers()
+        
+        assert exchange.calls == {'fetch_ticker': 0, 'fetch_tickers': requests}
+        assert set(price_feed.price_snapshots) == set(self.SYMBOLS)
+        assert price_feed.get_latest_price('COIN7/USDT') == 110.0
+        
+        metrics = price_feed.get_statistics()['ticker_metrics']
+        assert metrics['mode'] == 'bulk'
+        assert metrics['cycles'] == 1
+        assert metrics['last_cycle_requests'] == requests
+        assert metrics['last_cycle_ms'] > 0
+    
+    @pytest.mark.asyncio
+    async def test_single_ticker_fallback(self):
+        """Test exchanges without bulk tickers get one request per symbol"""
+        exchange = FakeTickerExchange(bulk=False)
+        price_feed = self._make_feed(exchange, ticker_batch_size=10)
+        
+        await price_feed._update_all_tickers()
+        await price_feed._update_all_tickers()
+        
+        assert exchange.calls == {'fetch_ticker': 80, 'fetch_tickers': 0}
+        assert len(price_feed.price_snapshots) == 40
+        metrics = price_feed.get_statistics()['ticker_metrics']
+        assert metrics['mode'] == 'single'
+        assert metrics['requests'] == 80
+    
+    @pytest.mark.asyncio
+    async def test_not_supported_disables_bulk(self):
+        """Test a NotSupported bulk request falls back to per-symbol tickers for good"""
+        import ccxt.async_support as ccxt
+        exchange = FakeTickerExchange(bulk_raises=ccxt.NotSupported('fetchTickers'))
+        price_feed = self._make_feed(exchange)
+        
+        await price_feed._update_all_tickers()
+        await price_feed._update_all_tickers()
+        
+        assert exchange.calls == {'fetch_ticker': 80, 'fetch_tickers': 1}
+        assert len(price_feed.price_snapshots) == 40
+    
+    @pytest.mark.asyncio
+    async def test_redis_mirror_one_pipeline_per_cycle(self):
+        """Test a ticker cycle mirrors every snapshot to Redis in one round trip"""
+        fakeredis = pytest.importorskip('fakeredis')
+        from src.data.storage import RedisCache
+        
+        price_feed = self._make_feed(FakeTickerExchange())
+        price_feed.cache = RedisCache(client=fakeredis.FakeAsyncRedis())
+        
+        await price_feed._update_all_tickers()
+        
+        stats = price_feed.cache.get_stats()
+        assert stats['round_trips'] == 1
+        assert stats['writes'] == 40
+        snapshot = await price_feed.cache.get('price:COIN7/USDT')
+        assert snapshot['price'] == 110.0
+
+
+class TestRemotePriceFeed:
+    """Test RemotePriceFeed mirroring a publishing PriceFeed over Redis pub/sub"""
+    
+    def _make_publisher(self, client, bars, state):
+        """Publishing PriceFeed with fake tickers and OHLCV bars[:state['t']]"""
+        from src.data.storage import RedisCache
+        
+        price_feed = PriceFeed(
+            exchange_id='binance',
+            api_key='test',
+            api_secret='test',
+            symbols=['BTC/USDT', 'ETH/USDT'],
+            timeframes=['1h'],
+            candle_lookback_bars=100,
+            testnet=True,
+            publish=True
+        )
+        price_feed.rate_limiter = RateLimiter('binance')
+        
+        async def fetch_ohlcv(symbol, timeframe, limit):
+            return [list(bar) for bar in bars[max(0, state['t'] - limit):state['t']]]
+        
+        exchange = FakeTickerExchange()
+        exchange.fetch_ohlcv = fetch_ohlcv
+        price_feed.exchange = exchange
+        price_feed.cache = RedisCache(client=client)
+        return price_feed
+    
+    @pytest.mark.asyncio
+    async def test_late_join_and_candle_close(self):
+        """Test a late consumer loads the feed's state, then follows published candle closes"""
+        fakeredis = pytest.importorskip('fakeredis')
+        from src.data.storage import RedisCache
+        from src.data.remote_price_feed import RemotePriceFeed
+        
+        np.random.seed(5)
+        closes = 50000 * np.cumprod(1 + np.random.normal(0, 0.01, 150))
+        timestamps = pd.date_range('2024-01-01', periods=150, freq='1h').astype('int64') // 10**6
+        bars = [[int(t), c, c * 1.005, c * 0.995, c, 500.0] for t, c in zip(timestamps, closes)]
+        state = {'t': 120}
+        
+        server = fakeredis.FakeServer()
+        publisher = self._make_publisher(fakeredis.FakeAsyncRedis(server=server), bars, state)
+        await publisher._fetch_initial_ohlcv()
+        await publisher._update_all_tickers()
+        
+        remote = RemotePriceFeed('binance', cache=RedisCache(client=fakeredis.FakeAsyncRedis(server=server)))
+        await remote.start()
+        
+        assert remote.symbols == ['BTC/USDT', 'ETH/USDT']
+        assert remote.timeframes == ['1h']
+        assert remote.get_latest_price('ETH/USDT') == publisher.get_latest_price('ETH/USDT')
+        pd.testing.assert_frame_equal(remote.get_ohlcv('BTC/USDT', '1h'), publisher.get_ohlcv('BTC/USDT', '1h'))
+        assert remote.get_indicators('BTC/USDT', '1h')['rsi'] == pytest.approx(
+            publisher.get_indicators('BTC/USDT', '1h')['rsi'])
+        
+        state['t'] = 121
+        await publisher._fetch_ohlcv('BTC/USDT', '1h')
+        await publisher._flush_redis()
+        
+        expected = publisher.get_latest_candle('BTC/USDT', '1h')
+        for _ in range(200):
+            if remote.get_latest_candle('BTC/USDT', '1h') == expected:
+                break
+            await asyncio.sleep(0.01)
+        
+        assert remote.get_latest_candle('BTC/USDT', '1h') == expected
+        assert remote.messages_received >= 1
+        pd.testing.assert_frame_equal(
+            remote.get_multi_timeframe_data('BTC/USDT', lookback_bars=20)['1h'],
+            publisher.get_multi_timeframe_data('BTC/USDT', lookback_bars=20)['1h']
+        )
+        await remote.stop()
+
+
+class TestOHLCVRingBuffer:
+    """Test the fixed-capacity OHLCV window store"""
+    
+    @pytest.fixture
+    def frame(self):
+        """Candles with an integer flag column"""
+        n = 30
+        close = 100 + np.arange(n, dtype=float)
+        return pd.DataFrame({
+            'open': close - 0.5,
+            'high': close + 1,
+            'low': close - 1,
+            'close': close,
+            'volume': np.full(n, 1000.0),
+            'direction': (np.arange(n) % 2).astype(int)
+        }, index=pd.date_range('2024-01-01', periods=n, freq='1min', name='timestamp'))
+    
+    def test_wraparound_matches_tail(self, frame):
+        """Test appends past capacity keep the most recent rows in order"""
+        buffer = OHLCVRingBuffer.from_frame(frame.iloc[:10], capacity=8)
+        for timestamp, row in frame.iloc[10:].iterrows():
+            buffer.append(timestamp, row.to_dict())
+        
+        assert len(buffer) == 8
+        pd.testing.assert_frame_equal(buffer.view(), frame.tail(8), check_freq=False)
+        pd.testing.assert_frame_equal(buffer.view(3), frame.tail(3), check_freq=False)
+        assert buffer.timestamp(0) == frame.index[-8]
+        assert buffer.row(-1)['direction'] == frame['direction'].iloc[-1]
+    
+    def test_views_are_zero_copy_and_read_only(self, frame):
+        """Test columns and frames share the preallocated storage"""
+        buffer = OHLCVRingBuffer.from_frame(frame, capacity=50)
+        nbytes = buffer.nbytes
+        
+        closes = buffer.column('close', 5)
+        view = buffer.view()
+        assert np.shares_memory(closes, buffer._values)
+        assert np.shares_memory(view['close'].to_numpy(), buffer._values)
+        assert view['direction'].dtype == np.int64
+        with pytest.raises(ValueError):
+            closes[0] = 0.0
+        
+        for i in range(100):
+            buffer.append(frame.index[-1] + pd.Timedelta(minutes=i + 1), {'close': float(i)})
+        assert buffer.nbytes == nbytes == OHLCVRingBuffer.estimate_nbytes(50, 6)
+    
+    def test_upsert_replaces_forming_candle(self, frame):
+        """Test upsert replaces the last candle and rejects older timestamps"""
+        buffer = OHLCVRingBuffer.from_frame(frame, capacity=40)
+        
+        assert buffer.upsert(frame.index[-1], {**frame.iloc[-1].to_dict(), 'close': 1.5}) is False
+        assert len(buffer) == len(frame)
+        assert buffer.column('close')[-1] == 1.5
+        
+        assert buffer.upsert(frame.index[-1] + pd.Timedelta(minutes=1), frame.iloc[-1].to_dict()) is True
+        assert len(buffer) == len(frame) + 1
+        
+        with pytest.raises(ValueError):
+            buffer.upsert(frame.index[0], frame.iloc[0].to_dict())
+    
+    def test_write_tail(self, frame):
+        """Test rewriting a column across the wrap-around"""
+        buffer = OHLCVRingBuffer.from_frame(frame.iloc[:10], capacity=8)
+        for timestamp, row in frame.iloc[10:15].iterrows():
+            buffer.append(timestamp, row.to_dict())
+        
+        buffer.write_tail('volume', np.arange(6, dtype=float))
+        assert buffer.column('volume').tolist() == [1000.0, 1000.0, 0, 1, 2, 3, 4, 5]
+        assert buffer.view()['volume'].tolist() == [1000.0, 1000.0, 0, 1, 2, 3, 4, 5]
+
+
+class TestPriceFeedWebSocketTransport:
+    """Test the websocket transport against a local stand-in server"""
+    
+    RECORDED = [
+        {'result': None, 'id': 1},
+        {'e': '24hrTicker', 'E': 1704070800000, 's': 'BTCUSDT', 'c': '50010.5', 'q': '123456789.0'},
+        {'e': 'aggTrade', 'E': 1704070800100, 's': 'BTCUSDT', 'p': '50012.0', 'q': '0.5', 'T': 1704070800099},
+        {'e': 'kline', 'E': 1704070800200, 's': 'BTCUSDT', 'k': {
+            't': 1704070800000, 'i': '1h', 'o': '50000', 'h': '50100', 'l': '49900',
+            'c': '50050', 'v': '10.5', 'x': False}},
+        {'e': 'kline', 'E': 1704074399999, 's': 'BTCUSDT', 'k': {
+            't': 1704070800000, 'i': '1h', 'o': '50000', 'h': '50200', 'l': '49900',
+            'c': '50150', 'v': '20.0', 'x': True}},
+        {'e': 'kline', 'E': 1704074400100, 's': 'BTCUSDT', 'k': {
+            't': 1704074400000, 'i': '1h', 'o': '50150', 'h': '50160', 'l': '50140',
+            'c': '50155', 'v': '0.7', 'x': False}},
+    ]
+    
+    def _make_feed(self, url):
+        """PriceFeed with an initial 1h window ending at the first recorded candle"""
+        price_feed = PriceFeed(
+            exchange_id='binance',
+            api_key='test',
+            api_secret='test',
+            symbols=['BTC/USDT'],
+            timeframes=['1h'],
+            candle_lookback_bars=100,
+            testnet=True,
+            transport='websocket',
+            ws_url=url
+        )
+        price_feed.rate_limiter = RateLimiter('binance')
+        
+        np.random.seed(3)
+        closes = 50000 * np.cumprod(1 + np.random.normal(0, 0.002, 60))
+        timestamps = pd.date_range(end='2024-01-01 01:00', periods=60, freq='1h').astype('int64') // 10**6
+        bars = [[int(t), c, c * 1.002, c * 0.998, c, 5.0] for t, c in zip(timestamps, closes)]
+        
+        price_feed.exchange = AsyncMock()
+        price_feed.exchange.fetch_ohlcv = AsyncMock(return_value=bars)
+        price_feed.exchange.fetch_ticker = AsyncMock(return_value={'last': 49000.0, 'bid': 48999.0, 'ask': 49001.0})
+        return price_feed
+    
+    @staticmethod
+    async def _wait_for(condition, timeout=5.0):
+        """Poll until condition() is true"""
+        deadline = asyncio.get_running_loop().time() + timeout
+        while not condition():
+            assert asyncio.get_running_loop().time() < deadline, "timed out"
+            await asyncio.sleep(0.01)
+    
+    @pytest.mark.asyncio
+    async def test_stream_updates_feed_in_place(self):
+        """Test replayed ticker, trade and kline messages update snapshots and windows"""
+        subscriptions = []
+        
+        async def replay(connection):
+            subscriptions.append(json.loads(await connection.recv()))
+            for message in self.RECORDED:
+                await connection.send(json.dumps(message))
+            await connection.wait_closed()
+        
+        async with websockets.serve(replay, '127.0.0.1', 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            price_feed = self._make_feed(f'ws://127.0.0.1:{port}')
+            await price_feed._fetch_ohlcv('BTC/USDT', '1h', initial=True)
+            window = price_feed.ohlcv_windows[('BTC/USDT', '1h')]
+            
+            transport = price_feed._create_transport()
+            price_feed.transport = transport
+            await transport.start()
+            try:
+                await self._wait_for(lambda: transport.messages_received == len(self.RECORDED))
+            finally:
+                await transport.stop()
+        
+        assert subscriptions[0]['method'] == 'SUBSCRIBE'
+        assert 'btcusdt@kline_1h' in subscriptions[0]['params']
+        
+        snapshot = price_feed.price_snapshots['BTC/USDT']
+        assert snapshot.price == 50012.0
+        assert snapshot.volume_24h == 123456789.0
+        
+        assert price_feed.ohlcv_windows[('BTC/USDT', '1h')] is window
+        assert len(window.buffer) == 61
+        assert window.buffer.timestamp(-1) == pd.Timestamp('2024-01-01 02:00')
+        assert window.df['close'].iloc[-2:].tolist() == [50150.0, 50155.0]
+        assert window.indicators['rsi'] == pytest.approx(
+            price_feed._calculate_indicators(window.df[['open', 'high', 'low', 'close', 'volume']].copy())['rsi'].iloc[-1]
+        )
+        price_feed.exchange.fetch_ohlcv.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_falls_back_to_polling_on_disconnect(self):
+        """Test polling takes over while the stream is down and stops after reconnect"""
+        connections = []
+        
+        async def drop_first(connection):
+            connections.append(connection)
+            await connection.recv()
+            if len(connections) == 1:
+                await connection.close()
+                return
+            await connection.wait_closed()
+        
+        async with websockets.serve(drop_first, '127.0.0.1', 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            price_feed = self._make_feed(f'ws://127.0.0.1:{port}')
+            price_feed.is_running = True
+            
+            transport = price_feed._create_transport()
+            transport.reconnect_delay = 0.2
+            await transport.start()
+            try:
+                await self._wait_for(lambda: transport.fallback.is_running)
+                await self._wait_for(lambda: 'BTC/USDT' in price_feed.price_snapshots)
+                assert price_feed.price_snapshots['BTC/USDT'].price == 49000.0
+                
+                await self._wait_for(lambda: transport.connected and len(connections) == 2)
+                assert not transport.fallback.is_running
+                assert transport.disconnects == 1
+            finally:
+                price_feed.is_running = False
+                await transport.stop()
+    
+    def test_bybit_codec(self):
+        """Test Bybit v5 messages normalize to the same events"""
+        codec = BybitStreamCodec(['BTC/USDT:USDT'], ['1m', '1h'])
+        
+        assert json.loads(codec.subscribe_messages()[0])['args'] == [
+            'tickers.BTCUSDT', 'publicTrade.BTCUSDT', 'kline.1.BTCUSDT', 'kline.60.BTCUSDT'
+        ]
+        assert codec.parse(json.dumps({'success': True, 'op': 'subscribe'})) == []
+        
+        ticker = codec.parse(json.dumps({
+            'topic': 'tickers.BTCUSDT', 'type': 'delta',
+            'data': {'symbol': 'BTCUSDT', 'bid1Price': '50000.1', 'ask1Price': '50000.2'}
+        }))[0]
+        assert ticker.symbol == 'BTC/USDT:USDT'
+        assert ticker.data == {'last': None, 'bid': 50000.1, 'ask': 50000.2, 'quote_volume': None}
+        
+        kline = codec.parse(json.dumps({
+            'topic': 'kline.60.BTCUSDT', 'type': 'snapshot',
+            'data': [{'start': 1704070800000, 'open': '1', 'high': '2', 'low': '0.5',
+                      'close': '1.5', 'volume': '10', 'confirm': True}]
+        }))[0]
+        assert kline.timeframe == '1h'
+        assert kline.data == {'candle': [1704070800000, 1.0, 2.0, 0.5, 1.5, 10.0], 'closed': True}
+    
+    def test_invalid_transport(self):
+        """Test unknown transports are rejected"""
+        with pytest.raises(ValueError):
+            PriceFeed(
+                exchange_id='binance',
+                api_key='test',
+                api_secret='test',
+                symbols=['BTC/USDT'],
+                timeframes=['1h'],
+                transport='carrier-pigeon'
+            )
+
+
+class TestRateLimiter:
+    """Test the shared token-bucket rate limiter"""
+    
+    def test_budget_never_exceeded(self):
+        """Test reservations within one interval stay under the budget"""
+        bucket = TokenBucket.for_budget(limit=100, interval=1.0)
+        with patch('src.utils.rate_limiter.time.monotonic', return_value=1000.0):
+            bucket._updated = 1000.0
+            delays = [bucket.reserve() for _ in range(300)]
+        
+        assert delays[:25] == [0.0] * 25
+        assert delays == sorted(delays)
+        for start in np.arange(0.0, 2.0, 0.1):
+            sent = sum(start <= delay < start + 1.0 for delay in delays)
+            assert sent <= 100
+        assert bucket.waits == 275
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_acquire_waits(self):
+        """Test concurrent callers past the burst wait for the refill"""
+        limiter = RateLimiter('test', budgets={'market_data': (50, 1.0)}, burst=0.1)
+        
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(*[limiter.acquire('market_data') for _ in range(14)])
+        elapsed = loop.time() - start
+        
+        assert elapsed >= 0.15
+        stats = limiter.get_statistics()['market_data']
+        assert stats['requests'] == 14
+        assert stats['waits'] == 9
+    
+    def test_weights_and_penalty(self):
+        """Test heavy requests and 429 back-off drain the bucket"""
+        limiter = RateLimiter('binance')
+        bucket = limiter.bucket('market_data')
+        
+        assert request_weight('binance', 'fetch_ohlcv', 1000) == 5.0
+        assert request_weight('binance', 'fetch_tickers') == 40.0
+        assert request_weight('bybit', 'fetch_tickers') == 1.0
+        
+        assert limiter.acquire_blocking('market_data', 40.0) == 0.0
+        assert bucket.tokens == pytest.approx(bucket.capacity - 40.0, abs=0.5)
+        
+        limiter.penalize('market_data', seconds=2.0)
+        assert bucket.reserve() >= 2.0
+        
+        with pytest.raises(ValueError):
+            limiter.bucket('websocket')
+    
+    def test_shared_per_exchange(self):
+        """Test components on the same exchange share one limiter"""
+        price_feed = PriceFeed(
+            exchange_id='binance',
+            api_key='test',
+            api_secret='test',
+            symbols=['BTC/USDT'],
+            timeframes=['1h']
+        )
+        
+        assert price_feed.rate_limiter is get_rate_limiter('BINANCE')
+        assert get_rate_limiter('bybit') is not get_rate_limiter('binance')
+    
+    @pytest.mark.asyncio
+    async def test_price_feed_backs_off_on_429(self):
+        """Test a rate-limit error from the exchange drains the market data bucket"""
+        import ccxt.async_support as ccxt
+        exchange = FakeTickerExchange(bulk_raises=ccxt.RateLimitExceeded('429'))
+        price_feed = PriceFeed(
+            exchange_id='binance',
+            api_key='test',
+            api_secret='test',
+            symbols=['BTC/USDT', 'ETH/USDT'],
+            timeframes=['1h'],
+            rate_limiter=RateLimiter('binance')
+        )
+        price_feed.exchange = exchange
+        
+        await price_feed._update_all_tickers()
+        
+        assert price_feed.rate_limiter.bucket('market_data').tokens < 0
+
+
 class TestPromptBuilder:
     """Test PromptBuilder nof1-style prompt generation"""
     
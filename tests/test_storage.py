@@ -8,8 +8,10 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import tempfile
 import shutil
+import numpy as np
 
-from src.data.storage import SQLiteStorage, RedisCache
+from src.data.storage import SQLiteStorage, RedisCache, get_redis_pool, pack_value, unpack_value
+from src.data.write_behind import AsyncWriteBehind
 
 
 @pytest.fixture
@@ -92,6 +94,43 @@ class TestSQLiteStorage:
         df = sqlite_storage.get_market_data('BTC/USDT', '5m')
         assert len(df) == len(sample_market_data)
     
+    def test_save_market_data_upsert(self, sqlite_storage, sample_market_data):
+        """Test bulk saves skip or overwrite existing candles."""
+        assert sqlite_storage.save_market_data('BTC/USDT', '5m', sample_market_data) == 10
+        
+        revised = [dict(candle, close=candle['close'] + 1.0) for candle in sample_market_data[-3:]]
+        assert sqlite_storage.save_market_data('BTC/USDT', '5m', revised) == 0
+        assert sqlite_storage.get_market_data('BTC/USDT', '5m')['close'].iloc[-1] == sample_market_data[-1]['close']
+        
+        assert sqlite_storage.save_market_data('BTC/USDT', '5m', revised, update=True) == 3
+        df = sqlite_storage.get_market_data('BTC/USDT', '5m')
+        assert len(df) == 10
+        assert df['close'].iloc[-1] == sample_market_data[-1]['close'] + 1.0
+        assert sqlite_storage.save_market_data('BTC/USDT', '5m', []) == 0
+    
+    def test_unique_index_added_to_existing_database(self, temp_db_path, sample_market_data):
+        """Test databases created without the unique index are deduplicated and migrated."""
+        from sqlalchemy import text
+        
+        storage = SQLiteStorage(temp_db_path)
+        with storage.engine.begin() as conn:
+            conn.execute(text("DROP INDEX uq_market_data_candle"))
+            for _ in range(2):
+                conn.execute(
+                    text("INSERT INTO market_data (symbol, timeframe, timestamp, open, high, low, close, volume) "
+                         "VALUES ('BTC/USDT', '5m', :timestamp, 1, 1, 1, 1, 1)"),
+                    {'timestamp': sample_market_data[0]['timestamp'].strftime('%Y-%m-%d %H:%M:%S.%f')}
+                )
+        storage.close()
+        
+        storage = SQLiteStorage(temp_db_path)
+        storage.save_market_data('BTC/USDT', '5m', sample_market_data)
+        
+        assert len(storage.get_market_data('BTC/USDT', '5m')) == 10
+        with storage.engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == 'wal'
+        storage.close()
+    
     def test_get_market_data_with_filters(self, sqlite_storage, sample_market_data):
         """Test retrieving market data with time filters."""
         sqlite_storage.save_market_data('BTC/USDT', '5m', sample_market_data)
@@ -101,6 +140,28 @@ class TestSQLiteStorage:
         
         assert len(df) == 5  # Should get last 5 records
     
+    def test_get_market_data_limit_and_types(self, sqlite_storage, sample_market_data):
+        """Test the limit keeps the most recent candles, oldest first, with typed columns."""
+        from sqlalchemy import text
+        
+        sqlite_storage.save_market_data('BTC/USDT', '5m', sample_market_data)
+        
+        df = sqlite_storage.get_market_data('BTC/USDT', '5m', limit=3)
+        assert list(df.columns) == ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+        assert list(df['timestamp']) == [c['timestamp'] for c in sample_market_data[-3:]]
+        assert str(df['timestamp'].dtype) == 'datetime64[ns]'
+        assert df['close'].dtype == 'float64'
+        
+        df = sqlite_storage.get_market_data('BTC/USDT', '5m', end_time=sample_market_data[3]['timestamp'], limit=None)
+        assert list(df['open']) == [c['open'] for c in sample_market_data[:4]]
+        
+        with sqlite_storage.engine.connect() as conn:
+            indexes = {row[0] for row in conn.execute(text(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'market_data'"
+            ))}
+        assert 'uq_market_data_candle' in indexes
+        assert 'ix_market_data_symbol' not in indexes
+    
     def test_get_market_data_empty(self, sqlite_storage):
         """Test retrieving market data when none exists."""
         df = sqlite_storage.get_market_data('ETH/USDT', '1h')
@@ -178,6 +239,80 @@ class TestSQLiteStorage:
         sqlite_storage.close()
 
 
+
+@pytest.mark.asyncio
+class TestAsyncWriteBehind:
+    """Test suite for AsyncWriteBehind class."""
+    
+    async def test_batches_writes_in_order(self, sqlite_storage, sample_trade_data):
+        """Test queued writes are committed in order and resolve their futures."""
+        writer = AsyncWriteBehind(sqlite_storage, batch_size=50, flush_interval=0.05)
+        await writer.start()
+        
+        futures = [await writer.save_trade(dict(sample_trade_data, size=0.1 * (i + 1))) for i in range(20)]
+        trade_ids = await asyncio.gather(*futures)
+        assert trade_ids == sorted(trade_ids)
+        
+        update = await writer.update_trade(trade_ids[0], {'status': 'closed', 'pnl': 5.0})
+        await writer.save_performance_metric('sharpe_ratio', 1.5, symbol='BTC/USDT', metadata={'period': '30d'})
+        await writer.close()
+        
+        assert await update is True
+        trades = sqlite_storage.get_trades(symbol='BTC/USDT', status='closed')
+        assert [t['id'] for t in trades] == [trade_ids[0]]
+        assert len(sqlite_storage.get_trades(limit=100)) == 20
+        
+        with pytest.raises(RuntimeError):
+            await writer.save_trade(sample_trade_data)
+    
+    async def test_backpressure(self, sqlite_storage, sample_trade_data):
+        """Test a full queue makes callers wait."""
+        writer = AsyncWriteBehind(sqlite_storage, max_queue=2, batch_size=10, flush_interval=0)
+        await writer.start()
+        
+        futures = [await writer.save_trade(sample_trade_data) for _ in range(5)]
+        assert writer.pending <= 2
+        
+        await writer.flush()
+        assert len(await asyncio.gather(*futures)) == 5
+        assert len(sqlite_storage.get_trades()) == 5
+        await writer.close()
+    
+    async def test_failed_operation_stops_its_batch(self, sqlite_storage, sample_trade_data):
+        """Test nothing queued after a failed write in its batch is committed."""
+        writer = AsyncWriteBehind(sqlite_storage, batch_size=10, flush_interval=0.05)
+        await writer.start()
+        
+        first = await writer.save_trade(sample_trade_data)
+        bad = await writer.save_trade({'symbol': 'BTC/USDT'})
+        later = [await writer.save_trade(sample_trade_data) for _ in range(2)]
+        await writer.flush()
+        
+        trade_id = await first
+        with pytest.raises(Exception):
+            await bad
+        for future in later:
+            with pytest.raises(RuntimeError):
+                await future
+        assert [t['id'] for t in sqlite_storage.get_trades()] == [trade_id]
+        
+        assert await (await writer.save_trade(sample_trade_data)) > trade_id
+        await writer.close()
+        assert len(sqlite_storage.get_trades()) == 2
+    
+    async def test_in_memory_database_rejected(self):
+        """Test the writer cannot open a second, empty in-memory database."""
+        storage = SQLiteStorage(':memory:')
+        writer = AsyncWriteBehind(storage)
+        with pytest.raises(ValueError):
+            await writer.start()
+        storage.close()
+    
+    async def test_invalid_options(self, sqlite_storage):
+        """Test invalid queue options are rejected."""
+        with pytest.raises(ValueError):
+            AsyncWriteBehind(sqlite_storage, max_queue=0)
+
 @pytest.mark.asyncio
 class TestRedisCache:
     """Test suite for RedisCache class."""
@@ -271,3 +406,50 @@ class TestRedisCache:
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
+
+
+@pytest.mark.asyncio
+class TestRedisCachePipelining:
+    """Test suite for RedisCache batching, encoding and stats (against fakeredis)."""
+    
+    def _make_cache(self):
+        fakeredis = pytest.importorskip('fakeredis')
+        return RedisCache("redis://localhost:6379/15", client=fakeredis.FakeAsyncRedis())
+    
+    async def test_set_many_is_one_round_trip(self):
+        """Test batched writes and reads each take a single round trip."""
+        cache = self._make_cache()
+        await cache.connect()
+        
+        await cache.set_many([(f"price:COIN{i}", {'price': float(i)}, 30) for i in range(50)])
+        found = await cache.get_many(['price:COIN7', 'price:COIN49', 'price:missing'])
+        
+        assert found == {'price:COIN7': {'price': 7.0}, 'price:COIN49': {'price': 49.0}}
+        assert await cache.redis.ttl('price:COIN7') > 0
+        stats = cache.get_stats()
+        assert stats['round_trips'] == 2
+        assert stats['writes'] == 50
+        assert (stats['hits'], stats['misses']) == (2, 1)
+        assert stats['hit_rate'] == pytest.approx(2 / 3)
+        await cache.disconnect()
+    
+    async def test_binary_encoding(self):
+        """Test NumPy arrays, scalars and datetimes survive the msgpack encoding."""
+        cache = self._make_cache()
+        window = np.arange(12, dtype=np.float64).reshape(3, 4)
+        
+        await cache.set('ohlcv:BTC/USDT:5m', {'window': window, 'rsi': np.float32(55.5),
+                                              'at': datetime(2024, 1, 1)})
+        value = await cache.get('ohlcv:BTC/USDT:5m')
+        
+        np.testing.assert_array_equal(value['window'], window)
+        assert value['rsi'] == 55.5
+        assert value['at'] == '2024-01-01T00:00:00'
+        assert await cache.get('nonexistent') is None
+        assert len(pack_value({'price': 50000.0, 'bid': 49999.5})) < len('{"price": 50000.0, "bid": 49999.5}')
+        assert unpack_value(pack_value([1, 'a', None])) == [1, 'a', None]
+    
+    async def test_shared_pool(self):
+        """Test caches for the same URL share one connection pool."""
+        assert get_redis_pool("redis://localhost:6379/14") is get_redis_pool("redis://localhost:6379/14")
+        assert get_redis_pool("redis://localhost:6379/14") is not get_redis_pool("redis://localhost:6379/13")